@@ -5,6 +5,12 @@ Designed for deployment on Render, Railway, or similar platforms.
 
 import os
 import json
+import bisect
+import gzip
+import hashlib
+import time
+from functools import lru_cache, wraps
+import numpy as np
 from flask import Flask, request, jsonify, Response
 from itertools import combinations
 from dotenv import load_dotenv
@@ -42,6 +48,35 @@ from dynasty_trade_analyzer_v2 import (
     TradeProposal,
     Player,
     Team,
+    LeagueLeaderboards,
+    DependencyGraph,
+    eligibility_mask,
+    position_filter_mask,
+    ELIGIBILITY_BITS,
+    FIELD_MASK,
+    PITCHER_MASK,
+    get_prospect_value,
+    parse_actual_stats,
+    get_value_weights,
+    set_value_weights,
+    reset_value_weights,
+    DEFAULT_VALUE_WEIGHTS,
+    VALUE_WEIGHT_SECTIONS,
+    PROJECTION_YEARS,
+    AGE_CURVE_MAX_AGE,
+    age_curve_group,
+    age_curve_peaks,
+    project_values_by_year,
+    ValueUncertainty,
+    SeasonSimulator,
+    LineupOptimizer,
+    LineupScorer,
+    TradeMarket,
+    MARKET_CATEGORIES,
+    PackageIndex,
+    trade_key,
+    EvaluatedTrades,
+    PROSPECT_VALUE_VERSION,
     HITTER_PROJECTIONS,
     PITCHER_PROJECTIONS,
     RELIEVER_PROJECTIONS,
@@ -59,49 +94,19 @@ except ImportError:
     print("Warning: fantraxapi not installed. API refresh will be unavailable.")
 
 # ============================================================================
-# PROSPECT VALUATION - Tiered exponential decay (realistic dynasty values)
+# PROSPECT VALUATION - shared versioned table (PROSPECT_VALUE_TABLE)
 # ============================================================================
 
 def calculate_prospect_value(rank):
     """
-    Calculate prospect dynasty value using tiered decay.
-    CALIBRATED against 5-source consensus (MLB Pipeline, PL, CFR, HKB):
-    - #1 prospect = 76 (near Elite tier, reflecting premium dynasty value)
-    - Mid-tier prospects reduced to not exceed proven contributors
-
-    Tier breakdown (adjusted for risk vs proven production):
-    - Rank 1-5:    Star/Elite (76 → 68)  - Premium dynasty assets
-    - Rank 6-10:   Star (66 → 60)        - High ceiling assets
-    - Rank 11-25:  Star (58 → 46)        - Quality dynasty pieces
-    - Rank 26-50:  Solid (38 → 26)       - Trade chips (reduced)
-    - Rank 51-100: Depth (25 → 14)       - Upside plays (reduced)
-    - Rank 101-200: Depth (13 → 5)       - Organizational depth
-    - Rank 201-300: Minimal (4.5 → 2)    - Deep league stashes
+    Calculate prospect dynasty value from the shared prospect value table.
+
+    Uses the same versioned table (PROSPECT_VALUE_VERSION) as
+    DynastyValueCalculator.calculate_player_value, so a free-agent or unrostered
+    prospect is worth exactly what a rostered prospect of the same rank is.
+    Ranks outside 1-300 are worth 0.5.
     """
-    if rank <= 0 or rank > 300:
-        return 0.5
-
-    if rank <= 5:
-        # Top 5: 76 at rank 1, 68 at rank 5 (STAR/ELITE - premium assets)
-        return 76 - (rank - 1) * 2.0
-    elif rank <= 10:
-        # Top 10: 66 at rank 6, 60 at rank 10 (STAR)
-        return 66 - (rank - 6) * 1.5
-    elif rank <= 25:
-        # 11-25: 58 at rank 11, 46 at rank 25 (STAR)
-        return 58 - (rank - 11) * 0.857
-    elif rank <= 50:
-        # 26-50: 38 at rank 26, 26 at rank 50 (SOLID - reduced for risk)
-        return 38 - (rank - 26) * 0.5
-    elif rank <= 100:
-        # 51-100: 25 at rank 51, 14 at rank 100 (DEPTH - reduced)
-        return 25 - (rank - 51) * 0.224
-    elif rank <= 200:
-        # 101-200: 13 at rank 101, 5 at rank 200 (DEPTH)
-        return 13 - (rank - 101) * 0.08
-    else:
-        # 201-300: 4.5 at rank 201, 2 at rank 300 (DEPTH)
-        return 4.5 - (rank - 201) * 0.025
+    return get_prospect_value(rank)
 
 
 # ============================================================================
@@ -1083,18 +1088,203 @@ league_transactions = []
 completed_trades = []  # Parsed and graded trade history from CSV
 
 # Player stats (actual in-season stats)
-player_actual_stats = {}  # player_name -> {stats dict}
+player_actual_stats = {}  # player_name -> {stats dict} as received (for display)
+player_actual_stats_parsed = {}  # player_name -> numeric stats (parse_actual_stats), used for valuation
 player_fantasy_points = {}  # player_name -> {fantasy_points, fppg}
 
+# Player value cache for the current data version: name -> (signature, value).
+# The signature covers the Player fields the calculator reads besides the name,
+# so ad-hoc Player objects with different attributes never share an entry.
+_player_value_cache = {}
+_player_value_cache_version = -1
+
+
+def _player_value_signature(player):
+    return (player.position, player.age,
+            getattr(player, 'fantrax_rank', None), getattr(player, 'fantrax_score', None))
+
+
+def _get_player_value_cache():
+    global _player_value_cache_version
+    if _player_value_cache_version != _data_version:
+        _player_value_cache.clear()
+        _player_value_cache_version = _data_version
+    return _player_value_cache
+
 
 def calc_player_value(player):
     """Wrapper for calculate_player_value that automatically includes actual stats.
 
     This enables the blended stats feature - projections are blended with actual
-    in-season performance as the season progresses.
+    in-season performance as the season progresses. Values are cached until the
+    data version changes or the player's stats are re-ingested.
+    """
+    cache = _get_player_value_cache()
+    signature = _player_value_signature(player)
+    cached = cache.get(player.name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    value = calculator.calculate_player_value(player, player_actual_stats_parsed.get(player.name))
+    cache[player.name] = (signature, value)
+    return value
+
+
+def calc_player_values_batch(players):
+    """Vectorized calc_player_value over a list of players (same values, one pass for cache misses)."""
+    cache = _get_player_value_cache()
+    values = [None] * len(players)
+    misses = []
+    for i, p in enumerate(players):
+        cached = cache.get(p.name)
+        if cached is not None and cached[0] == _player_value_signature(p):
+            values[i] = cached[1]
+        else:
+            misses.append(i)
+    if misses:
+        computed = calculator.calculate_values_batch([players[i] for i in misses], player_actual_stats_parsed)
+        for i, value in zip(misses, computed.tolist()):
+            values[i] = value
+            cache[players[i].name] = (_player_value_signature(players[i]), value)
+    return values
+
+
+# ============================================================================
+# MULTI-YEAR VALUE PROJECTIONS (value by season, per data version)
+# ============================================================================
+# Every rostered player's value for this season and the next PROJECTION_YEARS,
+# from the age curves in project_values_by_year. Rebuilt in one vectorized pass
+# when the data version changes; readers index rows instead of redoing age math.
+
+_value_projections = {'version': None, 'index': {}, 'values': np.zeros((0, PROJECTION_YEARS + 1))}
+
+
+def get_value_projections():
+    """({player name: row}, (n, PROJECTION_YEARS + 1) value-by-year array) for all rostered players."""
+    if _value_projections['version'] != _data_version:
+        players = [p for team in teams.values() for p in team.players]
+        values = project_values_by_year(players, calc_player_values_batch(players))
+        _value_projections['index'] = {p.name: i for i, p in enumerate(players)}
+        _value_projections['values'] = values
+        _value_projections['version'] = _data_version
+    return _value_projections['index'], _value_projections['values']
+
+
+def get_values_by_year(players):
+    """(len(players), PROJECTION_YEARS + 1) value-by-year rows; unrostered players are projected on the fly."""
+    index, values = get_value_projections()
+    rows = np.zeros((len(players), PROJECTION_YEARS + 1))
+    missing = []
+    for i, p in enumerate(players):
+        row = index.get(p.name)
+        if row is None:
+            missing.append(i)
+        else:
+            rows[i] = values[row]
+    if missing:
+        extra = [players[i] for i in missing]
+        rows[missing] = project_values_by_year(extra, calc_player_values_batch(extra))
+    return rows
+
+
+# ============================================================================
+# STARTING LINEUPS (optimal active lineup per roster, per data version)
+# ============================================================================
+# Category totals count only the players who fill the league's starting slots
+# (LINEUP_SLOTS): bench, minors and IR depth no longer inflate team totals.
+# Per-player eligibility masks and lineup scores are cached, so solving any
+# roster (real or hypothetical) is a dict lookup per player plus one
+# LineupOptimizer.assign call.
+
+LINEUP_OPTIMIZER = LineupOptimizer()
+_lineup_scores = {'version': None, 'scorer': None, 'entries': {}}
+
+
+def _lineup_entry(player):
+    """(eligibility mask, lineup weight) for one player, cached per data version."""
+    if _lineup_scores['version'] != _data_version:
+        pool = [p.name for team in teams.values() for p in team.players]
+        _lineup_scores['scorer'] = LineupScorer(pool)
+        _lineup_scores['entries'] = {}
+        _lineup_scores['version'] = _data_version
+    key = (player.name, player.position)
+    entry = _lineup_scores['entries'].get(key)
+    if entry is None:
+        masks, weights = _lineup_scores['scorer'].player_weights([player])
+        entry = _lineup_scores['entries'][key] = (masks[0], weights[0])
+    return entry
+
+
+def get_starting_lineup(players):
+    """[(player, slot)] for the best legal starting lineup from these players, in slot order."""
+    entries = [_lineup_entry(p) for p in players]
+    return LINEUP_OPTIMIZER.starting_lineup(players, [m for m, _ in entries], [w for _, w in entries])
+
+
+def get_active_lineup(players):
+    """Just the starters from get_starting_lineup."""
+    return [p for p, _ in get_starting_lineup(players)]
+
+
+DEPTH_POSITIONS = ('C', '1B', '2B', 'SS', '3B', 'OF', 'SP', 'RP')
+
+
+def position_depth_counts(players, positions=DEPTH_POSITIONS):
+    """{position: players eligible there}; multi-position players count at every position."""
+    counts = dict.fromkeys(positions, 0)
+    bits = [(pos, ELIGIBILITY_BITS[pos]) for pos in positions]
+    for p in players:
+        mask = p.eligibility
+        for pos, bit in bits:
+            if mask & bit:
+                counts[pos] += 1
+    return counts
+
+
+def crowded_depth(player, counts):
+    """(depth, position) at the player's least crowded eligible position."""
+    mask = player.eligibility
+    eligible = [(counts[pos], pos) for pos in counts if mask & ELIGIBILITY_BITS[pos]]
+    return min(eligible) if eligible else (0, 'UTIL')
+
+
+# ============================================================================
+# VALUE UNCERTAINTY (Monte Carlo value samples, per data version)
+# ============================================================================
+# One batched draw of projection and consensus noise for every rostered player.
+# Percentiles and trade win probabilities read rows of the cached sample matrix,
+# so no request ever samples.
+
+VALUE_UNCERTAINTY_SAMPLES = 500
+_value_uncertainty = {'version': None, 'model': None}
+
+
+def get_value_uncertainty():
+    """ValueUncertainty over all rostered players for the current data version."""
+    if _value_uncertainty['version'] != _data_version:
+        players = [p for team in teams.values() for p in team.players]
+        _value_uncertainty['model'] = ValueUncertainty(players, player_actual_stats_parsed,
+                                                       samples=VALUE_UNCERTAINTY_SAMPLES)
+        _value_uncertainty['version'] = _data_version
+    return _value_uncertainty['model']
+
+
+def trade_win_probability(receives_a, receives_b, picks_a_value=0.0, picks_b_value=0.0):
+    """P(side A receives more value than side B) over the cached value samples.
+
+    receives_a / receives_b are Player lists; players without samples count at
+    their point value, picks at their fixed value.
     """
-    actual = player_actual_stats.get(player.name)
-    return calculator.calculate_player_value(player, actual)
+    model = get_value_uncertainty()
+    fixed_a = picks_a_value + sum(calc_player_value(p) for p in receives_a if p.name not in model.index)
+    fixed_b = picks_b_value + sum(calc_player_value(p) for p in receives_b if p.name not in model.index)
+    return model.win_probability(model.package_samples([p.name for p in receives_a], fixed_a),
+                                 model.package_samples([p.name for p in receives_b], fixed_b))
+
+
+def store_actual_stats(player_name, actual):
+    """Record a player's actual stats: raw for display, parsed once for valuation."""
+    player_actual_stats[player_name] = actual
+    player_actual_stats_parsed[player_name] = parse_actual_stats(actual)
 
 # Draft order configuration (team_name -> pick_number for 2026)
 # If empty, draft order is calculated based on team value (worst team = pick 1)
@@ -1123,19 +1313,227 @@ def save_draft_order_config():
         print(f"Warning: Could not save draft order config: {e}")
 
 
-def get_team_rankings():
-    """Calculate team rankings based on total dynasty value (lower value = worse team = earlier pick)."""
-    team_values = []
-    for name, team in teams.items():
-        total_value = sum(calc_player_value(p) for p in team.players)
-        team_values.append((name, total_value))
+# ============================================================================
+# RESPONSE CACHE (snapshot-versioned JSON for read-mostly endpoints)
+# ============================================================================
+# Every loader or mutation that changes league data or draft order calls
+# bump_data_version(). Cached responses are keyed on (path, query, version),
+# so a new version makes every stale entry unreachable without any per-route
+# invalidation logic.
+
+_data_version = 0
+_response_cache = {}  # (path, query_string, version) -> {'body', 'gzip', 'etag', 'gzip_etag', 'mimetype'}
+RESPONSE_CACHE_MAX_ENTRIES = 256
+GZIP_MIN_BYTES = 1024
+
+# Ranked /suggest result lists, so later pages are slices of the first query's work
+_suggest_results = {}  # (fingerprint, version) -> {'suggestions', 'team_needs', 'created'}
+SUGGEST_RESULTS_MAX_ENTRIES = 64
+SUGGEST_RESULTS_TTL_SECONDS = 600
+SUGGEST_PAGE_PARAMS = ('offset', 'limit', 'cursor')
+SUGGEST_MAX_LIMIT = 200  # /suggest ranks at most 200 results
+
+# Trade scores shared by the suggestion generators, keyed on canonical trade_key
+EVALUATED_TRADES_MAX_ENTRIES = 4096
+_evaluated_trades = EvaluatedTrades(EVALUATED_TRADES_MAX_ENTRIES)
+
+
+def bump_data_version(reason="", full=True):
+    """Mark league data as changed and drop all cached responses.
+
+    full=False keeps the league metrics graph; the caller invalidates just the
+    graph nodes its change touches.
+    """
+    global _data_version
+    _data_version += 1
+    _response_cache.clear()
+    _suggest_results.clear()
+    _evaluated_trades.clear()
+    if full:
+        league_graph.reset()
+    if reason:
+        print(f"Data version -> {_data_version} ({reason})")
+    return _data_version
+
+
+def get_data_version():
+    """Current snapshot version of league data."""
+    return _data_version
+
+
+def _build_cached_entry(response):
+    """Capture body, ETag and gzip variant of a successful JSON response."""
+    body = response.get_data()
+    etag = f'v{_data_version}-{hashlib.md5(body).hexdigest()}'
+    entry = {
+        'body': body,
+        'gzip': gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None,
+        'etag': etag,
+        'gzip_etag': f'{etag}-gz',  # a different byte sequence needs its own strong validator
+        'mimetype': response.mimetype,
+    }
+    return entry
+
+
+def _serve_cached_entry(entry):
+    """Build a response from a cache entry, honouring If-None-Match and Accept-Encoding."""
+    use_gzip = entry['gzip'] is not None and 'gzip' in request.accept_encodings
+    etag = entry['gzip_etag'] if use_gzip else entry['etag']
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif use_gzip:
+        response = Response(entry['gzip'], mimetype=entry['mimetype'])
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(entry['body'], mimetype=entry['mimetype'])
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def cached_response(view_func):
+    """Decorator: serve a route from the snapshot cache until data_version changes.
+
+    Only 200 responses are cached; errors are always recomputed. Clients get an
+    ETag and may revalidate with If-None-Match to receive an empty 304.
+    """
+    @wraps(view_func)
+    def wrapper(*args, **kwargs):
+        key = (request.path, request.query_string, _data_version)
+        entry = _response_cache.get(key)
+        if entry is None:
+            version_before = _data_version
+            response = app.make_response(view_func(*args, **kwargs))
+            if response.status_code != 200 or response.direct_passthrough:
+                return response
+            entry = _build_cached_entry(response)
+            # Don't store if the view itself changed the data (e.g. lazy trade history load)
+            if version_before == _data_version:
+                if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                    _response_cache.pop(next(iter(_response_cache)))
+                _response_cache[(request.path, request.query_string, _data_version)] = entry
+        return _serve_cached_entry(entry)
+    return wrapper
+
+
+def suggest_query_fingerprint(args):
+    """Stable hash of a /suggest query, ignoring the paging parameters."""
+    query = sorted((k, v) for k, v in args.items(multi=True) if k not in SUGGEST_PAGE_PARAMS)
+    return hashlib.md5(json.dumps(query).encode()).hexdigest()[:16]
+
+
+def encode_suggest_cursor(fingerprint, offset):
+    """Opaque token for the page of a ranked /suggest list starting at offset."""
+    return f"{fingerprint}.{offset}"
+
+
+def decode_suggest_cursor(cursor):
+    """Inverse of encode_suggest_cursor; raises ValueError on a malformed token."""
+    fingerprint, _, offset = cursor.partition('.')
+    if not fingerprint or not offset.isdigit():
+        raise ValueError(f"malformed cursor: {cursor!r}")
+    return fingerprint, int(offset)
+
+
+def get_suggest_results(fingerprint):
+    """Ranked /suggest results for this query and data version, or None.
+
+    Entries older than SUGGEST_RESULTS_TTL_SECONDS are dropped; a hit moves the
+    entry to the back of the eviction order (least recently used goes first).
+    """
+    key = (fingerprint, _data_version)
+    entry = _suggest_results.pop(key, None)
+    if entry is None or time.time() - entry['created'] > SUGGEST_RESULTS_TTL_SECONDS:
+        return None
+    _suggest_results[key] = entry
+    return entry
+
+
+def store_suggest_results(fingerprint, entry):
+    """Keep a ranked /suggest result list, evicting the least recently used."""
+    while len(_suggest_results) >= SUGGEST_RESULTS_MAX_ENTRIES:
+        _suggest_results.pop(next(iter(_suggest_results)))
+    entry['created'] = time.time()
+    _suggest_results[(fingerprint, _data_version)] = entry
+
+
+# ============================================================================
+# LEAGUE METRICS GRAPH (reactive derived values)
+# ============================================================================
+# Team totals, power rankings, category ranks, championship odds, team needs and
+# trade-partner compatibility are nodes in one dependency graph:
+#
+#   roster[t] -> team_values[t] -> team_total[t] -> team_rankings -> championship_score[t] -> championship_odds
+#   roster[t] -> team_projections[t] -> team_categories[t] -> category_rankings -^
+#   team_values / team_rankings / team_projections -> team_needs[t] -> trade_partners[t]
+#
+# Edges are recorded as the nodes compute. A roster move, revaluation or
+# projection update invalidates only its source nodes; the next read recomputes
+# what actually changed downstream. GET /derived-graph shows the recompute trace.
+
+league_graph = DependencyGraph()
+
+
+def mark_rosters_changed(*team_names):
+    """Invalidate graph nodes fed by these teams' rosters (after a roster edit or swap)."""
+    for team_name in team_names:
+        league_graph.invalidate(('roster', team_name))
+
+
+@league_graph.node('league')
+def _graph_league():
+    return tuple(teams)
+
+
+@league_graph.node('draft_order')
+def _graph_draft_order():
+    return dict(draft_order_config)
+
+
+@league_graph.node('roster')
+def _graph_roster(team_name):
+    return tuple(teams[team_name].players)
+
+
+@league_graph.node('team_projections')
+def _graph_team_projections(team_name):
+    # Projection dicts are replaced, not mutated, on update, so identity comparison spots changes
+    return tuple((HITTER_PROJECTIONS.get(p.name), PITCHER_PROJECTIONS.get(p.name), RELIEVER_PROJECTIONS.get(p.name))
+                 for p in league_graph.get(('roster', team_name)))
+
+
+@league_graph.node('team_values')
+def _graph_team_values(team_name):
+    return [(p, calc_player_value(p)) for p in league_graph.get(('roster', team_name))]
+
+
+@league_graph.node('team_total')
+def _graph_team_total(team_name):
+    return sum(v for _, v in league_graph.get(('team_values', team_name)))
+
+
+def get_team_player_values(team_name):
+    """(player, value) pairs for a team's roster, in roster order."""
+    return league_graph.get(('team_values', team_name))
+
+
+def get_team_value_total(team_name):
+    """Total dynasty value of a team's current roster."""
+    return league_graph.get(('team_total', team_name))
+
+
+@league_graph.node('team_rankings')
+def _graph_team_rankings():
+    team_values = [(name, get_team_value_total(name)) for name in league_graph.get(('league',))]
+    configured_order = league_graph.get(('draft_order',))
 
     # Sort by value ascending (worst team first for draft order)
     team_values.sort(key=lambda x: x[1])
 
     # Use configured draft order if available, otherwise calculate based on value
-    if draft_order_config:
-        draft_order = dict(draft_order_config)
+    if configured_order:
+        draft_order = dict(configured_order)
         # Fill in any missing teams with calculated values
         for i, (name, _) in enumerate(team_values):
             if name not in draft_order:
@@ -1150,6 +1548,11 @@ def get_team_rankings():
 
     return draft_order, power_rankings, {name: val for name, val in team_values}
 
+
+def get_team_rankings():
+    """Calculate team rankings based on total dynasty value (lower value = worse team = earlier pick)."""
+    return league_graph.get(('team_rankings',))
+
 # ============================================================================
 # HTML CONTENT (Embedded UI)
 # ============================================================================
@@ -5329,12 +5732,13 @@ fantrax_ages = {}
 
 # Free agents data
 FREE_AGENTS = []
+_fa_load_count = 0  # bumped on every load_free_agents(); keys FA_FEATURES
 
 
 def load_free_agents():
     """Load available free agents from fantrax_available_players.csv."""
     import csv
-    global FREE_AGENTS
+    global FREE_AGENTS, _fa_load_count
     FREE_AGENTS = []
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -5391,17 +5795,8 @@ def load_free_agents():
                     fa['prospect_rank'] = prospect_rank if fa['is_prospect'] else None
                     fa['prospect_name'] = matched_name if fa['is_prospect'] else None  # Store matched name for /prospects
 
-                    # Debug: Log FA prospects found
-                    if fa['is_prospect']:
-                        match_info = f" (matched as '{matched_name}')" if matched_name != fa_name else ""
-                        print(f"FA PROSPECT FOUND: {fa_name}{match_info} - Rank #{prospect_rank}")
-
                     # Calculate dynasty value for FA (with prospect bonus if applicable)
                     fa['dynasty_value'] = calculate_fa_dynasty_value(fa)
-
-                    # Debug: Log value for ranked prospects
-                    if fa['is_prospect']:
-                        print(f"  -> Dynasty Value: {fa['dynasty_value']}")
                     FREE_AGENTS.append(fa)
                 except (ValueError, TypeError) as e:
                     continue
@@ -5414,6 +5809,9 @@ def load_free_agents():
         print(f"Loaded {len(FREE_AGENTS)} free agents ({fa_prospect_count} are ranked prospects)")
     except Exception as e:
         print(f"Error loading free agents: {e}")
+    _fa_load_count += 1
+    bump_data_version("free agents loaded")
+    build_fa_feature_table()
 
 
 def calculate_fa_dynasty_value(fa):
@@ -5442,12 +5840,6 @@ def calculate_fa_dynasty_value(fa):
     else:
         base_value = max(5, fantrax_score * 0.25)  # 5-10 range
 
-    # DEBUG: Log calculation details for FA prospects
-    if fa.get('is_prospect'):
-        print(f"FA PROSPECT VALUE CALC: {fa.get('name')}")
-        print(f"  fantrax_score={fantrax_score}, base_value={base_value}")
-        print(f"  age={age}, rank={rank}, roster_pct={roster_pct}")
-
     # Age adjustment - younger FAs more valuable in dynasty
     if age <= 24:
         age_mult = 1.25
@@ -5489,15 +5881,10 @@ def calculate_fa_dynasty_value(fa):
     is_prospect = fa.get('is_prospect')
     prospect_rank = fa.get('prospect_rank')
 
-    print(f"DEBUG calculate_fa_dynasty_value: {fa.get('name')} - is_prospect={is_prospect}, prospect_rank={prospect_rank}")
-
     if is_prospect and prospect_rank:
         # Use tiered exponential decay formula (realistic dynasty values)
         value = calculate_prospect_value(prospect_rank)
-
-        final_value = round(value, 1)
-        print(f"  -> FA PROSPECT TIERED VALUE: {fa.get('name')} rank {prospect_rank} -> value {final_value}")
-        return final_value
+        return round(value, 1)
 
     # Non-prospect FA value calculation
     value = (base_value * age_mult) + rank_bonus + ros_bonus
@@ -5506,11 +5893,695 @@ def calculate_fa_dynasty_value(fa):
     # If Fantrax rank > 1000 AND roster % <= 5%, they're not worth much
     if rank > 1000 and roster_pct <= 5:
         value = min(value, 2.0)
-        print(f"  -> UNROSTERABLE FLOOR: {fa.get('name')} rank={rank}, roster_pct={roster_pct} -> capped at 2.0")
 
-    final_value = round(value, 1)
-    print(f"  -> NON-PROSPECT PATH: {fa.get('name')} -> value {final_value}")
-    return final_value
+    return round(value, 1)
+
+
+# ============================================================================
+# FREE AGENT FEATURE TABLE & RECOMMENDER
+# ============================================================================
+# Everything about a free agent that doesn't depend on the team asking
+# (projections, special-value tags, position flags, stat columns) is built
+# once per FA-file load, and rebuilt when ingested projections change a free
+# agent's line. Rows line up with FREE_AGENTS. The per-team recommender
+# scores the whole table with array ops and only builds reason strings for
+# the rows it returns.
+
+FA_FEATURES = {}
+
+FA_NEED_POSITIONS = ['C', '1B', '2B', 'SS', '3B', 'OF', 'SP', 'RP']
+FA_HITTER_POSITIONS = ['C', '1B', '2B', 'SS', '3B', 'OF', 'LF', 'CF', 'RF', 'DH']
+
+# Projection columns used for scoring, with the default applied when missing
+FA_STAT_DEFAULTS = {
+    'HR': 0, 'SB': 0, 'RBI': 0, 'R': 0, 'AVG': 0, 'OPS': 0, 'SO': 0,
+    'K': 0, 'QS': 0, 'ERA': 5.0, 'WHIP': 1.5, 'SV': 0, 'HD': 0, 'W': 0, 'L': 10, 'IP': 0,
+}
+
+# GM philosophy groups used for philosophy-aware FA recommendations
+YOUTH_PHILOSOPHIES = ['rising_powerhouse', 'prospect_rich_rebuilder', 'analytical_rebuilder', 'dynasty_champion']
+PRODUCTION_PHILOSOPHIES = ['championship_closer', 'all_in_buyer', 'loaded_and_ready', 'win_now']
+VALUE_PHILOSOPHIES = ['bargain_hunter', 'smart_contender', 'value_seeker']
+
+
+def get_fa_projection(name):
+    """Projection dict for a free agent (hitter, then SP, then RP)."""
+    return HITTER_PROJECTIONS.get(name, {}) or PITCHER_PROJECTIONS.get(name, {}) or RELIEVER_PROJECTIONS.get(name, {})
+
+
+def detect_fa_special_value(fa, fa_proj):
+    """Detect undervalued gems and breakout candidates with enhanced logic."""
+    special_tags = []
+    name = fa['name']
+    age = fa['age']
+    roster_pct = fa['roster_pct']
+    dynasty_value = fa['dynasty_value']
+
+    if not fa_proj:
+        fa_proj = {}
+
+    hr = fa_proj.get('HR', 0)
+    sb = fa_proj.get('SB', 0)
+    rbi = fa_proj.get('RBI', 0)
+    r = fa_proj.get('R', 0)
+    avg = fa_proj.get('AVG', 0)
+    k = fa_proj.get('K', 0)
+    qs = fa_proj.get('QS', 0)
+    era = fa_proj.get('ERA', 5.0)
+    whip = fa_proj.get('WHIP', 1.5)
+    sv = fa_proj.get('SV', 0)
+    hld = fa_proj.get('HD', 0)
+
+    # 1. BREAKOUT CANDIDATE - young with projections exceeding ownership
+    if age <= 26 and roster_pct < 50:
+        if hr >= 20 or sb >= 20 or k >= 150:
+            special_tags.append("🚀 Breakout Candidate")
+        elif hr >= 15 and sb >= 10:  # Power/speed developing
+            special_tags.append("📈 Breakout Watch")
+
+    # 2. POWER/SPEED COMBO - rare and valuable
+    if hr >= 15 and sb >= 15:
+        special_tags.append("⚡ Power/Speed")
+    elif hr >= 20 and sb >= 10:
+        special_tags.append("💪 Power+ Speed")
+    elif sb >= 25 and hr >= 8:
+        special_tags.append("🏃 Speed+ Power")
+
+    # 3. UNDERVALUED GEM - projections don't match dynasty value
+    if dynasty_value < 40:
+        if hr >= 25 or rbi >= 80 or k >= 180 or (k >= 100 and era <= 3.50):
+            special_tags.append("💎 Undervalued Gem")
+
+    # 4. RATIO STABILIZER - pitchers with elite ratios
+    is_pitcher = 'SP' in fa['position'].upper() or 'RP' in fa['position'].upper()
+    if is_pitcher:
+        if era <= 3.20 and whip <= 1.10:
+            special_tags.append("📊 Elite Ratios")
+        elif era <= 3.50 and whip <= 1.15:
+            special_tags.append("📊 Ratio Stabilizer")
+
+    # 5. MULTI-CATEGORY CONTRIBUTOR - helps in 3+ categories
+    cat_contributions = 0
+    if hr >= 15:
+        cat_contributions += 1
+    if sb >= 12:
+        cat_contributions += 1
+    if rbi >= 70:
+        cat_contributions += 1
+    if r >= 70:
+        cat_contributions += 1
+    if avg >= 0.280:
+        cat_contributions += 1
+    if k >= 120:
+        cat_contributions += 1
+    if sv + hld >= 15:
+        cat_contributions += 1
+
+    if cat_contributions >= 4:
+        special_tags.append("🎯 Multi-Cat Elite")
+    elif cat_contributions >= 3:
+        special_tags.append("📋 Multi-Cat Contributor")
+
+    # 6. STREAMING CANDIDATE - pitcher with solid matchups potential
+    if 'SP' in fa['position'].upper() and roster_pct < 40:
+        if era <= 4.00 and whip <= 1.25:
+            special_tags.append("📅 Streaming Option")
+
+    # 7. CLOSER WATCH - RP who could get saves
+    if 'RP' in fa['position'].upper():
+        if sv >= 20:
+            special_tags.append("🔒 Established Closer")
+        elif sv >= 10:
+            special_tags.append("👀 Closer Potential")
+        elif hld >= 20:
+            special_tags.append("🛡️ Elite Setup")
+
+    # 8. DYNASTY SLEEPER - young with upside, under the radar
+    if age <= 24 and dynasty_value >= 30 and roster_pct < 30:
+        special_tags.append("😴 Dynasty Sleeper")
+
+    # 9. INJURY COMEBACK - low roster % on formerly good player (approximation)
+    if age >= 27 and age <= 32 and roster_pct < 25 and dynasty_value >= 25:
+        # Likely returning from injury if low ownership on decent value player
+        special_tags.append("🏥 Comeback Watch")
+
+    # 10. WORKHORSE - SP with high innings and QS potential
+    if 'SP' in fa['position'].upper():
+        ip = fa_proj.get('IP', 0)
+        if ip >= 180 and qs >= 18:
+            special_tags.append("🐴 Workhorse")
+        elif ip >= 160 and qs >= 14:
+            special_tags.append("📈 Innings Eater")
+
+    return special_tags[:4]  # Limit to 4 tags max
+
+
+def build_fa_feature_table():
+    """Precompute per-FA projections, tags, position flags and stat columns."""
+    n = len(FREE_AGENTS)
+    projections = []
+    tags = []
+    stats = {stat: np.empty(n) for stat in FA_STAT_DEFAULTS}
+    positions = [fa['position'].upper() for fa in FREE_AGENTS]
+
+    for i, fa in enumerate(FREE_AGENTS):
+        fa_proj = get_fa_projection(fa['name'])
+        projections.append(fa_proj)
+        tags.append(detect_fa_special_value(fa, fa_proj))
+        for stat, default in FA_STAT_DEFAULTS.items():
+            val = fa_proj.get(stat, default)
+            stats[stat][i] = default if val is None else val
+
+    # Substring checks, same as the scalar recommender ('OF' does not match 'LF')
+    has_pos = {pos: np.array([pos in fa_pos for fa_pos in positions], dtype=bool) for pos in FA_NEED_POSITIONS}
+    eligible = dict(has_pos)
+    eligible['OF'] = np.array([any(x in fa_pos for x in ('OF', 'LF', 'CF', 'RF')) for fa_pos in positions], dtype=bool)
+
+    FA_FEATURES.clear()
+    FA_FEATURES.update({
+        'load': _fa_load_count,
+        'n': n,
+        'projections': projections,
+        'tags': tags,
+        'n_tags': np.array([len(t) for t in tags], dtype=float),
+        'stats': stats,
+        'dynasty_value': np.array([fa['dynasty_value'] for fa in FREE_AGENTS], dtype=float),
+        'age': np.array([fa['age'] for fa in FREE_AGENTS], dtype=float),
+        'roster_pct': np.array([fa['roster_pct'] for fa in FREE_AGENTS], dtype=float),
+        'is_prospect': np.array([bool(fa.get('is_prospect')) for fa in FREE_AGENTS], dtype=bool),
+        'is_hitter': np.array([any(pos in fa_pos for pos in FA_HITTER_POSITIONS) for fa_pos in positions], dtype=bool),
+        'is_sp': has_pos['SP'],
+        'is_rp': has_pos['RP'],
+        'has_pos': has_pos,
+        'eligible': eligible,
+        'positions': [fa['position'] for fa in FREE_AGENTS],
+    })
+    return FA_FEATURES
+
+
+def get_fa_features():
+    """FA feature table for the current FA load."""
+    if FA_FEATURES.get('load') != _fa_load_count:
+        build_fa_feature_table()
+    return FA_FEATURES
+
+
+def build_fa_team_context(team_name):
+    """Team-specific inputs for FA recommendations: needs, window, GM philosophy."""
+    team_cats, team_pos, team_window = calculate_team_needs(team_name)
+    weaknesses = [cat for cat, score in team_cats.items() if score < 0]
+    strengths = [cat for cat, score in team_cats.items() if score > 0]
+
+    # Get GM philosophy for philosophy-aware recommendations
+    gm = get_assistant_gm(team_name)
+
+    # Get league-wide category rankings for this team
+    all_team_cats, league_rankings = calculate_league_category_rankings()
+    my_ranks = league_rankings.get(team_name, {})
+
+    # Rank weaknesses by severity (worst rank first)
+    ranked_weaknesses = sorted([(cat, my_ranks.get(cat, 6)) for cat in weaknesses],
+                               key=lambda x: -x[1])
+    worst_cats = [cat for cat, rank in ranked_weaknesses[:3] if rank >= 8]
+
+    # Calculate detailed positional depth
+    pos_depth = {}
+    pos_age = {}  # Track average age at position
+    for p in teams[team_name].players:
+        mask = p.eligibility
+        for check_pos in FA_NEED_POSITIONS:
+            if mask & ELIGIBILITY_BITS[check_pos]:
+                pos_depth[check_pos] = pos_depth.get(check_pos, 0) + 1
+                if check_pos not in pos_age:
+                    pos_age[check_pos] = []
+                if p.age > 0:
+                    pos_age[check_pos].append(p.age)
+
+    return {
+        'team_name': team_name,
+        'weaknesses': weaknesses,
+        'strengths': strengths,
+        'worst_cats': worst_cats,
+        'team_window': team_window,
+        'philosophy': gm.get('philosophy', 'balanced'),
+        'gm_preferred_cats': gm.get('preferred_categories', []),
+        'positional_needs': [pos for pos in FA_NEED_POSITIONS if pos_depth.get(pos, 0) < 3],
+        'critical_needs': [pos for pos in FA_NEED_POSITIONS if pos_depth.get(pos, 0) < 2],
+        # Identify aging positions (avg age > 30)
+        'aging_positions': [pos for pos, ages in pos_age.items() if ages and sum(ages) / len(ages) > 30],
+    }
+
+
+def calculate_multi_category_fit(fa_proj, is_hitter, worst_cats):
+    """Score how well a player addresses multiple category needs."""
+    fit_score = 0
+    cats_addressed = []
+
+    if is_hitter:
+        for cat in worst_cats:
+            if cat == 'HR' and fa_proj.get('HR', 0) >= 15:
+                fit_score += 15
+                cats_addressed.append(f"HR ({fa_proj.get('HR', 0)})")
+            elif cat == 'SB' and fa_proj.get('SB', 0) >= 10:
+                fit_score += 15
+                cats_addressed.append(f"SB ({fa_proj.get('SB', 0)})")
+            elif cat == 'RBI' and fa_proj.get('RBI', 0) >= 60:
+                fit_score += 12
+                cats_addressed.append(f"RBI ({fa_proj.get('RBI', 0)})")
+            elif cat == 'R' and fa_proj.get('R', 0) >= 60:
+                fit_score += 12
+                cats_addressed.append(f"R ({fa_proj.get('R', 0)})")
+            elif cat == 'AVG' and fa_proj.get('AVG', 0) >= .280:
+                fit_score += 10
+                cats_addressed.append(f"AVG ({fa_proj.get('AVG', 0):.3f})")
+            elif cat == 'OPS' and fa_proj.get('OPS', 0) >= .800:
+                fit_score += 10
+                cats_addressed.append(f"OPS ({fa_proj.get('OPS', 0):.3f})")
+            elif cat == 'SO' and fa_proj.get('SO', 0) <= 100:  # Lower is better
+                fit_score += 8
+                cats_addressed.append(f"Low K ({fa_proj.get('SO', 0)})")
+    else:
+        for cat in worst_cats:
+            if cat == 'K' and fa_proj.get('K', 0) >= 100:
+                fit_score += 15
+                cats_addressed.append(f"K ({fa_proj.get('K', 0)})")
+            elif cat == 'QS' and fa_proj.get('QS', 0) >= 10:
+                fit_score += 15
+                cats_addressed.append(f"QS ({fa_proj.get('QS', 0)})")
+            elif cat == 'ERA' and fa_proj.get('ERA', 5.0) <= 4.00:
+                fit_score += 12
+                cats_addressed.append(f"ERA ({fa_proj.get('ERA', 0):.2f})")
+            elif cat == 'WHIP' and fa_proj.get('WHIP', 1.5) <= 1.25:
+                fit_score += 12
+                cats_addressed.append(f"WHIP ({fa_proj.get('WHIP', 0):.2f})")
+            elif cat == 'SV+HLD':
+                sv_hld = fa_proj.get('SV', 0) + fa_proj.get('HD', 0)
+                if sv_hld >= 15:
+                    fit_score += 15
+                    cats_addressed.append(f"SV+HLD ({sv_hld})")
+            elif cat == 'W' and fa_proj.get('W', 0) >= 8:
+                fit_score += 10
+                cats_addressed.append(f"W ({fa_proj.get('W', 0)})")
+            elif cat == 'L':  # Lower is better
+                if fa_proj.get('L', 10) <= 8 and fa_proj.get('IP', 0) >= 100:
+                    fit_score += 8
+                    cats_addressed.append(f"Low L ({fa_proj.get('L', 0)})")
+
+    # Bonus for addressing multiple categories
+    if len(cats_addressed) >= 2:
+        fit_score += 10  # Multi-category bonus
+    if len(cats_addressed) >= 3:
+        fit_score += 10  # Even bigger bonus for 3+
+
+    return fit_score, cats_addressed
+
+
+def score_fa_for_team(fa, fa_proj, special_tags, ctx):
+    """Score one free agent for a team, with reasons. Returns None if the FA doesn't fit.
+
+    This is the reference implementation; score_fa_table_for_team must agree with it
+    (tests/test_free_agents.py checks every FA for every team).
+    """
+    weaknesses = ctx['weaknesses']
+    team_window = ctx['team_window']
+    philosophy = ctx['philosophy']
+
+    base_score = fa['dynasty_value']
+    bonus = 0
+    reasons = []
+    fit_explanation = []
+
+    fa_pos = fa['position'].upper()
+    is_hitter = any(pos in fa_pos for pos in FA_HITTER_POSITIONS)
+    is_sp = 'SP' in fa_pos
+    is_rp = 'RP' in fa_pos
+
+    # Multi-category fit analysis
+    multi_fit_score, cats_addressed = calculate_multi_category_fit(fa_proj, is_hitter, ctx['worst_cats'])
+    if multi_fit_score > 0:
+        bonus += multi_fit_score
+        if len(cats_addressed) >= 2:
+            reasons.append(f"Addresses {len(cats_addressed)} needs")
+            fit_explanation.extend(cats_addressed)
+
+    # Category need bonus with specific stat matching
+    if is_hitter:
+        hr_proj = fa_proj.get('HR', 0)
+        sb_proj = fa_proj.get('SB', 0)
+        rbi_proj = fa_proj.get('RBI', 0)
+
+        if 'HR' in weaknesses and hr_proj >= 20:
+            if 'HR' not in str(cats_addressed):
+                bonus += 20
+                reasons.append(f"+{hr_proj} HR projected")
+        elif 'HR' in weaknesses and hr_proj >= 15:
+            if 'HR' not in str(cats_addressed):
+                bonus += 12
+
+        if 'SB' in weaknesses and sb_proj >= 15:
+            if 'SB' not in str(cats_addressed):
+                bonus += 20
+                reasons.append(f"+{sb_proj} SB projected")
+        elif 'SB' in weaknesses and sb_proj >= 10:
+            if 'SB' not in str(cats_addressed):
+                bonus += 12
+
+        if 'RBI' in weaknesses and rbi_proj >= 70:
+            if 'RBI' not in str(cats_addressed):
+                bonus += 15
+                reasons.append(f"Run producer ({rbi_proj} RBI)")
+
+        # Power + speed combo detection
+        if hr_proj >= 15 and sb_proj >= 15:
+            bonus += 10
+            reasons.append(f"Power/Speed combo")
+
+    if is_sp:
+        k_proj = fa_proj.get('K', 0)
+        era_proj = fa_proj.get('ERA', 5.0)
+        qs_proj = fa_proj.get('QS', 0)
+        ip_proj = fa_proj.get('IP', 0)
+
+        if 'K' in weaknesses and k_proj >= 150:
+            if 'K' not in str(cats_addressed):
+                bonus += 20
+                reasons.append(f"Strikeout arm ({k_proj} K)")
+        elif 'K' in weaknesses and k_proj >= 100:
+            if 'K' not in str(cats_addressed):
+                bonus += 12
+
+        if 'ERA' in weaknesses and era_proj <= 3.50:
+            if 'ERA' not in str(cats_addressed):
+                bonus += 15
+                reasons.append(f"Elite ratios ({era_proj:.2f} ERA)")
+
+        # Workhouse bonus for contenders
+        if team_window in ['win-now', 'contender'] and ip_proj >= 170 and qs_proj >= 15:
+            bonus += 12
+            reasons.append(f"Workhouse ({ip_proj:.0f} IP)")
+
+    if is_rp:
+        sv_proj = fa_proj.get('SV', 0)
+        hld_proj = fa_proj.get('HD', 0)
+        era_proj = fa_proj.get('ERA', 5.0)
+
+        if 'SV+HLD' in weaknesses:
+            if sv_proj >= 20:
+                bonus += 25
+                reasons.append(f"Closer ({sv_proj} SV proj)")
+            elif sv_proj >= 10 or hld_proj >= 15:
+                bonus += 15
+                reasons.append(f"Reliever help ({sv_proj+hld_proj} SV+HD)")
+
+        # Elite ratio reliever
+        if era_proj <= 3.00 and fa_proj.get('WHIP', 1.5) <= 1.10:
+            bonus += 8
+            reasons.append("Elite ratios RP")
+
+    # Critical positional need - big bonus
+    pos_reason_added = False
+    for need_pos in ctx['critical_needs']:
+        if need_pos in fa_pos:
+            bonus += 20
+            reasons.append(f"CRITICAL {need_pos} need")
+            pos_reason_added = True
+            break
+
+    if not pos_reason_added:
+        # Regular positional need
+        for need_pos in ctx['positional_needs']:
+            if need_pos in fa_pos:
+                bonus += 10
+                reasons.append(f"Adds {need_pos} depth")
+                pos_reason_added = True
+                break
+
+    # Aging position replacement (for dynasty/rebuilding teams)
+    if not pos_reason_added and team_window in ['rebuilding', 'rising', 'dynasty']:
+        for aging_pos in ctx['aging_positions']:
+            if aging_pos in fa_pos and fa['age'] <= 27:
+                bonus += 12
+                reasons.append(f"Replaces aging {aging_pos}")
+                break
+
+    # Window alignment with specific recommendations
+    age = fa['age']
+    if team_window in ['rebuilding', 'rising']:
+        if age <= 25:
+            bonus += 15
+            reasons.append("Young asset for future")
+        elif age <= 27:
+            bonus += 8
+            reasons.append("Fits rebuild timeline")
+        elif age >= 32:
+            bonus -= 15  # Stronger penalty for old players on rebuilding teams
+    elif team_window in ['win-now', 'contender']:
+        if 26 <= age <= 31:
+            bonus += 12
+            reasons.append("Win-now fit")
+        elif age <= 25 and base_score >= 55:
+            bonus += 8
+            reasons.append("Ready to contribute now")
+        # Contenders should grab proven players
+        if fa['roster_pct'] >= 60 and age >= 28 and age <= 32:
+            bonus += 5
+            reasons.append("Proven veteran")
+    elif team_window == 'dynasty':
+        if age <= 26:
+            bonus += 12
+            reasons.append("Dynasty building block")
+        elif age <= 28 and base_score >= 50:
+            bonus += 6
+            reasons.append("Core piece")
+
+    # Roster % as quality indicator
+    if fa['roster_pct'] >= 70:
+        bonus += 8
+        if len(reasons) < 4:
+            reasons.append(f"High demand ({fa['roster_pct']:.0f}%)")
+    elif fa['roster_pct'] >= 50:
+        bonus += 4
+
+    # Special value (breakout, undervalued, etc.)
+    if special_tags:
+        bonus += 5 * len(special_tags)
+        reasons.extend(special_tags)
+
+    # ============ GM PHILOSOPHY-BASED ADJUSTMENTS ============
+    # Youth-focused GMs get bonus for young players
+    if philosophy in YOUTH_PHILOSOPHIES:
+        if age <= 24:
+            bonus += 15
+            if "Young asset" not in str(reasons):
+                reasons.append("Aligns with youth focus")
+        elif age <= 26:
+            bonus += 8
+        elif age >= 30:
+            bonus -= 10  # Penalty for older players
+
+    # Production-focused GMs want proven contributors
+    if philosophy in PRODUCTION_PHILOSOPHIES:
+        if fa['roster_pct'] >= 50 and age >= 26:
+            bonus += 12
+            if "proven" not in str(reasons).lower():
+                reasons.append("Proven producer")
+        # Prospects are less valuable to win-now GMs
+        if fa.get('is_prospect') and age <= 22:
+            bonus -= 8
+
+    # Value-focused GMs look for inefficiencies
+    if philosophy in VALUE_PHILOSOPHIES:
+        # Low roster % but high value = inefficiency
+        if fa['roster_pct'] <= 40 and base_score >= 40:
+            bonus += 15
+            reasons.append("Underowned value")
+        # Breakout candidates
+        if age <= 27 and base_score >= 35 and fa['roster_pct'] <= 50:
+            bonus += 8
+            if "breakout" not in str(reasons).lower():
+                reasons.append("Breakout candidate")
+
+    # GM's preferred categories get bonus
+    for pref_cat in ctx['gm_preferred_cats']:
+        if pref_cat in str(cats_addressed):
+            bonus += 10
+            reasons.append(f"Fits {pref_cat} priority")
+            break
+
+    # Don't recommend players that don't fit at all
+    if bonus < -5:  # Allow slightly negative if strong in other areas
+        return None
+
+    # Generate detailed fit explanation
+    full_explanation = ""
+    if fit_explanation:
+        full_explanation = f"Addresses your needs in: {', '.join(fit_explanation[:3])}"
+    elif reasons:
+        full_explanation = reasons[0] if reasons else "Available depth"
+
+    return {
+        **fa,
+        'fit_score': round(base_score + bonus, 1),
+        'reasons': reasons[:4] if reasons else ["Available depth"],
+        'fit_explanation': full_explanation,
+        'categories_addressed': cats_addressed,
+        'special_tags': special_tags
+    }
+
+
+def score_fa_table_for_team(ctx):
+    """Vectorized score_fa_for_team over the whole FA table.
+
+    Returns (scores, keep) arrays aligned with FREE_AGENTS; keep is False for
+    rows score_fa_for_team would reject.
+    """
+    f = get_fa_features()
+    n = f['n']
+    s = f['stats']
+    is_hitter, is_sp, is_rp = f['is_hitter'], f['is_sp'], f['is_rp']
+    age, ros, base = f['age'], f['roster_pct'], f['dynasty_value']
+    weaknesses = set(ctx['weaknesses'])
+    team_window = ctx['team_window']
+    philosophy = ctx['philosophy']
+    none = np.zeros(n, dtype=bool)
+    bonus = np.zeros(n)
+
+    # Multi-category fit: (test, points, label as it appears in cats_addressed)
+    hitter_tests = {
+        'HR': (s['HR'] >= 15, 15, 'HR'), 'SB': (s['SB'] >= 10, 15, 'SB'),
+        'RBI': (s['RBI'] >= 60, 12, 'RBI'), 'R': (s['R'] >= 60, 12, 'R'),
+        'AVG': (s['AVG'] >= .280, 10, 'AVG'), 'OPS': (s['OPS'] >= .800, 10, 'OPS'),
+        'SO': (s['SO'] <= 100, 8, 'Low K'),
+    }
+    pitcher_tests = {
+        'K': (s['K'] >= 100, 15, 'K'), 'QS': (s['QS'] >= 10, 15, 'QS'),
+        'ERA': (s['ERA'] <= 4.00, 12, 'ERA'), 'WHIP': (s['WHIP'] <= 1.25, 12, 'WHIP'),
+        'SV+HLD': (s['SV'] + s['HD'] >= 15, 15, 'SV+HLD'), 'W': (s['W'] >= 8, 10, 'W'),
+        'L': ((s['L'] <= 8) & (s['IP'] >= 100), 8, 'Low L'),
+    }
+    addressed = {}  # label -> bool array
+    n_addressed = np.zeros(n)
+    for cat in ctx['worst_cats']:
+        for tests, rows in ((hitter_tests, is_hitter), (pitcher_tests, ~is_hitter)):
+            if cat in tests:
+                test, points, label = tests[cat]
+                hit = test & rows
+                bonus += points * hit
+                n_addressed += hit
+                addressed[label] = addressed.get(label, none) | hit
+    bonus += 10 * (n_addressed >= 2) + 10 * (n_addressed >= 3)
+
+    def addressed_mentions(text):
+        # Equivalent of `text in str(cats_addressed)`
+        mask = none
+        for label, hit in addressed.items():
+            if text in label:
+                mask = mask | hit
+        return mask
+
+    # Category need bonus with specific stat matching
+    if 'HR' in weaknesses:
+        open_rows = is_hitter & ~addressed_mentions('HR')
+        bonus += 20 * (open_rows & (s['HR'] >= 20)) + 12 * (open_rows & (s['HR'] < 20) & (s['HR'] >= 15))
+    if 'SB' in weaknesses:
+        open_rows = is_hitter & ~addressed_mentions('SB')
+        bonus += 20 * (open_rows & (s['SB'] >= 15)) + 12 * (open_rows & (s['SB'] < 15) & (s['SB'] >= 10))
+    if 'RBI' in weaknesses:
+        bonus += 15 * (is_hitter & ~addressed_mentions('RBI') & (s['RBI'] >= 70))
+    bonus += 10 * (is_hitter & (s['HR'] >= 15) & (s['SB'] >= 15))
+
+    if 'K' in weaknesses:
+        open_rows = is_sp & ~addressed_mentions('K')
+        bonus += 20 * (open_rows & (s['K'] >= 150)) + 12 * (open_rows & (s['K'] < 150) & (s['K'] >= 100))
+    if 'ERA' in weaknesses:
+        bonus += 15 * (is_sp & ~addressed_mentions('ERA') & (s['ERA'] <= 3.50))
+    if team_window in ['win-now', 'contender']:
+        bonus += 12 * (is_sp & (s['IP'] >= 170) & (s['QS'] >= 15))
+
+    if 'SV+HLD' in weaknesses:
+        closer = is_rp & (s['SV'] >= 20)
+        bonus += 25 * closer + 15 * (is_rp & ~closer & ((s['SV'] >= 10) | (s['HD'] >= 15)))
+    bonus += 8 * (is_rp & (s['ERA'] <= 3.00) & (s['WHIP'] <= 1.10))
+
+    # Positional needs (critical first, then regular, then aging replacement)
+    critical = none
+    for pos in ctx['critical_needs']:
+        critical = critical | f['has_pos'][pos]
+    regular = none
+    for pos in ctx['positional_needs']:
+        regular = regular | f['has_pos'][pos]
+    regular = regular & ~critical
+    bonus += 20 * critical + 10 * regular
+    if team_window in ['rebuilding', 'rising', 'dynasty']:
+        aging = none
+        for pos in ctx['aging_positions']:
+            aging = aging | f['has_pos'][pos]
+        bonus += 12 * (~critical & ~regular & aging & (age <= 27))
+
+    # Window alignment
+    if team_window in ['rebuilding', 'rising']:
+        bonus += np.select([age <= 25, age <= 27, age >= 32], [15, 8, -15], 0)
+    elif team_window in ['win-now', 'contender']:
+        bonus += np.select([(age >= 26) & (age <= 31), (age <= 25) & (base >= 55)], [12, 8], 0)
+        bonus += 5 * ((ros >= 60) & (age >= 28) & (age <= 32))
+    elif team_window == 'dynasty':
+        bonus += np.select([age <= 26, (age <= 28) & (base >= 50)], [12, 6], 0)
+
+    # Roster % and special value tags
+    bonus += np.select([ros >= 70, ros >= 50], [8, 4], 0)
+    bonus += 5 * f['n_tags']
+
+    # GM philosophy
+    if philosophy in YOUTH_PHILOSOPHIES:
+        bonus += np.select([age <= 24, age <= 26, age >= 30], [15, 8, -10], 0)
+    if philosophy in PRODUCTION_PHILOSOPHIES:
+        bonus += 12 * ((ros >= 50) & (age >= 26)) - 8 * (f['is_prospect'] & (age <= 22))
+    if philosophy in VALUE_PHILOSOPHIES:
+        bonus += 15 * ((ros <= 40) & (base >= 40)) + 8 * ((age <= 27) & (base >= 35) & (ros <= 50))
+    preferred = none
+    for pref_cat in ctx['gm_preferred_cats']:
+        preferred = preferred | addressed_mentions(pref_cat)
+    bonus += 10 * preferred
+
+    return base + bonus, bonus >= -5
+
+
+def _top_fa_rows(scores, mask, k):
+    """Indices of the k best rows under mask, ties broken by FA list order."""
+    rows = np.flatnonzero(mask)
+    if len(rows) == 0 or k <= 0:
+        return []
+    order = np.lexsort((rows, -np.round(scores[rows], 1)))
+    return rows[order[:k]].tolist()
+
+
+def recommend_free_agents(ctx, position_filter='', k=30, per_position=0):
+    """Top-k FA suggestions for a team (plus optional top-N per need position).
+
+    Scores every FA in one vectorized pass; reason strings are only built for
+    rows that are returned.
+    """
+    f = get_fa_features()
+    scores, keep = score_fa_table_for_team(ctx)
+    if position_filter:
+        keep = keep & np.array([position_filter in pos for pos in f['positions']], dtype=bool)
+
+    def build(rows):
+        entries = []
+        for i in rows:
+            entry = score_fa_for_team(FREE_AGENTS[i], f['projections'][i], f['tags'][i], ctx)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    suggestions = build(_top_fa_rows(scores, keep, k))
+    by_position = None
+    if per_position > 0:
+        by_position = {
+            pos: build(_top_fa_rows(scores, keep & f['eligible'][pos], per_position))
+            for pos in FA_NEED_POSITIONS
+        }
+    return suggestions, by_position
 
 
 def load_ages_from_fantrax_csv():
@@ -6057,7 +7128,7 @@ def load_data_from_json():
                 # Load actual stats if available
                 actual = p.get('actual_stats')
                 if actual:
-                    player_actual_stats[p['name']] = actual
+                    store_actual_stats(p['name'], actual)
 
                 # Load fantasy points if available
                 fp = p.get('fantasy_points')
@@ -6089,6 +7160,7 @@ def load_data_from_json():
         print(f"Loaded {len(player_actual_stats)} players with actual stats")
         print(f"Loaded {len(player_fantasy_points)} players with fantasy points")
         print(f"Standings: {len(league_standings)}, Matchups: {len(league_matchups)}, Transactions: {len(league_transactions)}")
+        bump_data_version("league data loaded from JSON")
         return True
 
     except Exception as e:
@@ -6134,6 +7206,7 @@ def load_data_from_csv():
         teams.update(load_fantrax_data(csv_path))
         interactive = InteractiveTradeAnalyzer(dict(teams))
         print(f"Loaded {len(teams)} teams from CSV: {csv_path}")
+        bump_data_version("league data loaded from CSV")
         return True
     except Exception as e:
         print(f"Failed to load from CSV: {e}")
@@ -6827,8 +7900,16 @@ def get_context_aware_verdict(value_diff, winner, loser, winner_context, loser_c
     }
 
 
+PICK_STRING_CACHE_SIZE = 1024  # transaction pick strings parsed once each, bounded
+
+
+@lru_cache(maxsize=PICK_STRING_CACHE_SIZE)
 def _calculate_pick_value_from_string(pick_string):
     """Calculate pick value from a string like '2026 Draft Pick, Round 3 Pick 6'."""
+    return _parse_pick_value_from_string(pick_string)
+
+
+def _parse_pick_value_from_string(pick_string):
     try:
         # Extract round and pick number
         import re
@@ -6951,6 +8032,7 @@ def load_data_from_api():
             print(f"Could not load transactions: {e}")
 
         print(f"Loaded {len(teams)} teams with {total_players} players from Fantrax API")
+        bump_data_version("league data loaded from Fantrax API")
         return True
 
     except Exception as e:
@@ -6958,6 +8040,170 @@ def load_data_from_api():
         return False
 
 
+# ============================================================================
+# PROSPECT BOARD (built once per data version, patched on roster moves)
+# ============================================================================
+# One entry per canonical prospect name (the PROSPECT_RANKINGS spelling).
+# Precedence matches the old /prospects merge: rostered > FA list > rankings.
+
+PROSPECT_BOARD = {}  # canonical name -> board entry
+_prospect_board_order = []  # canonical names sorted by rank
+_prospect_board_version = -1
+
+
+def get_prospect_level_and_eta(name, rank, alt_name=None):
+    """CFR level and ETA (years) for a prospect, estimating from rank when level is unknown."""
+    level = CFR_PROSPECT_LEVELS.get(name) or (CFR_PROSPECT_LEVELS.get(alt_name) if alt_name else None)
+    if level and level in LEVEL_TO_ETA:
+        return level, LEVEL_TO_ETA[level]
+    # Same fallback as calculate_prospect_proximity
+    if rank <= 25:
+        return level, 1.0
+    elif rank <= 100:
+        return level, 2.0
+    return level, 3.0
+
+
+def _rostered_prospect_entry(player, team_name, value=None):
+    canonical = getattr(player, 'prospect_name', None) or player.name
+    level, eta = get_prospect_level_and_eta(canonical, player.prospect_rank, player.name)
+    if value is None:
+        value = calc_player_value(player)
+    return canonical, {
+        "name": player.name,
+        "rank": player.prospect_rank,
+        "position": player.position,
+        "age": player.age,
+        "mlb_team": player.mlb_team,
+        "fantasy_team": team_name,
+        "value": round(value, 1),
+        "is_free_agent": False,
+        "not_in_league": False,
+        "level": level,
+        "eta": eta
+    }
+
+
+def _fa_prospect_entry(fa):
+    canonical = fa.get('prospect_name') or fa['name']
+    level, eta = get_prospect_level_and_eta(canonical, fa['prospect_rank'], fa['name'])
+    return canonical, {
+        "name": fa['name'],  # Use FA name for display
+        "rank": fa['prospect_rank'],
+        "position": fa['position'],
+        "age": fa['age'],
+        "mlb_team": fa['mlb_team'],
+        "fantasy_team": "Free Agent",
+        "value": fa['dynasty_value'],
+        "is_free_agent": True,
+        "not_in_league": False,
+        "level": level,
+        "eta": eta
+    }
+
+
+def _ranked_prospect_entry(name, rank):
+    # Not on a roster or in the FA file, but every ranked prospect is in the Fantrax pool
+    metadata = PROSPECT_METADATA.get(name, {})
+    level, eta = get_prospect_level_and_eta(name, rank)
+    return name, {
+        "name": name,
+        "rank": rank,
+        "position": metadata.get('position', 'UTIL'),
+        "age": metadata.get('age', 0),
+        "mlb_team": metadata.get('mlb_team', 'N/A'),
+        "fantasy_team": "Free Agent",
+        "value": round(calculate_prospect_value(rank), 1),
+        "is_free_agent": True,
+        "not_in_league": False,
+        "level": level,
+        "eta": eta
+    }
+
+
+def _is_board_prospect(player):
+    return player.is_prospect and player.prospect_rank and player.prospect_rank <= 300
+
+
+def _resort_prospect_board():
+    global _prospect_board_order
+    _prospect_board_order = sorted(PROSPECT_BOARD, key=lambda n: PROSPECT_BOARD[n]["rank"])
+
+
+def build_prospect_board():
+    """Merge rostered prospects, FA prospects and PROSPECT_RANKINGS (top 300) into PROSPECT_BOARD."""
+    global _prospect_board_version
+    PROSPECT_BOARD.clear()
+
+    for team_name, team in teams.items():
+        for player in team.players:
+            if _is_board_prospect(player):
+                canonical, entry = _rostered_prospect_entry(player, team_name)
+                PROSPECT_BOARD[canonical] = entry
+
+    for fa in FREE_AGENTS:
+        if fa.get('is_prospect') and fa.get('prospect_rank') and fa['prospect_rank'] <= 300:
+            canonical, entry = _fa_prospect_entry(fa)
+            if canonical not in PROSPECT_BOARD:
+                PROSPECT_BOARD[canonical] = entry
+
+    for name, rank in PROSPECT_RANKINGS.items():
+        # Skip alias names (the player is found under their canonical name)
+        if name in PROSPECT_NAME_ALIASES or rank > 300:
+            continue
+        if name not in PROSPECT_BOARD:
+            PROSPECT_BOARD[name] = _ranked_prospect_entry(name, rank)[1]
+
+    _resort_prospect_board()
+    _prospect_board_version = _data_version
+    return PROSPECT_BOARD
+
+
+def get_prospect_board():
+    """Prospect board for the current data version (rebuilt only after a data change)."""
+    if _prospect_board_version != _data_version:
+        build_prospect_board()
+    return PROSPECT_BOARD
+
+
+def prospect_board_add_rostered(player, team_name):
+    """Patch the board after a player joins team_name (call after bump_data_version,
+    only if the board was current for the previous version)."""
+    global _prospect_board_version
+    _prospect_board_version = _data_version
+    if not _is_board_prospect(player):
+        return
+    canonical, entry = _rostered_prospect_entry(player, team_name)
+    old_rank = PROSPECT_BOARD.get(canonical, {}).get("rank")
+    PROSPECT_BOARD[canonical] = entry
+    if old_rank != entry["rank"]:
+        _resort_prospect_board()
+
+
+def query_prospect_board(level=None, position=None, owner=None, max_rank=None):
+    """Prospect board entries in rank order, filtered by level, position, owner or rank cutoff.
+
+    owner may be a fantasy team name or 'Free Agent'.
+    """
+    board = get_prospect_board()
+    wanted = position_filter_mask(position) if position else 0
+    if position and not wanted:
+        return []
+    results = []
+    for name in _prospect_board_order:
+        entry = board[name]
+        if max_rank and entry["rank"] > max_rank:
+            break
+        if level and entry["level"] != level:
+            continue
+        if owner and entry["fantasy_team"] != owner:
+            continue
+        if wanted and not eligibility_mask(entry["position"]) & wanted:
+            continue
+        results.append(entry)
+    return results
+
+
 # ============================================================================
 # ROUTE HANDLERS
 # ============================================================================
@@ -6968,6 +8214,7 @@ def index():
 
 
 @app.route('/teams')
+@cached_response
 def get_teams():
     draft_order, power_rankings, team_totals = get_team_rankings()
     return jsonify({
@@ -6982,131 +8229,77 @@ def get_teams():
 
 
 @app.route('/prospects')
+@cached_response
 def get_prospects():
-    """Get all 200 prospects, including those not in the league."""
-    # Track which prospects we've found (by name)
-    found_prospects = {}  # name -> prospect_data
+    """Get the top 300 prospects, including those not in the league.
 
-    # Get prospects from team rosters
-    for team_name, team in teams.items():
-        for player in team.players:
-            if player.is_prospect and player.prospect_rank and player.prospect_rank <= 300:
-                value = calc_player_value(player)
-                # Use matched prospect name as key (for consistency with PROSPECT_RANKINGS)
-                prospect_key = getattr(player, 'prospect_name', None) or player.name
-                found_prospects[prospect_key] = {
-                    "name": player.name,
-                    "rank": player.prospect_rank,
-                    "position": player.position,
-                    "age": player.age,
-                    "mlb_team": player.mlb_team,
-                    "fantasy_team": team_name,
-                    "value": round(value, 1),
-                    "is_free_agent": False,
-                    "not_in_league": False
-                }
+    Optional filters: level (CFR level, e.g. AA), position, owner (team name or 'Free Agent').
+    """
+    prospects = query_prospect_board(
+        level=request.args.get('level') or None,
+        position=request.args.get('position') or None,
+        owner=request.args.get('owner') or None,
+    )
+    return jsonify({"prospects": prospects, "value_version": PROSPECT_VALUE_VERSION})
 
-    # Get prospects from free agents
-    # Use the stored prospect_name which was matched during load_free_agents()
-    for fa in FREE_AGENTS:
-        if fa.get('is_prospect') and fa.get('prospect_rank') and fa['prospect_rank'] <= 300:
-            # Use the stored prospect_name (matched during FA loading)
-            prospect_name = fa.get('prospect_name') or fa['name']
-
-            if prospect_name not in found_prospects:
-                found_prospects[prospect_name] = {
-                    "name": fa['name'],  # Use FA name for display
-                    "rank": fa['prospect_rank'],
-                    "position": fa['position'],
-                    "age": fa['age'],
-                    "mlb_team": fa['mlb_team'],
-                    "fantasy_team": "Free Agent",
-                    "value": fa['dynasty_value'],
-                    "is_free_agent": True,
-                    "not_in_league": False
-                }
 
-    # Add any prospects from PROSPECT_RANKINGS (1-300) that weren't found in rosters or FA list
-    # These are all available as Free Agents in Fantrax (user confirmed all prospects are in the pool)
-    # Skip alias names (keys in PROSPECT_NAME_ALIASES) to avoid duplicates
-    for name, rank in PROSPECT_RANKINGS.items():
-        # Skip if this is an alias name (the player will be found under their canonical name)
-        if name in PROSPECT_NAME_ALIASES:
-            continue
-        # Only show top 300 prospects
-        if rank > 300:
-            continue
-        if name not in found_prospects:
-            metadata = PROSPECT_METADATA.get(name, {})
-            # Use tiered exponential decay formula (realistic dynasty values)
-            est_value = calculate_prospect_value(rank)
-
-            # All prospects are available in Fantrax pool - show as Free Agent
-            found_prospects[name] = {
-                "name": name,
-                "rank": rank,
-                "position": metadata.get('position', 'UTIL'),
-                "age": metadata.get('age', 0),
-                "mlb_team": metadata.get('mlb_team', 'N/A'),
-                "fantasy_team": "Free Agent",
-                "value": round(est_value, 1),
-                "is_free_agent": True,
-                "not_in_league": False
-            }
+@league_graph.node('team_categories')
+def _graph_team_categories(team_name):
+    """One team's projected category totals from its optimal starting lineup."""
+    players = league_graph.get(('roster', team_name))
+    league_graph.get(('team_projections', team_name))
+    return compute_team_categories(get_active_lineup(players))
 
-    # Convert to list and sort by rank
-    all_prospects = list(found_prospects.values())
-    all_prospects.sort(key=lambda x: x["rank"])
 
-    return jsonify({"prospects": all_prospects})
+def compute_team_categories(players):
+    """Projected category totals for any list of players (a roster, or a hypothetical one)."""
+    hr = sum(HITTER_PROJECTIONS.get(p.name, {}).get('HR', 0) for p in players)
+    sb = sum(HITTER_PROJECTIONS.get(p.name, {}).get('SB', 0) for p in players)
+    rbi = sum(HITTER_PROJECTIONS.get(p.name, {}).get('RBI', 0) for p in players)
+    runs = sum(HITTER_PROJECTIONS.get(p.name, {}).get('R', 0) for p in players)
+    so = sum(HITTER_PROJECTIONS.get(p.name, {}).get('SO', 0) for p in players)  # Hitter strikeouts (lower is better)
+    k = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in players)
+    sv_hld = sum((RELIEVER_PROJECTIONS.get(p.name, {}).get('SV', 0) + RELIEVER_PROJECTIONS.get(p.name, {}).get('HD', 0)) for p in players)
+    ip = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in players)
 
+    # Calculate QS (Quality Starts) - from starters only
+    qs = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('QS', 0) for p in players)
 
-def calculate_league_category_rankings():
-    """Calculate each team's category totals and rankings across the league."""
-    team_cats = {}
-    for t_name, t in teams.items():
-        # Calculate team totals
-        hr = sum(HITTER_PROJECTIONS.get(p.name, {}).get('HR', 0) for p in t.players)
-        sb = sum(HITTER_PROJECTIONS.get(p.name, {}).get('SB', 0) for p in t.players)
-        rbi = sum(HITTER_PROJECTIONS.get(p.name, {}).get('RBI', 0) for p in t.players)
-        runs = sum(HITTER_PROJECTIONS.get(p.name, {}).get('R', 0) for p in t.players)
-        so = sum(HITTER_PROJECTIONS.get(p.name, {}).get('SO', 0) for p in t.players)  # Hitter strikeouts (lower is better)
-        k = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in t.players)
-        sv_hld = sum((RELIEVER_PROJECTIONS.get(p.name, {}).get('SV', 0) + RELIEVER_PROJECTIONS.get(p.name, {}).get('HD', 0)) for p in t.players)
-        ip = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in t.players)
-
-        # Calculate QS (Quality Starts) - from starters only
-        qs = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('QS', 0) for p in t.players)
-
-        # Calculate L (Losses) - from both starters and relievers
-        losses = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('L', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('L', 0)) for p in t.players)
-
-        # Calculate BB (Walks) for K/BB ratio - from both starters and relievers
-        bb = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('BB', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('BB', 0)) for p in t.players)
-        k_bb = k / bb if bb > 0 else 0
-
-        # Calculate weighted ERA and WHIP
-        era_weighted = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('ERA', 0) * PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in t.players)
-        whip_weighted = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('WHIP', 0) * PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in t.players)
-        era = era_weighted / ip if ip > 0 else 5.00
-        whip = whip_weighted / ip if ip > 0 else 1.50
-
-        # Calculate weighted AVG and OPS (weighted by AB since PA not in projections)
-        ab = sum(HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in t.players)
-        hits = sum(HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) * HITTER_PROJECTIONS.get(p.name, {}).get('AVG', 0) for p in t.players)
-        ops_weighted = sum(HITTER_PROJECTIONS.get(p.name, {}).get('OPS', 0) * HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in t.players)
-        avg = hits / ab if ab > 0 else .250
-        ops = ops_weighted / ab if ab > 0 else .700
-
-        team_cats[t_name] = {
-            'HR': hr, 'SB': sb, 'RBI': rbi, 'R': runs, 'SO': so, 'K': k, 'SV+HLD': sv_hld,
-            'ERA': era, 'WHIP': whip, 'AVG': avg, 'OPS': ops, 'IP': ip,
-            'QS': qs, 'L': losses, 'K/BB': k_bb
-        }
+    # Calculate L (Losses) - from both starters and relievers
+    losses = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('L', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('L', 0)) for p in players)
+
+    # Calculate BB (Walks) for K/BB ratio - from both starters and relievers
+    bb = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('BB', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('BB', 0)) for p in players)
+    k_bb = k / bb if bb > 0 else 0
+
+    # Calculate weighted ERA and WHIP
+    era_weighted = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('ERA', 0) * PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in players)
+    whip_weighted = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('WHIP', 0) * PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in players)
+    era = era_weighted / ip if ip > 0 else 5.00
+    whip = whip_weighted / ip if ip > 0 else 1.50
+
+    # Calculate weighted AVG and OPS (weighted by AB since PA not in projections)
+    ab = sum(HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in players)
+    hits = sum(HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) * HITTER_PROJECTIONS.get(p.name, {}).get('AVG', 0) for p in players)
+    ops_weighted = sum(HITTER_PROJECTIONS.get(p.name, {}).get('OPS', 0) * HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in players)
+    avg = hits / ab if ab > 0 else .250
+    ops = ops_weighted / ab if ab > 0 else .700
+
+    return {
+        'HR': hr, 'SB': sb, 'RBI': rbi, 'R': runs, 'SO': so, 'K': k, 'SV+HLD': sv_hld,
+        'ERA': era, 'WHIP': whip, 'AVG': avg, 'OPS': ops, 'IP': ip,
+        'QS': qs, 'L': losses, 'K/BB': k_bb
+    }
+
+
+@league_graph.node('category_rankings')
+def _graph_category_rankings():
+    team_names = league_graph.get(('league',))
+    team_cats = {t_name: league_graph.get(('team_categories', t_name)) for t_name in team_names}
 
     # Calculate rankings for each category
     rankings = {}
-    for t_name in teams.keys():
+    for t_name in team_names:
         rankings[t_name] = {}
 
     # Higher is better categories
@@ -7124,17 +8317,33 @@ def calculate_league_category_rankings():
     return team_cats, rankings
 
 
-def simulate_trade_impact(team_a_name, team_b_name, players_a, players_b):
+def calculate_league_category_rankings():
+    """Calculate each team's category totals and rankings across the league."""
+    return league_graph.get(('category_rankings',))
+
+
+def trade_impact_baseline():
+    """Current category ranks and championship odds, shared by many simulate_trade_impact calls."""
+    _, current_rankings = calculate_league_category_rankings()
+    return current_rankings, dict(get_normalized_championship_odds())
+
+
+def simulate_trade_impact(team_a_name, team_b_name, players_a, players_b, baseline=None):
     """
     Simulate the impact of a trade on category rankings and championship odds.
     players_a: list of Player objects Team A is sending
     players_b: list of Player objects Team B is sending
+    baseline: optional trade_impact_baseline() to skip re-reading the
+    untouched league (the restore is lazy, so back-to-back calls each pay
+    for one recompute)
     Returns before/after comparison for both teams.
     """
     # Get current rankings and odds
-    current_cats, current_rankings = calculate_league_category_rankings()
-    current_odds_a = get_team_championship_odds(team_a_name)
-    current_odds_b = get_team_championship_odds(team_b_name)
+    if baseline is None:
+        baseline = trade_impact_baseline()
+    current_rankings, current_odds = baseline
+    current_odds_a = current_odds.get(team_a_name, 0)
+    current_odds_b = current_odds.get(team_b_name, 0)
 
     # Store original rosters
     team_a = teams[team_a_name]
@@ -7151,6 +8360,7 @@ def simulate_trade_impact(team_a_name, team_b_name, players_a, players_b):
     # Temporarily swap rosters
     team_a.players = simulated_roster_a
     team_b.players = simulated_roster_b
+    mark_rosters_changed(team_a_name, team_b_name)
 
     try:
         # Calculate new rankings and odds
@@ -7161,6 +8371,7 @@ def simulate_trade_impact(team_a_name, team_b_name, players_a, players_b):
         # Restore original rosters
         team_a.players = original_roster_a
         team_b.players = original_roster_b
+        mark_rosters_changed(team_a_name, team_b_name)
 
     # Build impact summary for each team
     def build_impact(team_name, old_ranks, new_ranks, old_odds, new_odds):
@@ -7243,231 +8454,218 @@ def debug_prospects(team_name):
     })
 
 
-@app.route('/team/<team_name>')
-def get_team(team_name):
-    try:
-        if team_name not in teams:
-            return jsonify({"error": f"Team '{team_name}' not found", "available_teams": list(teams.keys())}), 404
-
-        team = teams[team_name]
-        draft_order, power_rankings, team_totals = get_team_rankings()
-
-        players_with_value = [(p, calc_player_value(p)) for p in team.players]
-        players_with_value.sort(key=lambda x: x[1], reverse=True)
-
-        players = []
-        for p, value in players_with_value:
-            # Get projections for player info
-            proj = HITTER_PROJECTIONS.get(p.name) or PITCHER_PROJECTIONS.get(p.name) or RELIEVER_PROJECTIONS.get(p.name, {})
-            proj_str = ""
-            if proj:
-                if p.name in HITTER_PROJECTIONS:
-                    proj_str = f"{proj.get('HR', 0)} HR, {proj.get('RBI', 0)} RBI, .{int(proj.get('AVG', 0)*1000):03d} AVG"
-                elif p.name in PITCHER_PROJECTIONS:
-                    proj_str = f"{proj.get('K', 0)} K, {proj.get('ERA', 0):.2f} ERA"
-                elif p.name in RELIEVER_PROJECTIONS:
-                    proj_str = f"{proj.get('SV', 0)} SV, {proj.get('ERA', 0):.2f} ERA"
-
-            players.append({
-                "name": p.name,
-                "position": p.position,
-                "team": p.mlb_team,
-                "age": p.age,
-                "value": round(value, 1),
-                "status": p.roster_status,
-                "proj": proj_str
-            })
+def build_team_detail(team_name, rankings=None, category_rankings=None):
+    """Team detail payload (as served by /team/<name>).
 
-        total_value = team_totals.get(team_name, 0)
-        power_rank = power_rankings.get(team_name, 0)
-        draft_pick = draft_order.get(team_name, 0)
+    rankings / category_rankings are the results of get_team_rankings() and
+    calculate_league_category_rankings(); pass them in to share them across teams.
+    """
+    team = teams[team_name]
+    draft_order, power_rankings, team_totals = rankings or get_team_rankings()
 
-        # Get top players and prospects
-        top_players = players[:20]
+    players_with_value = [(p, calc_player_value(p)) for p in team.players]
+    players_with_value.sort(key=lambda x: x[1], reverse=True)
 
-        # Build prospects list with level and ETA
-        def get_prospect_eta(name, rank):
-            """Calculate ETA in years based on level or rank."""
-            level = CFR_PROSPECT_LEVELS.get(name, '')
-            eta_map = {'MLB': 0, 'AAA': 0.5, 'AA': 1.5, 'A+': 2.5, 'A': 3, 'CPX': 3.5, 'DSL': 4, 'INTL': 4}
-            if level in eta_map:
-                return eta_map[level]
-            # Estimate from rank if no level
-            if rank <= 25:
-                return 1.0
-            elif rank <= 100:
-                return 2.0
-            return 3.0
-
-        prospects = [{
+    players = []
+    for p, value in players_with_value:
+        # Get projections for player info
+        proj = HITTER_PROJECTIONS.get(p.name) or PITCHER_PROJECTIONS.get(p.name) or RELIEVER_PROJECTIONS.get(p.name, {})
+        proj_str = ""
+        if proj:
+            if p.name in HITTER_PROJECTIONS:
+                proj_str = f"{proj.get('HR', 0)} HR, {proj.get('RBI', 0)} RBI, .{int(proj.get('AVG', 0)*1000):03d} AVG"
+            elif p.name in PITCHER_PROJECTIONS:
+                proj_str = f"{proj.get('K', 0)} K, {proj.get('ERA', 0):.2f} ERA"
+            elif p.name in RELIEVER_PROJECTIONS:
+                proj_str = f"{proj.get('SV', 0)} SV, {proj.get('ERA', 0):.2f} ERA"
+
+        players.append({
             "name": p.name,
-            "rank": p.prospect_rank,
-            "age": p.age,
             "position": p.position,
-            "level": CFR_PROSPECT_LEVELS.get(p.name, ''),
-            "eta": get_prospect_eta(p.name, p.prospect_rank)
-        } for p in team.players if p.is_prospect and p.prospect_rank]
-        prospects.sort(key=lambda x: x['rank'])
-
-        # Calculate league-wide category rankings
-        team_cats, league_rankings = calculate_league_category_rankings()
-        my_cats = team_cats.get(team_name, {})
-        my_rankings = league_rankings.get(team_name, {})
-        num_teams = len(teams)
-
-        # Build category details with values and rankings
-        category_details = {
-            'HR': {'value': my_cats.get('HR', 0), 'rank': my_rankings.get('HR', 0)},
-            'SB': {'value': my_cats.get('SB', 0), 'rank': my_rankings.get('SB', 0)},
-            'RBI': {'value': my_cats.get('RBI', 0), 'rank': my_rankings.get('RBI', 0)},
-            'R': {'value': my_cats.get('R', 0), 'rank': my_rankings.get('R', 0)},
-            'AVG': {'value': round(my_cats.get('AVG', .250), 3), 'rank': my_rankings.get('AVG', 0)},
-            'OPS': {'value': round(my_cats.get('OPS', .700), 3), 'rank': my_rankings.get('OPS', 0)},
-            'SO': {'value': my_cats.get('SO', 0), 'rank': my_rankings.get('SO', 0)},
-            'K': {'value': my_cats.get('K', 0), 'rank': my_rankings.get('K', 0)},
-            'ERA': {'value': round(my_cats.get('ERA', 4.50), 2), 'rank': my_rankings.get('ERA', 0)},
-            'WHIP': {'value': round(my_cats.get('WHIP', 1.30), 2), 'rank': my_rankings.get('WHIP', 0)},
-            'SV+HLD': {'value': my_cats.get('SV+HLD', 0), 'rank': my_rankings.get('SV+HLD', 0)},
-            'QS': {'value': my_cats.get('QS', 0), 'rank': my_rankings.get('QS', 0)},
-            'L': {'value': my_cats.get('L', 0), 'rank': my_rankings.get('L', 0)},
-            'K/BB': {'value': round(my_cats.get('K/BB', 0), 2), 'rank': my_rankings.get('K/BB', 0)},
-        }
+            "team": p.mlb_team,
+            "age": p.age,
+            "value": round(value, 1),
+            "status": p.roster_status,
+            "proj": proj_str
+        })
 
-        # Calculate category strengths/weaknesses based on rankings
-        hitting_strengths, hitting_weaknesses = [], []
-        pitching_strengths, pitching_weaknesses = [], []
-
-        top_third = num_teams // 3
-        bottom_third = num_teams - top_third
-
-        for cat in ['HR', 'SB', 'RBI', 'R', 'AVG', 'OPS', 'SO']:
-            rank = my_rankings.get(cat, num_teams)
-            if rank <= top_third:
-                hitting_strengths.append(cat)
-            elif rank >= bottom_third:
-                hitting_weaknesses.append(cat)
-
-        for cat in ['K', 'ERA', 'WHIP', 'SV+HLD', 'QS', 'L', 'K/BB']:
-            rank = my_rankings.get(cat, num_teams)
-            if rank <= top_third:
-                pitching_strengths.append(cat)
-            elif rank >= bottom_third:
-                pitching_weaknesses.append(cat)
-
-        # Positional depth analysis
-        pos_depth = {'C': [], '1B': [], '2B': [], 'SS': [], '3B': [], 'OF': [], 'UT': [], 'SP': [], 'RP': []}
-        for p, v in players_with_value:
-            pos = p.position.upper() if p.position else ''
-            player_info = {"name": p.name, "value": round(v, 1), "age": p.age}
-            matched_any = False
-            if 'C' in pos and '1B' not in pos and 'CF' not in pos:
-                pos_depth['C'].append(player_info)
-                matched_any = True
-            if '1B' in pos:
-                pos_depth['1B'].append(player_info)
-                matched_any = True
-            if '2B' in pos:
-                pos_depth['2B'].append(player_info)
-                matched_any = True
-            if 'SS' in pos:
-                pos_depth['SS'].append(player_info)
-                matched_any = True
-            if '3B' in pos:
-                pos_depth['3B'].append(player_info)
-                matched_any = True
-            if 'OF' in pos or 'LF' in pos or 'CF' in pos or 'RF' in pos:
-                pos_depth['OF'].append(player_info)
-                matched_any = True
-            if 'SP' in pos:
-                pos_depth['SP'].append(player_info)
-                matched_any = True
-            if 'RP' in pos or 'CL' in pos:
-                pos_depth['RP'].append(player_info)
-                matched_any = True
-            # UT/DH/UTIL - only add if they didn't match any specific position
-            # This prevents Ohtani (UT/SP) from double-counting as a hitter
-            if ('UT' in pos or 'DH' in pos or 'UTIL' in pos) and not matched_any:
-                pos_depth['UT'].append(player_info)
-
-        # Sort each position by value (keep all players for full depth chart)
-        for pos in pos_depth:
-            pos_depth[pos] = sorted(pos_depth[pos], key=lambda x: x['value'], reverse=True)
-
-        # Calculate roster composition
-        hitters = len([p for p in team.players if p.name in HITTER_PROJECTIONS])
-        starters = len([p for p in team.players if p.name in PITCHER_PROJECTIONS])
-        relievers = len([p for p in team.players if p.name in RELIEVER_PROJECTIONS])
-        ages = [p.age for p in team.players if p.age > 0]
-        avg_age = round(sum(ages) / len(ages), 1) if ages else 0
-        young_count = len([a for a in ages if a <= 25])
-        prime_count = len([a for a in ages if 26 <= a <= 30])
-        vet_count = len([a for a in ages if a > 30])
-
-        roster_composition = {
-            'hitters': hitters,
-            'starters': starters,
-            'relievers': relievers,
-            'avg_age': avg_age,
-            'young': young_count,
-            'prime': prime_count,
-            'veteran': vet_count
-        }
+    total_value = team_totals.get(team_name, 0)
+    power_rank = power_rankings.get(team_name, 0)
+    draft_pick = draft_order.get(team_name, 0)
+
+    # Get top players and prospects
+    top_players = players[:20]
+
+    # Build prospects list with level and ETA
+    def get_prospect_eta(name, rank):
+        """Calculate ETA in years based on level or rank."""
+        level = CFR_PROSPECT_LEVELS.get(name, '')
+        eta_map = {'MLB': 0, 'AAA': 0.5, 'AA': 1.5, 'A+': 2.5, 'A': 3, 'CPX': 3.5, 'DSL': 4, 'INTL': 4}
+        if level in eta_map:
+            return eta_map[level]
+        # Estimate from rank if no level
+        if rank <= 25:
+            return 1.0
+        elif rank <= 100:
+            return 2.0
+        return 3.0
 
-        # Generate analysis
-        analysis = generate_team_analysis(team_name, team, players_with_value, power_rank, len(teams))
-
-        # Get enhanced window analysis (this populates _window_analysis_cache)
-        _, _, window = calculate_team_needs(team_name)
-        window_analysis = _window_analysis_cache.get(team_name, {})
-
-        # DIRECT CALCULATION - bypass cache issues
-        direct_pp = calculate_prospect_proximity(team.players, CFR_PROSPECT_LEVELS)
-
-        # Build window details for UI display
-        window_details = None
-        if window_analysis:
-            pt = window_analysis.get('peak_timing', {})
-            pp = window_analysis.get('prospect_proximity', {})
-            details = window_analysis.get('details', {})
-            window_details = {
-                'window': window,
-                'window_score': window_analysis.get('score', 0),
-                'core_age': window_analysis.get('core_age', avg_age),
-                'years_in_window': pt.get('years_in_window', 0),
-                'ascending_count': pt.get('ascending_count', 0),
-                'peak_count': pt.get('peak_count', 0),
-                'declining_count': pt.get('declining_count', 0),
-                'prospect_eta': direct_pp.get('avg_eta', 0),
-                'mlb_ready_prospects': direct_pp.get('mlb_ready_count', 0),
-                'prospect_value': direct_pp.get('prospect_value', 0),
-                'score_breakdown': {
-                    'rank': details.get('rank_score', 0),
-                    'age': details.get('age_score', 0),
-                    'peak': details.get('peak_score', 0),
-                    'prospects': details.get('prospect_score', 0)
-                }
+    prospects = [{
+        "name": p.name,
+        "rank": p.prospect_rank,
+        "age": p.age,
+        "position": p.position,
+        "level": CFR_PROSPECT_LEVELS.get(p.name, ''),
+        "eta": get_prospect_eta(p.name, p.prospect_rank)
+    } for p in team.players if p.is_prospect and p.prospect_rank]
+    prospects.sort(key=lambda x: x['rank'])
+
+    # Calculate league-wide category rankings
+    team_cats, league_rankings = category_rankings or calculate_league_category_rankings()
+    my_cats = team_cats.get(team_name, {})
+    my_rankings = league_rankings.get(team_name, {})
+    num_teams = len(teams)
+
+    # Build category details with values and rankings
+    category_details = {
+        'HR': {'value': my_cats.get('HR', 0), 'rank': my_rankings.get('HR', 0)},
+        'SB': {'value': my_cats.get('SB', 0), 'rank': my_rankings.get('SB', 0)},
+        'RBI': {'value': my_cats.get('RBI', 0), 'rank': my_rankings.get('RBI', 0)},
+        'R': {'value': my_cats.get('R', 0), 'rank': my_rankings.get('R', 0)},
+        'AVG': {'value': round(my_cats.get('AVG', .250), 3), 'rank': my_rankings.get('AVG', 0)},
+        'OPS': {'value': round(my_cats.get('OPS', .700), 3), 'rank': my_rankings.get('OPS', 0)},
+        'SO': {'value': my_cats.get('SO', 0), 'rank': my_rankings.get('SO', 0)},
+        'K': {'value': my_cats.get('K', 0), 'rank': my_rankings.get('K', 0)},
+        'ERA': {'value': round(my_cats.get('ERA', 4.50), 2), 'rank': my_rankings.get('ERA', 0)},
+        'WHIP': {'value': round(my_cats.get('WHIP', 1.30), 2), 'rank': my_rankings.get('WHIP', 0)},
+        'SV+HLD': {'value': my_cats.get('SV+HLD', 0), 'rank': my_rankings.get('SV+HLD', 0)},
+        'QS': {'value': my_cats.get('QS', 0), 'rank': my_rankings.get('QS', 0)},
+        'L': {'value': my_cats.get('L', 0), 'rank': my_rankings.get('L', 0)},
+        'K/BB': {'value': round(my_cats.get('K/BB', 0), 2), 'rank': my_rankings.get('K/BB', 0)},
+    }
+
+    # Calculate category strengths/weaknesses based on rankings
+    hitting_strengths, hitting_weaknesses = [], []
+    pitching_strengths, pitching_weaknesses = [], []
+
+    top_third = num_teams // 3
+    bottom_third = num_teams - top_third
+
+    for cat in ['HR', 'SB', 'RBI', 'R', 'AVG', 'OPS', 'SO']:
+        rank = my_rankings.get(cat, num_teams)
+        if rank <= top_third:
+            hitting_strengths.append(cat)
+        elif rank >= bottom_third:
+            hitting_weaknesses.append(cat)
+
+    for cat in ['K', 'ERA', 'WHIP', 'SV+HLD', 'QS', 'L', 'K/BB']:
+        rank = my_rankings.get(cat, num_teams)
+        if rank <= top_third:
+            pitching_strengths.append(cat)
+        elif rank >= bottom_third:
+            pitching_weaknesses.append(cat)
+
+    # Positional depth analysis
+    pos_depth = {'C': [], '1B': [], '2B': [], 'SS': [], '3B': [], 'OF': [], 'UT': [], 'SP': [], 'RP': []}
+    for p, v in players_with_value:
+        mask = p.eligibility
+        player_info = {"name": p.name, "value": round(v, 1), "age": p.age}
+        for pos in ('C', '1B', '2B', 'SS', '3B', 'OF', 'SP', 'RP'):
+            if mask & ELIGIBILITY_BITS[pos]:
+                pos_depth[pos].append(player_info)
+        # UT lists DH-only players; Ohtani (UT,SP) is already under SP
+        if mask and not mask & (FIELD_MASK | PITCHER_MASK):
+            pos_depth['UT'].append(player_info)
+
+    # Sort each position by value (keep all players for full depth chart)
+    for pos in pos_depth:
+        pos_depth[pos] = sorted(pos_depth[pos], key=lambda x: x['value'], reverse=True)
+
+    # Calculate roster composition
+    hitters = len([p for p in team.players if p.name in HITTER_PROJECTIONS])
+    starters = len([p for p in team.players if p.name in PITCHER_PROJECTIONS])
+    relievers = len([p for p in team.players if p.name in RELIEVER_PROJECTIONS])
+    ages = [p.age for p in team.players if p.age > 0]
+    avg_age = round(sum(ages) / len(ages), 1) if ages else 0
+    young_count = len([a for a in ages if a <= 25])
+    prime_count = len([a for a in ages if 26 <= a <= 30])
+    vet_count = len([a for a in ages if a > 30])
+
+    roster_composition = {
+        'hitters': hitters,
+        'starters': starters,
+        'relievers': relievers,
+        'avg_age': avg_age,
+        'young': young_count,
+        'prime': prime_count,
+        'veteran': vet_count
+    }
+
+    # Generate analysis
+    analysis = generate_team_analysis(team_name, team, players_with_value, power_rank, len(teams))
+
+    # Get enhanced window analysis (this populates _window_analysis_cache)
+    _, _, window = calculate_team_needs(team_name)
+    window_analysis = _window_analysis_cache.get(team_name, {})
+
+    # DIRECT CALCULATION - bypass cache issues
+    direct_pp = calculate_prospect_proximity(team.players, CFR_PROSPECT_LEVELS)
+
+    # Build window details for UI display
+    window_details = None
+    if window_analysis:
+        pt = window_analysis.get('peak_timing', {})
+        pp = window_analysis.get('prospect_proximity', {})
+        details = window_analysis.get('details', {})
+        window_details = {
+            'window': window,
+            'window_score': window_analysis.get('score', 0),
+            'core_age': window_analysis.get('core_age', avg_age),
+            'years_in_window': pt.get('years_in_window', 0),
+            'ascending_count': pt.get('ascending_count', 0),
+            'peak_count': pt.get('peak_count', 0),
+            'declining_count': pt.get('declining_count', 0),
+            'prospect_eta': direct_pp.get('avg_eta', 0),
+            'mlb_ready_prospects': direct_pp.get('mlb_ready_count', 0),
+            'prospect_value': direct_pp.get('prospect_value', 0),
+            'value_by_year': window_analysis.get('value_by_year', []),
+            'score_breakdown': {
+                'rank': details.get('rank_score', 0),
+                'age': details.get('age_score', 0),
+                'peak': details.get('peak_score', 0),
+                'prospects': details.get('prospect_score', 0)
             }
+        }
 
-        return jsonify({
-            "name": team_name,
-            "players": players,
-            "top_players": top_players,
-            "prospects": prospects,
-            "player_count": len(players),
-            "total_value": round(total_value, 1),
-            "power_rank": power_rank,
-            "draft_pick": draft_pick,
-            "hitting_strengths": hitting_strengths,
-            "hitting_weaknesses": hitting_weaknesses,
-            "pitching_strengths": pitching_strengths,
-            "pitching_weaknesses": pitching_weaknesses,
-            "category_details": category_details,
-            "positional_depth": pos_depth,
-            "roster_composition": roster_composition,
-            "num_teams": num_teams,
-            "analysis": analysis,
-            "window_analysis": window_details
-        })
+    return {
+        "name": team_name,
+        "players": players,
+        "top_players": top_players,
+        "prospects": prospects,
+        "player_count": len(players),
+        "total_value": round(total_value, 1),
+        "power_rank": power_rank,
+        "draft_pick": draft_pick,
+        "hitting_strengths": hitting_strengths,
+        "hitting_weaknesses": hitting_weaknesses,
+        "pitching_strengths": pitching_strengths,
+        "pitching_weaknesses": pitching_weaknesses,
+        "category_details": category_details,
+        "positional_depth": pos_depth,
+        "roster_composition": roster_composition,
+        "num_teams": num_teams,
+        "analysis": analysis,
+        "window_analysis": window_details
+    }
+
+
+@app.route('/team/<team_name>')
+@cached_response
+def get_team(team_name):
+    try:
+        if team_name not in teams:
+            return jsonify({"error": f"Team '{team_name}' not found", "available_teams": list(teams.keys())}), 404
+        return jsonify(build_team_detail(team_name))
     except Exception as e:
         import traceback
         error_details = traceback.format_exc()
@@ -7481,6 +8679,11 @@ def get_best_trade_partners(team_name):
     if team_name not in teams:
         return jsonify({"error": f"Team '{team_name}' not found"}), 404
 
+    return jsonify(league_graph.get(('trade_partners', team_name)))
+
+
+@league_graph.node('trade_partners')
+def _graph_trade_partners(team_name):
     my_cats, my_pos, my_window = calculate_team_needs(team_name)
 
     # Window compatibility - who makes a good trade partner
@@ -7502,7 +8705,7 @@ def get_best_trade_partners(team_name):
 
     trade_partners = []
 
-    for other_team_name in teams.keys():
+    for other_team_name in league_graph.get(('league',)):
         if other_team_name == team_name:
             continue
 
@@ -7536,10 +8739,9 @@ def get_best_trade_partners(team_name):
             reasons.append(f"✓ I can help them in: {', '.join(overlap_they_need)}")
 
         # Find specific trade targets - players who fill my needs
-        other_team = teams[other_team_name]
+        league_graph.get(('team_projections', other_team_name))
         target_players = []
-        for p in other_team.players:
-            value = calc_player_value(p)
+        for p, value in get_team_player_values(other_team_name):
             if value < 20:
                 continue  # Skip low-value players
 
@@ -7589,13 +8791,13 @@ def get_best_trade_partners(team_name):
     # Sort by compatibility score
     trade_partners.sort(key=lambda x: x['compatibility_score'], reverse=True)
 
-    return jsonify({
+    return {
         'team': team_name,
         'my_window': my_window,
         'my_weaknesses': my_weaknesses,
         'my_strengths': my_strengths,
         'trade_partners': trade_partners
-    })
+    }
 
 
 @app.route('/team-profile/<team_name>', methods=['GET'])
@@ -7686,9 +8888,11 @@ def build_gm_chat_context(team_name, client_prefs=None):
     prospects.sort(key=lambda x: x[1])
 
     # Build position-specific breakdowns for clarity (include handedness for pitchers)
-    starters = [(p.name, round(v, 1), p.age, p.throws or '?') for p, v in players_with_value if 'SP' in p.position][:8]
-    relievers = [(p.name, round(v, 1), p.age, p.throws or '?') for p, v in players_with_value if 'RP' in p.position and 'SP' not in p.position][:5]
-    hitters = [(p.name, round(v, 1), p.age, p.position) for p, v in players_with_value if p.position not in ['SP', 'RP', 'SP,RP', 'RP,SP']][:10]
+    sp_bit, rp_bit = ELIGIBILITY_BITS['SP'], ELIGIBILITY_BITS['RP']
+    starters = [(p.name, round(v, 1), p.age, p.throws or '?') for p, v in players_with_value if p.eligibility & sp_bit][:8]
+    relievers = [(p.name, round(v, 1), p.age, p.throws or '?') for p, v in players_with_value
+                 if p.eligibility & PITCHER_MASK == rp_bit][:5]
+    hitters = [(p.name, round(v, 1), p.age, p.position) for p, v in players_with_value if p.is_hitter()][:10]
 
     # Full roster list for "already on team" check
     all_roster_names = [p.name for p in team.players]
@@ -8304,6 +9508,20 @@ def find_trades_for_player():
 
         return base_score + cat_bonus, cat_reasons, window_bonus
 
+    seen = set()
+
+    def score_new_package(my_send, their_receive, other_team_name, their_window):
+        """score_package for a trade not listed yet; None if it's a duplicate."""
+        key = trade_key(my_team_name, [s['name'] for s in my_send],
+                        other_team_name, [r['name'] for r in their_receive])
+        if key in seen:
+            return None
+        seen.add(key)
+        return _evaluated_trades.get_or_evaluate(
+            key, ('score_package', my_team_name, category_filter),
+            lambda: score_package(my_send, their_receive, other_team_name, their_window)
+        )
+
     if direction == 'send':
         # TRADE AWAY: I'm trading away one of MY players
         player = next((p for p in my_team.players if p.name == player_name), None)
@@ -8311,6 +9529,8 @@ def find_trades_for_player():
             return jsonify({"error": f"Player '{player_name}' not found on your team"}), 404
 
         player_value = calc_player_value(player)
+        market = get_trade_market()
+        row = market.row(my_team_name, player.name)
         my_other_players = [(p, calc_player_value(p)) for p in my_team.players if p.name != player_name and calc_player_value(p) >= 10]
         my_other_players.sort(key=lambda x: x[1], reverse=True)
 
@@ -8319,59 +9539,68 @@ def find_trades_for_player():
             other_teams = [target_team_name]
 
         for other_team_name in other_teams:
-            other_team = teams[other_team_name]
             _, _, their_window = calculate_team_needs(other_team_name)
-            other_players = [(p, calc_player_value(p)) for p in other_team.players]
-            other_players.sort(key=lambda x: x[1], reverse=True)
 
             # 1-for-1 trades (tighter tolerance: don't lose more than 10 pts)
-            for op, ov in other_players[:20]:
+            cols = market.ranked(other_team_name, limit=20)
+            gains = market.diff[row, cols]
+            for col in cols[(gains >= -10) & (gains <= 15)].tolist():
+                op, ov = market.players[col], market.values.item(col)
                 value_diff = ov - player_value
-                if -10 <= value_diff <= 15:
+                send_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
+                receive_list = [{'name': op.name, 'position': op.position, 'value': round(ov, 1)}]
+                scored = score_new_package(send_list, receive_list, other_team_name, their_window)
+                if scored is None:
+                    continue
+                fit_score, cat_reasons, window_bonus = scored
+                packages.append({
+                    'other_team': other_team_name,
+                    'trade_type': '1-for-1',
+                    'send': send_list,
+                    'receive': receive_list,
+                    'send_total': round(player_value, 1),
+                    'receive_total': round(ov, 1),
+                    'value_diff': round(value_diff, 1),
+                    'fit_score': round(fit_score, 1),
+                    'window_match': their_window,
+                    'window_bonus': window_bonus,
+                    'category_fit': cat_reasons
+                })
+
+            # 1-for-2 trades (give 1, get 2)
+            if include_packages:
+                # Getting 2 lesser for 1 star
+                their_packages = get_team_packages(other_team_name)
+                matches = their_packages.closest(
+                    2, player_value, player_value - 20, player_value + 30, PACKAGE_MATCHES_PER_PLAYER,
+                    keep=lambda totals, members: their_packages.values[members[:, 0]] <= player_value * 0.85)
+                for (i, j), combined_receive in matches:
+                    op1, ov1 = their_packages.players[i], their_packages.values.item(i)
+                    op2, ov2 = their_packages.players[j], their_packages.values.item(j)
+                    value_diff = combined_receive - player_value
                     send_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
-                    receive_list = [{'name': op.name, 'position': op.position, 'value': round(ov, 1)}]
-                    fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, other_team_name, their_window)
+                    receive_list = [
+                        {'name': op1.name, 'position': op1.position, 'value': round(ov1, 1)},
+                        {'name': op2.name, 'position': op2.position, 'value': round(ov2, 1)}
+                    ]
+                    scored = score_new_package(send_list, receive_list, other_team_name, their_window)
+                    if scored is None:
+                        continue
+                    fit_score, cat_reasons, window_bonus = scored
                     packages.append({
                         'other_team': other_team_name,
-                        'trade_type': '1-for-1',
+                        'trade_type': '1-for-2',
                         'send': send_list,
                         'receive': receive_list,
                         'send_total': round(player_value, 1),
-                        'receive_total': round(ov, 1),
+                        'receive_total': round(combined_receive, 1),
                         'value_diff': round(value_diff, 1),
-                        'fit_score': round(fit_score, 1),
+                        'fit_score': round(fit_score - 5, 1),  # Slight penalty for complexity
                         'window_match': their_window,
                         'window_bonus': window_bonus,
                         'category_fit': cat_reasons
                     })
 
-            # 1-for-2 trades (give 1, get 2)
-            if include_packages:
-                for i, (op1, ov1) in enumerate(other_players[:12]):
-                    for op2, ov2 in other_players[i+1:15]:
-                        combined_receive = ov1 + ov2
-                        value_diff = combined_receive - player_value
-                        if -20 <= value_diff <= 30 and ov1 <= player_value * 0.85:  # Getting 2 lesser for 1 star
-                            send_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
-                            receive_list = [
-                                {'name': op1.name, 'position': op1.position, 'value': round(ov1, 1)},
-                                {'name': op2.name, 'position': op2.position, 'value': round(ov2, 1)}
-                            ]
-                            fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, other_team_name, their_window)
-                            packages.append({
-                                'other_team': other_team_name,
-                                'trade_type': '1-for-2',
-                                'send': send_list,
-                                'receive': receive_list,
-                                'send_total': round(player_value, 1),
-                                'receive_total': round(combined_receive, 1),
-                                'value_diff': round(value_diff, 1),
-                                'fit_score': round(fit_score - 5, 1),  # Slight penalty for complexity
-                                'window_match': their_window,
-                                'window_bonus': window_bonus,
-                                'category_fit': cat_reasons
-                            })
-
     else:
         # ACQUIRE: I want to acquire a player from ANOTHER team
         if not target_team_name:
@@ -8395,92 +9624,107 @@ def find_trades_for_player():
         is_elite_target = player_value >= AI_GM_CONFIG["elite_superstar_threshold"]
 
         # 1-for-1 trades (skip for elite unless trading another elite)
-        for mp, mv in my_players[:20]:
-            value_diff = player_value - mv
-
+        market = get_trade_market()
+        cols = market.ranked(my_team_name, 10, 20)
+        gaps = market.diff[cols, market.row(target_team_name, player.name)]
+        matches = (gaps >= -10) & (gaps <= 15)  # Tighter tolerance: don't overpay by more than 10
+        if is_elite_target:
             # Elite players require elite-for-elite or package deals
-            if is_elite_target and mv < AI_GM_CONFIG["elite_superstar_threshold"]:
-                continue  # Skip 1-for-1 for elite targets unless sending elite back
+            matches &= market.values[cols] >= AI_GM_CONFIG["elite_superstar_threshold"]
+        for col in cols[matches].tolist():
+            mp, mv = market.players[col], market.values.item(col)
+            value_diff = player_value - mv
+            send_list = [{'name': mp.name, 'position': mp.position, 'value': round(mv, 1)}]
+            receive_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
+            scored = score_new_package(send_list, receive_list, target_team_name, their_window)
+            if scored is None:
+                continue
+            fit_score, cat_reasons, window_bonus = scored
+            packages.append({
+                'other_team': target_team_name,
+                'trade_type': '1-for-1',
+                'send': send_list,
+                'receive': receive_list,
+                'send_total': round(mv, 1),
+                'receive_total': round(player_value, 1),
+                'value_diff': round(value_diff, 1),
+                'fit_score': round(fit_score, 1),
+                'window_match': their_window,
+                'window_bonus': window_bonus,
+                'category_fit': cat_reasons
+            })
 
-            if -10 <= value_diff <= 15:  # Tighter tolerance: don't overpay by more than 10
-                send_list = [{'name': mp.name, 'position': mp.position, 'value': round(mv, 1)}]
+        # 2-for-1 trades (give 2, get 1)
+        if include_packages:
+            # Fair if combined value is within reasonable range (tightened thresholds)
+            my_packages = get_team_packages(my_team_name)
+            matches = my_packages.closest(
+                2, player_value, player_value - 15, player_value + 10, PACKAGE_MATCHES_PER_PLAYER,
+                keep=lambda totals, members: my_packages.values[members[:, 0]] <= player_value * 0.85)
+            for (i, j), combined_send in matches:
+                mp1, mv1 = my_packages.players[i], my_packages.values.item(i)
+                mp2, mv2 = my_packages.players[j], my_packages.values.item(j)
+                value_diff = player_value - combined_send
+                send_list = [
+                    {'name': mp1.name, 'position': mp1.position, 'value': round(mv1, 1)},
+                    {'name': mp2.name, 'position': mp2.position, 'value': round(mv2, 1)}
+                ]
                 receive_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
-                fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, target_team_name, their_window)
+                scored = score_new_package(send_list, receive_list, target_team_name, their_window)
+                if scored is None:
+                    continue
+                fit_score, cat_reasons, window_bonus = scored
                 packages.append({
                     'other_team': target_team_name,
-                    'trade_type': '1-for-1',
+                    'trade_type': '2-for-1',
                     'send': send_list,
                     'receive': receive_list,
-                    'send_total': round(mv, 1),
+                    'send_total': round(combined_send, 1),
                     'receive_total': round(player_value, 1),
                     'value_diff': round(value_diff, 1),
-                    'fit_score': round(fit_score, 1),
+                    'fit_score': round(fit_score - 3, 1),  # Slight penalty for complexity
                     'window_match': their_window,
                     'window_bonus': window_bonus,
                     'category_fit': cat_reasons
                 })
 
-        # 2-for-1 trades (give 2, get 1)
-        if include_packages:
-            for i, (mp1, mv1) in enumerate(my_players[:15]):
-                for mp2, mv2 in my_players[i+1:18]:
-                    combined_send = mv1 + mv2
-                    value_diff = player_value - combined_send
-                    # Fair if combined value is within reasonable range (tightened thresholds)
-                    if -10 <= value_diff <= 15 and mv1 <= player_value * 0.85:
-                        send_list = [
-                            {'name': mp1.name, 'position': mp1.position, 'value': round(mv1, 1)},
-                            {'name': mp2.name, 'position': mp2.position, 'value': round(mv2, 1)}
-                        ]
-                        receive_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
-                        fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, target_team_name, their_window)
-                        packages.append({
-                            'other_team': target_team_name,
-                            'trade_type': '2-for-1',
-                            'send': send_list,
-                            'receive': receive_list,
-                            'send_total': round(combined_send, 1),
-                            'receive_total': round(player_value, 1),
-                            'value_diff': round(value_diff, 1),
-                            'fit_score': round(fit_score - 3, 1),  # Slight penalty for complexity
-                            'window_match': their_window,
-                            'window_bonus': window_bonus,
-                            'category_fit': cat_reasons
-                        })
-
             # 2-for-2 trades
             other_players = [(p, calc_player_value(p)) for p in target_team.players if p.name != player_name and calc_player_value(p) >= 10]
             other_players.sort(key=lambda x: x[1], reverse=True)
 
-            for i, (mp1, mv1) in enumerate(my_players[:10]):
-                for mp2, mv2 in my_players[i+1:12]:
-                    for op, ov in other_players[:8]:
-                        combined_send = mv1 + mv2
-                        combined_receive = player_value + ov
-                        value_diff = combined_receive - combined_send
-                        if -20 <= value_diff <= 20:
-                            send_list = [
-                                {'name': mp1.name, 'position': mp1.position, 'value': round(mv1, 1)},
-                                {'name': mp2.name, 'position': mp2.position, 'value': round(mv2, 1)}
-                            ]
-                            receive_list = [
-                                {'name': player.name, 'position': player.position, 'value': round(player_value, 1)},
-                                {'name': op.name, 'position': op.position, 'value': round(ov, 1)}
-                            ]
-                            fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, target_team_name, their_window)
-                            packages.append({
-                                'other_team': target_team_name,
-                                'trade_type': '2-for-2',
-                                'send': send_list,
-                                'receive': receive_list,
-                                'send_total': round(combined_send, 1),
-                                'receive_total': round(combined_receive, 1),
-                                'value_diff': round(value_diff, 1),
-                                'fit_score': round(fit_score - 5, 1),  # Penalty for complexity
-                                'window_match': their_window,
-                                'window_bonus': window_bonus,
-                                'category_fit': cat_reasons
-                            })
+            for op, ov in other_players:
+                combined_receive = player_value + ov
+                matches = my_packages.closest(
+                    2, combined_receive, combined_receive - 20, combined_receive + 20, PACKAGE_MATCHES_PER_PACKAGE)
+                for (i, j), combined_send in matches:
+                    mp1, mv1 = my_packages.players[i], my_packages.values.item(i)
+                    mp2, mv2 = my_packages.players[j], my_packages.values.item(j)
+                    value_diff = combined_receive - combined_send
+                    send_list = [
+                        {'name': mp1.name, 'position': mp1.position, 'value': round(mv1, 1)},
+                        {'name': mp2.name, 'position': mp2.position, 'value': round(mv2, 1)}
+                    ]
+                    receive_list = [
+                        {'name': player.name, 'position': player.position, 'value': round(player_value, 1)},
+                        {'name': op.name, 'position': op.position, 'value': round(ov, 1)}
+                    ]
+                    scored = score_new_package(send_list, receive_list, target_team_name, their_window)
+                    if scored is None:
+                        continue
+                    fit_score, cat_reasons, window_bonus = scored
+                    packages.append({
+                        'other_team': target_team_name,
+                        'trade_type': '2-for-2',
+                        'send': send_list,
+                        'receive': receive_list,
+                        'send_total': round(combined_send, 1),
+                        'receive_total': round(combined_receive, 1),
+                        'value_diff': round(value_diff, 1),
+                        'fit_score': round(fit_score - 5, 1),  # Penalty for complexity
+                        'window_match': their_window,
+                        'window_bonus': window_bonus,
+                        'category_fit': cat_reasons
+                    })
 
             # PLAYER + PICK packages (1 player + draft pick for target)
             # Get team's draft pick position (same position in each round)
@@ -8507,7 +9751,10 @@ def find_trades_for_player():
                             {'name': pick['display'], 'position': 'PICK', 'value': round(pick['value'], 1), 'is_pick': True}
                         ]
                         receive_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
-                        fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, target_team_name, their_window)
+                        scored = score_new_package(send_list, receive_list, target_team_name, their_window)
+                        if scored is None:
+                            continue
+                        fit_score, cat_reasons, window_bonus = scored
                         packages.append({
                             'other_team': target_team_name,
                             'trade_type': 'Player+Pick',
@@ -8525,49 +9772,45 @@ def find_trades_for_player():
 
             # 3-FOR-1 PACKAGES (for elite players - 110+ value)
             if is_elite_target:
-                for i, (mp1, mv1) in enumerate(my_players[:10]):
-                    for j, (mp2, mv2) in enumerate(my_players[i+1:12]):
-                        for mp3, mv3 in my_players[j+i+2:15]:
-                            combined_send = mv1 + mv2 + mv3
-                            value_diff = player_value - combined_send
-                            # Elite targets need close-to-fair or overpay packages
-                            if -5 <= value_diff <= 20 and mv1 <= player_value * 0.7:
-                                send_list = [
-                                    {'name': mp1.name, 'position': mp1.position, 'value': round(mv1, 1)},
-                                    {'name': mp2.name, 'position': mp2.position, 'value': round(mv2, 1)},
-                                    {'name': mp3.name, 'position': mp3.position, 'value': round(mv3, 1)}
-                                ]
-                                receive_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
-                                fit_score, cat_reasons, window_bonus = score_package(send_list, receive_list, target_team_name, their_window)
-                                packages.append({
-                                    'other_team': target_team_name,
-                                    'trade_type': '3-for-1',
-                                    'send': send_list,
-                                    'receive': receive_list,
-                                    'send_total': round(combined_send, 1),
-                                    'receive_total': round(player_value, 1),
-                                    'value_diff': round(value_diff, 1),
-                                    'fit_score': round(fit_score - 8, 1),  # Larger penalty for complexity
-                                    'window_match': their_window,
-                                    'window_bonus': window_bonus,
-                                    'category_fit': cat_reasons,
-                                    'elite_package': True
-                                })
+                # Elite targets need close-to-fair or overpay packages
+                matches = my_packages.closest(
+                    3, player_value, player_value - 20, player_value + 5, PACKAGE_MATCHES_PER_PLAYER,
+                    keep=lambda totals, members: my_packages.values[members[:, 0]] <= player_value * 0.7)
+                for (i, j, k), combined_send in matches:
+                    mp1, mv1 = my_packages.players[i], my_packages.values.item(i)
+                    mp2, mv2 = my_packages.players[j], my_packages.values.item(j)
+                    mp3, mv3 = my_packages.players[k], my_packages.values.item(k)
+                    value_diff = player_value - combined_send
+                    send_list = [
+                        {'name': mp1.name, 'position': mp1.position, 'value': round(mv1, 1)},
+                        {'name': mp2.name, 'position': mp2.position, 'value': round(mv2, 1)},
+                        {'name': mp3.name, 'position': mp3.position, 'value': round(mv3, 1)}
+                    ]
+                    receive_list = [{'name': player.name, 'position': player.position, 'value': round(player_value, 1)}]
+                    scored = score_new_package(send_list, receive_list, target_team_name, their_window)
+                    if scored is None:
+                        continue
+                    fit_score, cat_reasons, window_bonus = scored
+                    packages.append({
+                        'other_team': target_team_name,
+                        'trade_type': '3-for-1',
+                        'send': send_list,
+                        'receive': receive_list,
+                        'send_total': round(combined_send, 1),
+                        'receive_total': round(player_value, 1),
+                        'value_diff': round(value_diff, 1),
+                        'fit_score': round(fit_score - 8, 1),  # Larger penalty for complexity
+                        'window_match': their_window,
+                        'window_bonus': window_bonus,
+                        'category_fit': cat_reasons,
+                        'elite_package': True
+                    })
 
     # Sort by fit score, then by value diff
     packages.sort(key=lambda x: (x['fit_score'], -abs(x['value_diff'])), reverse=True)
 
-    # Dedupe similar packages (same players involved)
-    seen = set()
-    unique_packages = []
-    for pkg in packages:
-        key = tuple(sorted([p['name'] for p in pkg['send']] + [p['name'] for p in pkg['receive']]))
-        if key not in seen:
-            seen.add(key)
-            unique_packages.append(pkg)
-
     # Calculate likelihood to accept for each package
-    for pkg in unique_packages:
+    for pkg in packages:
         other_team_name = pkg.get('other_team', target_team_name if direction == 'receive' else '')
         if other_team_name and other_team_name in teams:
             their_cats, _, their_window = calculate_team_needs(other_team_name)
@@ -8605,7 +9848,7 @@ def find_trades_for_player():
         # Combine: 40% value, 35% likelihood, 25% fit
         return value_score * 0.40 + likelihood * 0.35 + fit * 0.25
 
-    unique_packages.sort(key=trade_score, reverse=True)
+    packages.sort(key=trade_score, reverse=True)
 
     # Determine if target is elite (for UI display)
     target_is_elite = player_value >= AI_GM_CONFIG["elite_superstar_threshold"] if direction == 'receive' else False
@@ -8617,7 +9860,7 @@ def find_trades_for_player():
         'is_elite': target_is_elite,
         'package_required': target_is_elite,
         'elite_message': f"⚠️ {player_name} is an Elite Superstar ({player_value:.0f} pts). Package deals required - no 1-for-1 trades unless trading another elite." if target_is_elite else None,
-        'packages': unique_packages[:limit]
+        'packages': packages[:limit]
     })
 
 
@@ -8771,23 +10014,17 @@ def scan_league_for_opportunities(team_name):
 
 def find_similar_value_players(team_name, player_value, tolerance=8):
     """Find players from other teams with similar dynasty value for trade ideas."""
+    market = get_trade_market()
     similar = []
-
-    for other_team_name, other_team in teams.items():
-        if other_team_name == team_name:
-            continue
-
-        for player in other_team.players:
-            value = calc_player_value(player)
-            if abs(value - player_value) <= tolerance:
-                similar.append({
-                    'name': player.name,
-                    'team': other_team_name,
-                    'value': round(value, 1),
-                    'age': player.age,
-                    'position': player.position
-                })
-
+    for row in market.near_value(player_value, tolerance, exclude_team=team_name).tolist():
+        player = market.players[row]
+        similar.append({
+            'name': player.name,
+            'team': market.team_names[market.team[row]],
+            'value': round(market.values.item(row), 1),
+            'age': player.age,
+            'position': player.position
+        })
     return similar
 
 
@@ -10541,8 +11778,15 @@ def generate_gm_trade_scenarios(team_name, team):
 
     # ============ SMART SCENARIO RANKING ============
     # Score and filter scenarios based on GM personality parameters
+    # Scenarios only carry display text; the same offer and ask reached by two
+    # routes (in any order) is one trade and is scored once
+    seen = set()
     scored_scenarios = []
     for s in scenarios:
+        key = trade_key(team_name, s.get('offer', '').split(' + '), '', s.get('target', '').split(' + '))
+        if key in seen:
+            continue
+        seen.add(key)
         score = 50  # Base score
 
         # Filter by min_value_threshold - only show deals above GM's threshold
@@ -10771,38 +12015,27 @@ def calculate_championship_score(team_name, power_rank, total_teams, players_wit
     return max(1, score)
 
 
-# Cache for normalized championship odds (recalculated when teams change)
-_championship_odds_cache = {}
-_championship_odds_cache_key = None
-
-
-def get_normalized_championship_odds():
-    """Calculate championship odds for all teams, normalized to sum to 100%.
-
-    Returns a dict of {team_name: probability} where all probabilities sum to 100.
-    """
-    global _championship_odds_cache, _championship_odds_cache_key
+@league_graph.node('championship_score')
+def _graph_championship_score(team_name):
+    league_graph.get(('draft_order',))
+    _, rankings = calculate_league_category_rankings()
+    _, power_rankings, _ = get_team_rankings()
+    team_names = league_graph.get(('league',))
 
-    # Create cache key based on team count (simple invalidation)
-    cache_key = len(teams)
-    if cache_key == _championship_odds_cache_key and _championship_odds_cache:
-        return _championship_odds_cache
+    players_with_value = list(get_team_player_values(team_name))
+    players_with_value.sort(key=lambda x: x[1], reverse=True)
+    power_rank = power_rankings.get(team_name, len(team_names))
+    my_ranks = rankings.get(team_name, {})
 
-    # Get rankings and category data
-    team_cats, rankings = calculate_league_category_rankings()
-    _, power_rankings, _ = get_team_rankings()
+    return calculate_championship_score(
+        team_name, power_rank, len(team_names), players_with_value, my_ranks
+    )
 
-    # Calculate raw scores for all teams
-    raw_scores = {}
-    for team_name, team in teams.items():
-        players_with_value = [(p, calc_player_value(p)) for p in team.players]
-        players_with_value.sort(key=lambda x: x[1], reverse=True)
-        power_rank = power_rankings.get(team_name, len(teams))
-        my_ranks = rankings.get(team_name, {})
 
-        raw_scores[team_name] = calculate_championship_score(
-            team_name, power_rank, len(teams), players_with_value, my_ranks
-        )
+@league_graph.node('championship_odds')
+def _graph_championship_odds():
+    team_names = league_graph.get(('league',))
+    raw_scores = {team_name: league_graph.get(('championship_score', team_name)) for team_name in team_names}
 
     # Normalize to 100%
     total_score = sum(raw_scores.values())
@@ -10810,14 +12043,17 @@ def get_normalized_championship_odds():
         normalized = {name: round((score / total_score) * 100, 1) for name, score in raw_scores.items()}
     else:
         # Fallback: equal odds
-        equal_odds = round(100 / len(teams), 1)
-        normalized = {name: equal_odds for name in teams.keys()}
+        equal_odds = round(100 / len(team_names), 1)
+        normalized = {name: equal_odds for name in team_names}
+    return normalized
 
-    # Cache results
-    _championship_odds_cache = normalized
-    _championship_odds_cache_key = cache_key
 
-    return normalized
+def get_normalized_championship_odds():
+    """Calculate championship odds for all teams, normalized to sum to 100%.
+
+    Returns a dict of {team_name: probability} where all probabilities sum to 100.
+    """
+    return league_graph.get(('championship_odds',))
 
 
 def get_team_championship_odds(team_name):
@@ -10826,6 +12062,77 @@ def get_team_championship_odds(team_name):
     return odds.get(team_name, 0)
 
 
+# Simulated title odds: full H2H categories seasons (schedule, weekly category
+# results, playoffs) drawn from the team category projections
+H2H_SIMULATED_SEASONS = 10000
+
+
+@league_graph.node('season_simulation')
+def _graph_season_simulation():
+    team_cats, _ = calculate_league_category_rankings()
+    result = SeasonSimulator(team_cats).run(H2H_SIMULATED_SEASONS)
+    # Run time differs on every recompute; leave it out so unchanged odds cut off downstream
+    result.pop('elapsed_ms')
+    return result
+
+
+def get_simulated_championship_odds(seasons=None, seed=0):
+    """Monte Carlo season results per team (title/playoff odds with 95% intervals).
+
+    The default run is cached in the league graph; other season counts or
+    seeds are simulated on demand.
+    """
+    if (seasons is None or seasons == H2H_SIMULATED_SEASONS) and seed == 0:
+        return league_graph.get(('season_simulation',))
+    team_cats, _ = calculate_league_category_rankings()
+    return SeasonSimulator(team_cats).run(seasons or H2H_SIMULATED_SEASONS, seed=seed)
+
+
+# Batch trade evaluation replays one shared set of season draws for every
+# candidate, so deltas between trades reflect the trades, not sampling noise
+H2H_TRADE_SEASONS = 3000
+SUGGEST_ODDS_CANDIDATES = 40
+
+
+def evaluate_trades_championship_impact(trades, seasons=H2H_TRADE_SEASONS, seed=0):
+    """Simulated title-odds change for both sides of each candidate trade.
+
+    trades: list of {team_a, team_b, players_a, players_b} (players_a are the
+    names team_a sends, as in /analyze). Returns one entry per trade, in order:
+    {team_a: {...}, team_b: {...}} with title_odds, title_delta (points),
+    title_delta_ci and playoff_delta, or {"error": ...} for an invalid trade.
+    """
+    team_cats, _ = calculate_league_category_rankings()
+    variants, slots, results = [], [], []
+    for trade in trades:
+        team_a, team_b = trade.get('team_a'), trade.get('team_b')
+        if team_a not in teams or team_b not in teams or team_a == team_b:
+            results.append({"error": "One or both teams not found"})
+            continue
+        send_a = {n.lower() for n in trade.get('players_a', [])}
+        send_b = {n.lower() for n in trade.get('players_b', [])}
+        moving_a = [p for p in teams[team_a].players if p.name.lower() in send_a]
+        moving_b = [p for p in teams[team_b].players if p.name.lower() in send_b]
+        if len(moving_a) != len(send_a) or len(moving_b) != len(send_b):
+            results.append({"error": "Player not found on roster"})
+            continue
+        variants.append({
+            team_a: compute_team_categories(get_active_lineup(
+                [p for p in teams[team_a].players if p.name.lower() not in send_a] + moving_b)),
+            team_b: compute_team_categories(get_active_lineup(
+                [p for p in teams[team_b].players if p.name.lower() not in send_b] + moving_a)),
+        })
+        slots.append(len(results))
+        results.append((team_a, team_b))
+
+    if variants:
+        comparison = SeasonSimulator(team_cats).compare(variants, seasons=seasons, seed=seed)
+        for index, odds in zip(slots, comparison['variants']):
+            team_a, team_b = results[index]
+            results[index] = {team_a: odds[team_a], team_b: odds[team_b]}
+    return results
+
+
 def calculate_risk_assessment(players_with_value):
     """Calculate risk factors for the roster and return risk heat map data."""
     risks = {
@@ -10928,13 +12235,7 @@ def generate_team_analysis(team_name, team, players_with_value=None, power_rank=
     pitcher_value = sum(v for _, v in starters) + sum(v for _, v in relievers)
 
     # Position depth
-    pos_counts = {'C': 0, '1B': 0, '2B': 0, 'SS': 0, '3B': 0, 'OF': 0, 'SP': 0, 'RP': 0}
-    for p, _ in players_with_value:
-        pos_str = (p.position or '').upper()
-        for pos in pos_str.replace('/', ',').split(','):
-            pos = pos.strip()
-            if pos in ['LF', 'CF', 'RF']: pos = 'OF'
-            if pos in pos_counts: pos_counts[pos] += 1
+    pos_counts = position_depth_counts([p for p, _ in players_with_value])
     thin_positions = [pos for pos, count in pos_counts.items() if count <= 2 and count > 0]
     deep_positions = [pos for pos, count in pos_counts.items() if count >= 5]
 
@@ -11317,12 +12618,12 @@ def generate_personalized_trade_advice(player, value, projections):
 
     pos_premium = None
     for pos, name in premium_positions.items():
-        if pos in player.position:
+        if player.eligibility & ELIGIBILITY_BITS[pos]:
             pos_premium = f"Premium {name} scarcity adds significant trade value."
             break
     if not pos_premium:
         for pos, name in scarce_positions.items():
-            if pos in player.position:
+            if player.eligibility & ELIGIBILITY_BITS[pos]:
                 pos_premium = f"{name} depth is valuable in category leagues."
                 break
 
@@ -11418,35 +12719,67 @@ def generate_personalized_trade_advice(player, value, projections):
         return " ".join(parts)
 
 
-@app.route('/player/<player_name>')
-def get_player(player_name):
-    print(f"=== GET PLAYER CALLED: {player_name} ===", flush=True)
-    # Find player on a team roster first
+# Shared lookups for player detail pages, built once per data version:
+# case-insensitive name -> rostered player / FA, and overall dynasty ranks.
+_player_lookup = None
+_player_lookup_version = -1
+
+
+def get_player_lookup():
+    """Name indexes and overall-rank tables for the current data version."""
+    global _player_lookup, _player_lookup_version
+    if _player_lookup is not None and _player_lookup_version == _data_version:
+        return _player_lookup
+
+    rostered = {}  # lower name -> (player, team_name); first roster match wins
+    roster_players = []
+    for team_name, team in teams.items():
+        for p in team.players:
+            rostered.setdefault(p.name.lower(), (p, team_name))
+            roster_players.append(p)
+    all_player_values = [(p.name, v) for p, v in zip(roster_players, calc_player_values_batch(roster_players))]
+
+    free_agents = {}
+    for fa in FREE_AGENTS:
+        free_agents.setdefault(fa['name'].lower(), fa)
+
+    # Overall dynasty rank = position in the value-sorted list (first occurrence of a name)
+    all_player_values.sort(key=lambda x: -x[1])
+    overall_ranks = {}
+    for i, (pname, _) in enumerate(all_player_values, 1):
+        overall_ranks.setdefault(pname, i)
+
+    _player_lookup = {
+        'rostered': rostered,
+        'free_agents': free_agents,
+        'overall_ranks': overall_ranks,
+        'neg_values_sorted': [-v for _, v in all_player_values],  # ascending, for bisect
+    }
+    _player_lookup_version = _data_version
+    return _player_lookup
+
+
+def build_player_detail(player_name, lookup=None):
+    """Player detail payload (as served by /player/<name>), or None if not found."""
+    if lookup is None:
+        lookup = get_player_lookup()
+
+    # Find player on a team roster first, then in free agents
     player = None
     fantasy_team = None
     is_free_agent = False
     fa_data = None
 
-    for team_name, team in teams.items():
-        for p in team.players:
-            if p.name.lower() == player_name.lower():
-                player = p
-                fantasy_team = team_name
-                break
-        if player:
-            break
-
-    # If not found on a team, check free agents
-    if not player:
-        for fa in FREE_AGENTS:
-            if fa['name'].lower() == player_name.lower():
-                is_free_agent = True
-                fa_data = fa
-                fantasy_team = "Free Agent"
-                break
+    key = player_name.lower()
+    if key in lookup['rostered']:
+        player, fantasy_team = lookup['rostered'][key]
+    elif key in lookup['free_agents']:
+        is_free_agent = True
+        fa_data = lookup['free_agents'][key]
+        fantasy_team = "Free Agent"
 
     if not player and not is_free_agent:
-        return jsonify({"error": f"Player '{player_name}' not found"}), 404
+        return None
 
     # Handle free agent display
     if is_free_agent:
@@ -11486,22 +12819,10 @@ def get_player(player_name):
         else:
             trade_advice = f"Free agent with {fa_data['roster_pct']:.0f}% roster rate. Fantrax rank #{fa_data['rank']}. Consider adding if he fills a need."
 
-        # Calculate overall dynasty rank (including rostered + this FA)
-        all_player_values = []
-        for team_name, team in teams.items():
-            for p in team.players:
-                pval = calc_player_value(p)
-                all_player_values.append((p.name, pval))
-        # Add this free agent
-        all_player_values.append((fa_data['name'], fa_data['dynasty_value']))
-        all_player_values.sort(key=lambda x: -x[1])
-        fa_overall_rank = None
-        for i, (pname, pval) in enumerate(all_player_values, 1):
-            if pname == fa_data['name']:
-                fa_overall_rank = i
-                break
+        # Overall dynasty rank if this FA were slotted in (after rostered players of equal value)
+        fa_overall_rank = bisect.bisect_right(lookup['neg_values_sorted'], -fa_data['dynasty_value']) + 1
 
-        return jsonify({
+        return {
             "name": fa_data['name'],
             "position": fa_data['position'],
             "mlb_team": fa_data['mlb_team'],
@@ -11527,7 +12848,7 @@ def get_player(player_name):
                 "fantrax_rank": fa_data['rank'],
                 "fantrax_score": fa_data['score']
             }
-        })
+        }
 
     value = calc_player_value(player)
 
@@ -11692,25 +13013,15 @@ def get_player(player_name):
     actual_stats = player_actual_stats.get(player.name)
     fantasy_pts = player_fantasy_points.get(player.name, {})
 
-    # Calculate overall dynasty rank
-    all_player_values = []
-    for team_name, team in teams.items():
-        for p in team.players:
-            pval = calc_player_value(p)
-            all_player_values.append((p.name, pval))
-    all_player_values.sort(key=lambda x: -x[1])
-    overall_rank = None
-    for i, (pname, pval) in enumerate(all_player_values, 1):
-        if pname == player.name:
-            overall_rank = i
-            break
+    # Overall dynasty rank
+    overall_rank = lookup['overall_ranks'].get(player.name)
 
     # Get prospect level and ETA
     prospect_level = CFR_PROSPECT_LEVELS.get(player.name, '') if player.is_prospect else ''
     eta_map = {'MLB': 0, 'AAA': 0.5, 'AA': 1.5, 'A+': 2.5, 'A': 3, 'CPX': 3.5, 'DSL': 4, 'INTL': 4}
     prospect_eta = eta_map.get(prospect_level, 2.0) if player.is_prospect and prospect_level else None
 
-    return jsonify({
+    return {
         "name": player.name,
         "position": player.position,
         "team": player.mlb_team,
@@ -11734,58 +13045,251 @@ def get_player(player_name):
         "prospect_bonus": prospect_bonus,
         "category_contributions": category_contributions,
         "trade_advice": trade_advice
-    })
+    }
 
 
-@app.route('/analyze', methods=['POST'])
-def analyze_trade():
-    data = request.get_json()
+@app.route('/player/<player_name>')
+def get_player(player_name):
+    print(f"=== GET PLAYER CALLED: {player_name} ===", flush=True)
+    detail = build_player_detail(player_name)
+    if detail is None:
+        return jsonify({"error": f"Player '{player_name}' not found"}), 404
+    return jsonify(detail)
 
-    team_a = data.get('team_a')
-    team_b = data.get('team_b')
-    players_a = data.get('players_a', [])
-    players_b = data.get('players_b', [])
-    picks_a = data.get('picks_a', [])
-    picks_b = data.get('picks_b', [])
 
-    if not team_a or not team_b:
-        return jsonify({"error": "Both teams must be specified"}), 400
+BATCH_DETAIL_MAX_PLAYERS = 200
 
-    if team_a not in teams or team_b not in teams:
-        return jsonify({"error": "One or both teams not found"}), 404
 
-    # Find players
-    found_players_a = []
-    found_players_b = []
+@app.route('/batch-details', methods=['POST'])
+def get_batch_details():
+    """Player and team details for many names in one round trip.
 
-    for name in players_a:
-        for p in teams[team_a].players:
-            if p.name.lower() == name.lower():
-                found_players_a.append(p)
-                break
+    Body: {"players": [names...], "teams": [names...]}. Name indexes, overall
+    ranks, team rankings and category rankings are computed once for the whole
+    batch, and team payloads already in the response cache are reused.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        player_names = data.get('players') or []
+        team_names = data.get('teams') or []
+        if not isinstance(player_names, list) or not isinstance(team_names, list):
+            return jsonify({"error": "'players' and 'teams' must be lists of names"}), 400
+        if not all(isinstance(name, str) for name in player_names + team_names):
+            return jsonify({"error": "Player and team names must be strings"}), 400
+        if len(player_names) > BATCH_DETAIL_MAX_PLAYERS:
+            return jsonify({"error": f"At most {BATCH_DETAIL_MAX_PLAYERS} players per request"}), 400
+
+        lookup = get_player_lookup()
+        players = {}
+        missing_players = []
+        for name in dict.fromkeys(player_names):  # de-dupe, keep order
+            detail = build_player_detail(name, lookup)
+            if detail is None:
+                missing_players.append(name)
+            else:
+                players[name] = detail
+
+        team_details = {}
+        missing_teams = []
+        rankings = category_rankings = None
+        for name in dict.fromkeys(team_names):
+            if name not in teams:
+                missing_teams.append(name)
+                continue
+            cached = _response_cache.get((f'/team/{name}', b'', _data_version))
+            if cached is not None:
+                team_details[name] = json.loads(cached['body'])
+                continue
+            if rankings is None:
+                rankings = get_team_rankings()
+                category_rankings = calculate_league_category_rankings()
+            team_details[name] = build_team_detail(name, rankings, category_rankings)
 
-    for name in players_b:
-        for p in teams[team_b].players:
-            if p.name.lower() == name.lower():
-                found_players_b.append(p)
-                break
+        return jsonify({
+            "players": players,
+            "teams": team_details,
+            "not_found": {"players": missing_players, "teams": missing_teams},
+            "data_version": _data_version
+        })
+    except Exception as e:
+        print(f"Error in get_batch_details: {e}")
+        return jsonify({"error": f"Failed to load batch details: {str(e)}"}), 500
 
-    # Calculate values
-    value_a_sends = sum(calc_player_value(p) for p in found_players_a)
-    value_b_sends = sum(calc_player_value(p) for p in found_players_b)
 
-    # Add pick values
-    for pick in picks_a:
-        value_a_sends += DynastyValueCalculator.calculate_pick_value(pick)
-    for pick in picks_b:
-        value_b_sends += DynastyValueCalculator.calculate_pick_value(pick)
+# ============================================================================
+# TRADE EVALUATION (single and batch)
+# ============================================================================
 
-    value_diff = abs(value_a_sends - value_b_sends)
+# Upper bound on proposals per POST /analyze-batch
+MAX_BATCH_PROPOSALS = 500
 
-    # ELITE PLAYER DETECTION
-    elite_threshold = AI_GM_CONFIG["elite_superstar_threshold"]
-    elite_players_a = [p for p in found_players_a if calc_player_value(p) >= elite_threshold]
-    elite_players_b = [p for p in found_players_b if calc_player_value(p) >= elite_threshold]
+
+class TradeEvaluationContext:
+    """State shared by every proposal evaluated in one request.
+
+    Player lookup tables, dynasty values, team needs, power rankings and
+    per-player projection rows are built once and reused, so a batch of
+    hundreds of proposals pays for each team and player only once.
+    """
+
+    def __init__(self, players=None):
+        self._rosters = {}
+        self._team_needs = {}
+        self._stat_rows = {}
+        self._values = {}
+        self._power_rankings = None
+        self._uncertainty = None
+        if players:
+            self.prime_values(players)
+
+    def prime_values(self, players):
+        """Value a list of players in one batched pass."""
+        players = list({p.name: p for p in players if p.name not in self._values}.values())
+        if players:
+            for p, value in zip(players, calc_player_values_batch(players)):
+                self._values[p.name] = value
+
+    def value(self, player):
+        value = self._values.get(player.name)
+        if value is None:
+            value = self._values[player.name] = calc_player_value(player)
+        return value
+
+    def roster(self, team_name):
+        """Lowercase name -> Player for a team (first match wins, like a roster scan)."""
+        roster = self._rosters.get(team_name)
+        if roster is None:
+            roster = {}
+            for p in teams[team_name].players:
+                roster.setdefault(p.name.lower(), p)
+            self._rosters[team_name] = roster
+        return roster
+
+    def resolve(self, team_name, names):
+        roster = self.roster(team_name)
+        return [roster[name.lower()] for name in names if name.lower() in roster]
+
+    def team_values(self, team_name):
+        return [(p, self.value(p)) for p in teams[team_name].players]
+
+    def team_needs(self, team_name):
+        needs = self._team_needs.get(team_name)
+        if needs is None:
+            needs = self._team_needs[team_name] = calculate_team_needs(team_name)
+        return needs
+
+    @property
+    def power_rankings(self):
+        if self._power_rankings is None:
+            self._power_rankings = get_team_rankings()[1]
+        return self._power_rankings
+
+    @property
+    def uncertainty(self):
+        if self._uncertainty is None:
+            self._uncertainty = get_value_uncertainty()
+        return self._uncertainty
+
+    def _stat_row(self, name):
+        row = self._stat_rows.get(name)
+        if row is None:
+            h = HITTER_PROJECTIONS.get(name, {})
+            sp = PITCHER_PROJECTIONS.get(name, {})
+            rp = RELIEVER_PROJECTIONS.get(name, {})
+            ip = sp.get('IP', 0) or rp.get('IP', 0)
+            row = self._stat_rows[name] = (
+                h.get('HR', 0), h.get('RBI', 0), h.get('R', 0), h.get('SB', 0), h.get('SO', 0),
+                sp.get('K', 0) or rp.get('K', 0), sp.get('BB', 0) or rp.get('BB', 0),
+                rp.get('SV', 0), rp.get('HD', 0), sp.get('QS', 0),
+                sp.get('W', 0) or rp.get('W', 0), sp.get('L', 0) or rp.get('L', 0), ip,
+                h.get('AB', 0), h.get('AVG', 0) * h.get('AB', 0), h.get('OPS', 0) * h.get('AB', 0),
+                (sp.get('ERA', 0) or rp.get('ERA', 0)) * ip / 9, (sp.get('WHIP', 0) or rp.get('WHIP', 0)) * ip,
+            )
+        return row
+
+    def package_stats(self, players):
+        """Projected stat totals for a package (rate stats weighted by AB / IP)."""
+        totals = [0] * 18
+        for p in players:
+            for i, x in enumerate(self._stat_row(p.name)):
+                totals[i] += x
+        (hr, rbi, r, sb, so, k, bb, sv, hld, qs, w, l, ip,
+         total_ab, avg_ab, ops_ab, total_er, total_whip_ip) = totals
+        stats = {
+            'HR': hr, 'RBI': rbi, 'R': r, 'SB': sb, 'SO': so, 'AVG': 0, 'OPS': 0,
+            'K': k, 'BB': bb, 'ERA': 0, 'WHIP': 0, 'SV': sv, 'HLD': hld, 'QS': qs,
+            'W': w, 'L': l, 'IP': ip,
+        }
+        stats['K/BB'] = k / bb if bb > 0 else 0
+        if total_ab > 0:
+            stats['AVG'] = avg_ab / total_ab
+            stats['OPS'] = ops_ab / total_ab
+        if ip > 0:
+            stats['ERA'] = (total_er * 9) / ip
+            stats['WHIP'] = total_whip_ip / ip
+        return stats
+
+
+def trade_proposal_shape_error(data):
+    """Error message if a proposal's fields have the wrong types, else None.
+
+    Teams must be names; players_* and picks_* (optional) lists of names.
+    """
+    if not isinstance(data, dict):
+        return "Proposal must be an object"
+    for key in ('team_a', 'team_b'):
+        if data.get(key) is not None and not isinstance(data[key], str):
+            return f"'{key}' must be a team name"
+    for key in ('players_a', 'players_b', 'picks_a', 'picks_b'):
+        names = data.get(key, [])
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            return f"'{key}' must be a list of names"
+    return None
+
+
+def evaluate_trade_proposal(ctx, data):
+    """Full /analyze verdict for one proposal, minus trade_impact.
+
+    ctx is a TradeEvaluationContext shared by every proposal in a request.
+    Returns (result, None) or (None, (error message, HTTP status)).
+    """
+    shape_error = trade_proposal_shape_error(data)
+    if shape_error:
+        return None, (shape_error, 400)
+
+    team_a = data.get('team_a')
+    team_b = data.get('team_b')
+    players_a = data.get('players_a', [])
+    players_b = data.get('players_b', [])
+    picks_a = data.get('picks_a', [])
+    picks_b = data.get('picks_b', [])
+
+    if not team_a or not team_b:
+        return None, ("Both teams must be specified", 400)
+
+    if team_a not in teams or team_b not in teams:
+        return None, ("One or both teams not found", 404)
+
+    # Find players
+    found_players_a = ctx.resolve(team_a, players_a)
+    found_players_b = ctx.resolve(team_b, players_b)
+
+    # Calculate values
+    value_a_sends = sum(ctx.value(p) for p in found_players_a)
+    value_b_sends = sum(ctx.value(p) for p in found_players_b)
+
+    # Add pick values
+    for pick in picks_a:
+        value_a_sends += DynastyValueCalculator.calculate_pick_value(pick)
+    for pick in picks_b:
+        value_b_sends += DynastyValueCalculator.calculate_pick_value(pick)
+
+    value_diff = abs(value_a_sends - value_b_sends)
+
+    # ELITE PLAYER DETECTION
+    elite_threshold = AI_GM_CONFIG["elite_superstar_threshold"]
+    elite_players_a = [p for p in found_players_a if ctx.value(p) >= elite_threshold]
+    elite_players_b = [p for p in found_players_b if ctx.value(p) >= elite_threshold]
 
     elite_warning = None
     if elite_players_a or elite_players_b:
@@ -11854,6 +13358,27 @@ def analyze_trade():
             team_getting_younger = team_a if age_diff > 0 else team_b
             age_analysis = f"Slight age advantage to {team_getting_younger}. "
 
+    # Win probability: share of simulated value outcomes in which each side comes out ahead
+    pick_value_a = sum(DynastyValueCalculator.calculate_pick_value(pick) for pick in picks_a)
+    pick_value_b = sum(DynastyValueCalculator.calculate_pick_value(pick) for pick in picks_b)
+    win_prob_a = trade_win_probability(found_players_b, found_players_a, pick_value_b, pick_value_a)
+    winner_prob = win_prob_a if winner == team_a else 1.0 - win_prob_a
+    if value_diff >= fair:
+        reasoning += f" {winner} comes out ahead in {winner_prob:.0%} of simulated outcomes."
+
+    # Multi-year view: what each side receives, season by season, from the cached age-curve projections
+    a_receives_by_year = get_values_by_year(found_players_b).sum(axis=0)
+    b_receives_by_year = get_values_by_year(found_players_a).sum(axis=0)
+    for pick in picks_b:
+        a_receives_by_year += DynastyValueCalculator.calculate_pick_value(pick)
+    for pick in picks_a:
+        b_receives_by_year += DynastyValueCalculator.calculate_pick_value(pick)
+    horizon_edge = a_receives_by_year[-1] - b_receives_by_year[-1]
+    long_run_winner = team_a if horizon_edge > 0 else team_b
+    if value_diff >= fair and abs(horizon_edge) >= fair and long_run_winner != winner:
+        age_analysis += (f"{winner} wins now, but {long_run_winner} comes out ahead by "
+                         f"{abs(horizon_edge):.1f} in {PROJECTION_YEARS} seasons as the players age. ")
+
     # Position analysis
     positions_a_sends = [p.position.split('/')[0] if '/' in p.position else p.position for p in found_players_a]
     positions_b_sends = [p.position.split('/')[0] if '/' in p.position else p.position for p in found_players_b]
@@ -11878,46 +13403,8 @@ def analyze_trade():
         prospect_analysis = "Both sides exchanging prospect value. "
 
     # Comprehensive stat breakdown for both sides
-    def get_player_stats(players):
-        stats = {
-            # Hitting
-            'HR': sum(HITTER_PROJECTIONS.get(p.name, {}).get('HR', 0) for p in players),
-            'RBI': sum(HITTER_PROJECTIONS.get(p.name, {}).get('RBI', 0) for p in players),
-            'R': sum(HITTER_PROJECTIONS.get(p.name, {}).get('R', 0) for p in players),
-            'SB': sum(HITTER_PROJECTIONS.get(p.name, {}).get('SB', 0) for p in players),
-            'SO': sum(HITTER_PROJECTIONS.get(p.name, {}).get('SO', 0) for p in players),  # Hitter strikeouts
-            'AVG': 0,
-            'OPS': 0,
-            # Pitching
-            'K': sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in players),
-            'BB': sum((PITCHER_PROJECTIONS.get(p.name, {}).get('BB', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('BB', 0)) for p in players),
-            'ERA': 0,
-            'WHIP': 0,
-            'SV': sum(RELIEVER_PROJECTIONS.get(p.name, {}).get('SV', 0) for p in players),
-            'HLD': sum(RELIEVER_PROJECTIONS.get(p.name, {}).get('HD', 0) for p in players),
-            'QS': sum(PITCHER_PROJECTIONS.get(p.name, {}).get('QS', 0) for p in players),
-            'W': sum((PITCHER_PROJECTIONS.get(p.name, {}).get('W', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('W', 0)) for p in players),
-            'L': sum((PITCHER_PROJECTIONS.get(p.name, {}).get('L', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('L', 0)) for p in players),  # Losses
-            'IP': sum((PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('IP', 0)) for p in players),
-        }
-        # Calculate K/BB ratio
-        stats['K/BB'] = stats['K'] / stats['BB'] if stats['BB'] > 0 else 0
-
-        # Calculate weighted AVG and OPS
-        total_ab = sum(HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in players)
-        if total_ab > 0:
-            stats['AVG'] = sum(HITTER_PROJECTIONS.get(p.name, {}).get('AVG', 0) * HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in players) / total_ab
-            stats['OPS'] = sum(HITTER_PROJECTIONS.get(p.name, {}).get('OPS', 0) * HITTER_PROJECTIONS.get(p.name, {}).get('AB', 0) for p in players) / total_ab
-        # Calculate weighted ERA and WHIP
-        if stats['IP'] > 0:
-            total_er = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('ERA', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('ERA', 0)) * (PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('IP', 0)) / 9 for p in players)
-            stats['ERA'] = (total_er * 9) / stats['IP'] if stats['IP'] > 0 else 0
-            total_whip_ip = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('WHIP', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('WHIP', 0)) * (PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('IP', 0)) for p in players)
-            stats['WHIP'] = total_whip_ip / stats['IP'] if stats['IP'] > 0 else 0
-        return stats
-
-    stats_a = get_player_stats(found_players_a)
-    stats_b = get_player_stats(found_players_b)
+    stats_a = ctx.package_stats(found_players_a)
+    stats_b = ctx.package_stats(found_players_b)
 
     # Calculate stat differences (positive = team_a gains, negative = team_b gains)
     stat_diffs = {}
@@ -11988,7 +13475,7 @@ def analyze_trade():
         category_analysis = "Category impact: " + "; ".join(cat_impacts) + ". "
 
     # Team window analysis
-    draft_order, power_rankings, team_totals = get_team_rankings()
+    power_rankings = ctx.power_rankings
     rank_a = power_rankings.get(team_a, 6)
     rank_b = power_rankings.get(team_b, 6)
 
@@ -12062,8 +13549,8 @@ def analyze_trade():
 
         # Suggest removing a player to close the gap
         if loser == team_a and found_players_a:
-            smallest = min(found_players_a, key=lambda p: calc_player_value(p))
-            smallest_val = calc_player_value(smallest)
+            smallest = min(found_players_a, key=ctx.value)
+            smallest_val = ctx.value(smallest)
             if smallest_val <= gap * 1.5 and smallest_val >= gap * 0.5:
                 counter_offer_suggestions.append({
                     'for_team': loser,
@@ -12071,8 +13558,8 @@ def analyze_trade():
                     'value_add': smallest_val
                 })
         elif loser == team_b and found_players_b:
-            smallest = min(found_players_b, key=lambda p: calc_player_value(p))
-            smallest_val = calc_player_value(smallest)
+            smallest = min(found_players_b, key=ctx.value)
+            smallest_val = ctx.value(smallest)
             if smallest_val <= gap * 1.5 and smallest_val >= gap * 0.5:
                 counter_offer_suggestions.append({
                     'for_team': loser,
@@ -12081,10 +13568,9 @@ def analyze_trade():
                 })
 
         # Find a player from winner's team that could be added
-        winner_team = teams.get(winner)
-        if winner_team:
-            candidates = [(p, calc_player_value(p)) for p in winner_team.players
-                         if not any(fp.name == p.name for fp in (found_players_a if winner == team_a else found_players_b))]
+        if winner in teams:
+            in_trade = {fp.name for fp in (found_players_a if winner == team_a else found_players_b)}
+            candidates = [(p, v) for p, v in ctx.team_values(winner) if p.name not in in_trade]
             candidates.sort(key=lambda x: abs(x[1] - gap))
 
             if candidates:
@@ -12110,8 +13596,8 @@ def analyze_trade():
             window_advice.append(f"{team_a} is rebuilding - acquiring young assets/prospects for veterans aligns with your rebuild")
 
     # Category fit analysis for each team
-    team_a_cats, team_a_pos, team_a_window = calculate_team_needs(team_a)
-    team_b_cats, team_b_pos, team_b_window = calculate_team_needs(team_b)
+    team_a_cats, team_a_pos, team_a_window = ctx.team_needs(team_a)
+    team_b_cats, team_b_pos, team_b_window = ctx.team_needs(team_b)
 
     category_fit = {
         'team_a': {
@@ -12130,37 +13616,26 @@ def analyze_trade():
     for cat, score in team_a_cats.items():
         if score < 0:  # Team A weak in this category
             # Check if players from B help this
-            if cat in ['HR', 'SB', 'RBI', 'R']:
-                gain = sum(HITTER_PROJECTIONS.get(p.name, {}).get(cat, 0) for p in found_players_b)
-                loss = sum(HITTER_PROJECTIONS.get(p.name, {}).get(cat, 0) for p in found_players_a)
+            if cat in ['HR', 'SB', 'RBI', 'R', 'K']:
+                gain, loss = stats_b[cat], stats_a[cat]
                 if gain > loss:
                     category_fit['team_a']['helps_weaknesses'].append(f"+{gain - loss:.0f} {cat}")
-            elif cat == 'K':
-                gain = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in found_players_b)
-                loss = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in found_players_a)
-                if gain > loss:
-                    category_fit['team_a']['helps_weaknesses'].append(f"+{gain - loss:.0f} K")
 
     # Check if trade helps team B's weaknesses
     for cat, score in team_b_cats.items():
         if score < 0:  # Team B weak in this category
-            if cat in ['HR', 'SB', 'RBI', 'R']:
-                gain = sum(HITTER_PROJECTIONS.get(p.name, {}).get(cat, 0) for p in found_players_a)
-                loss = sum(HITTER_PROJECTIONS.get(p.name, {}).get(cat, 0) for p in found_players_b)
+            if cat in ['HR', 'SB', 'RBI', 'R', 'K']:
+                gain, loss = stats_a[cat], stats_b[cat]
                 if gain > loss:
                     category_fit['team_b']['helps_weaknesses'].append(f"+{gain - loss:.0f} {cat}")
-            elif cat == 'K':
-                gain = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in found_players_a)
-                loss = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in found_players_b)
-                if gain > loss:
-                    category_fit['team_b']['helps_weaknesses'].append(f"+{gain - loss:.0f} K")
 
     # Build player details for each side
     players_a_details = [{
         "name": p.name,
         "position": p.position,
         "age": p.age,
-        "value": round(calc_player_value(p), 1),
+        "value": round(ctx.value(p), 1),
+        "value_range": ctx.uncertainty.percentiles(p.name),
         "is_prospect": p.is_prospect,
         "prospect_rank": p.prospect_rank if p.is_prospect else None
     } for p in found_players_a]
@@ -12169,20 +13644,13 @@ def analyze_trade():
         "name": p.name,
         "position": p.position,
         "age": p.age,
-        "value": round(calc_player_value(p), 1),
+        "value": round(ctx.value(p), 1),
+        "value_range": ctx.uncertainty.percentiles(p.name),
         "is_prospect": p.is_prospect,
         "prospect_rank": p.prospect_rank if p.is_prospect else None
     } for p in found_players_b]
 
-    # Calculate trade impact simulation (category ranking and championship odds changes)
-    trade_impact = None
-    if found_players_a or found_players_b:  # Only simulate if there are players involved
-        try:
-            trade_impact = simulate_trade_impact(team_a, team_b, found_players_a, found_players_b)
-        except Exception as e:
-            print(f"Error simulating trade impact: {e}")
-
-    return jsonify({
+    return {
         "verdict": verdict,
         "value_a_sends": round(value_a_sends, 1),
         "value_b_sends": round(value_b_sends, 1),
@@ -12197,6 +13665,14 @@ def analyze_trade():
             "team_a_sends_avg_age": round(avg_age_a_sends, 1) if avg_age_a_sends else None,
             "team_b_sends_avg_age": round(avg_age_b_sends, 1) if avg_age_b_sends else None,
         },
+        "win_probability": {
+            "team_a": round(win_prob_a, 3),
+            "team_b": round(1.0 - win_prob_a, 3),
+        },
+        "value_by_year": {
+            "team_a_receives": [round(v, 1) for v in a_receives_by_year.tolist()],
+            "team_b_receives": [round(v, 1) for v in b_receives_by_year.tolist()],
+        },
         "category_impact": cat_impacts,
         "recommendation": recommendation,
         "counter_offer_suggestions": counter_offer_suggestions,
@@ -12211,8 +13687,88 @@ def analyze_trade():
             "team_b_sends": {k: round(v, 3) if isinstance(v, float) else v for k, v in stats_b.items()},
             "net_for_team_a": stat_diffs
         },
-        "trade_impact": trade_impact
-    })
+        "trade_impact": None
+    }, None
+
+
+def _proposal_trade_impact(ctx, data, baseline=None):
+    """simulate_trade_impact for an evaluated proposal (None when no players move)."""
+    team_a, team_b = data.get('team_a'), data.get('team_b')
+    found_players_a = ctx.resolve(team_a, data.get('players_a', []))
+    found_players_b = ctx.resolve(team_b, data.get('players_b', []))
+    if not (found_players_a or found_players_b):
+        return None
+    try:
+        return simulate_trade_impact(team_a, team_b, found_players_a, found_players_b, baseline=baseline)
+    except Exception as e:
+        print(f"Error simulating trade impact: {e}")
+        return None
+
+
+@app.route('/analyze', methods=['POST'])
+def analyze_trade():
+    data = request.get_json()
+    ctx = TradeEvaluationContext()
+    result, error = evaluate_trade_proposal(ctx, data)
+    if error:
+        return jsonify({"error": error[0]}), error[1]
+
+    # Calculate trade impact simulation (category ranking and championship odds changes)
+    result["trade_impact"] = _proposal_trade_impact(ctx, data)
+    return jsonify(result)
+
+
+@app.route('/analyze-batch', methods=['POST'])
+def analyze_trade_batch():
+    """Evaluate many trade proposals in one call.
+
+    Body: {"proposals": [<same shape as /analyze>, ...], "include_impact": true}.
+    Player lookups, values, team needs and projection rows are shared across
+    proposals; with include_impact the league baseline is computed once and
+    each proposal only recomputes the two rosters it swaps. Results come back
+    in proposal order, errors as {"error", "status"} entries.
+    """
+    try:
+        start = time.perf_counter()
+        data = request.get_json() or {}
+        proposals = data.get('proposals')
+        if not isinstance(proposals, list) or not proposals:
+            return jsonify({"error": "proposals must be a non-empty list"}), 400
+        if len(proposals) > MAX_BATCH_PROPOSALS:
+            return jsonify({"error": f"At most {MAX_BATCH_PROPOSALS} proposals per call"}), 400
+        include_impact = bool(data.get('include_impact', True))
+
+        ctx = TradeEvaluationContext()
+        involved = []
+        for proposal in proposals:
+            if trade_proposal_shape_error(proposal):
+                continue  # reported per proposal below
+            for side in ('a', 'b'):
+                team_name = proposal.get(f'team_{side}')
+                if team_name in teams:
+                    involved.extend(ctx.resolve(team_name, proposal.get(f'players_{side}', [])))
+        ctx.prime_values(involved)
+
+        # Every verdict is read against the untouched rosters before any swap
+        results = []
+        for proposal in proposals:
+            result, error = evaluate_trade_proposal(ctx, proposal)
+            results.append(result if error is None else {"error": error[0], "status": error[1]})
+
+        if include_impact:
+            baseline = trade_impact_baseline()
+            for proposal, result in zip(proposals, results):
+                if 'error' not in result:
+                    result["trade_impact"] = _proposal_trade_impact(ctx, proposal, baseline)
+
+        return jsonify({
+            "results": results,
+            "count": len(results),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)
+        })
+    except Exception as e:
+        print(f"Error in analyze_trade_batch: {e}")
+        return jsonify({"error": f"Failed to analyze trades: {str(e)}"}), 500
 
 
 # ============================================================================
@@ -12231,16 +13787,13 @@ LEVEL_TO_ETA = {
     'INTL': 4,   # International
 }
 
-# Peak age ranges by position type
-PEAK_AGES = {
-    'hitter': {'start': 26, 'end': 31},
-    'pitcher': {'start': 26, 'end': 30},
-}
-
-
 def calculate_core_weighted_age(players_with_value, top_n=10):
     """Calculate age weighted by player value - core players matter more than depth.
 
+    The core is the top_n players by current value; each one's age is weighted
+    by his value summed over this season and the next PROJECTION_YEARS (the
+    cached age-curve projections), so a core piece about to fade counts less.
+
     Args:
         players_with_value: List of (player, value) tuples
         top_n: Number of top players to consider as "core"
@@ -12258,12 +13811,13 @@ def calculate_core_weighted_age(players_with_value, top_n=10):
     if not core_players:
         return 27.0, []
 
-    # Weight age by value (higher value = more weight)
-    total_value = sum(v for _, v in core_players)
-    if total_value == 0:
+    # Weight age by projected multi-year value (higher value = more weight)
+    horizon_values = get_values_by_year([p for p, _ in core_players]).sum(axis=1).tolist()
+    total_value = sum(horizon_values)
+    if total_value <= 0:
         return 27.0, []
 
-    weighted_age = sum(p.age * v for p, v in core_players) / total_value
+    weighted_age = sum(p.age * w for (p, _), w in zip(core_players, horizon_values)) / total_value
 
     return round(weighted_age, 1), core_players
 
@@ -12271,6 +13825,10 @@ def calculate_core_weighted_age(players_with_value, top_n=10):
 def calculate_peak_timing(core_players):
     """Calculate how many years until the core starts declining.
 
+    Each player's phase and seasons until decline are read from the age curve
+    table (age_curve_peaks) for his position group, the same curves that drive
+    value_by_year.
+
     Args:
         core_players: List of (player, value) tuples for core players
 
@@ -12280,6 +13838,7 @@ def calculate_peak_timing(core_players):
     if not core_players:
         return {'years_in_window': 3, 'ascending_count': 0, 'peak_count': 0, 'declining_count': 0}
 
+    phases, seasons_left = age_curve_peaks()
     ascending = 0  # Before peak
     at_peak = 0    # In peak years
     declining = 0  # Past peak
@@ -12290,20 +13849,16 @@ def calculate_peak_timing(core_players):
         if player.age <= 0:
             continue
 
-        # Determine if hitter or pitcher
-        pos = player.position.upper() if player.position else ''
-        is_pitcher = 'SP' in pos or 'RP' in pos or pos == 'P'
-        peak = PEAK_AGES['pitcher'] if is_pitcher else PEAK_AGES['hitter']
-
-        if player.age < peak['start']:
+        group = age_curve_group(player.position)
+        age = min(int(round(player.age)), AGE_CURVE_MAX_AGE)
+        phase = phases[group, age]
+        if phase > 0:
             ascending += 1
-            years_until_decline.append(peak['end'] - player.age)
-        elif player.age <= peak['end']:
+        elif phase == 0:
             at_peak += 1
-            years_until_decline.append(peak['end'] - player.age)
         else:
             declining += 1
-            years_until_decline.append(0)  # Already declining
+        years_until_decline.append(float(seasons_left[group, age]))
 
     # Weight by value for years calculation
     if years_until_decline:
@@ -12515,37 +14070,38 @@ def determine_enhanced_window(power_rank, total_teams, core_age, peak_timing, pr
     return window, combined_score, window_details
 
 
+# Competitive category totals; a team's need score in a category is
+# (total - optimal) / optimal * 4, clamped to [-2, 2]
+TEAM_NEED_OPTIMAL = {
+    'HR': 190, 'SB': 90, 'RBI': 550, 'R': 550,
+    'K': 1100, 'SV+HLD': 50, 'ERA': 3.90, 'WHIP': 1.25
+}
+
+
 def calculate_team_needs(team_name):
     """Calculate a team's category needs and positional depth."""
-    team = teams.get(team_name)
-    if not team:
+    if team_name not in teams:
         return {}, {}, "unknown"
+    return league_graph.get(('team_needs', team_name))
 
-    # Calculate category totals
-    total_hr = sum(HITTER_PROJECTIONS.get(p.name, {}).get('HR', 0) for p in team.players)
-    total_sb = sum(HITTER_PROJECTIONS.get(p.name, {}).get('SB', 0) for p in team.players)
-    total_rbi = sum(HITTER_PROJECTIONS.get(p.name, {}).get('RBI', 0) for p in team.players)
-    total_runs = sum(HITTER_PROJECTIONS.get(p.name, {}).get('R', 0) for p in team.players)
-    total_k = sum((PITCHER_PROJECTIONS.get(p.name, {}).get('K', 0) or RELIEVER_PROJECTIONS.get(p.name, {}).get('K', 0)) for p in team.players)
-    total_sv_hld = sum((RELIEVER_PROJECTIONS.get(p.name, {}).get('SV', 0) + RELIEVER_PROJECTIONS.get(p.name, {}).get('HD', 0)) for p in team.players)
-    total_ip = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in team.players)
 
-    # Calculate weighted ERA and WHIP
-    total_era_weighted = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('ERA', 0) * PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in team.players)
-    total_whip_weighted = sum(PITCHER_PROJECTIONS.get(p.name, {}).get('WHIP', 0) * PITCHER_PROJECTIONS.get(p.name, {}).get('IP', 0) for p in team.players)
-    avg_era = total_era_weighted / total_ip if total_ip > 0 else 4.50
-    avg_whip = total_whip_weighted / total_ip if total_ip > 0 else 1.30
+@league_graph.node('team_needs')
+def _graph_team_needs(team_name):
+    team = teams[team_name]
+    league_graph.get(('roster', team_name))
+    league_graph.get(('team_projections', team_name))
+
+    # Category totals from the optimal starting lineup (shared with the category rankings)
+    cats = league_graph.get(('team_categories', team_name))
+    total_hr, total_sb, total_rbi, total_runs = cats['HR'], cats['SB'], cats['RBI'], cats['R']
+    total_k, total_sv_hld = cats['K'], cats['SV+HLD']
+    avg_era = cats['ERA'] if cats['IP'] > 0 else 4.50
+    avg_whip = cats['WHIP'] if cats['IP'] > 0 else 1.30
 
     # GRADIENT FIT SCORING: Calculate continuous need scores instead of discrete buckets
     # Scores from -2 (desperate need) to +2 (major strength) with fine-grained precision
     # Formula: ((actual - optimal) / optimal) * scale, clamped to [-2, 2]
 
-    # Define optimal thresholds (competitive level)
-    OPTIMAL = {
-        'HR': 190, 'SB': 90, 'RBI': 550, 'R': 550,
-        'K': 1100, 'SV+HLD': 50, 'ERA': 3.90, 'WHIP': 1.25
-    }
-
     def gradient_score(actual, optimal, inverted=False):
         """Calculate gradient score: positive = strength, negative = need"""
         if inverted:  # For ERA/WHIP where lower is better
@@ -12557,36 +14113,18 @@ def calculate_team_needs(team_name):
         return max(-2, min(2, score))  # Clamp to [-2, 2]
 
     category_scores = {
-        'HR': gradient_score(total_hr, OPTIMAL['HR']),
-        'SB': gradient_score(total_sb, OPTIMAL['SB']),
-        'RBI': gradient_score(total_rbi, OPTIMAL['RBI']),
-        'R': gradient_score(total_runs, OPTIMAL['R']),
-        'K': gradient_score(total_k, OPTIMAL['K']),
-        'SV+HLD': gradient_score(total_sv_hld, OPTIMAL['SV+HLD']),
-        'ERA': gradient_score(avg_era, OPTIMAL['ERA'], inverted=True),
-        'WHIP': gradient_score(avg_whip, OPTIMAL['WHIP'], inverted=True),
+        'HR': gradient_score(total_hr, TEAM_NEED_OPTIMAL['HR']),
+        'SB': gradient_score(total_sb, TEAM_NEED_OPTIMAL['SB']),
+        'RBI': gradient_score(total_rbi, TEAM_NEED_OPTIMAL['RBI']),
+        'R': gradient_score(total_runs, TEAM_NEED_OPTIMAL['R']),
+        'K': gradient_score(total_k, TEAM_NEED_OPTIMAL['K']),
+        'SV+HLD': gradient_score(total_sv_hld, TEAM_NEED_OPTIMAL['SV+HLD']),
+        'ERA': gradient_score(avg_era, TEAM_NEED_OPTIMAL['ERA'], inverted=True),
+        'WHIP': gradient_score(avg_whip, TEAM_NEED_OPTIMAL['WHIP'], inverted=True),
     }
 
     # Positional depth (count rostered players by position group)
-    pos_depth = {'C': 0, '1B': 0, '2B': 0, 'SS': 0, '3B': 0, 'OF': 0, 'SP': 0, 'RP': 0}
-    for p in team.players:
-        pos = p.position.upper() if p.position else ''
-        if 'C' in pos and '1B' not in pos and 'CF' not in pos:
-            pos_depth['C'] += 1
-        if '1B' in pos:
-            pos_depth['1B'] += 1
-        if '2B' in pos:
-            pos_depth['2B'] += 1
-        if 'SS' in pos:
-            pos_depth['SS'] += 1
-        if '3B' in pos:
-            pos_depth['3B'] += 1
-        if 'OF' in pos or 'LF' in pos or 'CF' in pos or 'RF' in pos:
-            pos_depth['OF'] += 1
-        if 'SP' in pos:
-            pos_depth['SP'] += 1
-        if 'RP' in pos or 'CL' in pos:
-            pos_depth['RP'] += 1
+    pos_depth = position_depth_counts(team.players)
 
     # =========================================================================
     # ENHANCED WINDOW DETERMINATION - Uses core-weighted age, peak timing,
@@ -12594,7 +14132,7 @@ def calculate_team_needs(team_name):
     # =========================================================================
 
     # Calculate player values for core analysis
-    players_with_value = [(p, calc_player_value(p)) for p in team.players]
+    players_with_value = list(get_team_player_values(team_name))
     total_value = sum(v for _, v in players_with_value)
 
     # Get power ranking
@@ -12616,6 +14154,9 @@ def calculate_team_needs(team_name):
         power_rank, total_teams, core_age, peak_timing, prospect_proximity
     )
 
+    # 5. VALUE TRAJECTORY: roster value by season from the cached age-curve projections
+    value_by_year = get_values_by_year(team.players).sum(axis=0)
+
     # Store window details for potential UI display (optional enhancement)
     # This data can be used to show users WHY their team has a certain window
     _window_analysis_cache[team_name] = {
@@ -12624,7 +14165,8 @@ def calculate_team_needs(team_name):
         'details': window_details,
         'core_age': core_age,
         'peak_timing': peak_timing,
-        'prospect_proximity': prospect_proximity
+        'prospect_proximity': prospect_proximity,
+        'value_by_year': [round(v, 1) for v in value_by_year.tolist()]
     }
 
     return category_scores, pos_depth, window
@@ -12667,6 +14209,10 @@ def get_player_categories(player):
     return {'type': 'unknown'}
 
 
+# score_trade_fit points lost per point of value difference
+FIT_FAIRNESS_PENALTY = 2.5
+
+
 def score_trade_fit(my_team_name, their_team_name, you_send, you_receive, value_diff):
     """Score how well a trade fits both teams' needs. Returns (score, reasons)."""
     my_cats, my_pos, my_window = calculate_team_needs(my_team_name)
@@ -12676,7 +14222,7 @@ def score_trade_fit(my_team_name, their_team_name, you_send, you_receive, value_
     reasons = []
 
     # Penalize for value difference (0-10 range typical for fair trades)
-    fairness_penalty = value_diff * 2.5  # Slightly higher penalty with tighter thresholds
+    fairness_penalty = value_diff * FIT_FAIRNESS_PENALTY  # Slightly higher penalty with tighter thresholds
     score -= fairness_penalty
 
     # Calculate category changes for my team
@@ -12861,33 +14407,25 @@ def score_trade_fit(my_team_name, their_team_name, you_send, you_receive, value_
 
     # Positional upgrade detection
     for p_recv in you_receive:
-        recv_pos = p_recv.position.upper() if p_recv.position else ''
         recv_val = calc_player_value(p_recv)
         for p_send in you_send:
-            send_pos = p_send.position.upper() if p_send.position else ''
             send_val = calc_player_value(p_send)
-            # Same position, getting upgrade
-            if recv_pos == send_pos and recv_val > send_val * 1.15:
+            # Shared real position (every hitter is UTIL-eligible, so UTIL doesn't count)
+            shared = p_recv.eligibility & p_send.eligibility & (FIELD_MASK | PITCHER_MASK)
+            if shared and recv_val > send_val * 1.15:
                 score += 5
-                reasons.append(f"Positional upgrade at {recv_pos}")
+                shared_pos = next(pos for pos, bit in ELIGIBILITY_BITS.items() if shared & bit)
+                reasons.append(f"Positional upgrade at {shared_pos}")
                 break
 
     # POSITIONAL SURPLUS PENALTY - Penalize acquiring players at positions we're already deep in
     my_team = teams.get(my_team_name)
     if my_team:
-        my_pos_counts = {}
-        for p in my_team.players:
-            pos = p.position.split('/')[0].split(',')[0].upper() if p.position else 'UTIL'
-            if pos in ['LF', 'CF', 'RF']:
-                pos = 'OF'
-            my_pos_counts[pos] = my_pos_counts.get(pos, 0) + 1
+        _, my_pos_counts, _ = calculate_team_needs(my_team_name)
 
         for p_recv in you_receive:
-            recv_pos = p_recv.position.split('/')[0].split(',')[0].upper() if p_recv.position else 'UTIL'
-            if recv_pos in ['LF', 'CF', 'RF']:
-                recv_pos = 'OF'
-
-            current_count = my_pos_counts.get(recv_pos, 0)
+            # A multi-position player only crowds the roster if every spot they can play is deep
+            current_count, recv_pos = crowded_depth(p_recv, my_pos_counts)
             if current_count >= 5:
                 # Already stacked at this position - significant penalty
                 score -= 25
@@ -12900,160 +14438,405 @@ def score_trade_fit(my_team_name, their_team_name, you_send, you_receive, value_
     return score, reasons
 
 
-@app.route('/suggest')
-def get_suggestions():
+def evaluate_trade_fit(my_team_name, their_team_name, you_send, you_receive, value_diff):
+    """score_trade_fit, scored once per trade per data version.
+
+    value_diff must be the one the players' values imply, so that the
+    canonical trade key alone identifies the result.
+    """
+    key = trade_key(my_team_name, you_send, their_team_name, you_receive)
+    return _evaluated_trades.get_or_evaluate(
+        key, ('score_trade_fit', my_team_name),
+        lambda: score_trade_fit(my_team_name, their_team_name, you_send, you_receive, value_diff)
+    )
+
+
+def fit_score_ceiling(my_team_name, their_team_name, you_receive):
+    """Upper bound on score_trade_fit for receiving these players, before the fairness penalty.
+
+    Holds for any send package: every send-dependent term is taken at its
+    best case. Lets searches with a minimum fit skip a candidate whose
+    ceiling minus FIT_FAIRNESS_PENALTY * value_diff is already too low.
+    """
+    my_cats, my_pos, my_window = calculate_team_needs(my_team_name)
+    _, _, their_window = calculate_team_needs(their_team_name)
+    score = 100
+
+    # Category gains in a need (capped at 20) or trading from a strength (+5)
+    for cat in ['HR', 'SB', 'RBI', 'R', 'K', 'SV+HLD']:
+        need_score = my_cats.get(cat, 0)
+        if need_score < 0:
+            score += 20
+        elif need_score >= 1:
+            score += 5
+
+    # Window-driven age and prospect bonuses
+    prospects_received = len([p for p in you_receive if p.is_prospect])
+    if my_window in ['rebuilding', 'rising', 'dynasty']:
+        score += int(10 * (1 + AI_GM_CONFIG.get("philosophy_weight", 0.15)))
+    elif my_window in ['win-now', 'contender']:
+        score += 5 + int(8 * (AI_GM_CONFIG.get("veteran_premium_contending", 1.15) - 1) * 10)
+    if my_window in ['rebuilding', 'rising']:
+        score += int(10 * prospects_received * AI_GM_CONFIG.get("prospect_premium_rebuilding", 1.12))
+    elif my_window in ['win-now', 'contender']:
+        score += 8 + 5
+
+    # Their need filled, like-for-like positions, complementary windows
+    score += 5 + 3
+    complementary_windows = {
+        ('rebuilding', 'win-now'), ('rebuilding', 'contender'),
+        ('win-now', 'rebuilding'), ('contender', 'rebuilding'),
+        ('rising', 'declining'), ('declining', 'rising'),
+        ('teardown', 'contender'), ('contender', 'teardown'),
+        ('teardown', 'win-now'), ('win-now', 'teardown')
+    }
+    if (my_window, their_window) in complementary_windows:
+        score += 8
+
+    # Received-player bonuses and surplus penalties are known exactly
+    for p in you_receive:
+        if p.age <= 25:
+            pval = calc_player_value(p)
+            if pval >= 60:
+                score += 12
+            elif pval >= 45:
+                score += 6
+        if p.is_prospect and p.prospect_rank and p.prospect_rank <= 50:
+            score += 15 if p.prospect_rank <= 20 else 8
+        if p.eligibility & (FIELD_MASK | PITCHER_MASK):
+            score += 5  # Positional upgrade, if some sent player shares a real position
+        current_count, _ = crowded_depth(p, my_pos)
+        if current_count >= 5:
+            score -= 25
+        elif current_count >= 4:
+            score -= 15
+    if you_receive and max(you_receive, key=lambda p: calc_player_value(p)).age <= 26:
+        score += 10  # Younger at similar value
+
+    return score
+
+
+# ============================================================================
+# TRADE MARKET MATRIX
+# ============================================================================
+
+@league_graph.node('trade_market')
+def _graph_trade_market():
+    """League-wide 1-for-1 value-difference and category-fit matrices."""
+    team_names = league_graph.get(('league',))
+    return TradeMarket(
+        {name: get_team_player_values(name) for name in team_names},
+        {name: calculate_team_needs(name)[0] for name in team_names},
+        {cat: 4 / TEAM_NEED_OPTIMAL[cat] for cat in MARKET_CATEGORIES},
+    )
+
+
+def get_trade_market():
+    """The cached TradeMarket for the current rosters, values and team needs."""
+    return league_graph.get(('trade_market',))
+
+
+# Multi-player packages come from a team's tradeable players (value >= 10).
+# Searches score the packages nearest the target value first, this many per
+# target player or per target package.
+PACKAGE_MIN_VALUE = 10
+PACKAGE_MATCHES_PER_PLAYER = 6
+PACKAGE_MATCHES_PER_PACKAGE = 2
+
+
+@league_graph.node('team_packages')
+def _graph_team_packages(team_name):
+    """Sorted 2- and 3-player package totals over a team's tradeable players, best-first."""
+    tradeable = [(p, v) for p, v in get_team_player_values(team_name) if v >= PACKAGE_MIN_VALUE]
+    tradeable.sort(key=lambda x: x[1], reverse=True)
+    return PackageIndex([p for p, _ in tradeable], [v for _, v in tradeable])
+
+
+def get_team_packages(team_name):
+    """PackageIndex for a team; rebuilt only when that team's roster or values change."""
+    return league_graph.get(('team_packages', team_name))
+
+
+@app.route('/trade-market/heatmap')
+@cached_response
+def get_trade_market_heatmap():
+    """Whole-league fair-trade heatmap: fair 1-for-1 pairs between every two teams.
+
+    Optional: tolerance (max value gap, default 8), min_value (both players, default 10).
+    mutual_fit is the mean category fit of those pairs for both owners combined.
+    """
     try:
-        my_team = request.args.get('my_team')
-        target_team = request.args.get('target_team')
-        trade_type = request.args.get('trade_type', 'any')
-        offset = int(request.args.get('offset', 0))
-        limit = int(request.args.get('limit', 8))
-        # Quick filter parameters
-        filter_position = request.args.get('filter_position', '')
-        filter_min_fit = int(request.args.get('filter_min_fit', 0))
-        filter_max_diff = int(request.args.get('filter_max_diff', 100))
+        tolerance = request.args.get('tolerance', 8, type=float)
+        min_value = request.args.get('min_value', 10, type=float)
+        market = get_trade_market()
+        heat = market.heatmap(tolerance, min_value)
+        pairs = heat['pairs'].astype(int)
+        return jsonify({
+            "teams": market.team_names,
+            "tolerance": tolerance,
+            "min_value": min_value,
+            "pairs": pairs.tolist(),
+            "mutual_fit": np.round(heat['mutual_fit'], 3).tolist(),
+            "busiest_partner": {
+                name: market.team_names[int(np.argmax(row))] if row.any() else None
+                for name, row in zip(market.team_names, pairs)
+            },
+            "total_pairs": int(pairs.sum()) // 2
+        })
+    except Exception as e:
+        print(f"Error in get_trade_market_heatmap: {e}")
+        return jsonify({"error": f"Failed to build trade market heatmap: {str(e)}"}), 500
 
-        if not my_team or my_team not in teams:
-            return jsonify({"error": "Invalid team specified"}), 400
 
-        suggestions = []
-        my_players = [(p, calc_player_value(p)) for p in teams[my_team].players]
-        my_players.sort(key=lambda x: x[1], reverse=True)
-        # EXPANDED: Include stars (85+) and depth pieces (10+) for more trade options
-        my_tradeable = [(p, v) for p, v in my_players if v >= 10][:15]
+def rank_suggestions(my_team, target_team, trade_type, filter_position,
+                     filter_min_fit, filter_max_diff, sort_by):
+    """Generate, filter and rank every /suggest candidate for one query.
 
-        # Get my team's needs for insights
-        my_cats, my_pos, my_window = calculate_team_needs(my_team)
+    Returns (suggestions, needs_summary); /suggest pages through the list.
+    """
+    # Filters are pushed into candidate generation: ineligible receive players
+    # and over-tolerance pairs are never scored, and with a minimum fit a
+    # candidate is only scored if its fit_score_ceiling can still reach it.
+    # Shown values are rounded to 0.1, so the bounds allow for the rounding.
+    wanted = position_filter_mask(filter_position) if filter_position else None
+    max_gap = filter_max_diff + 0.05 if filter_max_diff < 100 else float('inf')
+    min_fit = filter_min_fit - 0.05 if filter_min_fit > 0 else None
+
+    def receivable(players):
+        return wanted is None or any(p.is_eligible(wanted) for p in players)
+
+    ceilings = {}
+
+    def may_reach_min_fit(other_team, receive, diff):
+        if min_fit is None:
+            return True
+        key = (other_team, tuple(p.name for p in receive))
+        if key not in ceilings:
+            ceilings[key] = fit_score_ceiling(my_team, other_team, receive)
+        return ceilings[key] - diff * FIT_FAIRNESS_PENALTY >= min_fit
 
-        # If targeting all teams, we need to be more selective to avoid timeout
-        all_teams_mode = not target_team
-        target_teams = [target_team] if target_team else [t for t in teams.keys() if t != my_team]
+    seen = set()
 
-        for other_team in target_teams:
-            if other_team == my_team:
-                continue
+    def add_suggestion(suggestion):
+        key = trade_key(my_team, suggestion['you_send'], suggestion['other_team'], suggestion['you_receive'])
+        if key in seen:
+            return
+        seen.add(key)
+        if min_fit is not None and suggestion['fit_score'] < filter_min_fit:
+            return
+        if filter_max_diff < 100 and suggestion['value_diff'] > filter_max_diff:
+            return
+        suggestions.append(suggestion)
+
+    suggestions = []
+    # EXPANDED: Include stars (85+) and depth pieces (10+) for more trade options
+    market = get_trade_market()
+    my_rows = market.ranked(my_team, 10, 15)
+    # 2-player packages come from every tradeable player, matched by value
+    my_packages = get_team_packages(my_team)
+
+    # Get my team's needs for insights
+    my_cats, my_pos, my_window = calculate_team_needs(my_team)
+
+    # If targeting all teams, we need to be more selective to avoid timeout
+    all_teams_mode = not target_team
+    target_teams = [target_team] if target_team else [t for t in teams.keys() if t != my_team]
+
+    for other_team in target_teams:
+        if other_team == my_team:
+            continue
 
-            their_players = [(p, calc_player_value(p)) for p in teams[other_team].players]
-            their_players.sort(key=lambda x: x[1], reverse=True)
-            # Use fewer players when searching all teams
-            max_tradeable = 10 if all_teams_mode else 15
-            # EXPANDED: Include all valuable players, not just mid-tier (was 15-85)
-            their_tradeable = [(p, v) for p, v in their_players if v >= 10][:max_tradeable]
-
-            # 1-for-1 trades
-            if trade_type in ['any', '1-for-1']:
-                for my_p, my_val in my_tradeable:
-                    for their_p, their_val in their_tradeable:
-                        diff = abs(my_val - their_val)
-                        if diff < 12:  # Tighter threshold
-                            # Skip full scoring in all-teams mode for speed
-                            if all_teams_mode:
-                                fit_score = 100 - diff * 2
-                                reasons = []
-                            else:
-                                fit_score, reasons = score_trade_fit(
-                                    my_team, other_team, [my_p], [their_p], diff
-                                )
-                            suggestions.append({
-                                "my_team": my_team,
-                                "other_team": other_team,
-                                "you_send": [my_p.name],
-                                "you_receive": [their_p.name],
-                                "you_send_positions": [my_p.position],
-                                "you_receive_positions": [their_p.position],
-                                "you_send_value": round(my_val, 1),
-                                "you_receive_value": round(their_val, 1),
-                                "value_diff": round(diff, 1),
-                                "trade_type": "1-for-1",
-                                "fit_score": round(fit_score, 1),
-                                "reasons": reasons[:3]
-                            })
+        their_players = [(p, calc_player_value(p)) for p in teams[other_team].players]
+        their_players.sort(key=lambda x: x[1], reverse=True)
+        # Use fewer players when searching all teams
+        max_tradeable = 10 if all_teams_mode else 15
+        # EXPANDED: Include all valuable players, not just mid-tier (was 15-85)
+        their_tradeable = [(p, v) for p, v in their_players if v >= 10][:max_tradeable]
+
+        # 1-for-1 trades: the close-value pairs are one slice of the market matrix
+        if trade_type in ['any', '1-for-1']:
+            their_rows = np.array([row for row in market.ranked(other_team, 10, max_tradeable).tolist()
+                                   if receivable([market.players[row]])], dtype=np.intp)
+            for my_row, their_row in market.within(my_rows, their_rows, min(12, max_gap)):
+                my_p, my_val = market.players[my_row], market.values[my_row].item()
+                their_p, their_val = market.players[their_row], market.values[their_row].item()
+                diff = abs(my_val - their_val)
+                # Skip full scoring in all-teams mode for speed
+                if all_teams_mode:
+                    fit_score = 100 - diff * 2
+                    reasons = []
+                elif may_reach_min_fit(other_team, [their_p], diff):
+                    fit_score, reasons = evaluate_trade_fit(
+                        my_team, other_team, [my_p], [their_p], diff
+                    )
+                else:
+                    continue
+                add_suggestion({
+                    "my_team": my_team,
+                    "other_team": other_team,
+                    "you_send": [my_p.name],
+                    "you_receive": [their_p.name],
+                    "you_send_positions": [my_p.position],
+                    "you_receive_positions": [their_p.position],
+                    "you_send_value": round(my_val, 1),
+                    "you_receive_value": round(their_val, 1),
+                    "value_diff": round(diff, 1),
+                    "trade_type": "1-for-1",
+                    "fit_score": round(fit_score, 1),
+                    "reasons": reasons[:3]
+                })
 
-            # 2-for-1 trades (you send 2, receive 1 better player) - skip in all-teams mode
-            if trade_type in ['any', '2-for-1'] and not all_teams_mode:
-                for i, (my_p1, my_v1) in enumerate(my_tradeable[:8]):
-                    for my_p2, my_v2 in my_tradeable[i+1:8]:
-                        combined_val = my_v1 + my_v2
-                        for their_p, their_val in their_tradeable:
-                            diff = abs(combined_val - their_val)
-                            # 2-for-1 should get a better player (their_val > max of yours)
-                            if diff < 18 and their_val > max(my_v1, my_v2) * 1.1:
-                                fit_score, reasons = score_trade_fit(
-                                    my_team, other_team, [my_p1, my_p2], [their_p], diff
-                                )
-                                suggestions.append({
-                                    "my_team": my_team,
-                                    "other_team": other_team,
-                                    "you_send": [my_p1.name, my_p2.name],
-                                    "you_receive": [their_p.name],
-                                    "you_send_positions": [my_p1.position, my_p2.position],
-                                    "you_receive_positions": [their_p.position],
-                                    "you_send_value": round(combined_val, 1),
-                                    "you_receive_value": round(their_val, 1),
-                                    "value_diff": round(diff, 1),
-                                    "trade_type": "2-for-1",
-                                    "fit_score": round(fit_score, 1),
-                                    "reasons": reasons[:3]
-                                })
+        # 2-for-1 trades (you send 2, receive 1 better player) - skip in all-teams mode
+        if trade_type in ['any', '2-for-1'] and not all_teams_mode:
+            for their_p, their_val in their_tradeable:
+                if not receivable([their_p]):
+                    continue
+                tolerance = min(18, max_gap)
+                # 2-for-1 should get a better player (their_val > max of yours)
+                matches = my_packages.closest(
+                    2, their_val, their_val - tolerance, their_val + tolerance, PACKAGE_MATCHES_PER_PLAYER,
+                    keep=lambda totals, members: (np.abs(totals - their_val) < tolerance)
+                    & (their_val > my_packages.values[members[:, 0]] * 1.1))
+                for (i, j), combined_val in matches:
+                    my_p1, my_p2 = my_packages.players[i], my_packages.players[j]
+                    diff = abs(combined_val - their_val)
+                    if not may_reach_min_fit(other_team, [their_p], diff):
+                        continue
+                    fit_score, reasons = evaluate_trade_fit(
+                        my_team, other_team, [my_p1, my_p2], [their_p], diff
+                    )
+                    add_suggestion({
+                        "my_team": my_team,
+                        "other_team": other_team,
+                        "you_send": [my_p1.name, my_p2.name],
+                        "you_receive": [their_p.name],
+                        "you_send_positions": [my_p1.position, my_p2.position],
+                        "you_receive_positions": [their_p.position],
+                        "you_send_value": round(combined_val, 1),
+                        "you_receive_value": round(their_val, 1),
+                        "value_diff": round(diff, 1),
+                        "trade_type": "2-for-1",
+                        "fit_score": round(fit_score, 1),
+                        "reasons": reasons[:3]
+                    })
 
-            # 2-for-2 trades - skip in all-teams mode
-            if trade_type in ['any', '2-for-2'] and not all_teams_mode:
-                for i, (my_p1, my_v1) in enumerate(my_tradeable[:6]):
-                    for my_p2, my_v2 in my_tradeable[i+1:6]:
-                        my_combined = my_v1 + my_v2
-                        for j, (their_p1, their_v1) in enumerate(their_tradeable[:6]):
-                            for their_p2, their_v2 in their_tradeable[j+1:6]:
-                                their_combined = their_v1 + their_v2
-                                diff = abs(my_combined - their_combined)
-                                if diff < 18:
-                                    fit_score, reasons = score_trade_fit(
-                                        my_team, other_team, [my_p1, my_p2], [their_p1, their_p2], diff
-                                    )
-                                    suggestions.append({
-                                        "my_team": my_team,
-                                        "other_team": other_team,
-                                        "you_send": [my_p1.name, my_p2.name],
-                                        "you_receive": [their_p1.name, their_p2.name],
-                                        "you_send_positions": [my_p1.position, my_p2.position],
-                                        "you_receive_positions": [their_p1.position, their_p2.position],
-                                        "you_send_value": round(my_combined, 1),
-                                        "you_receive_value": round(their_combined, 1),
-                                        "value_diff": round(diff, 1),
-                                        "trade_type": "2-for-2",
-                                        "fit_score": round(fit_score, 1),
-                                        "reasons": reasons[:3]
-                                    })
+        # 2-for-2 trades - skip in all-teams mode
+        if trade_type in ['any', '2-for-2'] and not all_teams_mode:
+            for k, (their_p1, their_v1) in enumerate(their_tradeable):
+                for their_p2, their_v2 in their_tradeable[k+1:]:
+                    if not receivable([their_p1, their_p2]):
+                        continue
+                    their_combined = their_v1 + their_v2
+                    tolerance = min(18, max_gap)
+                    matches = my_packages.closest(
+                        2, their_combined, their_combined - tolerance, their_combined + tolerance,
+                        PACKAGE_MATCHES_PER_PACKAGE,
+                        keep=lambda totals, members: np.abs(totals - their_combined) < tolerance)
+                    for (i, j), my_combined in matches:
+                        my_p1, my_p2 = my_packages.players[i], my_packages.players[j]
+                        diff = abs(my_combined - their_combined)
+                        if not may_reach_min_fit(other_team, [their_p1, their_p2], diff):
+                            continue
+                        fit_score, reasons = evaluate_trade_fit(
+                            my_team, other_team, [my_p1, my_p2], [their_p1, their_p2], diff
+                        )
+                        add_suggestion({
+                            "my_team": my_team,
+                            "other_team": other_team,
+                            "you_send": [my_p1.name, my_p2.name],
+                            "you_receive": [their_p1.name, their_p2.name],
+                            "you_send_positions": [my_p1.position, my_p2.position],
+                            "you_receive_positions": [their_p1.position, their_p2.position],
+                            "you_send_value": round(my_combined, 1),
+                            "you_receive_value": round(their_combined, 1),
+                            "value_diff": round(diff, 1),
+                            "trade_type": "2-for-2",
+                            "fit_score": round(fit_score, 1),
+                            "reasons": reasons[:3]
+                        })
+
+    # Sort by fit score (best fits first), not just value difference
+    suggestions.sort(key=lambda x: x['fit_score'], reverse=True)
+    suggestions = suggestions[:200]  # Cap at 200 total suggestions
+
+    if sort_by == 'odds' and suggestions:
+        suggestions = suggestions[:SUGGEST_ODDS_CANDIDATES]
+        impacts = evaluate_trades_championship_impact([
+            {"team_a": s['my_team'], "team_b": s['other_team'],
+             "players_a": s['you_send'], "players_b": s['you_receive']}
+            for s in suggestions
+        ])
+        for s, impact in zip(suggestions, impacts):
+            s['odds_gained'] = impact[s['my_team']]['title_delta']
+            s['odds_gained_ci'] = impact[s['my_team']]['title_delta_ci']
+            s['their_odds_change'] = impact[s['other_team']]['title_delta']
+        suggestions.sort(key=lambda x: x['odds_gained'], reverse=True)
+
+    # Add team needs summary to response
+    needs_summary = {
+        'weaknesses': [cat for cat, score in my_cats.items() if score < 0],
+        'strengths': [cat for cat, score in my_cats.items() if score > 0],
+        'window': my_window
+    }
 
-        # Sort by fit score (best fits first), not just value difference
-        suggestions.sort(key=lambda x: x['fit_score'], reverse=True)
-        suggestions = suggestions[:200]  # Cap at 200 total suggestions
+    return suggestions, needs_summary
 
-        # Apply quick filters
-        if filter_position:
-            suggestions = [s for s in suggestions if any(filter_position in pos for pos in s.get('you_receive_positions', []))]
-        if filter_min_fit > 0:
-            suggestions = [s for s in suggestions if s['fit_score'] >= filter_min_fit]
-        if filter_max_diff < 100:
-            suggestions = [s for s in suggestions if s['value_diff'] <= filter_max_diff]
+
+@app.route('/suggest')
+def get_suggestions():
+    try:
+        my_team = request.args.get('my_team')
+        target_team = request.args.get('target_team')
+        trade_type = request.args.get('trade_type', 'any')
+        # Quick filter parameters
+        filter_position = request.args.get('filter_position', '')
+        try:
+            offset = max(0, int(request.args.get('offset', 0)))
+            limit = max(1, min(int(request.args.get('limit', 8)), SUGGEST_MAX_LIMIT))
+            filter_min_fit = int(request.args.get('filter_min_fit', 0))
+            filter_max_diff = int(request.args.get('filter_max_diff', 100))
+        except ValueError:
+            return jsonify({"error": "'offset', 'limit' and filters must be integers", "suggestions": []}), 400
+        # sort=odds re-ranks the best filtered fits by simulated title odds gained
+        sort_by = request.args.get('sort', 'fit')
+
+        # A cursor from a previous page names the ranked list and the next offset
+        fingerprint = suggest_query_fingerprint(request.args)
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                cursor_fingerprint, offset = decode_suggest_cursor(cursor)
+            except ValueError:
+                return jsonify({"error": "Invalid cursor", "suggestions": []}), 400
+            if cursor_fingerprint != fingerprint:
+                return jsonify({"error": "Cursor does not match this query", "suggestions": []}), 400
+
+        entry = get_suggest_results(fingerprint)
+        if entry is None:
+            if not my_team or my_team not in teams:
+                return jsonify({"error": "Invalid team specified"}), 400
+            version_before = _data_version
+            suggestions, needs_summary = rank_suggestions(
+                my_team, target_team, trade_type, filter_position,
+                filter_min_fit, filter_max_diff, sort_by
+            )
+            entry = {'suggestions': suggestions, 'team_needs': needs_summary}
+            if version_before == _data_version:
+                store_suggest_results(fingerprint, entry)
+        suggestions = entry['suggestions']
 
         # Paginate
         paginated = suggestions[offset:offset + limit]
         has_more = len(suggestions) > offset + limit
 
-        # Add team needs summary to response
-        needs_summary = {
-            'weaknesses': [cat for cat, score in my_cats.items() if score < 0],
-            'strengths': [cat for cat, score in my_cats.items() if score > 0],
-            'window': my_window
-        }
-
         return jsonify({
             "suggestions": paginated,
             "has_more": has_more,
             "total_found": len(suggestions),
             "offset": offset,
             "limit": limit,
-            "team_needs": needs_summary
+            "next_cursor": encode_suggest_cursor(fingerprint, offset + limit) if has_more else None,
+            "team_needs": entry['team_needs']
         })
     except Exception as e:
         print(f"Error in get_suggestions: {e}")
@@ -13062,133 +14845,29 @@ def get_suggestions():
 
 @app.route('/free-agents')
 def get_free_agent_suggestions():
-    """Get AI-powered free agent recommendations based on team needs."""
+    """Get AI-powered free agent recommendations based on team needs.
+
+    Optional: position (substring filter), per_position=N for the top N at each need position.
+    """
     try:
         team_name = request.args.get('team')
         position_filter = request.args.get('position', '')
-
-        # Helper function to detect undervalued gems and breakout candidates
-        def detect_special_value(fa, fa_proj):
-            """Detect undervalued gems and breakout candidates with enhanced logic."""
-            special_tags = []
-            name = fa['name']
-            age = fa['age']
-            roster_pct = fa['roster_pct']
-            dynasty_value = fa['dynasty_value']
-
-            if not fa_proj:
-                fa_proj = {}
-
-            hr = fa_proj.get('HR', 0)
-            sb = fa_proj.get('SB', 0)
-            rbi = fa_proj.get('RBI', 0)
-            r = fa_proj.get('R', 0)
-            avg = fa_proj.get('AVG', 0)
-            k = fa_proj.get('K', 0)
-            qs = fa_proj.get('QS', 0)
-            era = fa_proj.get('ERA', 5.0)
-            whip = fa_proj.get('WHIP', 1.5)
-            sv = fa_proj.get('SV', 0)
-            hld = fa_proj.get('HD', 0)
-
-            # 1. BREAKOUT CANDIDATE - young with projections exceeding ownership
-            if age <= 26 and roster_pct < 50:
-                if hr >= 20 or sb >= 20 or k >= 150:
-                    special_tags.append("🚀 Breakout Candidate")
-                elif hr >= 15 and sb >= 10:  # Power/speed developing
-                    special_tags.append("📈 Breakout Watch")
-
-            # 2. POWER/SPEED COMBO - rare and valuable
-            if hr >= 15 and sb >= 15:
-                special_tags.append("⚡ Power/Speed")
-            elif hr >= 20 and sb >= 10:
-                special_tags.append("💪 Power+ Speed")
-            elif sb >= 25 and hr >= 8:
-                special_tags.append("🏃 Speed+ Power")
-
-            # 3. UNDERVALUED GEM - projections don't match dynasty value
-            if dynasty_value < 40:
-                if hr >= 25 or rbi >= 80 or k >= 180 or (k >= 100 and era <= 3.50):
-                    special_tags.append("💎 Undervalued Gem")
-
-            # 4. RATIO STABILIZER - pitchers with elite ratios
-            is_pitcher = 'SP' in fa['position'].upper() or 'RP' in fa['position'].upper()
-            if is_pitcher:
-                if era <= 3.20 and whip <= 1.10:
-                    special_tags.append("📊 Elite Ratios")
-                elif era <= 3.50 and whip <= 1.15:
-                    special_tags.append("📊 Ratio Stabilizer")
-
-            # 5. MULTI-CATEGORY CONTRIBUTOR - helps in 3+ categories
-            cat_contributions = 0
-            if hr >= 15:
-                cat_contributions += 1
-            if sb >= 12:
-                cat_contributions += 1
-            if rbi >= 70:
-                cat_contributions += 1
-            if r >= 70:
-                cat_contributions += 1
-            if avg >= 0.280:
-                cat_contributions += 1
-            if k >= 120:
-                cat_contributions += 1
-            if sv + hld >= 15:
-                cat_contributions += 1
-
-            if cat_contributions >= 4:
-                special_tags.append("🎯 Multi-Cat Elite")
-            elif cat_contributions >= 3:
-                special_tags.append("📋 Multi-Cat Contributor")
-
-            # 6. STREAMING CANDIDATE - pitcher with solid matchups potential
-            if 'SP' in fa['position'].upper() and roster_pct < 40:
-                if era <= 4.00 and whip <= 1.25:
-                    special_tags.append("📅 Streaming Option")
-
-            # 7. CLOSER WATCH - RP who could get saves
-            if 'RP' in fa['position'].upper():
-                if sv >= 20:
-                    special_tags.append("🔒 Established Closer")
-                elif sv >= 10:
-                    special_tags.append("👀 Closer Potential")
-                elif hld >= 20:
-                    special_tags.append("🛡️ Elite Setup")
-
-            # 8. DYNASTY SLEEPER - young with upside, under the radar
-            if age <= 24 and dynasty_value >= 30 and roster_pct < 30:
-                special_tags.append("😴 Dynasty Sleeper")
-
-            # 9. INJURY COMEBACK - low roster % on formerly good player (approximation)
-            if age >= 27 and age <= 32 and roster_pct < 25 and dynasty_value >= 25:
-                # Likely returning from injury if low ownership on decent value player
-                special_tags.append("🏥 Comeback Watch")
-
-            # 10. WORKHORSE - SP with high innings and QS potential
-            if 'SP' in fa['position'].upper():
-                ip = fa_proj.get('IP', 0)
-                if ip >= 180 and qs >= 18:
-                    special_tags.append("🐴 Workhorse")
-                elif ip >= 160 and qs >= 14:
-                    special_tags.append("📈 Innings Eater")
-
-            return special_tags[:4]  # Limit to 4 tags max
+        per_position = request.args.get('per_position', 0, type=int)
+        features = get_fa_features()
 
         # If no team selected, return top 30 FAs by dynasty value
         if not team_name or team_name not in teams:
-            filtered_fas = FREE_AGENTS
+            rows = range(len(FREE_AGENTS))
             if position_filter:
-                filtered_fas = [fa for fa in FREE_AGENTS if position_filter in fa['position']]
+                rows = [i for i in rows if position_filter in FREE_AGENTS[i]['position']]
 
             # Add basic scoring for non-team view
             scored_fas = []
-            for fa in filtered_fas[:50]:  # Consider top 50, return 30
+            for i in list(rows)[:50]:  # Consider top 50, return 30
+                fa = FREE_AGENTS[i]
                 score = fa['dynasty_value']
                 reasons = []
 
-                # Get projections for special value detection
-                fa_proj = HITTER_PROJECTIONS.get(fa['name'], {}) or PITCHER_PROJECTIONS.get(fa['name'], {}) or RELIEVER_PROJECTIONS.get(fa['name'], {})
-
                 # Age-based value
                 if fa['age'] <= 26:
                     score += 10
@@ -13214,8 +14893,8 @@ def get_free_agent_suggestions():
                     score += 3
                     reasons.append("Premium position")
 
-                # Detect special value (breakout, undervalued, etc.)
-                special_tags = detect_special_value(fa, fa_proj)
+                # Special value (breakout, undervalued, etc.) - precomputed at FA load
+                special_tags = features['tags'][i]
                 if special_tags:
                     score += 5 * len(special_tags)  # Bonus for special value
                     reasons.extend(special_tags)
@@ -13234,355 +14913,17 @@ def get_free_agent_suggestions():
                 "total_available": len(FREE_AGENTS)
             })
 
-        # Team-specific recommendations with enhanced AI logic
-        team_cats, team_pos, team_window = calculate_team_needs(team_name)
-        weaknesses = [cat for cat, score in team_cats.items() if score < 0]
-        strengths = [cat for cat, score in team_cats.items() if score > 0]
-
-        # Get GM philosophy for philosophy-aware recommendations
-        gm = get_assistant_gm(team_name)
-        philosophy = gm.get('philosophy', 'balanced')
-        gm_preferred_cats = gm.get('preferred_categories', [])
-
-        # Philosophy-based tendencies
-        YOUTH_PHILOSOPHIES = ['rising_powerhouse', 'prospect_rich_rebuilder', 'analytical_rebuilder', 'dynasty_champion']
-        PRODUCTION_PHILOSOPHIES = ['championship_closer', 'all_in_buyer', 'loaded_and_ready', 'win_now']
-        VALUE_PHILOSOPHIES = ['bargain_hunter', 'smart_contender', 'value_seeker']
-
-        # Get league-wide category rankings for this team
-        all_team_cats, league_rankings = calculate_league_category_rankings()
-        my_ranks = league_rankings.get(team_name, {})
-
-        # Rank weaknesses by severity (worst rank first)
-        ranked_weaknesses = sorted([(cat, my_ranks.get(cat, 6)) for cat in weaknesses],
-                                   key=lambda x: -x[1])
-        worst_cats = [cat for cat, rank in ranked_weaknesses[:3] if rank >= 8]
-
-        # Calculate detailed positional depth
-        pos_depth = {}
-        pos_quality = {}  # Track quality at each position
-        pos_age = {}  # Track average age at position
-        team = teams[team_name]
-        for p in team.players:
-            pos = p.position.upper() if p.position else ''
-            pval = calc_player_value(p)
-            for check_pos in ['C', '1B', '2B', 'SS', '3B', 'OF', 'SP', 'RP']:
-                if check_pos in pos or (check_pos == 'OF' and any(x in pos for x in ['LF', 'CF', 'RF'])):
-                    pos_depth[check_pos] = pos_depth.get(check_pos, 0) + 1
-                    pos_quality[check_pos] = max(pos_quality.get(check_pos, 0), pval)
-                    # Track ages for position age analysis
-                    if check_pos not in pos_age:
-                        pos_age[check_pos] = []
-                    if p.age > 0:
-                        pos_age[check_pos].append(p.age)
-
-        positional_needs = [pos for pos in ['C', '1B', '2B', 'SS', '3B', 'OF', 'SP', 'RP']
-                          if pos_depth.get(pos, 0) < 3]
-        critical_needs = [pos for pos in ['C', '1B', '2B', 'SS', '3B', 'OF', 'SP', 'RP']
-                        if pos_depth.get(pos, 0) < 2]
-
-        # Identify aging positions (avg age > 30)
-        aging_positions = [pos for pos, ages in pos_age.items()
-                         if ages and sum(ages)/len(ages) > 30]
-
-        # Calculate multi-category fit scores
-        def calculate_multi_category_fit(fa_proj, is_hitter):
-            """Score how well a player addresses multiple category needs."""
-            fit_score = 0
-            cats_addressed = []
-
-            if is_hitter:
-                for cat in worst_cats:
-                    if cat == 'HR' and fa_proj.get('HR', 0) >= 15:
-                        fit_score += 15
-                        cats_addressed.append(f"HR ({fa_proj.get('HR', 0)})")
-                    elif cat == 'SB' and fa_proj.get('SB', 0) >= 10:
-                        fit_score += 15
-                        cats_addressed.append(f"SB ({fa_proj.get('SB', 0)})")
-                    elif cat == 'RBI' and fa_proj.get('RBI', 0) >= 60:
-                        fit_score += 12
-                        cats_addressed.append(f"RBI ({fa_proj.get('RBI', 0)})")
-                    elif cat == 'R' and fa_proj.get('R', 0) >= 60:
-                        fit_score += 12
-                        cats_addressed.append(f"R ({fa_proj.get('R', 0)})")
-                    elif cat == 'AVG' and fa_proj.get('AVG', 0) >= .280:
-                        fit_score += 10
-                        cats_addressed.append(f"AVG ({fa_proj.get('AVG', 0):.3f})")
-                    elif cat == 'OPS' and fa_proj.get('OPS', 0) >= .800:
-                        fit_score += 10
-                        cats_addressed.append(f"OPS ({fa_proj.get('OPS', 0):.3f})")
-                    elif cat == 'SO' and fa_proj.get('SO', 0) <= 100:  # Lower is better
-                        fit_score += 8
-                        cats_addressed.append(f"Low K ({fa_proj.get('SO', 0)})")
-            else:
-                for cat in worst_cats:
-                    if cat == 'K' and fa_proj.get('K', 0) >= 100:
-                        fit_score += 15
-                        cats_addressed.append(f"K ({fa_proj.get('K', 0)})")
-                    elif cat == 'QS' and fa_proj.get('QS', 0) >= 10:
-                        fit_score += 15
-                        cats_addressed.append(f"QS ({fa_proj.get('QS', 0)})")
-                    elif cat == 'ERA' and fa_proj.get('ERA', 5.0) <= 4.00:
-                        fit_score += 12
-                        cats_addressed.append(f"ERA ({fa_proj.get('ERA', 0):.2f})")
-                    elif cat == 'WHIP' and fa_proj.get('WHIP', 1.5) <= 1.25:
-                        fit_score += 12
-                        cats_addressed.append(f"WHIP ({fa_proj.get('WHIP', 0):.2f})")
-                    elif cat == 'SV+HLD':
-                        sv_hld = fa_proj.get('SV', 0) + fa_proj.get('HD', 0)
-                        if sv_hld >= 15:
-                            fit_score += 15
-                            cats_addressed.append(f"SV+HLD ({sv_hld})")
-                    elif cat == 'W' and fa_proj.get('W', 0) >= 8:
-                        fit_score += 10
-                        cats_addressed.append(f"W ({fa_proj.get('W', 0)})")
-                    elif cat == 'L':  # Lower is better
-                        if fa_proj.get('L', 10) <= 8 and fa_proj.get('IP', 0) >= 100:
-                            fit_score += 8
-                            cats_addressed.append(f"Low L ({fa_proj.get('L', 0)})")
-
-            # Bonus for addressing multiple categories
-            if len(cats_addressed) >= 2:
-                fit_score += 10  # Multi-category bonus
-            if len(cats_addressed) >= 3:
-                fit_score += 10  # Even bigger bonus for 3+
-
-            return fit_score, cats_addressed
-
-        # Enhanced scoring for team-specific recommendations
-        scored_fas = []
-        for fa in FREE_AGENTS:
-            if position_filter and position_filter not in fa['position']:
-                continue
-
-            base_score = fa['dynasty_value']
-            score = base_score
-            reasons = []
-            fit_explanation = []
-
-            fa_pos = fa['position'].upper()
-            is_hitter = any(pos in fa_pos for pos in ['C', '1B', '2B', 'SS', '3B', 'OF', 'LF', 'CF', 'RF', 'DH'])
-            is_sp = 'SP' in fa_pos
-            is_rp = 'RP' in fa_pos
-
-            # Get FA's projected stats from our projections if available
-            fa_proj = HITTER_PROJECTIONS.get(fa['name'], {}) or PITCHER_PROJECTIONS.get(fa['name'], {}) or RELIEVER_PROJECTIONS.get(fa['name'], {})
-
-            # Multi-category fit analysis
-            multi_fit_score, cats_addressed = calculate_multi_category_fit(fa_proj, is_hitter)
-            if multi_fit_score > 0:
-                score += multi_fit_score
-                if len(cats_addressed) >= 2:
-                    reasons.append(f"Addresses {len(cats_addressed)} needs")
-                    fit_explanation.extend(cats_addressed)
-
-            # Category need bonus with specific stat matching
-            if is_hitter:
-                hr_proj = fa_proj.get('HR', 0)
-                sb_proj = fa_proj.get('SB', 0)
-                rbi_proj = fa_proj.get('RBI', 0)
-                avg_proj = fa_proj.get('AVG', 0)
-
-                if 'HR' in weaknesses and hr_proj >= 20:
-                    if 'HR' not in str(cats_addressed):
-                        score += 20
-                        reasons.append(f"+{hr_proj} HR projected")
-                elif 'HR' in weaknesses and hr_proj >= 15:
-                    if 'HR' not in str(cats_addressed):
-                        score += 12
-
-                if 'SB' in weaknesses and sb_proj >= 15:
-                    if 'SB' not in str(cats_addressed):
-                        score += 20
-                        reasons.append(f"+{sb_proj} SB projected")
-                elif 'SB' in weaknesses and sb_proj >= 10:
-                    if 'SB' not in str(cats_addressed):
-                        score += 12
-
-                if 'RBI' in weaknesses and rbi_proj >= 70:
-                    if 'RBI' not in str(cats_addressed):
-                        score += 15
-                        reasons.append(f"Run producer ({rbi_proj} RBI)")
-
-                # Power + speed combo detection
-                if hr_proj >= 15 and sb_proj >= 15:
-                    score += 10
-                    reasons.append(f"Power/Speed combo")
-
-            if is_sp:
-                k_proj = fa_proj.get('K', 0)
-                era_proj = fa_proj.get('ERA', 5.0)
-                qs_proj = fa_proj.get('QS', 0)
-                ip_proj = fa_proj.get('IP', 0)
-
-                if 'K' in weaknesses and k_proj >= 150:
-                    if 'K' not in str(cats_addressed):
-                        score += 20
-                        reasons.append(f"Strikeout arm ({k_proj} K)")
-                elif 'K' in weaknesses and k_proj >= 100:
-                    if 'K' not in str(cats_addressed):
-                        score += 12
-
-                if 'ERA' in weaknesses and era_proj <= 3.50:
-                    if 'ERA' not in str(cats_addressed):
-                        score += 15
-                        reasons.append(f"Elite ratios ({era_proj:.2f} ERA)")
-
-                # Workhouse bonus for contenders
-                if team_window in ['win-now', 'contender'] and ip_proj >= 170 and qs_proj >= 15:
-                    score += 12
-                    reasons.append(f"Workhouse ({ip_proj:.0f} IP)")
-
-            if is_rp:
-                sv_proj = fa_proj.get('SV', 0)
-                hld_proj = fa_proj.get('HD', 0)
-                era_proj = fa_proj.get('ERA', 5.0)
-
-                if 'SV+HLD' in weaknesses:
-                    if sv_proj >= 20:
-                        score += 25
-                        reasons.append(f"Closer ({sv_proj} SV proj)")
-                    elif sv_proj >= 10 or hld_proj >= 15:
-                        score += 15
-                        reasons.append(f"Reliever help ({sv_proj+hld_proj} SV+HD)")
-
-                # Elite ratio reliever
-                if era_proj <= 3.00 and fa_proj.get('WHIP', 1.5) <= 1.10:
-                    score += 8
-                    reasons.append("Elite ratios RP")
-
-            # Critical positional need - big bonus
-            pos_reason_added = False
-            for need_pos in critical_needs:
-                if need_pos in fa_pos:
-                    score += 20
-                    reasons.append(f"CRITICAL {need_pos} need")
-                    pos_reason_added = True
-                    break
-
-            if not pos_reason_added:
-                # Regular positional need
-                for need_pos in positional_needs:
-                    if need_pos in fa_pos:
-                        score += 10
-                        reasons.append(f"Adds {need_pos} depth")
-                        pos_reason_added = True
-                        break
-
-            # Aging position replacement (for dynasty/rebuilding teams)
-            if not pos_reason_added and team_window in ['rebuilding', 'rising', 'dynasty']:
-                for aging_pos in aging_positions:
-                    if aging_pos in fa_pos and fa['age'] <= 27:
-                        score += 12
-                        reasons.append(f"Replaces aging {aging_pos}")
-                        break
-
-            # Window alignment with specific recommendations
-            age = fa['age']
-            if team_window in ['rebuilding', 'rising']:
-                if age <= 25:
-                    score += 15
-                    reasons.append("Young asset for future")
-                elif age <= 27:
-                    score += 8
-                    reasons.append("Fits rebuild timeline")
-                elif age >= 32:
-                    score -= 15  # Stronger penalty for old players on rebuilding teams
-            elif team_window in ['win-now', 'contender']:
-                if 26 <= age <= 31:
-                    score += 12
-                    reasons.append("Win-now fit")
-                elif age <= 25 and base_score >= 55:
-                    score += 8
-                    reasons.append("Ready to contribute now")
-                # Contenders should grab proven players
-                if fa['roster_pct'] >= 60 and age >= 28 and age <= 32:
-                    score += 5
-                    reasons.append("Proven veteran")
-            elif team_window == 'dynasty':
-                if age <= 26:
-                    score += 12
-                    reasons.append("Dynasty building block")
-                elif age <= 28 and base_score >= 50:
-                    score += 6
-                    reasons.append("Core piece")
-
-            # Roster % as quality indicator
-            if fa['roster_pct'] >= 70:
-                score += 8
-                if len(reasons) < 4:
-                    reasons.append(f"High demand ({fa['roster_pct']:.0f}%)")
-            elif fa['roster_pct'] >= 50:
-                score += 4
-
-            # Detect special value (breakout, undervalued, etc.)
-            special_tags = detect_special_value(fa, fa_proj)
-            if special_tags:
-                score += 5 * len(special_tags)
-                reasons.extend(special_tags)
-
-            # ============ GM PHILOSOPHY-BASED ADJUSTMENTS ============
-            # Youth-focused GMs get bonus for young players
-            if philosophy in YOUTH_PHILOSOPHIES:
-                if age <= 24:
-                    score += 15
-                    if "Young asset" not in str(reasons):
-                        reasons.append("Aligns with youth focus")
-                elif age <= 26:
-                    score += 8
-                elif age >= 30:
-                    score -= 10  # Penalty for older players
-
-            # Production-focused GMs want proven contributors
-            if philosophy in PRODUCTION_PHILOSOPHIES:
-                if fa['roster_pct'] >= 50 and age >= 26:
-                    score += 12
-                    if "proven" not in str(reasons).lower():
-                        reasons.append("Proven producer")
-                # Prospects are less valuable to win-now GMs
-                if fa.get('is_prospect') and age <= 22:
-                    score -= 8
-
-            # Value-focused GMs look for inefficiencies
-            if philosophy in VALUE_PHILOSOPHIES:
-                # Low roster % but high value = inefficiency
-                if fa['roster_pct'] <= 40 and base_score >= 40:
-                    score += 15
-                    reasons.append("Underowned value")
-                # Breakout candidates
-                if age <= 27 and base_score >= 35 and fa['roster_pct'] <= 50:
-                    score += 8
-                    if "breakout" not in str(reasons).lower():
-                        reasons.append("Breakout candidate")
-
-            # GM's preferred categories get bonus
-            for pref_cat in gm_preferred_cats:
-                if pref_cat in str(cats_addressed):
-                    score += 10
-                    reasons.append(f"Fits {pref_cat} priority")
-                    break
-
-            # Don't recommend players that don't fit at all
-            if score < base_score - 5:  # Allow slightly negative if strong in other areas
-                continue
-
-            # Generate detailed fit explanation
-            full_explanation = ""
-            if fit_explanation:
-                full_explanation = f"Addresses your needs in: {', '.join(fit_explanation[:3])}"
-            elif reasons:
-                full_explanation = reasons[0] if reasons else "Available depth"
-
-            scored_fas.append({
-                **fa,
-                'fit_score': round(score, 1),
-                'reasons': reasons[:4] if reasons else ["Available depth"],
-                'fit_explanation': full_explanation,
-                'categories_addressed': cats_addressed,
-                'special_tags': special_tags
-            })
+        # Team-specific recommendations: one vectorized pass over the FA feature table
+        ctx = build_fa_team_context(team_name)
+        suggestions, top_by_position = recommend_free_agents(
+            ctx, position_filter, k=30, per_position=max(0, min(per_position, 25))
+        )
 
-        scored_fas.sort(key=lambda x: x['fit_score'], reverse=True)
+        philosophy = ctx['philosophy']
+        team_window = ctx['team_window']
+        worst_cats = ctx['worst_cats']
+        critical_needs = ctx['critical_needs']
+        aging_positions = ctx['aging_positions']
 
         # Build AI summary for the team with philosophy awareness
         philosophy_names = {
@@ -13616,20 +14957,23 @@ def get_free_agent_suggestions():
         if aging_positions and philosophy in YOUTH_PHILOSOPHIES:
             ai_summary += f". Replace aging {', '.join(aging_positions)}"
 
-        return jsonify({
-            "suggestions": scored_fas[:30],
+        result = {
+            "suggestions": suggestions,
             "team_needs": {
-                "weaknesses": weaknesses,
-                "strengths": strengths,
+                "weaknesses": ctx['weaknesses'],
+                "strengths": ctx['strengths'],
                 "worst_categories": worst_cats,
-                "positional_needs": positional_needs,
+                "positional_needs": ctx['positional_needs'],
                 "critical_needs": critical_needs,
                 "aging_positions": aging_positions,
                 "window": team_window
             },
             "ai_summary": ai_summary,
             "total_available": len(FREE_AGENTS)
-        })
+        }
+        if top_by_position is not None:
+            result["top_by_position"] = top_by_position
+        return jsonify(result)
 
     except Exception as e:
         print(f"Error in get_free_agent_suggestions: {e}")
@@ -13637,109 +14981,73 @@ def get_free_agent_suggestions():
 
 
 @app.route('/standings')
+@cached_response
 def get_standings():
     return jsonify({"standings": league_standings})
 
 
-@app.route('/top-players')
-def get_top_players():
-    """Get the top 50 players in the league by dynasty value."""
-    all_players = []
+# Value-ordered leaderboards, rebuilt when the data version changes and
+# maintained incrementally (add/remove/update_value) in between
+_leaderboards = None
+_leaderboards_version = -1
+
+
+def get_leaderboards():
+    """League leaderboards for the current data version."""
+    global _leaderboards, _leaderboards_version
+    if _leaderboards is None or _leaderboards_version != _data_version:
+        roster_players = [p for team in teams.values() for p in team.players]
+        _leaderboards = LeagueLeaderboards.build(teams, calc_player_value, calc_player_values_batch(roster_players))
+        _leaderboards_version = _data_version
+    return _leaderboards
 
-    # Collect all players from all teams
-    for team_name, team in teams.items():
-        for player in team.players:
-            value = calc_player_value(player)
-            all_players.append({
-                "name": player.name,
-                "position": player.position,
-                "mlb_team": player.mlb_team,
-                "fantasy_team": team_name,
-                "age": player.age,
-                "value": round(value, 1),
-                "is_prospect": player.is_prospect,
-                "prospect_rank": player.prospect_rank if player.is_prospect else None
-            })
 
-    # Sort by value descending and take top 50
-    all_players.sort(key=lambda x: -x["value"])
-    top_players = all_players[:50]
+def leaderboard_response(group, default_limit):
+    """Serialize a leaderboard, honouring optional position/min_age/max_age/team/limit filters."""
+    limit = request.args.get('limit', default_limit, type=int)
+    entries = get_leaderboards().top(
+        group, max(0, min(limit, 500)),
+        position=request.args.get('position') or None,
+        min_age=request.args.get('min_age', type=int),
+        max_age=request.args.get('max_age', type=int),
+        team=request.args.get('team') or None,
+    )
+    players = []
+    for i, entry in enumerate(entries, 1):
+        player = entry.player
+        players.append({
+            "name": player.name,
+            "position": player.position,
+            "mlb_team": player.mlb_team,
+            "fantasy_team": entry.team_name,
+            "age": player.age,
+            "value": round(entry.value, 1),
+            "is_prospect": player.is_prospect,
+            "prospect_rank": player.prospect_rank if player.is_prospect else None,
+            "rank": i
+        })
+    return jsonify({"players": players})
 
-    # Add rank
-    for i, player in enumerate(top_players, 1):
-        player["rank"] = i
 
-    return jsonify({"players": top_players})
+@app.route('/top-players')
+@cached_response
+def get_top_players():
+    """Get the top 50 players in the league by dynasty value."""
+    return leaderboard_response('all', 50)
 
 
 @app.route('/top-pitchers')
+@cached_response
 def get_top_pitchers():
     """Get the top 25 pitchers in the league by dynasty value."""
-    all_pitchers = []
-    pitcher_positions = {'SP', 'RP', 'P'}
-
-    # Collect all pitchers from all teams
-    for team_name, team in teams.items():
-        for player in team.players:
-            # Check if player is a pitcher
-            player_positions = set(player.position.replace('/', ',').replace(' ', '').split(','))
-            if player_positions & pitcher_positions:
-                value = calc_player_value(player)
-                all_pitchers.append({
-                    "name": player.name,
-                    "position": player.position,
-                    "mlb_team": player.mlb_team,
-                    "fantasy_team": team_name,
-                    "age": player.age,
-                    "value": round(value, 1),
-                    "is_prospect": player.is_prospect,
-                    "prospect_rank": player.prospect_rank if player.is_prospect else None
-                })
-
-    # Sort by value descending and take top 25
-    all_pitchers.sort(key=lambda x: -x["value"])
-    top_pitchers = all_pitchers[:25]
-
-    # Add rank
-    for i, player in enumerate(top_pitchers, 1):
-        player["rank"] = i
-
-    return jsonify({"players": top_pitchers})
+    return leaderboard_response('pitchers', 25)
 
 
 @app.route('/top-hitters')
+@cached_response
 def get_top_hitters():
     """Get the top 25 hitters in the league by dynasty value."""
-    all_hitters = []
-    pitcher_positions = {'SP', 'RP', 'P'}
-
-    # Collect all hitters from all teams
-    for team_name, team in teams.items():
-        for player in team.players:
-            # Check if player is NOT a pitcher (is a hitter)
-            player_positions = set(player.position.replace('/', ',').replace(' ', '').split(','))
-            if not (player_positions & pitcher_positions):
-                value = calc_player_value(player)
-                all_hitters.append({
-                    "name": player.name,
-                    "position": player.position,
-                    "mlb_team": player.mlb_team,
-                    "fantasy_team": team_name,
-                    "age": player.age,
-                    "value": round(value, 1),
-                    "is_prospect": player.is_prospect,
-                    "prospect_rank": player.prospect_rank if player.is_prospect else None
-                })
-
-    # Sort by value descending and take top 25
-    all_hitters.sort(key=lambda x: -x["value"])
-    top_hitters = all_hitters[:25]
-
-    # Add rank
-    for i, player in enumerate(top_hitters, 1):
-        player["rank"] = i
-
-    return jsonify({"players": top_hitters})
+    return leaderboard_response('hitters', 25)
 
 
 @app.route('/matchups')
@@ -13753,6 +15061,7 @@ def get_transactions():
 
 
 @app.route('/trade-history')
+@cached_response
 def get_trade_history():
     """Get graded completed trades from Fantrax history."""
     # Load trade history if not already loaded
@@ -13773,6 +15082,8 @@ def handle_draft_order():
             # Clear the draft order
             draft_order_config.clear()
             save_draft_order_config()
+            bump_data_version("draft order cleared", full=False)
+            league_graph.invalidate(('draft_order',))
             return jsonify({
                 "success": True,
                 "message": "Draft order cleared. Using calculated order based on team value."
@@ -13787,6 +15098,8 @@ def handle_draft_order():
         draft_order_config.clear()
         draft_order_config.update(new_order)
         save_draft_order_config()
+        bump_data_version("draft order updated", full=False)
+        league_graph.invalidate(('draft_order',))
 
         return jsonify({
             "success": True,
@@ -13800,6 +15113,412 @@ def handle_draft_order():
     })
 
 
+# ============================================================================
+# ACTUAL STATS INGEST (dirty tracking)
+# ============================================================================
+# A daily stats refresh touches only the players who played. ingest_actual_stats
+# parses each stat line once, diffs it against what is stored and revalues just
+# the changed players; derived tables built for the previous data version are
+# patched and carried forward instead of being rebuilt from scratch.
+
+def ingest_actual_stats(stats_by_name, replace=False):
+    """Store a batch of actual stats and revalue only the players whose stats changed.
+
+    stats_by_name: player_name -> raw actual stats dict (Fantrax format)
+    replace: treat the batch as the complete stat set and drop players missing from it
+    Returns the set of player names whose stats changed.
+    """
+    dirty = set()
+    for name, actual in stats_by_name.items():
+        if not actual:
+            continue
+        parsed = parse_actual_stats(actual)
+        if player_actual_stats_parsed.get(name) != parsed:
+            player_actual_stats[name] = actual
+            player_actual_stats_parsed[name] = parsed
+            dirty.add(name)
+    if replace:
+        for name in [n for n in player_actual_stats if n not in stats_by_name]:
+            player_actual_stats.pop(name, None)
+            player_actual_stats_parsed.pop(name, None)
+            dirty.add(name)
+
+    if dirty:
+        revalue_players(dirty, reason=f"actual stats changed for {len(dirty)} players")
+    return dirty
+
+
+def revalue_players(names, reason=""):
+    """Bump the data version, recomputing only `names` and the aggregates that depend on them.
+
+    Player values and leaderboards are patched in place and re-stamped with the
+    new version; the affected teams' values are invalidated in the league metrics
+    graph, which recomputes totals, ranks and odds on next use.
+    Returns the names of teams that roster a changed player.
+    """
+    global _player_value_cache_version
+    global _leaderboards_version, _prospect_board_version
+    names = set(names)
+    previous = _data_version
+    bump_data_version(reason, full=False)
+
+    if _player_value_cache_version == previous:
+        for name in names:
+            _player_value_cache.pop(name, None)
+        _player_value_cache_version = _data_version
+
+    affected = [(team_name, p) for team_name, team in teams.items() for p in team.players if p.name in names]
+    affected_teams = {team_name for team_name, _ in affected}
+
+    for team_name in affected_teams:
+        league_graph.invalidate(('team_values', team_name))
+
+    if _leaderboards is not None and _leaderboards_version == previous:
+        for _, player in affected:
+            _leaderboards.update_value(player, calc_player_value(player))
+        _leaderboards_version = _data_version
+
+    # Board entries carry values; keep the board only if none of them changed
+    if _prospect_board_version == previous and not any(
+            entry["name"] in names for entry in PROSPECT_BOARD.values()):
+        _prospect_board_version = _data_version
+
+    print(f"Revalued {len(names)} players ({len(affected)} rostered across {len(affected_teams)} teams)")
+    return affected_teams
+
+
+@app.route('/actual-stats', methods=['POST'])
+def post_actual_stats():
+    """Ingest a stats refresh: {"stats": {player_name: {...}}, "replace": false}.
+
+    Only players whose stats changed are revalued.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        stats = data.get('stats')
+        if not isinstance(stats, dict):
+            return jsonify({"error": "Expected 'stats' object of player_name -> stats"}), 400
+
+        changed = ingest_actual_stats(stats, replace=bool(data.get('replace')))
+        affected_teams = {team_name for team_name, team in teams.items()
+                          if any(p.name in changed for p in team.players)}
+        return jsonify({
+            "received": len(stats),
+            "changed": len(changed),
+            "changed_players": sorted(changed),
+            "teams_affected": sorted(affected_teams),
+            "data_version": _data_version
+        })
+    except Exception as e:
+        print(f"Error in post_actual_stats: {e}")
+        return jsonify({"error": f"Failed to ingest stats: {str(e)}"}), 500
+
+
+def ingest_projections(updates):
+    """Replace projection lines and revalue only the players whose projections changed.
+
+    updates: {"hitters" | "pitchers" | "relievers": {player_name: projection dict}}
+    Returns the set of player names whose projections changed. Raises ValueError,
+    before any table is touched, if a group or projection line is malformed.
+    """
+    tables = {'hitters': HITTER_PROJECTIONS, 'pitchers': PITCHER_PROJECTIONS, 'relievers': RELIEVER_PROJECTIONS}
+    for group in tables:
+        lines = updates.get(group)
+        if lines is None:
+            continue
+        if not isinstance(lines, dict):
+            raise ValueError(f"'{group}' must be an object of player_name -> projection")
+        for name, proj in lines.items():
+            if not isinstance(proj, dict) or not all(
+                    isinstance(v, (int, float)) and not isinstance(v, bool) for v in proj.values()):
+                raise ValueError(f"Projection for '{name}' in '{group}' must be an object of numbers")
+
+    dirty = set()
+    for group, table in tables.items():
+        for name, proj in (updates.get(group) or {}).items():
+            if proj and table.get(name) != proj:
+                table[name] = dict(proj)
+                dirty.add(name)
+
+    if dirty:
+        if any(fa['name'] in dirty for fa in FREE_AGENTS):
+            build_fa_feature_table()  # the table holds the FA projection lines
+        affected_teams = revalue_players(dirty, reason=f"projections changed for {len(dirty)} players")
+        for team_name in affected_teams:
+            league_graph.invalidate(('team_projections', team_name))
+    return dirty
+
+
+def move_player(player_name, from_team, to_team):
+    """Move a rostered player between two teams, invalidating only what depends on those rosters."""
+    global _player_value_cache_version, _leaderboards_version
+    source = teams[from_team].players
+    idx = next((i for i, p in enumerate(source) if p.name == player_name), None)
+    if idx is None:
+        raise KeyError(f"{player_name} is not on {from_team}")
+
+    previous = _data_version
+    player = source.pop(idx)
+    teams[to_team].players.append(player)
+    player.fantasy_team = to_team
+    bump_data_version(f"{player_name} moved from {from_team} to {to_team}", full=False)
+
+    # Values don't depend on the owning team; the leaderboards only relabel the entry
+    # and the prospect board only re-points a moved prospect's owner
+    if _player_value_cache_version == previous:
+        _player_value_cache_version = _data_version
+    if _leaderboards is not None and _leaderboards_version == previous:
+        _leaderboards.move_player(player, to_team)
+        _leaderboards_version = _data_version
+    if _prospect_board_version == previous:
+        prospect_board_add_rostered(player, to_team)
+
+    mark_rosters_changed(from_team, to_team)
+    return player
+
+
+@app.route('/projections', methods=['POST'])
+def post_projections():
+    """Ingest projection updates: {"hitters": {...}, "pitchers": {...}, "relievers": {...}}.
+
+    Only players whose projection lines changed are revalued.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        if not any(isinstance(data.get(group), dict) for group in ('hitters', 'pitchers', 'relievers')):
+            return jsonify({"error": "Expected 'hitters', 'pitchers' or 'relievers' objects of player_name -> projection"}), 400
+
+        seq = league_graph.last_seq
+        try:
+            changed = ingest_projections(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        get_normalized_championship_odds()
+        return jsonify({
+            "changed": len(changed),
+            "changed_players": sorted(changed),
+            "data_version": _data_version,
+            "recomputed": league_graph.trace(since=seq)
+        })
+    except Exception as e:
+        print(f"Error in post_projections: {e}")
+        return jsonify({"error": f"Failed to ingest projections: {str(e)}"}), 500
+
+
+@app.route('/roster-move', methods=['POST'])
+def post_roster_move():
+    """Move a player between rosters: {"player": name, "from": team, "to": team}.
+
+    Responds with the graph nodes that recomputed to refresh championship odds.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        player_name, from_team, to_team = data.get('player'), data.get('from'), data.get('to')
+        if not player_name or not from_team or not to_team:
+            return jsonify({"error": "Expected 'player', 'from' and 'to'"}), 400
+        for team_name in (from_team, to_team):
+            if team_name not in teams:
+                return jsonify({"error": f"Team '{team_name}' not found"}), 404
+        if from_team == to_team:
+            return jsonify({"error": "'from' and 'to' must be different teams"}), 400
+
+        seq = league_graph.last_seq
+        try:
+            move_player(player_name, from_team, to_team)
+        except KeyError as e:
+            return jsonify({"error": str(e.args[0])}), 404
+        odds = get_normalized_championship_odds()
+        return jsonify({
+            "player": player_name,
+            "from": from_team,
+            "to": to_team,
+            "championship_odds": {from_team: odds.get(from_team, 0), to_team: odds.get(to_team, 0)},
+            "data_version": _data_version,
+            "recomputed": league_graph.trace(since=seq)
+        })
+    except Exception as e:
+        print(f"Error in post_roster_move: {e}")
+        return jsonify({"error": f"Failed to move player: {str(e)}"}), 500
+
+
+@app.route('/derived-graph')
+def get_derived_graph():
+    """League metrics graph state and recompute trace (?since=<seq> for newer entries only)."""
+    since = request.args.get('since', 0, type=int)
+    trace = league_graph.trace(since=since)
+    return jsonify({
+        "stats": league_graph.stats(),
+        "last_seq": league_graph.last_seq,
+        "total_ms": round(sum(entry['ms'] for entry in trace if entry['depth'] == 0), 3),
+        "trace": trace
+    })
+
+
+@app.route('/season-simulation')
+@cached_response
+def get_season_simulation():
+    """Simulated H2H seasons: title and playoff odds with 95% intervals (?seasons=N&seed=S)."""
+    try:
+        seasons = max(100, min(request.args.get('seasons', H2H_SIMULATED_SEASONS, type=int), 100000))
+        seed = request.args.get('seed', 0, type=int)
+        start = time.perf_counter()
+        result = get_simulated_championship_odds(seasons, seed)
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        heuristic = get_normalized_championship_odds()
+        teams_out = [{"team": name, **stats, "heuristic_odds": heuristic.get(name, 0)}
+                     for name, stats in result['teams'].items()]
+        teams_out.sort(key=lambda t: -t['title_odds'])
+        return jsonify({
+            "seasons": result['seasons'],
+            "weeks": result['weeks'],
+            "playoff_teams": result['playoff_teams'],
+            "elapsed_ms": elapsed_ms,
+            "teams": teams_out
+        })
+    except Exception as e:
+        print(f"Error in get_season_simulation: {e}")
+        return jsonify({"error": f"Failed to simulate season: {str(e)}"}), 500
+
+
+@app.route('/trade-odds', methods=['POST'])
+def evaluate_trade_odds():
+    """Championship-odds change for a batch of trades: {"trades": [{team_a, team_b, players_a, players_b}, ...]}.
+
+    Optional "seasons" (default H2H_TRADE_SEASONS) and "seed".
+    """
+    try:
+        data = request.get_json() or {}
+        trades = data.get('trades', [])
+        if not isinstance(trades, list) or not trades:
+            return jsonify({"error": "Provide a non-empty list of trades"}), 400
+        if len(trades) > 200:
+            return jsonify({"error": "At most 200 trades per request"}), 400
+        for i, trade in enumerate(trades):
+            if not isinstance(trade, dict):
+                return jsonify({"error": f"Trade {i} must be an object"}), 400
+            if not all(isinstance(trade.get(key), str) for key in ('team_a', 'team_b')):
+                return jsonify({"error": f"Trade {i}: 'team_a' and 'team_b' must be team names"}), 400
+            for key in ('players_a', 'players_b'):
+                names = trade.get(key, [])
+                if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+                    return jsonify({"error": f"Trade {i}: '{key}' must be a list of player names"}), 400
+        try:
+            seasons = max(500, min(int(data.get('seasons', H2H_TRADE_SEASONS)), 20000))
+            seed = int(data.get('seed', 0))
+        except (TypeError, ValueError):
+            return jsonify({"error": "'seasons' and 'seed' must be integers"}), 400
+        start = time.perf_counter()
+        results = evaluate_trades_championship_impact(trades, seasons=seasons, seed=seed)
+        return jsonify({
+            "seasons": seasons,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            "results": results
+        })
+    except Exception as e:
+        print(f"Error in evaluate_trade_odds: {e}")
+        return jsonify({"error": f"Failed to evaluate trade odds: {str(e)}"}), 500
+
+
+# ============================================================================
+# VALUE WEIGHT CALIBRATION
+# ============================================================================
+# Category, position and consensus-source weights can be swapped at runtime.
+# A new weight set invalidates every derived value (full data version bump) and
+# the league is revalued in one batch pass, so calibration is a live loop.
+
+def revalue_with_weights(updates=None, replace=False, reset=False, top=25):
+    """Apply a weight set, revalue every rostered player and report the biggest movers."""
+    rostered = [(team_name, p) for team_name, team in teams.items() for p in team.players]
+    players = [p for _, p in rostered]
+    before = calc_player_values_batch(players)
+
+    previous = reset_value_weights() if reset else set_value_weights(updates or {}, replace=replace)
+    current = get_value_weights()
+    bump_data_version("value weights changed")
+
+    start = time.perf_counter()
+    try:
+        after = calc_player_values_batch(players)
+    except Exception:
+        # A weight set that can't value the league must not stay active
+        set_value_weights(previous, replace=True)
+        bump_data_version("value weights rolled back")
+        raise
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    def overall_ranks(values):
+        order = sorted(range(len(values)), key=lambda i: -values[i])
+        ranks = [0] * len(values)
+        for rank, i in enumerate(order, 1):
+            ranks[i] = rank
+        return ranks
+
+    old_ranks, new_ranks = overall_ranks(before), overall_ranks(after)
+    changes = [new - old for old, new in zip(before, after)]
+    order = sorted(range(len(players)), key=lambda i: -abs(changes[i]))
+    movers = []
+    for i in order[:top]:
+        if changes[i] == 0:
+            break
+        team_name, p = rostered[i]
+        movers.append({
+            "name": p.name,
+            "team": team_name,
+            "position": p.position,
+            "age": p.age,
+            "old_value": round(before[i], 1),
+            "new_value": round(after[i], 1),
+            "change": round(changes[i], 2),
+            "old_rank": old_ranks[i],
+            "new_rank": new_ranks[i],
+        })
+
+    weight_changes = []
+    for section in VALUE_WEIGHT_SECTIONS:
+        old, new = previous[section], current[section]
+        if not isinstance(old, dict):
+            if old != new:
+                weight_changes.append({"section": section, "key": None, "old": old, "new": new})
+            continue
+        for key in list(old) + [k for k in new if k not in old]:
+            if old.get(key) != new.get(key):
+                weight_changes.append({"section": section, "key": key, "old": old.get(key), "new": new.get(key)})
+
+    return {
+        "weights": current,
+        "weight_changes": weight_changes,
+        "players_revalued": len(players),
+        "players_changed": sum(1 for c in changes if c != 0),
+        "rank_changes": sum(1 for o, n in zip(old_ranks, new_ranks) if o != n),
+        "mean_abs_change": round(sum(abs(c) for c in changes) / len(changes), 3) if changes else 0,
+        "revalue_ms": round(elapsed_ms, 1),
+        "biggest_movers": movers,
+        "data_version": _data_version
+    }
+
+
+@app.route('/value-weights', methods=['GET', 'POST'])
+def handle_value_weights():
+    """GET the active and default weight sets; POST {"weights": {...}, "replace": false,
+    "top": 25} or {"reset": true} to swap them and get a biggest-movers report."""
+    if request.method == 'GET':
+        return jsonify({"weights": get_value_weights(), "defaults": DEFAULT_VALUE_WEIGHTS})
+
+    try:
+        data = request.get_json(silent=True) or {}
+        top = max(1, min(request.args.get('top', data.get('top', 25), type=int) or 25, 200))
+        if data.get('reset'):
+            return jsonify(revalue_with_weights(reset=True, top=top))
+        if not isinstance(data.get('weights'), dict):
+            return jsonify({"error": "Expected 'weights' object or 'reset': true"}), 400
+        return jsonify(revalue_with_weights(data['weights'], replace=bool(data.get('replace')), top=top))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        print(f"Error in handle_value_weights: {e}")
+        return jsonify({"error": f"Failed to apply value weights: {str(e)}"}), 500
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
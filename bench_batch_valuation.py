@@ -0,0 +1,81 @@
+"""
+Benchmark: scalar calculate_player_value vs vectorized calculate_values_batch.
+
+Scores the whole league, the free-agent pool and the prospect universe (~8k
+players), checks the two paths agree exactly, and reports timings. Also checks
+the batch consensus pull against _apply_consensus_adjustment over a sweep of
+base values that crosses every implied-rank and correction-tier boundary.
+
+Usage: python bench_batch_valuation.py [repeats]
+"""
+import contextlib
+import io
+import sys
+import time
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+from dynasty_trade_analyzer_v2 import DynastyValueCalculator, Player, PROSPECT_RANKINGS
+
+
+CONSENSUS_SWEEP = (0.0, 12.5, 39.9, 40.0, 55.0, 62.3, 70.0, 85.0, 99.99, 100.0, 131.7)
+
+
+def build_universe():
+    """Rostered players + free agents + ranked prospects not already covered."""
+    players = [p for team in app.teams.values() for p in team.players]
+    seen = {p.name for p in players}
+    for fa in app.FREE_AGENTS:
+        if fa['name'] not in seen:
+            players.append(Player(name=fa['name'], position=fa['position'], age=fa.get('age') or 0))
+            seen.add(fa['name'])
+    for name in PROSPECT_RANKINGS:
+        if name not in seen:
+            players.append(Player(name=name, position='SS', age=20))
+            seen.add(name)
+    return players
+
+
+def best_of(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    players = build_universe()
+    actual = app.player_actual_stats
+
+    scalar = [DynastyValueCalculator.calculate_player_value(p, actual.get(p.name)) for p in players]
+    batch = DynastyValueCalculator.calculate_values_batch(players, actual)
+    mismatches = [(p.name, s, b) for p, s, b in zip(players, scalar, batch) if s != b]
+
+    t_scalar = best_of(lambda: [DynastyValueCalculator.calculate_player_value(p, actual.get(p.name))
+                                for p in players], repeats)
+    t_batch = best_of(lambda: DynastyValueCalculator.calculate_values_batch(players, actual), repeats)
+
+    print(f"Players valued:  {len(players)}")
+    print(f"Exact matches:   {len(players) - len(mismatches)}/{len(players)}")
+    for name, s, b in mismatches[:10]:
+        print(f"  MISMATCH {name}: scalar={s!r} batch={b!r}")
+    print(f"Scalar loop:     {t_scalar * 1000:.1f} ms (best of {repeats})")
+    print(f"Batch:           {t_batch * 1000:.1f} ms (best of {repeats})")
+    print(f"Speedup:         {t_scalar / t_batch:.2f}x")
+
+    # Consensus pull alone, over a sweep of base values for every player
+    names = [p.name for p in players for _ in CONSENSUS_SWEEP]
+    base = [v for _ in players for v in CONSENSUS_SWEEP]
+    scalar = [DynastyValueCalculator._apply_consensus_adjustment(n, v) for n, v in zip(names, base)]
+    batch = DynastyValueCalculator.apply_consensus_adjustment_batch(names, base)
+    consensus_mismatches = sum(1 for s, b in zip(scalar, batch) if s != b)
+    print(f"Consensus pull:  {len(names) - consensus_mismatches}/{len(names)} exact")
+    return 1 if mismatches or consensus_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
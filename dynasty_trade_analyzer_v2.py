@@ -40,14 +40,22 @@ Games Played    Projection Weight    Actual Pace Weight
 120+            20%                  80%    (September - nearly all actual)
 """
 
+import bisect
 import csv
 import json
 import os
 import unicodedata
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import combinations
 import math
+import operator
+import re
+import time
+
+import numpy as np
 
 
 def normalize_name(name: str) -> str:
@@ -86,31 +94,28 @@ def load_prospect_rankings() -> Dict[str, int]:
     return {}
 
 
-def load_consensus_rankings() -> Dict[str, float]:
-    """Load weighted consensus dynasty rankings from 10 external sources.
+# Consensus source weights (must sum to 1.0 when all sources present)
+# Optimized weights - removed STS/PL standalone since they're already in CFR
+SOURCE_WEIGHTS = {
+    'FHQ': 0.30,      # Dynasty rankings (FantraxHQ Top 500)
+    'HKB': 0.30,      # Dynasty rankings (harryknowsball values)
+    'Steamer': 0.10,  # Production projections
+    'ZiPS': 0.10,     # Production projections
+    'CFR': 0.20,      # Consensus Formulated Ranks (includes PL, STS, DIGS, FScore, PG+)
+    # STS and PL removed - already included in CFR to avoid double-counting
+}
+DEFAULT_SOURCE_WEIGHT = 0.05  # Sources without an explicit weight (STS, PL)
 
-    Sources & Weights:
-    - Dynasty Rankings (50% total): FHQ (25%), HKB (25%)
-    - Production Projections (30% total): Steamer (15%), ZiPS (15%)
-    - Supplemental (20% total): STS (10%), CFR (5%), PL (5%)
 
-    Returns a dict mapping player name to weighted average consensus rank.
-    This is used for hybrid value calculation - pulling projection-based
-    values toward market consensus when there's significant deviation.
+def load_consensus_sources() -> 'ConsensusMatrix':
+    """Load every external ranking source, keeping only the ranks that count toward consensus.
+
+    Returns a ConsensusMatrix whose mask already drops CFR ranks of MLB-level or
+    mature (25+) players and ranks beyond 500, so combining is a plain weighted
+    average.
     """
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
-    # Source weights (must sum to 1.0 when all sources present)
-    # Optimized weights - removed STS/PL standalone since they're already in CFR
-    SOURCE_WEIGHTS = {
-        'FHQ': 0.30,      # Dynasty rankings (FantraxHQ Top 500)
-        'HKB': 0.30,      # Dynasty rankings (harryknowsball values)
-        'Steamer': 0.10,  # Production projections
-        'ZiPS': 0.10,     # Production projections
-        'CFR': 0.20,      # Consensus Formulated Ranks (includes PL, STS, DIGS, FScore, PG+)
-        # STS and PL removed - already included in CFR to avoid double-counting
-    }
-
     all_sources = {}
     cfr_player_info = {}  # Track {name: {'level': ..., 'age': ...}} from CFR for filtering
     player_ages_from_sources = {}  # Load ages from HKB/FHQ to filter CFR properly
@@ -318,48 +323,162 @@ def load_consensus_rankings() -> Dict[str, float]:
     except Exception:
         pass
 
-    # Combine into weighted consensus rank
-    all_players = set()
-    for source_data in all_sources.values():
-        all_players.update(source_data.keys())
-
-    consensus = {}
-    for name in all_players:
-        weighted_sum = 0.0
-        total_weight = 0.0
-
-        for source_name, source_data in all_sources.items():
-            if name in source_data:
-                # FIX: Exclude CFR for MLB players and mature players (it's prospect-focused)
-                # Only include CFR for young MiLB/prospect players (<25 years old)
-                if source_name == 'CFR':
-                    info = cfr_player_info.get(name, {})
-                    player_level = info.get('level', 'UNKNOWN')
-                    # Use age from HKB/FHQ if available, otherwise use CFR age
-                    player_age = player_ages_from_sources.get(name, info.get('age'))
-                    # Exclude CFR if: 1) MLB level, OR 2) Age 25+ (mature/established)
-                    if player_level == 'MLB' or (player_age and player_age >= 25):
-                        continue  # Skip CFR for MLB or mature players
-
-                rank = source_data[name]
-                # Filter out extreme ranks (>500) to avoid noise
-                if rank <= 500:
-                    weight = SOURCE_WEIGHTS.get(source_name, 0.05)
-                    weighted_sum += rank * weight
-                    total_weight += weight
-
-        if total_weight > 0:
-            consensus[name] = weighted_sum / total_weight
+    # Eligibility: ranks beyond 500 are noise for every source. CFR is prospect-focused,
+    # so it only counts for young MiLB players - excluded for MLB level or age 25+
+    # (age from HKB/FHQ when available, otherwise CFR's own).
+    matrix = ConsensusMatrix.from_sources(all_sources)
+    eligible = matrix.ranks <= 500
+    if 'CFR' in matrix.source_index:
+        levels = [cfr_player_info.get(name, {}).get('level', 'UNKNOWN') for name in matrix.names]
+        ages = np.array([player_ages_from_sources.get(name, cfr_player_info.get(name, {}).get('age')) or 0.0
+                         for name in matrix.names], dtype=float)
+        cfr_excluded = (np.array(levels) == 'MLB') | (ages >= 25)
+        eligible[:, matrix.source_index['CFR']] &= ~cfr_excluded
+    matrix.mask &= eligible
+    return matrix
+
+
+class ConsensusMatrix:
+    """External ranks as a player x source matrix with an eligibility mask.
+
+    names[i] is row i, sources[j] column j; ranks[i, j] is only meaningful where
+    mask[i, j]. The weighted consensus for any weight set is one masked product
+    over the matrix, so reweighting or adding a source never re-reads the CSVs.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.row_index: Dict[str, int] = {}
+        self.sources: List[str] = []
+        self.source_index: Dict[str, int] = {}
+        self.ranks = np.zeros((0, 0))
+        self.mask = np.zeros((0, 0), dtype=bool)
+
+    @classmethod
+    def from_sources(cls, sources: Dict[str, Dict[str, float]]) -> 'ConsensusMatrix':
+        matrix = cls()
+        for source, ranks in sources.items():
+            matrix.add_source(source, ranks)
+        return matrix
+
+    def _ensure_rows(self, names) -> np.ndarray:
+        rows = []
+        for name in names:
+            row = self.row_index.get(name)
+            if row is None:
+                row = self.row_index[name] = len(self.names)
+                self.names.append(name)
+            rows.append(row)
+        grow = len(self.names) - self.ranks.shape[0]
+        if grow:
+            self.ranks = np.vstack([self.ranks, np.zeros((grow, self.ranks.shape[1]))])
+            self.mask = np.vstack([self.mask, np.zeros((grow, self.mask.shape[1]), dtype=bool)])
+        return np.array(rows, dtype=np.intp)
+
+    def add_source(self, source: str, ranks: Dict[str, float]):
+        """Add (or replace) one source column; unseen player names become new rows."""
+        rows = self._ensure_rows(ranks)
+        j = self.source_index.get(source)
+        if j is None:
+            j = self.source_index[source] = len(self.sources)
+            self.sources.append(source)
+            self.ranks = np.hstack([self.ranks, np.zeros((self.ranks.shape[0], 1))])
+            self.mask = np.hstack([self.mask, np.zeros((self.mask.shape[0], 1), dtype=bool)])
+        self.ranks[:, j] = 0.0
+        self.mask[:, j] = False
+        self.ranks[rows, j] = np.fromiter(ranks.values(), dtype=float, count=len(rows))
+        self.mask[rows, j] = True
+
+    def weight_vector(self, weights: Dict[str, float] = None) -> np.ndarray:
+        weights = SOURCE_WEIGHTS if weights is None else weights
+        return np.array([weights.get(source, DEFAULT_SOURCE_WEIGHT) for source in self.sources], dtype=float)
+
+    def combined(self, weights: Dict[str, float] = None) -> np.ndarray:
+        """Weighted average rank per row (nan where no eligible source has a weight)."""
+        w = self.weight_vector(weights)
+        contrib = np.where(self.mask, self.ranks * w, 0.0)
+        present = np.where(self.mask, w, 0.0)
+        # Accumulate columns in source order so results match a per-player running sum bit-for-bit
+        weighted_sum = np.zeros(len(self.names))
+        total_weight = np.zeros(len(self.names))
+        for j in range(len(self.sources)):
+            weighted_sum += contrib[:, j]
+            total_weight += present[:, j]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(total_weight > 0, weighted_sum / total_weight, np.nan)
+
+    def source_ranks(self, source: str) -> Dict[str, float]:
+        """{player: rank} of the eligible ranks in one source."""
+        j = self.source_index[source]
+        rows = np.flatnonzero(self.mask[:, j])
+        return {self.names[i]: float(self.ranks[i, j]) for i in rows}
+
+    def lookup(self, names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """(ranks, mask) rows for arbitrary player names; unknown names are all-ineligible."""
+        rows = np.array([self.row_index.get(name, -1) for name in names], dtype=np.intp)
+        known = rows >= 0
+        ranks = np.zeros((len(names), len(self.sources)))
+        mask = np.zeros((len(names), len(self.sources)), dtype=bool)
+        ranks[known] = self.ranks[rows[known]]
+        mask[known] = self.mask[rows[known]]
+        return ranks, mask
+
+
+def combine_consensus(matrix: ConsensusMatrix, weights: Dict[str, float] = None) -> Dict[str, float]:
+    """Weighted average rank per player across the loaded sources."""
+    combined = matrix.combined(weights)
+    return {matrix.names[i]: float(combined[i]) for i in np.flatnonzero(~np.isnan(combined))}
+
+
+def load_consensus_rankings(matrix: ConsensusMatrix = None) -> Dict[str, float]:
+    """Load weighted consensus dynasty rankings from the external sources.
+
+    Sources & Weights (SOURCE_WEIGHTS):
+    - Dynasty Rankings (60% total): FHQ (30%), HKB (30%)
+    - Production Projections (20% total): Steamer (10%), ZiPS (10%)
+    - Prospects: CFR (20%, MiLB players under 25 only)
+
+    Returns a dict mapping player name to weighted average consensus rank.
+    This is used for hybrid value calculation - pulling projection-based
+    values toward market consensus when there's significant deviation.
+    """
+    if matrix is None:
+        matrix = load_consensus_sources()
+    consensus = combine_consensus(matrix)
 
     if consensus:
-        sources_loaded = list(all_sources.keys())
-        print(f"Loaded weighted consensus for {len(consensus)} players from {len(sources_loaded)} sources: {', '.join(sources_loaded)}")
+        print(f"Loaded weighted consensus for {len(consensus)} players from {len(matrix.sources)} sources: {', '.join(matrix.sources)}")
 
     return consensus
 
 
-# Global consensus rankings - loaded once at module import
-CONSENSUS_RANKINGS = load_consensus_rankings()
+def refresh_consensus_rankings():
+    """Recombine CONSENSUS_RANKINGS (in place) from the source matrix and current SOURCE_WEIGHTS."""
+    consensus = combine_consensus(CONSENSUS_MATRIX)
+    CONSENSUS_RANKINGS.clear()
+    CONSENSUS_RANKINGS.update(consensus)
+
+
+def add_consensus_source(source: str, ranks: Dict[str, float], weight: float = None, max_rank: float = 500):
+    """Add or replace a consensus source from {player: rank} and recombine the rankings.
+
+    Ranks beyond max_rank are ignored, as for the shipped sources. weight, if
+    given, becomes the source's SOURCE_WEIGHTS entry.
+    """
+    kept = {name: float(rank) for name, rank in ranks.items() if rank <= max_rank}
+    CONSENSUS_MATRIX.add_source(source, kept)
+    CONSENSUS_SOURCES[source] = CONSENSUS_MATRIX.source_ranks(source)
+    if weight is not None:
+        SOURCE_WEIGHTS[source] = float(weight)
+    refresh_consensus_rankings()
+
+
+# Global consensus rankings - sources loaded once at module import into a
+# player x source matrix; the rankings are recombined in place when
+# SOURCE_WEIGHTS change or a source is added
+CONSENSUS_MATRIX = load_consensus_sources()
+CONSENSUS_SOURCES = {source: CONSENSUS_MATRIX.source_ranks(source) for source in CONSENSUS_MATRIX.sources}
+CONSENSUS_RANKINGS = load_consensus_rankings(CONSENSUS_MATRIX)
 
 
 # ============================================================================
@@ -393,6 +512,69 @@ def get_inseason_weights(games_played: int) -> Tuple[float, float]:
         return (0.20, 0.80)
 
 
+# ----------------------------------------------------------------------------
+# Position eligibility bitmasks
+# ----------------------------------------------------------------------------
+# Fantrax position strings ('SS,3B', '2B/OF', 'UT,SP') are parsed once per
+# distinct string into eligibility bits; flex slots and position filters are
+# unions of bits, so eligibility checks are integer ANDs.
+
+ELIGIBILITY_BITS = {
+    'C': 1 << 0, '1B': 1 << 1, '2B': 1 << 2, 'SS': 1 << 3, '3B': 1 << 4,
+    'OF': 1 << 5, 'UTIL': 1 << 6, 'SP': 1 << 7, 'RP': 1 << 8,
+}
+_POSITION_TOKEN_BITS = {
+    **ELIGIBILITY_BITS,
+    'LF': ELIGIBILITY_BITS['OF'], 'CF': ELIGIBILITY_BITS['OF'], 'RF': ELIGIBILITY_BITS['OF'],
+    'UT': ELIGIBILITY_BITS['UTIL'], 'DH': ELIGIBILITY_BITS['UTIL'],
+    'P': ELIGIBILITY_BITS['SP'] | ELIGIBILITY_BITS['RP'],
+}
+MI_MASK = ELIGIBILITY_BITS['2B'] | ELIGIBILITY_BITS['SS']
+CI_MASK = ELIGIBILITY_BITS['1B'] | ELIGIBILITY_BITS['3B']
+INF_MASK = MI_MASK | CI_MASK
+FIELD_MASK = ELIGIBILITY_BITS['C'] | INF_MASK | ELIGIBILITY_BITS['OF']  # a real defensive position
+HITTER_MASK = FIELD_MASK | ELIGIBILITY_BITS['UTIL']
+PITCHER_MASK = ELIGIBILITY_BITS['SP'] | ELIGIBILITY_BITS['RP']
+
+# Position filter names (query params, slot names) -> bits a player needs one of
+POSITION_FILTER_MASKS = {
+    **_POSITION_TOKEN_BITS,
+    'MI': MI_MASK, 'CI': CI_MASK, 'INF': INF_MASK,
+    'H': HITTER_MASK, 'HITTER': HITTER_MASK, 'HITTERS': HITTER_MASK,
+    'PITCHER': PITCHER_MASK, 'PITCHERS': PITCHER_MASK,
+}
+
+_eligibility_cache: Dict[str, int] = {}
+
+
+def eligibility_mask(position: str) -> int:
+    """Fantrax position string -> eligibility bits (every hitter is also UTIL-eligible)."""
+    mask = _eligibility_cache.get(position)
+    if mask is None:
+        mask = 0
+        for token in split_positions(position):
+            mask |= _POSITION_TOKEN_BITS.get(token, 0)
+        if mask & HITTER_MASK:
+            mask |= ELIGIBILITY_BITS['UTIL']
+        _eligibility_cache[position] = mask
+    return mask
+
+
+def position_filter_mask(position_filter: str) -> int:
+    """Bits matched by a position filter like 'SS', 'MI', 'OF' or '2B,SS' (0 if unrecognized)."""
+    mask = 0
+    for token in split_positions(position_filter):
+        mask |= POSITION_FILTER_MASKS.get(token, 0)
+    return mask
+
+
+def split_positions(position: str) -> set:
+    """Split a Fantrax position string ('SS,3B', '2B/OF') into a set of tokens."""
+    if not position:
+        return set()
+    return set(position.replace('/', ',').replace(' ', '').upper().split(','))
+
+
 @dataclass
 class Player:
     """Represents a baseball player with projections and dynasty value."""
@@ -447,11 +629,20 @@ class Player:
     prospect_rank: int = 999  # Top 100 rank (999 = not ranked)
     is_prospect: bool = False
 
+    @property
+    def eligibility(self) -> int:
+        """Position eligibility bits (see ELIGIBILITY_BITS)."""
+        return eligibility_mask(self.position)
+
+    def is_eligible(self, mask: int) -> bool:
+        """True if the player qualifies for any position in mask (e.g. MI_MASK)."""
+        return bool(eligibility_mask(self.position) & mask)
+
     def is_hitter(self) -> bool:
-        return self.position not in ['SP', 'RP', 'P'] and self.position != 'N/A'
+        return bool(eligibility_mask(self.position) & HITTER_MASK)
 
     def is_pitcher(self) -> bool:
-        return self.position in ['SP', 'RP', 'P'] or 'SP' in self.position or 'RP' in self.position
+        return bool(eligibility_mask(self.position) & PITCHER_MASK)
 
     def get_blended_stat(self, proj_stat: float, actual_stat: float, games: int = None) -> float:
         """Blend projection with actual stat based on games played."""
@@ -498,6 +689,11 @@ class TradeProposal:
     reasoning: str = ""
 
 
+# TradeProposal fields filled in by TradeAnalyzer.analyze_trade
+ANALYSIS_FIELDS = ('value_a_receives', 'value_b_receives', 'category_impact_a', 'category_impact_b',
+                   'fit_score_a', 'fit_score_b', 'verdict', 'reasoning')
+
+
 # ============================================================================
 # PROJECTION DATA (From FantasyPros Consensus - Steamer/ZiPS/etc)
 # ============================================================================
@@ -7294,6 +7490,33 @@ PITCHER_HANDEDNESS = {
 # BLENDED STATS CALCULATOR (Projections + Actual Performance)
 # ============================================================================
 
+# Rate stats Fantrax reports as strings (".285", "1.012", ".---")
+ACTUAL_RATE_STATS = ('AVG', 'OPS', 'OBP', 'SLG', 'ERA', 'WHIP')
+
+
+def parse_rate_stat(value, default: float) -> float:
+    """Parse a rate stat that may be a Fantrax string ('.285') into a float."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_actual_stats(actual_stats: dict) -> dict:
+    """Numeric copy of an actual-stats dict: rate-stat strings become floats once,
+    so blending never re-parses them. Unparseable rates ('.---') are dropped and
+    fall back to the blend defaults."""
+    parsed = dict(actual_stats)
+    for stat in ACTUAL_RATE_STATS:
+        if stat in parsed and not isinstance(parsed[stat], (int, float)):
+            value = parse_rate_stat(parsed[stat], None)
+            if value is None:
+                del parsed[stat]
+            else:
+                parsed[stat] = value
+    return parsed
+
+
 def get_blended_hitter_stats(player_name: str, projections: dict, actual_stats: dict = None) -> dict:
     """
     Blend pre-season projections with actual in-season stats.
@@ -7348,22 +7571,13 @@ def get_blended_hitter_stats(player_name: str, projections: dict, actual_stats:
         blended[stat] = (proj_val * proj_weight) + (pace_val * actual_weight)
 
     # Rate stats - blend directly (already rate-based)
-    # AVG: need to handle string format from Fantrax
+    # AVG/OPS may still be Fantrax strings ('.285') unless pre-parsed by parse_actual_stats
     proj_avg = projections.get('AVG', 0.250)
-    actual_avg_str = actual_stats.get('AVG', '.250')
-    try:
-        actual_avg = float(actual_avg_str.replace('.', '0.')) if isinstance(actual_avg_str, str) else float(actual_avg_str)
-    except:
-        actual_avg = 0.250
+    actual_avg = parse_rate_stat(actual_stats.get('AVG', 0.250), 0.250)
     blended['AVG'] = (proj_avg * proj_weight) + (actual_avg * actual_weight)
 
-    # OPS: same handling
     proj_ops = projections.get('OPS', 0.750)
-    actual_ops_str = actual_stats.get('OPS', '.750')
-    try:
-        actual_ops = float(actual_ops_str.replace('.', '0.')) if isinstance(actual_ops_str, str) else float(actual_ops_str)
-    except:
-        actual_ops = 0.750
+    actual_ops = parse_rate_stat(actual_stats.get('OPS', 0.750), 0.750)
     blended['OPS'] = (proj_ops * proj_weight) + (actual_ops * actual_weight)
 
     # SO (strikeouts) - pace
@@ -7383,6 +7597,259 @@ def get_blended_hitter_stats(player_name: str, projections: dict, actual_stats:
     return blended
 
 
+# ============================================================================
+# PIECEWISE CURVE TABLES (vectorized valuation)
+# ============================================================================
+
+@dataclass(frozen=True)
+class PiecewiseCurve:
+    """Breakpoint table for one piecewise scoring curve.
+
+    `breaks` are ascending thresholds splitting the domain into len(breaks) + 1
+    segments. closed='left' puts a value equal to a break in the upper segment
+    (the scalar `x >= t` chains); closed='right' puts it in the lower one
+    (`x <= t` chains). Segment forms:
+        ('lin', base, anchor, slope)    -> base + (x - anchor) * slope
+        ('div', base, anchor, divisor)  -> base + (x - anchor) / divisor
+        ('ratio', divisor, scale)       -> x / divisor * scale
+        ('const', value)
+    These tables are the only definition of each curve: the scalar valuation
+    reads them through `at` and the batch path through `evaluate`, and both do
+    the same float operations in the same order, so results are bit-identical
+    (np.interp would smooth over the small jumps at the breaks).
+    """
+    breaks: Tuple[float, ...]
+    segments: Tuple[tuple, ...]
+    closed: str = 'left'
+    floor: Optional[float] = None
+    cap: Optional[float] = None
+
+    def segment_index(self, x: np.ndarray) -> np.ndarray:
+        side = 'right' if self.closed == 'left' else 'left'
+        return np.searchsorted(np.asarray(self.breaks, dtype=float), x, side=side)
+
+    def evaluate(self, x) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        idx = self.segment_index(x)
+        out = np.zeros_like(x)
+        for i, seg in enumerate(self.segments):
+            mask = idx == i
+            if not mask.any():
+                continue
+            xs = x[mask]
+            kind = seg[0]
+            if kind == 'lin':
+                out[mask] = seg[1] + (xs - seg[2]) * seg[3]
+            elif kind == 'div':
+                out[mask] = seg[1] + (xs - seg[2]) / seg[3]
+            elif kind == 'ratio':
+                out[mask] = xs / seg[1] * seg[2]
+            else:
+                out[mask] = seg[1]
+        if self.floor is not None:
+            out = np.maximum(out, self.floor)
+        if self.cap is not None:
+            out = np.minimum(out, self.cap)
+        return out
+
+    def at(self, x: float) -> float:
+        """Scalar `evaluate` for a single value (no array round trip)."""
+        x = float(x)
+        if self.closed == 'left':
+            seg = self.segments[bisect.bisect_right(self.breaks, x)]
+        else:
+            seg = self.segments[bisect.bisect_left(self.breaks, x)]
+        kind = seg[0]
+        if kind == 'lin':
+            out = seg[1] + (x - seg[2]) * seg[3]
+        elif kind == 'div':
+            out = seg[1] + (x - seg[2]) / seg[3]
+        elif kind == 'ratio':
+            out = x / seg[1] * seg[2]
+        else:
+            out = seg[1]
+        if self.floor is not None:
+            out = max(out, self.floor)
+        if self.cap is not None:
+            out = min(out, self.cap)
+        return float(out)
+
+
+def step_table(breaks: Tuple[float, ...], values: Tuple[float, ...], closed: str = 'left') -> PiecewiseCurve:
+    """Piecewise-constant curve (tier multipliers, bonuses)."""
+    return PiecewiseCurve(breaks, tuple(('const', v) for v in values), closed=closed)
+
+
+# Hitter category curves (calculate_hitter_value), each capped at 115
+HITTER_CATEGORY_CURVES = {
+    'AVG': PiecewiseCurve((0.240, 0.270, 0.300), (
+        ('ratio', 0.240, 40), ('lin', 40, 0.240, 1167), ('lin', 75, 0.270, 833), ('lin', 100, 0.300, 300),
+    ), floor=10, cap=115),
+    'OPS': PiecewiseCurve((0.650, 0.750, 0.850, 0.950), (
+        ('ratio', 0.650, 25), ('lin', 25, 0.650, 300), ('lin', 55, 0.750, 300),
+        ('lin', 85, 0.850, 150), ('lin', 100, 0.950, 200),
+    ), floor=5, cap=115),
+    'HR': PiecewiseCurve((15, 25, 40), (
+        ('ratio', 15, 40), ('lin', 40, 15, 3), ('lin', 70, 25, 2), ('lin', 100, 40, 2),
+    ), floor=5, cap=115),
+    'R': PiecewiseCurve((60, 80, 100), (
+        ('ratio', 60, 40), ('lin', 40, 60, 1.5), ('lin', 70, 80, 1.25), ('lin', 95, 100, 1),
+    ), floor=10, cap=115),
+    'RBI': PiecewiseCurve((60, 80, 100), (
+        ('ratio', 60, 40), ('lin', 40, 60, 1.5), ('lin', 70, 80, 1.25), ('lin', 95, 100, 1),
+    ), floor=10, cap=115),
+    'SB': PiecewiseCurve((5, 15, 30), (
+        ('ratio', 1, 6), ('lin', 30, 5, 3), ('lin', 60, 15, 2.33), ('lin', 95, 30, 2),
+    ), floor=5, cap=115),
+    # Inverse: lower is better, ties at a break go to the better (lower) segment
+    'SO': PiecewiseCurve((90, 130, 170), (
+        ('lin', 95, 90, -0.5), ('lin', 70, 130, -0.625), ('lin', 35, 170, -0.875), ('lin', 35, 170, -0.5),
+    ), closed='right', floor=5, cap=115),
+}
+
+# Elite young hitter boost tiers (age <= 25, blended stats)
+ELITE_HR_BOOST = step_table((35, 40), (0.0, 0.08, 0.12))
+ELITE_SB_BOOST = step_table((35, 40), (0.0, 0.08, 0.12))
+ELITE_AVG_BOOST = step_table((0.300, 0.310), (0.0, 0.06, 0.10))
+ELITE_RBI_BOOST = step_table((110,), (0.0, 0.08))
+
+# Starting pitcher: estimated H/9 by WHIP tier (for the K/BB estimate)
+SP_HITS_PER_9 = step_table((1.05, 1.15, 1.25), (7.2, 8.0, 8.5, 9.0))
+
+# Reliever curves (_calculate_reliever_value)
+RP_SV_HLD_CURVE = PiecewiseCurve((15, 25, 35), (
+    ('ratio', 1, 2), ('lin', 30, 15, 3), ('lin', 60, 25, 3), ('lin', 90, 35, 2),
+))
+RP_K_CURVE = PiecewiseCurve((), (('ratio', 90, 60),), cap=70)
+RP_ERA_CURVE = PiecewiseCurve((), (('lin', 70, 2.50, -20),), floor=20)
+RP_WHIP_CURVE = PiecewiseCurve((), (('lin', 70, 1.00, -40),), floor=20)
+RP_K_RATE_BONUS = step_table((1.1, 1.3), (0, 4, 8))
+RP_LEVERAGE_DISCOUNT = step_table((20, 30), (0.85, 0.92, 1.0))
+RP_DYNASTY_RELIEF = step_table((20, 30), (1.0, 1.08, 1.15))
+
+# Fantrax-score fallbacks when a player has no projections
+HITTER_FANTRAX_FALLBACK = step_table((100, 200, 400), (0.80, 0.65, 0.50, 0.35))
+PITCHER_FANTRAX_FALLBACK = step_table((100, 200, 300, 500), (0.85, 0.75, 0.60, 0.45, 0.30))
+
+# Dynasty adjustments (_apply_dynasty_adjustments); age <= 0 means unknown
+def pitcher_age_discount_curve(discount: float) -> PiecewiseCurve:
+    """Dynasty pitcher discount by age; `discount` applies to unknown ages and 32+."""
+    return step_table((0, 24, 31), (discount, 0.80, 0.65, discount), closed='right')
+
+
+PITCHER_AGE_DISCOUNT = pitcher_age_discount_curve(DYNASTY_PITCHER_DISCOUNT)
+HITTER_AGE_BONUS = step_table(
+    (0, 19, 21, 24, 26, 28, 30, 32, 34, 36),
+    (0.0, 0.20, 0.15, 0.10, 0.00, -0.10, -0.22, -0.35, -0.50, -0.65, -0.78), closed='right')
+PITCHER_AGE_BONUS = step_table(
+    (0, 19, 21, 24, 27, 31, 33, 35, 37),
+    (0.0, 0.20, 0.15, 0.10, 0.05, 0.00, -0.15, -0.35, -0.55, -0.75), closed='right')
+
+# Ranked prospect value, shared by calculate_player_value and the app's prospect
+# board / FA valuation. Version 1 reconciles the two curves that used to exist:
+# the 63-peak curve calculate_player_value has always used is kept, and the app's
+# separate 76-peak copy is retired, so a rostered and an unrostered prospect of the
+# same rank are worth the same. Bump the version whenever the breakpoints change.
+#   Rank 1-5:    63 -> 55     Rank 51-100:  24 -> 15
+#   Rank 6-10:   53 -> 48     Rank 101-200: 14 -> 6
+#   Rank 11-25:  46 -> 36     Rank 201-300: 5 -> 2
+#   Rank 26-50:  35 -> 25     Unranked / outside 1-300: 0.5
+PROSPECT_VALUE_VERSION = 1
+PROSPECT_VALUE_CURVE = PiecewiseCurve((0, 5, 10, 25, 50, 100, 200, 300), (
+    ('const', 0.5),
+    ('lin', 63, 1, -2.0), ('lin', 53, 6, -1.25), ('lin', 46, 11, -0.714), ('lin', 35, 26, -0.417),
+    ('lin', 24, 51, -0.184), ('lin', 14, 101, -0.081), ('lin', 5, 201, -0.030),
+    ('const', 0.5),
+), closed='right')
+PROSPECT_VALUE_MAX_RANK = 300
+PROSPECT_VALUE_TABLE = PROSPECT_VALUE_CURVE.evaluate(np.arange(PROSPECT_VALUE_MAX_RANK + 1)).tolist()  # index = rank
+
+
+def get_prospect_value(rank) -> float:
+    """Dynasty value for a prospect rank, read from PROSPECT_VALUE_TABLE."""
+    if 0 < rank <= PROSPECT_VALUE_MAX_RANK and rank == int(rank):
+        return PROSPECT_VALUE_TABLE[int(rank)]
+    return float(PROSPECT_VALUE_CURVE.evaluate([rank])[0])
+
+
+# Draft pick values (calculate_pick_value). A 12-team, 4-round draft; values are
+# scaled to match prospect/player valuations (1st ~30, 2nd ~18, 3rd ~10, 4th ~5)
+# with a position multiplier of 1.15 for pick 1 down to 0.875 for pick 12.
+PICK_ROUND_BASE_VALUES = {1: 30, 2: 18, 3: 10, 4: 5}
+PICK_ROUND_NAMES = {'1st': 1, '2nd': 2, '3rd': 3, '4th': 4}
+PICKS_PER_ROUND = 12
+# Year multiplier classes: 2026 picks with a known slot get a small premium,
+# later years an uncertainty discount. None = no year adjustment.
+PICK_YEAR_MULTIPLIERS = {None: None, 2026: 1.05, 2027: 0.90, 2028: 0.75}
+
+
+def compute_pick_value(year: Optional[int], round_num: int, pick_in_round: Optional[int]) -> float:
+    """Value of a (year class, round, pick-in-round) slot; pick None = slot unknown."""
+    value = PICK_ROUND_BASE_VALUES.get(round_num, 5)
+    if pick_in_round is not None:
+        value = value * (1.15 - ((pick_in_round - 1) * 0.025))
+    year_mult = PICK_YEAR_MULTIPLIERS.get(year)
+    if year_mult is not None:
+        value *= year_mult
+    return round(value, 1)
+
+
+# (year class, round, pick-in-round) -> value for every slot of a 4-round draft
+PICK_VALUE_TABLE = {
+    (year, round_num, pick): compute_pick_value(year, round_num, pick)
+    for year in PICK_YEAR_MULTIPLIERS
+    for round_num in PICK_ROUND_BASE_VALUES
+    for pick in [None] + list(range(1, PICKS_PER_ROUND + 1))
+}
+
+_PICK_ROUND_PICK_RE = re.compile(r'^(\d)\.(\d{2})$')
+_PICK_OVERALL_RE = re.compile(r'\(#(\d+)\)')
+_PICK_NUMBER_RE = re.compile(r'Pick\s+(\d+)(?:\s|$)')
+PICK_KEY_CACHE_SIZE = 1024  # pick strings come from requests, so the cache is bounded
+
+
+@lru_cache(maxsize=PICK_KEY_CACHE_SIZE)
+def parse_pick_key(pick: str) -> Optional[Tuple[Optional[int], int, Optional[int]]]:
+    """Parse a pick string into its PICK_VALUE_TABLE key (cached per string).
+
+    Formats supported:
+    - "1.03", "2.07" etc. (round.pickposition format used internally, no year adjustment)
+    - "2026 1st Round Pick 1 (#1)" through "2026 4th Round Pick 12 (#48)" (overall number)
+    - "2027 1st Round Pick", "2027 2nd Round Pick 3", etc.
+    Returns None for unrecognised strings.
+    """
+    key = None
+    round_pick_match = _PICK_ROUND_PICK_RE.match(pick)
+    overall_match = _PICK_OVERALL_RE.search(pick) if not round_pick_match else None
+    if round_pick_match:
+        key = (None, int(round_pick_match.group(1)), int(round_pick_match.group(2)))
+    elif overall_match:
+        # Overall pick position (1-48) is the most precise; picks past 36 are 4th rounders
+        overall_pick = int(overall_match.group(1))
+        round_num = min((overall_pick - 1) // PICKS_PER_ROUND + 1, 4) if overall_pick > 0 else 1
+        key = (2026 if '2026' in pick else None, round_num, overall_pick - (round_num - 1) * PICKS_PER_ROUND)
+    else:
+        for round_name, round_num in PICK_ROUND_NAMES.items():
+            if round_name in pick:
+                pick_match = _PICK_NUMBER_RE.search(pick)
+                year = next((y for y in (2026, 2027, 2028) if str(y) in pick), None)
+                key = (year, round_num, int(pick_match.group(1)) if pick_match else None)
+                break
+    return key
+
+
+# Consensus adjustment (_apply_consensus_adjustment): value <-> implied rank
+CONSENSUS_IMPLIED_RANK = PiecewiseCurve((40, 55, 70, 85, 100), (
+    ('lin', 155, 40, -5.0), ('lin', 95, 55, -4.0), ('lin', 50, 70, -3.0),
+    ('lin', 20, 85, -2.0), ('lin', 5, 100, -1.0), ('div', 5, 100, -5),
+), floor=1)
+CONSENSUS_TARGET_VALUE = PiecewiseCurve((5, 20, 50, 95, 155), (
+    ('lin', 100, 5, -5), ('lin', 100, 5, -1.0), ('div', 85, 20, -2.0),
+    ('div', 70, 50, -3.0), ('div', 55, 95, -4.0), ('div', 40, 155, -5.0),
+), closed='right', floor=10)
+CONSENSUS_CORRECTION = step_table((15, 40), (0.0, 0.25, 0.50), closed='right')
+
+
 # ============================================================================
 # VALUE CALCULATOR
 # ============================================================================
@@ -7402,28 +7869,41 @@ class DynastyValueCalculator:
         'ops': 0.19,    # OPS (rate stat premium)
     }
 
-    # Pitching: K, ERA, WHIP, K/BB, SV+HLD, L, QS (sum = 1.0)
+    # Pitching (starters): K, ERA, WHIP, QS, K/BB, L (sum = 1.0)
+    # SV+HLD not applicable to SP, redistributed to other pitching cats
     PITCHING_WEIGHTS = {
-        'k': 0.16,      # Strikeouts
-        'era': 0.18,    # ERA (rate stat premium)
-        'whip': 0.16,   # WHIP (rate stat premium)
-        'k_bb': 0.12,   # K/BB Ratio
-        'sv_hld': 0.16, # Saves + Holds
-        'l': 0.05,      # Losses (inverse - lower is better)
-        'qs': 0.17,     # Quality Starts
+        'k': 0.20,      # Strikeouts - very important for SP
+        'era': 0.22,    # ERA - premium rate stat
+        'whip': 0.20,   # WHIP - premium rate stat
+        'qs': 0.20,     # Quality Starts - SP specialty
+        'k_bb': 0.13,   # K/BB ratio (command)
+        'l': 0.05,      # Losses - minor factor
     }
-    
-    # Position scarcity multipliers
+
+    # Relievers: SV+HLD is primary RP value, the rest is scaled down (sum = 0.88)
+    RELIEVER_WEIGHTS = {
+        'sv_hld': 0.35, # Saves + Holds
+        'k': 0.20,      # Strikeouts (RPs have fewer opportunities)
+        'era': 0.18,    # ERA
+        'whip': 0.15,   # WHIP
+    }
+
+    # Position scarcity bonus for hitters, added to the age multiplier.
+    # First position found in the player's position string wins, in this order.
     POSITION_SCARCITY = {
-        'C': 1.15,
-        'SS': 1.10,
-        '2B': 1.05,
-        '3B': 1.00,
-        '1B': 0.95,
-        'OF': 1.00,
-        'SP': 1.10,
-        'RP': 0.95,
+        'C': 0.06,      # Catchers are scarce
+        'SS': 0.03,
+        '2B': 0.02,
+        '1B': -0.02,
     }
+
+    @staticmethod
+    def position_scarcity_bonus(position: str) -> float:
+        """Scarcity bonus for a hitter's position string (0 when none applies)."""
+        for pos, bonus in DynastyValueCalculator.POSITION_SCARCITY.items():
+            if pos in position:
+                return bonus
+        return 0
     
     @staticmethod
     def calculate_hitter_value(player: Player, actual_stats: dict = None) -> float:
@@ -7437,164 +7917,51 @@ class DynastyValueCalculator:
         proj = HITTER_PROJECTIONS.get(player.name)
         
         if proj:
+            # Category curves (HITTER_CATEGORY_CURVES), e.g. AVG .300+ elite / .270
+            # average / .240 below average, SO inverse (90 elite, 170 poor)
             value = 0.0
-
-            # AVG: .300+ elite, .270 average, .240 below average
-            # Steeper curve to penalize low averages
-            if proj['AVG'] >= 0.300:
-                avg_score = 100 + (proj['AVG'] - 0.300) * 300  # Elite bonus
-            elif proj['AVG'] >= 0.270:
-                avg_score = 75 + (proj['AVG'] - 0.270) * 833  # 75-100 for above avg
-            elif proj['AVG'] >= 0.240:
-                avg_score = 40 + (proj['AVG'] - 0.240) * 1167  # 40-75 for below avg
-            else:
-                avg_score = max(proj['AVG'] / 0.240 * 40, 10)  # Poor
-            avg_score = min(avg_score, 115)
-            value += avg_score * DynastyValueCalculator.HITTING_WEIGHTS['avg']
-
-            # OPS: .950+ elite, .800 average, .700 below average
-            if proj['OPS'] >= 0.950:
-                ops_score = 100 + (proj['OPS'] - 0.950) * 200
-            elif proj['OPS'] >= 0.850:
-                ops_score = 85 + (proj['OPS'] - 0.850) * 150
-            elif proj['OPS'] >= 0.750:
-                ops_score = 55 + (proj['OPS'] - 0.750) * 300
-            elif proj['OPS'] >= 0.650:
-                ops_score = 25 + (proj['OPS'] - 0.650) * 300
-            else:
-                ops_score = max(proj['OPS'] / 0.650 * 25, 5)
-            ops_score = min(ops_score, 115)
-            value += ops_score * DynastyValueCalculator.HITTING_WEIGHTS['ops']
-
-            # HR: 40+ elite, 25 average, 15 below average
-            if proj['HR'] >= 40:
-                hr_score = 100 + (proj['HR'] - 40) * 2
-            elif proj['HR'] >= 25:
-                hr_score = 70 + (proj['HR'] - 25) * 2
-            elif proj['HR'] >= 15:
-                hr_score = 40 + (proj['HR'] - 15) * 3
-            else:
-                hr_score = max(proj['HR'] / 15 * 40, 5)
-            hr_score = min(hr_score, 115)
-            value += hr_score * DynastyValueCalculator.HITTING_WEIGHTS['hr']
-
-            # R: 100+ elite, 80 average, 60 below average
-            if proj['R'] >= 100:
-                r_score = 95 + (proj['R'] - 100) * 1
-            elif proj['R'] >= 80:
-                r_score = 70 + (proj['R'] - 80) * 1.25
-            elif proj['R'] >= 60:
-                r_score = 40 + (proj['R'] - 60) * 1.5
-            else:
-                r_score = max(proj['R'] / 60 * 40, 10)
-            r_score = min(r_score, 115)
-            value += r_score * DynastyValueCalculator.HITTING_WEIGHTS['r']
-
-            # RBI: 100+ elite, 80 average, 60 below average
-            if proj['RBI'] >= 100:
-                rbi_score = 95 + (proj['RBI'] - 100) * 1
-            elif proj['RBI'] >= 80:
-                rbi_score = 70 + (proj['RBI'] - 80) * 1.25
-            elif proj['RBI'] >= 60:
-                rbi_score = 40 + (proj['RBI'] - 60) * 1.5
-            else:
-                rbi_score = max(proj['RBI'] / 60 * 40, 10)
-            rbi_score = min(rbi_score, 115)
-            value += rbi_score * DynastyValueCalculator.HITTING_WEIGHTS['rbi']
-
-            # SB: 30+ elite, 15 average, 5 below average
-            if proj['SB'] >= 30:
-                sb_score = 95 + (proj['SB'] - 30) * 2
-            elif proj['SB'] >= 15:
-                sb_score = 60 + (proj['SB'] - 15) * 2.33
-            elif proj['SB'] >= 5:
-                sb_score = 30 + (proj['SB'] - 5) * 3
-            else:
-                sb_score = max(proj['SB'] * 6, 5)
-            sb_score = min(sb_score, 115)
-            value += sb_score * DynastyValueCalculator.HITTING_WEIGHTS['sb']
-
-            # SO (inverse - lower is better): 90 elite, 130 average, 170 poor
-            if proj['SO'] <= 90:
-                so_score = 95 + (90 - proj['SO']) * 0.5
-            elif proj['SO'] <= 130:
-                so_score = 70 + (130 - proj['SO']) * 0.625
-            elif proj['SO'] <= 170:
-                so_score = 35 + (170 - proj['SO']) * 0.875
-            else:
-                so_score = max(35 - (proj['SO'] - 170) * 0.5, 5)
-            so_score = min(so_score, 115)
-            value += so_score * DynastyValueCalculator.HITTING_WEIGHTS['so']
+            weights = DynastyValueCalculator.HITTING_WEIGHTS
+            for cat, curve in HITTER_CATEGORY_CURVES.items():
+                value += curve.at(proj[cat]) * weights[cat.lower()]
 
             # ============ AUTOMATIC ELITE YOUNG HITTER BOOST ============
             # Young players (≤25) with elite single-category production get a boost
             # This compensates for the balanced formula penalizing specialists
             # Uses BLENDED stats (projections + actual pace) when in-season data available
             if player.age > 0 and player.age <= 25:
-                elite_boost = 1.0
-                elite_categories = 0
-
                 # Get blended stats for elite boost evaluation
                 # This allows breakout seasons to be recognized mid-year
                 blended = get_blended_hitter_stats(player.name, proj, actual_stats)
-                blended_hr = blended.get('HR', proj['HR'])
-                blended_sb = blended.get('SB', proj['SB'])
-                blended_avg = blended.get('AVG', proj['AVG'])
-                blended_rbi = blended.get('RBI', proj['RBI'])
-
-                # Elite power: 35+ HR
-                if blended_hr >= 40:
-                    elite_boost += 0.12  # 40+ HR is exceptional
-                    elite_categories += 1
-                elif blended_hr >= 35:
-                    elite_boost += 0.08
-                    elite_categories += 1
-
-                # Elite speed: 35+ SB
-                if blended_sb >= 40:
-                    elite_boost += 0.12  # 40+ SB is exceptional
-                    elite_categories += 1
-                elif blended_sb >= 35:
-                    elite_boost += 0.08
-                    elite_categories += 1
-
-                # Elite contact: .300+ AVG
-                if blended_avg >= 0.310:
-                    elite_boost += 0.10  # .310+ is exceptional
-                    elite_categories += 1
-                elif blended_avg >= 0.300:
-                    elite_boost += 0.06
-                    elite_categories += 1
-
-                # Elite run production: 110+ RBI
-                if blended_rbi >= 110:
-                    elite_boost += 0.08
-                    elite_categories += 1
-
-                # Multi-category elite bonus (5-tool players)
-                if elite_categories >= 2:
-                    elite_boost += 0.05  # Extra boost for multi-category elite
-
-                # Apply automatic boost (capped at 25% to avoid stacking too high)
-                elite_boost = min(elite_boost, 1.25)
-                value *= elite_boost
+                value *= DynastyValueCalculator.young_hitter_boost(
+                    blended.get('HR', proj['HR']), blended.get('SB', proj['SB']),
+                    blended.get('AVG', proj['AVG']), blended.get('RBI', proj['RBI']))
 
         else:
             # Fall back to Fantrax score with discount based on rank
-            if player.fantrax_rank < 100:
-                value = player.fantrax_score * 0.80
-            elif player.fantrax_rank < 200:
-                value = player.fantrax_score * 0.65
-            elif player.fantrax_rank < 400:
-                value = player.fantrax_score * 0.50
-            else:
-                value = player.fantrax_score * 0.35
+            value = player.fantrax_score * HITTER_FANTRAX_FALLBACK.at(player.fantrax_rank)
 
         # Dynasty adjustments (with reduced stacking) - includes manual ELITE_YOUNG_PLAYERS boost
         value = DynastyValueCalculator._apply_dynasty_adjustments(player, value, is_hitter=True)
 
         return value  # No cap - show true dynasty value
-    
+
+    @staticmethod
+    def young_hitter_boost(hr: float, sb: float, avg: float, rbi: float) -> float:
+        """Elite young hitter multiplier from (blended) HR / SB / AVG / RBI.
+
+        Each category adds its ELITE_*_BOOST tier (e.g. 35+ HR +8%, 40+ HR +12%),
+        two or more elite categories add another 5%, capped at +25%.
+        """
+        tiers = (ELITE_HR_BOOST.at(hr), ELITE_SB_BOOST.at(sb),
+                 ELITE_AVG_BOOST.at(avg), ELITE_RBI_BOOST.at(rbi))
+        boost = 1.0
+        for tier in tiers:
+            boost += tier
+        # Multi-category elite bonus (5-tool players)
+        if sum(tier > 0 for tier in tiers) >= 2:
+            boost += 0.05
+        return min(boost, 1.25)
+
     @staticmethod
     def calculate_pitcher_value(player: Player) -> float:
         """Calculate pitching value from projections (0-100 scale)."""
@@ -7609,20 +7976,11 @@ class DynastyValueCalculator:
             return DynastyValueCalculator._calculate_sp_value(player, sp_proj)
         else:
             # No projections - use Fantrax data with heavy discount
-            # Rank-based: lower rank = lower value
-            if player.fantrax_rank < 100:
-                value = player.fantrax_score * 0.85
-            elif player.fantrax_rank < 200:
-                value = player.fantrax_score * 0.75
-            elif player.fantrax_rank < 300:
-                value = player.fantrax_score * 0.60
-            elif player.fantrax_rank < 500:
-                value = player.fantrax_score * 0.45  # Keegan Akin is rank 418
-            else:
-                value = player.fantrax_score * 0.30
+            # Rank-based: lower rank = lower value (Keegan Akin is rank 418 -> 0.45)
+            value = player.fantrax_score * PITCHER_FANTRAX_FALLBACK.at(player.fantrax_rank)
             
             # Extra discount for RPs without projections (replaceable)
-            if 'RP' in player.position:
+            if player.eligibility & ELIGIBILITY_BITS['RP']:
                 value *= 0.70
             
             value = DynastyValueCalculator._apply_dynasty_adjustments(player, value, is_hitter=False)
@@ -7632,17 +7990,7 @@ class DynastyValueCalculator:
     def _calculate_sp_value(player: Player, proj: dict) -> float:
         """Calculate starting pitcher value."""
         value = 0.0
-        
-        # Weights for SP categories aligned with league scoring (sum = 1.0)
-        # Note: SV+HLD not applicable to SP, redistribute to other pitching cats
-        sp_weights = {
-            'k': 0.20,      # Strikeouts - very important for SP
-            'era': 0.22,    # ERA - premium rate stat
-            'whip': 0.20,   # WHIP - premium rate stat
-            'qs': 0.20,     # Quality Starts - SP specialty
-            'k_bb': 0.13,   # K/BB ratio (command)
-            'l': 0.05,      # Losses - minor factor
-        }
+        sp_weights = DynastyValueCalculator.PITCHING_WEIGHTS
         
         # K (normalize around 190 for aces)
         k_score = min((proj['K'] / 190) * 100, 115)
@@ -7665,15 +8013,8 @@ class DynastyValueCalculator:
         # WHIP = (H + BB) / IP, estimate H/9 based on WHIP tier
         ip = proj['IP'] if proj['IP'] > 0 else 1
         whip = proj['WHIP']
-        if whip < 1.05:
-            h_per_9 = 7.2  # Elite - fewer hits
-        elif whip < 1.15:
-            h_per_9 = 8.0  # Good
-        elif whip < 1.25:
-            h_per_9 = 8.5  # Average
-        else:
-            h_per_9 = 9.0  # Below average
-        
+        h_per_9 = SP_HITS_PER_9.at(whip)  # 7.2 elite (fewer hits) to 9.0 below average
+
         est_hits = (h_per_9 * ip) / 9
         est_bb = max((whip * ip) - est_hits, ip * 0.15)  # Floor of ~1.5 BB/9
         k_bb_ratio = proj['K'] / est_bb if est_bb > 0 else 5.0
@@ -7710,52 +8051,28 @@ class DynastyValueCalculator:
         sv_hld = proj.get('SV', 0) + proj.get('HD', 0)
 
         # Tiered SV+HLD scoring - only elite closers get high scores
-        if sv_hld >= 35:
-            sv_hld_score = 90 + (sv_hld - 35) * 2  # Elite closers: 90-100
-        elif sv_hld >= 25:
-            sv_hld_score = 60 + (sv_hld - 25) * 3  # Good closers: 60-90
-        elif sv_hld >= 15:
-            sv_hld_score = 30 + (sv_hld - 15) * 3  # Setup men: 30-60
-        else:
-            sv_hld_score = sv_hld * 2  # Low leverage: 0-30
+        # (elite closers 90-100, good closers 60-90, setup men 30-60, low leverage 0-30)
+        sv_hld_score = RP_SV_HLD_CURVE.at(sv_hld)
 
-        value += sv_hld_score * 0.35  # SV+HLD is primary RP value
+        rp_weights = DynastyValueCalculator.RELIEVER_WEIGHTS
+        value += sv_hld_score * rp_weights['sv_hld']  # SV+HLD is primary RP value
 
         # Strikeouts (less weight - RPs have fewer opportunities)
-        k_score = min((proj['K'] / 90) * 60, 70)  # Cap at 70
-        value += k_score * 0.20
-
-        # ERA
-        era_score = max(70 - ((proj['ERA'] - 2.50) * 20), 20)
-        value += era_score * 0.18
+        value += RP_K_CURVE.at(proj['K']) * rp_weights['k']  # Capped at 70
 
-        # WHIP
-        whip_score = max(70 - ((proj['WHIP'] - 1.00) * 40), 20)
-        value += whip_score * 0.15
+        # ERA and WHIP (floored at 20)
+        value += RP_ERA_CURVE.at(proj['ERA']) * rp_weights['era']
+        value += RP_WHIP_CURVE.at(proj['WHIP']) * rp_weights['whip']
 
-        # K rate bonus for high-K relievers
+        # K rate bonus for high-K relievers (+4 at 1.1 K/IP, +8 at 1.3)
         k_per_ip = proj['K'] / proj['IP'] if proj['IP'] > 0 else 0
-        if k_per_ip >= 1.3:
-            value += 8
-        elif k_per_ip >= 1.1:
-            value += 4
+        value += RP_K_RATE_BONUS.at(k_per_ip)
 
         # Tiered reliever discount based on SV+HD
-        # Elite relievers (closers and high-hold setup men) get reduced/no discount
-        if sv_hld >= 30:
-            # Elite: No RP discount
-            rp_discount = 1.0
-            dynasty_relief = 1.15  # +15% to offset harsh dynasty pitcher discount
-        elif sv_hld >= 20:
-            # High leverage: Reduced discount
-            rp_discount = 0.92
-            dynasty_relief = 1.08  # +8% dynasty relief
-        else:
-            # Low leverage: Standard discount
-            rp_discount = 0.85
-            dynasty_relief = 1.0  # No relief
-
-        value = value * rp_discount
+        # Elite relievers (closers and high-hold setup men) get reduced/no discount,
+        # plus dynasty relief to offset the harsh dynasty pitcher discount
+        value = value * RP_LEVERAGE_DISCOUNT.at(sv_hld)
+        dynasty_relief = RP_DYNASTY_RELIEF.at(sv_hld)
 
         # Apply dynasty adjustments (age, prospect status) - same as SP and hitters
         value = DynastyValueCalculator._apply_dynasty_adjustments(player, value, is_hitter=False)
@@ -7776,76 +8093,27 @@ class DynastyValueCalculator:
         # Apply pitcher dynasty discount - pitchers are heavily discounted in dynasty formats
         # due to injury risk, volatility, and shorter careers
         # Pitchers peak 27-31, so discount tiers are adjusted accordingly
+        # (0.80 through 24 for young elite arms like Skenes, 0.65 through 31, then
+        # the full DYNASTY_PITCHER_DISCOUNT for 32+ and unknown ages)
         if not is_hitter:
-            if player.age > 0 and player.age <= 24:
-                value *= 0.80  # Reduced discount for young elite pitchers (Skenes, etc.)
-            elif player.age > 0 and player.age <= 31:
-                value *= 0.65  # Moderate discount for prime-age pitchers (peak years)
-            else:
-                value *= DYNASTY_PITCHER_DISCOUNT  # Full discount for 32+ pitchers
+            value *= PITCHER_AGE_DISCOUNT.at(player.age)
 
         bonus_multiplier = 1.0  # Track bonuses to cap stacking
 
         # Age adjustments - Dynasty leagues value youth but elite veterans still have significant value
         # Calibration against FHQ/HKB consensus shows we need moderate decline, not extreme
         # Young players have longest runway, older players decline but elite production matters
-        if player.age > 0:
-            if is_hitter:
-                # Hitter age curve - peak 25-28, decline starts at 29
-                if player.age <= 19:
-                    bonus_multiplier += 0.20  # Extreme youth premium
-                elif player.age <= 21:
-                    bonus_multiplier += 0.15  # Youth premium
-                elif player.age <= 24:
-                    bonus_multiplier += 0.10  # Approaching prime
-                elif player.age <= 26:
-                    bonus_multiplier += 0.00  # Peak prime years (baseline)
-                elif player.age <= 28:
-                    bonus_multiplier -= 0.10  # Late prime, slight decline
-                elif player.age <= 30:
-                    bonus_multiplier -= 0.22  # Post-prime, moderate decline
-                elif player.age <= 32:
-                    bonus_multiplier -= 0.35  # Early 30s (Judge, Ramirez still elite)
-                elif player.age <= 34:
-                    bonus_multiplier -= 0.50  # Mid 30s decline (Betts, Harper)
-                elif player.age <= 36:
-                    bonus_multiplier -= 0.65  # Late 30s (Freeman)
-                else:  # 37+
-                    bonus_multiplier -= 0.78  # End of career
-            else:
-                # Pitcher age curve - peak 27-31, decline starts at 32
-                # Pitchers peak later than hitters and elite arms maintain into early 30s
-                if player.age <= 19:
-                    bonus_multiplier += 0.20  # Extreme youth premium
-                elif player.age <= 21:
-                    bonus_multiplier += 0.15  # Youth premium
-                elif player.age <= 24:
-                    bonus_multiplier += 0.10  # Young arm developing
-                elif player.age <= 27:
-                    bonus_multiplier += 0.05  # Entering prime
-                elif player.age <= 31:
-                    bonus_multiplier += 0.00  # Peak prime years (baseline) - extended for pitchers
-                elif player.age <= 33:
-                    bonus_multiplier -= 0.15  # Early 30s, slight decline
-                elif player.age <= 35:
-                    bonus_multiplier -= 0.35  # Mid 30s decline
-                elif player.age <= 37:
-                    bonus_multiplier -= 0.55  # Late 30s
-                else:  # 38+
-                    bonus_multiplier -= 0.75  # End of career
+        # Hitters peak 25-26 and decline from 27 (HITTER_AGE_BONUS: +20% at 19 down
+        # to -78% at 37+); pitchers peak 27-31 and hold into their early 30s
+        # (PITCHER_AGE_BONUS: +20% at 19 down to -75% at 38+). Unknown ages get 0.
+        if is_hitter:
+            bonus_multiplier += HITTER_AGE_BONUS.at(player.age)
+        else:
+            bonus_multiplier += PITCHER_AGE_BONUS.at(player.age)
 
         # Position scarcity (for hitters) - small adjustments
         if is_hitter:
-            pos_bonus = 0
-            if 'C' in player.position:
-                pos_bonus = 0.06  # Catchers are scarce
-            elif 'SS' in player.position:
-                pos_bonus = 0.03
-            elif '2B' in player.position:
-                pos_bonus = 0.02
-            elif '1B' in player.position:
-                pos_bonus = -0.02
-            bonus_multiplier += pos_bonus
+            bonus_multiplier += DynastyValueCalculator.position_scarcity_bonus(player.position)
 
         # Cap the total bonus/penalty - floor at 0.15 allows steep age decline for 35+ veterans
         bonus_multiplier = max(0.15, min(bonus_multiplier, 1.25))
@@ -7900,30 +8168,8 @@ class DynastyValueCalculator:
         if player.name in PROSPECT_RANKINGS:
             rank = PROSPECT_RANKINGS[player.name]
 
-            # Tiered prospect valuation - calibrated for dynasty league value
-            if rank <= 0 or rank > 300:
-                return 0.5
-            elif rank <= 5:
-                # Top 5: 63 at rank 1, 55 at rank 5
-                return 63 - (rank - 1) * 2.0
-            elif rank <= 10:
-                # Top 10: 53 at rank 6, 48 at rank 10
-                return 53 - (rank - 6) * 1.25
-            elif rank <= 25:
-                # 11-25: 46 at rank 11, 36 at rank 25
-                return 46 - (rank - 11) * 0.714
-            elif rank <= 50:
-                # 26-50: 35 at rank 26, 25 at rank 50
-                return 35 - (rank - 26) * 0.417
-            elif rank <= 100:
-                # 51-100: 24 at rank 51, 15 at rank 100
-                return 24 - (rank - 51) * 0.184
-            elif rank <= 200:
-                # 101-200: 14 at rank 101, 6 at rank 200
-                return 14 - (rank - 101) * 0.081
-            else:
-                # 201-300: 5 at rank 201, 2 at rank 300
-                return 5 - (rank - 201) * 0.030
+            # Tiered prospect valuation (PROSPECT_VALUE_TABLE)
+            return get_prospect_value(rank)
 
         # Check projections first to handle two-way players (like Ohtani)
         in_hitter_proj = player.name in HITTER_PROJECTIONS
@@ -7981,140 +8227,1579 @@ class DynastyValueCalculator:
 
         consensus_rank = CONSENSUS_RANKINGS[player_name]
 
-        # Estimate what rank our value implies
-        # Using rough scale: value 100+ = top 5, 90 = top 10, 80 = top 20, etc.
-        # This is approximate and based on our value distribution
-        if base_value >= 100:
-            implied_rank = max(1, 5 - (base_value - 100) / 5)
-        elif base_value >= 85:
-            implied_rank = 5 + (100 - base_value) * 1.0  # 85-100 maps to ranks 5-20
-        elif base_value >= 70:
-            implied_rank = 20 + (85 - base_value) * 2.0  # 70-85 maps to ranks 20-50
-        elif base_value >= 55:
-            implied_rank = 50 + (70 - base_value) * 3.0  # 55-70 maps to ranks 50-95
-        elif base_value >= 40:
-            implied_rank = 95 + (55 - base_value) * 4.0  # 40-55 maps to ranks 95-155
-        else:
-            implied_rank = 155 + (40 - base_value) * 5.0  # Below 40 maps to 155+
-
+        # Estimate what rank our value implies (CONSENSUS_IMPLIED_RANK)
+        # Using rough scale: value 100+ = top 5, 85-100 = ranks 5-20, 70-85 = 20-50,
+        # 55-70 = 50-95, 40-55 = 95-155, below 40 = 155+
+        implied_rank = CONSENSUS_IMPLIED_RANK.at(base_value)
         rank_diff = implied_rank - consensus_rank  # Positive = we rank lower than consensus
 
-        # Determine correction strength
-        abs_diff = abs(rank_diff)
-        if abs_diff <= 15:
-            # Within tolerance - no adjustment
-            return base_value
-        elif abs_diff <= 40:
-            # Moderate deviation - 25% correction
-            correction_strength = 0.25
-        else:
-            # Large deviation - 50% correction
-            correction_strength = 0.50
+        # Determine correction strength: none within 15 ranks, 25% up to 40, else 50%
+        correction_strength = CONSENSUS_CORRECTION.at(abs(rank_diff))
+        if correction_strength == 0:
+            return base_value  # Within tolerance - no adjustment
 
         # Calculate target value based on consensus rank
-        # Inverse of the implied_rank calculation
-        if consensus_rank <= 5:
-            target_value = 100 + (5 - consensus_rank) * 5
-        elif consensus_rank <= 20:
-            target_value = 100 - (consensus_rank - 5) * 1.0
-        elif consensus_rank <= 50:
-            target_value = 85 - (consensus_rank - 20) / 2.0
-        elif consensus_rank <= 95:
-            target_value = 70 - (consensus_rank - 50) / 3.0
-        elif consensus_rank <= 155:
-            target_value = 55 - (consensus_rank - 95) / 4.0
-        else:
-            target_value = 40 - (consensus_rank - 155) / 5.0
-
-        target_value = max(target_value, 10)  # Floor of 10
+        # Inverse of the implied_rank curve (CONSENSUS_TARGET_VALUE, floor of 10)
+        target_value = CONSENSUS_TARGET_VALUE.at(consensus_rank)
 
         # Apply correction: blend base_value toward target_value
         adjusted_value = base_value + (target_value - base_value) * correction_strength
 
         return adjusted_value
-    
+
+    # ------------------------------------------------------------------
+    # Vectorized batch valuation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def calculate_values_batch(players: List[Player], actual_stats: Dict[str, dict] = None) -> np.ndarray:
+        """Value many players in one vectorized pass.
+
+        Produces exactly what calculate_player_value returns for each player, but
+        every category curve is evaluated over the whole batch from the breakpoint
+        tables above, so scoring the league + FA pool + prospect universe costs one
+        Python pass to gather inputs plus a handful of array ops.
+
+        Args:
+            players: Player objects to value
+            actual_stats: Optional player_name -> actual in-season stats mapping
+        Returns:
+            float array of dynasty values aligned with `players`
+        """
+        n = len(players)
+        values = np.zeros(n)
+        if n == 0:
+            return values
+        cols, base = DynastyValueCalculator._base_values_batch(players, actual_stats)
+
+        # Ranked prospects return their prospect value directly
+        is_prospect = cols['prospect_rank'] > -np.inf
+        values[is_prospect] = PROSPECT_VALUE_CURVE.evaluate(cols['prospect_rank'][is_prospect])
+        rest = ~is_prospect
+
+        final = DynastyValueCalculator._consensus_adjustment_batch(cols, base)
+        final = final * cols['veteran_boost']
+        values[rest] = final[rest]
+        return values
+
+    @staticmethod
+    def _base_values_batch(players: List[Player], actual_stats: Dict[str, dict] = None) -> Tuple[dict, np.ndarray]:
+        """(batch columns, projection-based value before the consensus pull and veteran boost).
+
+        Entries for ranked prospects are 0 - they are valued from their rank alone.
+        """
+        n = len(players)
+        cols = DynastyValueCalculator._batch_columns(players)
+        is_prospect = cols['prospect_rank'] > -np.inf
+
+        in_hitter = cols['has_hitter_proj']
+        in_pitcher = cols['has_rp_proj'] | cols['has_sp_proj']
+        pitcher_fallback = cols['is_pitcher'] & ~in_hitter & ~in_pitcher
+        rest = ~is_prospect
+        need_hitter = rest & (in_hitter | (~in_pitcher & ~pitcher_fallback))
+        need_pitcher = rest & (in_pitcher | pitcher_fallback)
+
+        hitter_vals = np.zeros(n)
+        pitcher_vals = np.zeros(n)
+        idx = np.flatnonzero(need_hitter)
+        if len(idx):
+            hitter_vals[idx] = DynastyValueCalculator._hitter_values_batch(cols, idx, actual_stats)
+        idx = np.flatnonzero(need_pitcher)
+        if len(idx):
+            pitcher_vals[idx] = DynastyValueCalculator._pitcher_values_batch(cols, idx)
+
+        base = np.where(need_hitter, hitter_vals, pitcher_vals)
+        two_way = rest & in_hitter & in_pitcher
+        if two_way.any():
+            primary = np.maximum(hitter_vals[two_way], pitcher_vals[two_way])
+            secondary = np.minimum(hitter_vals[two_way], pitcher_vals[two_way])
+            base[two_way] = primary + (secondary * 0.40) + (primary * 0.10)
+        return cols, base
+
+    @staticmethod
+    def _batch_columns(players: List[Player]) -> Dict[str, np.ndarray]:
+        """Gather per-player inputs for the vectorized valuation (one comprehension per column)."""
+        names = [p.name for p in players]
+        age = np.array([p.age for p in players], dtype=float)
+        fantrax_rank = np.array([getattr(p, 'fantrax_rank', 1) for p in players], dtype=float)
+        fantrax_score = np.array([getattr(p, 'fantrax_score', 100) for p in players], dtype=float)
+        positions = [p.position for p in players]
+
+        # -inf = not a ranked prospect; nan = no consensus rank (or adjustment skipped)
+        prospect = [PROSPECT_RANKINGS.get(name) for name in names]
+        prospect_rank = np.array([-np.inf if r is None else r for r in prospect], dtype=float)
+        consensus_rank = DynastyValueCalculator.consensus_rank_column(names, prospect_rank)
+
+        hitter_projs = [HITTER_PROJECTIONS.get(name) for name in names]
+        sp_projs = [PITCHER_PROJECTIONS.get(name) for name in names]
+        rp_projs = [RELIEVER_PROJECTIONS.get(name) for name in names]
+        unproven_listed = np.array([name in UNPROVEN_PITCHERS for name in names], dtype=bool)
+
+        return {
+            'names': names,
+            'positions': positions,
+            'age': age,
+            'fantrax_rank': fantrax_rank,
+            'fantrax_score': fantrax_score,
+            'prospect_rank': prospect_rank,
+            'consensus_rank': consensus_rank,
+            'veteran_boost': np.array([PROVEN_VETERAN_STARS.get(name, 1.0) for name in names], dtype=float),
+            'elite_young_boost': np.array([ELITE_YOUNG_PLAYERS.get(name, 1.0) for name in names], dtype=float),
+            'unproven': unproven_listed | ((age >= 26) & (fantrax_score <= 5) & (fantrax_rank > 1000)),
+            'is_pitcher': np.array([p.is_pitcher() for p in players], dtype=bool),
+            'has_hitter_proj': np.array([proj is not None for proj in hitter_projs], dtype=bool),
+            'has_sp_proj': np.array([proj is not None for proj in sp_projs], dtype=bool),
+            'has_rp_proj': np.array([proj is not None for proj in rp_projs], dtype=bool),
+            'hitter_projs': hitter_projs,
+            'sp_projs': sp_projs,
+            'rp_projs': rp_projs,
+        }
+
+    @staticmethod
+    def _proj_columns(projs: List[dict], idx: np.ndarray, stats: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+        """Projection stats for players[idx] as one float column per stat."""
+        row = operator.itemgetter(*stats)
+        matrix = np.array([row(projs[i]) for i in idx.tolist()], dtype=float).reshape(len(idx), len(stats))
+        return {stat: matrix[:, j] for j, stat in enumerate(stats)}
+
+    @staticmethod
+    def _hitter_values_batch(cols: dict, idx: np.ndarray, actual_stats: Dict[str, dict] = None) -> np.ndarray:
+        """Vectorized calculate_hitter_value for players[idx]."""
+        values = np.zeros(len(idx))
+        has_proj = cols['has_hitter_proj'][idx]
+
+        sel = idx[has_proj]
+        if len(sel):
+            stats, scores = DynastyValueCalculator._hitter_category_scores(cols, sel)
+            weights = DynastyValueCalculator.HITTING_WEIGHTS
+            value = np.zeros(len(sel))
+            for cat, score in scores.items():
+                value += score * weights[cat]
+
+            young, boost = DynastyValueCalculator._young_hitter_boost(cols, sel, stats, actual_stats)
+            if young.any():
+                value = np.where(young, value * boost, value)
+            values[has_proj] = value
+
+        sel = idx[~has_proj]
+        if len(sel):
+            values[~has_proj] = cols['fantrax_score'][sel] * HITTER_FANTRAX_FALLBACK.evaluate(cols['fantrax_rank'][sel])
+
+        return DynastyValueCalculator._dynasty_adjustments_batch(cols, idx, values, is_hitter=True)
+
+    @staticmethod
+    def _hitter_category_scores(cols: dict, sel: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """Projection stats and per-category scores (keyed like HITTING_WEIGHTS) for hitters with projections."""
+        stats = DynastyValueCalculator._proj_columns(cols['hitter_projs'], sel, tuple(HITTER_CATEGORY_CURVES))
+        scores = {cat.lower(): HITTER_CATEGORY_CURVES[cat].evaluate(stats[cat])
+                  for cat in ('AVG', 'OPS', 'HR', 'R', 'RBI', 'SB', 'SO')}
+        return stats, scores
+
+    @staticmethod
+    def _young_hitter_boost(cols: dict, sel: np.ndarray, stats: Dict[str, np.ndarray],
+                            actual_stats: Dict[str, dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Elite young hitter boost on blended stats: (applies mask, boost multiplier).
+
+        Only players with an in-season line need the scalar blend.
+        """
+        ages = cols['age'][sel]
+        young = (ages > 0) & (ages <= 25)
+        boost = np.ones(len(sel))
+        if not young.any():
+            return young, boost
+        projs = cols['hitter_projs']
+        blend = {cat: stats[cat].copy() for cat in ('HR', 'SB', 'AVG', 'RBI')}
+        if actual_stats:
+            for j in np.flatnonzero(young):
+                name = cols['names'][sel[j]]
+                actual = actual_stats.get(name)
+                if actual:
+                    proj = projs[sel[j]]
+                    blended = get_blended_hitter_stats(name, proj, actual)
+                    for cat in blend:
+                        blend[cat][j] = blended.get(cat, proj[cat])
+        tiers = (ELITE_HR_BOOST.evaluate(blend['HR']), ELITE_SB_BOOST.evaluate(blend['SB']),
+                 ELITE_AVG_BOOST.evaluate(blend['AVG']), ELITE_RBI_BOOST.evaluate(blend['RBI']))
+        elite_categories = np.zeros(len(sel), dtype=int)
+        for tier in tiers:
+            boost = boost + tier
+            elite_categories += tier > 0
+        boost = np.where(elite_categories >= 2, boost + 0.05, boost)
+        boost = np.minimum(boost, 1.25)
+        return young, boost
+
+    @staticmethod
+    def _pitcher_values_batch(cols: dict, idx: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_pitcher_value (reliever, starter and Fantrax fallback paths)."""
+        values = np.zeros(len(idx))
+        is_rp = cols['has_rp_proj'][idx]
+        is_sp = ~is_rp & cols['has_sp_proj'][idx]
+        fallback = ~is_rp & ~is_sp
+
+        if is_sp.any():
+            values[is_sp] = DynastyValueCalculator._sp_values_batch(cols, idx[is_sp])
+        if is_rp.any():
+            values[is_rp] = DynastyValueCalculator._reliever_values_batch(cols, idx[is_rp])
+        if fallback.any():
+            sel = idx[fallback]
+            value = cols['fantrax_score'][sel] * PITCHER_FANTRAX_FALLBACK.evaluate(cols['fantrax_rank'][sel])
+            is_reliever = np.array(['RP' in cols['positions'][i] for i in sel.tolist()], dtype=bool)
+            value = np.where(is_reliever, value * 0.70, value)
+            values[fallback] = DynastyValueCalculator._dynasty_adjustments_batch(cols, sel, value, is_hitter=False)
+        return values
+
+    @staticmethod
+    def _sp_values_batch(cols: dict, idx: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_sp_value."""
+        scores = DynastyValueCalculator._sp_category_scores(cols, idx)
+        weights = DynastyValueCalculator.PITCHING_WEIGHTS
+        value = scores['k'] * weights['k']
+        for cat in ('era', 'whip', 'qs', 'k_bb', 'l'):
+            value += scores[cat] * weights[cat]
+
+        value = DynastyValueCalculator._dynasty_adjustments_batch(cols, idx, value, is_hitter=False)
+        return np.where(cols['unproven'][idx], value * 0.20, value)
+
+    @staticmethod
+    def _sp_category_scores(cols: dict, idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-category starter scores keyed like PITCHING_WEIGHTS."""
+        stats = DynastyValueCalculator._proj_columns(cols['sp_projs'], idx, ('K', 'ERA', 'WHIP', 'QS', 'L', 'IP'))
+        k, era, whip, qs, losses, ip = (stats[s] for s in ('K', 'ERA', 'WHIP', 'QS', 'L', 'IP'))
+        ip = np.where(ip > 0, ip, 1.0)
+
+        # K/BB ratio - estimate BB from WHIP with a tiered H/9
+        est_hits = (SP_HITS_PER_9.evaluate(whip) * ip) / 9
+        est_bb = np.maximum((whip * ip) - est_hits, ip * 0.15)
+        k_bb_ratio = np.where(est_bb > 0, k / np.where(est_bb > 0, est_bb, 1.0), 5.0)
+        return {
+            'k': np.minimum((k / 190) * 100, 115),
+            'era': np.minimum((3.80 / np.maximum(era, 2.50)) * 75, 115),
+            'whip': np.minimum((1.18 / np.maximum(whip, 0.90)) * 75, 115),
+            'qs': np.minimum((qs / 18) * 100, 115),
+            'k_bb': np.minimum((k_bb_ratio / 3.5) * 85, 115),
+            'l': np.maximum(100 - ((losses / 9) * 40), 40),
+        }
+
+    @staticmethod
+    def _reliever_values_batch(cols: dict, idx: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_reliever_value."""
+        scores, k_rate_bonus, sv_hld = DynastyValueCalculator._reliever_category_scores(cols, idx)
+        weights = DynastyValueCalculator.RELIEVER_WEIGHTS
+        value = scores['sv_hld'] * weights['sv_hld']
+        for cat in ('k', 'era', 'whip'):
+            value += scores[cat] * weights[cat]
+        value += k_rate_bonus
+
+        value = value * RP_LEVERAGE_DISCOUNT.evaluate(sv_hld)
+        value = DynastyValueCalculator._dynasty_adjustments_batch(cols, idx, value, is_hitter=False)
+        value = value * RP_DYNASTY_RELIEF.evaluate(sv_hld)
+        return np.where(cols['unproven'][idx], value * 0.20, value)
+
+    @staticmethod
+    def _reliever_category_scores(cols: dict, idx: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray]:
+        """Per-category reliever scores keyed like RELIEVER_WEIGHTS, plus the K-rate bonus and SV+HLD."""
+        projs = cols['rp_projs']
+        sv_hld = np.array([projs[i].get('SV', 0) + projs[i].get('HD', 0) for i in idx.tolist()], dtype=float)
+        stats = DynastyValueCalculator._proj_columns(projs, idx, ('K', 'ERA', 'WHIP', 'IP'))
+        k, ip = stats['K'], stats['IP']
+        k_per_ip = np.where(ip > 0, k / np.where(ip > 0, ip, 1.0), 0.0)
+        scores = {
+            'sv_hld': RP_SV_HLD_CURVE.evaluate(sv_hld),
+            'k': RP_K_CURVE.evaluate(k),
+            'era': RP_ERA_CURVE.evaluate(stats['ERA']),
+            'whip': RP_WHIP_CURVE.evaluate(stats['WHIP']),
+        }
+        return scores, RP_K_RATE_BONUS.evaluate(k_per_ip), sv_hld
+
+    @staticmethod
+    def _dynasty_adjustments_batch(cols: dict, idx: np.ndarray, values: np.ndarray, is_hitter: bool) -> np.ndarray:
+        """Vectorized _apply_dynasty_adjustments."""
+        ages = cols['age'][idx]
+        if not is_hitter:
+            values = values * PITCHER_AGE_DISCOUNT.evaluate(ages)
+            bonus = 1.0 + PITCHER_AGE_BONUS.evaluate(ages)
+        else:
+            bonus = 1.0 + HITTER_AGE_BONUS.evaluate(ages)
+            positions = cols['positions']
+            scarcity = DynastyValueCalculator.position_scarcity_bonus
+            bonus = bonus + np.array([scarcity(positions[i]) for i in idx.tolist()], dtype=float)
+        bonus = np.maximum(0.15, np.minimum(bonus, 1.25))
+        values = values * bonus
+        return values * cols['elite_young_boost'][idx]
+
+    @staticmethod
+    def consensus_rank_column(names: List[str], prospect_rank: np.ndarray = None) -> np.ndarray:
+        """CONSENSUS_RANKINGS per name; nan where there is none or the player is a top-100 prospect."""
+        if prospect_rank is None:
+            prospect_rank = np.array([PROSPECT_RANKINGS.get(name, -np.inf) for name in names], dtype=float)
+        consensus = np.array([CONSENSUS_RANKINGS.get(name, np.nan) for name in names], dtype=float)
+        consensus[(prospect_rank > -np.inf) & (prospect_rank <= 100)] = np.nan
+        return consensus
+
+    @staticmethod
+    def adjust_to_consensus(base_values, consensus_ranks) -> np.ndarray:
+        """Vectorized consensus pull: implied rank, correction tier and target value for whole arrays.
+
+        consensus_ranks is nan where no adjustment applies. Broadcasts, so an
+        (n, K) block of base values can share one (n, 1) rank column. Matches
+        _apply_consensus_adjustment exactly.
+        """
+        base_values = np.asarray(base_values, dtype=float)
+        consensus = np.asarray(consensus_ranks, dtype=float)
+        eligible = ~np.isnan(consensus)
+        consensus = np.where(eligible, consensus, 0.0)
+        implied_rank = CONSENSUS_IMPLIED_RANK.evaluate(base_values)
+        strength = CONSENSUS_CORRECTION.evaluate(np.abs(implied_rank - consensus))
+        target = CONSENSUS_TARGET_VALUE.evaluate(consensus)
+        adjusted = base_values + (target - base_values) * strength
+        return np.where(eligible & (strength > 0), adjusted, base_values)
+
+    @staticmethod
+    def apply_consensus_adjustment_batch(names: List[str], base_values) -> np.ndarray:
+        """Batch _apply_consensus_adjustment: final values for parallel names / base values."""
+        return DynastyValueCalculator.adjust_to_consensus(
+            base_values, DynastyValueCalculator.consensus_rank_column(names))
+
+    @staticmethod
+    def _consensus_adjustment_batch(cols: dict, base_values: np.ndarray, consensus: np.ndarray = None) -> np.ndarray:
+        """adjust_to_consensus on batch columns (`consensus` overrides cols['consensus_rank'])."""
+        if consensus is None:
+            consensus = cols['consensus_rank']
+        return DynastyValueCalculator.adjust_to_consensus(base_values, consensus)
+
     @staticmethod
     def calculate_pick_value(pick: str) -> float:
         """Calculate draft pick value based on format.
 
-        Formats supported:
-        - "1.03", "2.07" etc. (round.pickposition format used internally)
-        - "2026 1st Round Pick 1 (#1)" through "2026 4th Round Pick 12 (#48)"
-        - "2027 1st Round Pick", "2027 2nd Round Pick", etc.
+        The string is parsed once (parse_pick_key, cached) and the value read
+        from PICK_VALUE_TABLE; see parse_pick_key for the supported formats.
         """
-        import re
-
-        # Base values by round (12-team league)
-        # Values scaled to match prospect/player valuations
-        # 1st round: ~30 base (top pick ~35, last ~26)
-        # 2nd round: ~18 base (top ~21, last ~16)
-        # 3rd round: ~10 base (top ~12, last ~9)
-        # 4th round: ~5 base (top ~6, last ~4)
-        round_base_values = {1: 30, 2: 18, 3: 10, 4: 5}
-        round_name_values = {'1st': 30, '2nd': 18, '3rd': 10, '4th': 5}
-
-        # Check for "round.pick" format (e.g., "1.03", "2.07", "3.12")
-        round_pick_match = re.match(r'^(\d)\.(\d{2})$', pick)
-        if round_pick_match:
-            round_num = int(round_pick_match.group(1))
-            pick_in_round = int(round_pick_match.group(2))
-
-            base = round_base_values.get(round_num, 5)
-            # Position adjustment: pick 1 gets 1.15x, pick 12 gets 0.88x
-            position_mult = 1.15 - ((pick_in_round - 1) * 0.025)
-            value = base * position_mult
-
-            return round(value, 1)
-
-        # Try to extract overall pick number from (#N) format - most precise
-        overall_match = re.search(r'\(#(\d+)\)', pick)
-        if overall_match:
-            overall_pick = int(overall_match.group(1))
-            # Value based on overall pick position (1-48)
-            if overall_pick <= 12:  # 1st round
-                base = 30
-                position_mult = 1.15 - ((overall_pick - 1) * 0.025)
-            elif overall_pick <= 24:  # 2nd round
-                base = 18
-                position_mult = 1.15 - ((overall_pick - 13) * 0.025)
-            elif overall_pick <= 36:  # 3rd round
-                base = 10
-                position_mult = 1.15 - ((overall_pick - 25) * 0.025)
-            else:  # 4th round
-                base = 5
-                position_mult = 1.15 - ((overall_pick - 37) * 0.025)
-
-            value = base * position_mult
-
-            # Year adjustment for 2026 picks with specific numbers
-            if '2026' in pick:
-                value *= 1.05  # Small premium for known pick position
-
-            return round(value, 1)
-
-        # Fallback for picks without overall number (2027, 2028)
-        for round_name, base_value in round_name_values.items():
-            if round_name in pick:
-                value = base_value
+        key = parse_pick_key(pick)
+        if key is None:
+            return 5  # Unknown pick
+        value = PICK_VALUE_TABLE.get(key)
+        if value is None:
+            value = compute_pick_value(*key)  # Slot outside the 4x12 table
+        return value
+
+
+# ============================================================================
+# VALUE WEIGHT CONFIGURATION
+# ============================================================================
+# The weight sets above can be swapped at runtime for calibration. Dict weights
+# are updated in place so every reader (scalar and batch paths) sees the change
+# immediately; the pitcher discount curve and consensus ranks are rebuilt.
+
+VALUE_WEIGHT_SECTIONS = ('hitting', 'pitching', 'relief', 'position_scarcity',
+                         'dynasty_pitcher_discount', 'source_weights')
+
+
+def _weight_tables() -> Dict[str, dict]:
+    return {
+        'hitting': DynastyValueCalculator.HITTING_WEIGHTS,
+        'pitching': DynastyValueCalculator.PITCHING_WEIGHTS,
+        'relief': DynastyValueCalculator.RELIEVER_WEIGHTS,
+        'position_scarcity': DynastyValueCalculator.POSITION_SCARCITY,
+        'source_weights': SOURCE_WEIGHTS,
+    }
 
-                # Position adjustment if pick number present (e.g., "Pick 3")
-                pick_match = re.search(r'Pick\s+(\d+)(?:\s|$)', pick)
-                if pick_match:
-                    pick_num = int(pick_match.group(1))
-                    position_mult = 1.15 - ((pick_num - 1) * 0.025)
-                    value *= position_mult
 
-                # Year adjustments - closer picks worth more
-                if '2026' in pick:
-                    value *= 1.05
-                elif '2027' in pick:
-                    value *= 0.90  # Future uncertainty discount
-                elif '2028' in pick:
-                    value *= 0.75  # Greater uncertainty
+def get_value_weights() -> dict:
+    """Snapshot of every tunable valuation weight."""
+    weights = {section: dict(table) for section, table in _weight_tables().items()}
+    weights['dynasty_pitcher_discount'] = DYNASTY_PITCHER_DISCOUNT
+    return weights
 
-                return round(value, 1)
 
-        return 5  # Unknown pick
+DEFAULT_VALUE_WEIGHTS = get_value_weights()
+
+
+def _check_weight(label: str, value, low: float, high: float) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{label} must be a number")
+    if not low <= value <= high:
+        raise ValueError(f"{label} must be between {low} and {high}")
+    return float(value)
+
+
+def set_value_weights(updates: dict, replace: bool = False) -> dict:
+    """Apply a (partial) weight set and return the previous weights.
+
+    updates: e.g. {"hitting": {"hr": 0.18}, "dynasty_pitcher_discount": 0.6}.
+    Category keys must already exist, except position_scarcity (new positions
+    rank last) and source_weights (any loaded consensus source). replace=True
+    makes each given table exactly the given dict, so a hitting, pitching or
+    relief table must then list every category. Everything is validated
+    before anything changes; invalid input raises ValueError.
+    """
+    global DYNASTY_PITCHER_DISCOUNT, PITCHER_AGE_DISCOUNT
+    if not isinstance(updates, dict):
+        raise ValueError("weights must be an object")
+    unknown = set(updates) - set(VALUE_WEIGHT_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown weight sections: {', '.join(sorted(unknown))}")
+
+    tables = _weight_tables()
+    staged = {}
+    for section, values in updates.items():
+        if section == 'dynasty_pitcher_discount':
+            staged[section] = _check_weight(section, values, 0.05, 1.5)
+            continue
+        if not isinstance(values, dict):
+            raise ValueError(f"{section} must be an object of key -> weight")
+        table = tables[section]
+        low, high = (-0.5, 0.5) if section == 'position_scarcity' else (0.0, 1.0)
+        for key, value in values.items():
+            if section == 'source_weights':
+                if key not in CONSENSUS_SOURCES:
+                    raise ValueError(f"Unknown consensus source: {key}")
+            elif section != 'position_scarcity' and key not in table:
+                raise ValueError(f"Unknown {section} weight: {key}")
+            _check_weight(f"{section}.{key}", value, low, high)
+        if replace and section in ('hitting', 'pitching', 'relief'):
+            missing = set(DEFAULT_VALUE_WEIGHTS[section]) - set(values)
+            if missing:
+                raise ValueError(f"replace needs every {section} weight; missing: {', '.join(sorted(missing))}")
+        staged[section] = {key: float(value) for key, value in values.items()}
+
+    previous = get_value_weights()
+    for section, values in staged.items():
+        if section == 'dynasty_pitcher_discount':
+            DYNASTY_PITCHER_DISCOUNT = values
+            PITCHER_AGE_DISCOUNT = pitcher_age_discount_curve(values)
+            continue
+        if replace:
+            tables[section].clear()
+        tables[section].update(values)
+    if 'source_weights' in staged:
+        refresh_consensus_rankings()
+    return previous
+
+
+def reset_value_weights() -> dict:
+    """Restore the shipped weights; returns the weights that were active."""
+    return set_value_weights(DEFAULT_VALUE_WEIGHTS, replace=True)
+
+
+# ============================================================================
+# WEIGHT SENSITIVITY
+# ============================================================================
+
+class WeightSensitivity:
+    """Value a fixed set of players under many weight vectors at once.
+
+    The weight-independent inputs of calculate_values_batch (category scores,
+    age and boost factors, Fantrax fallbacks, per-source consensus ranks) are
+    gathered once. A block of K weight vectors then costs a few (n x K) matrix
+    products and curve evaluations. Parameters are the flattened
+    get_value_weights() entries: 'hitting.hr', 'dynasty_pitcher_discount',
+    'source_weights.FHQ', ...
+    """
+
+    GROUPS = ('hitting', 'pitching', 'relief', 'position_scarcity', 'source_weights')
+
+    def __init__(self, players: List[Player], actual_stats: Dict[str, dict] = None):
+        self.players = players
+        self.n = n = len(players)
+        cols = DynastyValueCalculator._batch_columns(players)
+        self._cols = cols
+
+        weights = get_value_weights()
+        weights['source_weights'] = {source: weights['source_weights'].get(source, DEFAULT_SOURCE_WEIGHT)
+                                     for source in CONSENSUS_MATRIX.sources}
+        self.params: List[str] = []
+        self._slices: Dict[str, slice] = {}
+        base = []
+        for group in self.GROUPS:
+            start = len(self.params)
+            for key, value in weights[group].items():
+                self.params.append(f"{group}.{key}")
+                base.append(value)
+            self._slices[group] = slice(start, len(self.params))
+        self._discount = len(self.params)
+        self.params.append('dynasty_pitcher_discount')
+        base.append(weights['dynasty_pitcher_discount'])
+        self.base_vector = np.array(base, dtype=float)
+
+        # Same routing as calculate_values_batch
+        self._is_prospect = cols['prospect_rank'] > -np.inf
+        self._prospect_value = np.zeros(n)
+        self._prospect_value[self._is_prospect] = PROSPECT_VALUE_CURVE.evaluate(cols['prospect_rank'][self._is_prospect])
+        in_hitter = cols['has_hitter_proj']
+        in_pitcher = cols['has_rp_proj'] | cols['has_sp_proj']
+        pitcher_fallback = cols['is_pitcher'] & ~in_hitter & ~in_pitcher
+        rest = ~self._is_prospect
+        self._need_hitter = rest & (in_hitter | (~in_pitcher & ~pitcher_fallback))
+        self._two_way = rest & in_hitter & in_pitcher
+        ages = cols['age']
+
+        # Hitters: category scores, young boost, fallback, age bonus, scarcity one-hot
+        self._hitter_scores = np.zeros((n, len(weights['hitting'])))
+        self._young = np.zeros(n, dtype=bool)
+        self._young_boost = np.ones(n)
+        sel = np.flatnonzero(in_hitter)
+        if len(sel):
+            stats, scores = DynastyValueCalculator._hitter_category_scores(cols, sel)
+            self._hitter_scores[sel] = np.column_stack([scores[key] for key in weights['hitting']])
+            young, boost = DynastyValueCalculator._young_hitter_boost(cols, sel, stats, actual_stats)
+            self._young[sel], self._young_boost[sel] = young, boost
+        self._hitter_fallback = cols['fantrax_score'] * HITTER_FANTRAX_FALLBACK.evaluate(cols['fantrax_rank'])
+        self._hitter_bonus = 1.0 + HITTER_AGE_BONUS.evaluate(ages)
+        self._scarcity = np.zeros((n, len(weights['position_scarcity'])))
+        for i, position in enumerate(cols['positions']):
+            for j, pos in enumerate(weights['position_scarcity']):
+                if pos in position:
+                    self._scarcity[i, j] = 1.0
+                    break
+
+        # Pitchers: starter/reliever scores and multipliers, fallback, age factors
+        self._is_rp = cols['has_rp_proj']
+        self._is_sp = ~self._is_rp & cols['has_sp_proj']
+        self._sp_scores = np.zeros((n, len(weights['pitching'])))
+        sel = np.flatnonzero(self._is_sp)
+        if len(sel):
+            scores = DynastyValueCalculator._sp_category_scores(cols, sel)
+            self._sp_scores[sel] = np.column_stack([scores[key] for key in weights['pitching']])
+        self._rp_scores = np.zeros((n, len(weights['relief'])))
+        self._rp_bonus = np.zeros(n)
+        self._rp_leverage = np.ones(n)
+        self._rp_relief = np.ones(n)
+        sel = np.flatnonzero(self._is_rp)
+        if len(sel):
+            scores, k_rate_bonus, sv_hld = DynastyValueCalculator._reliever_category_scores(cols, sel)
+            self._rp_scores[sel] = np.column_stack([scores[key] for key in weights['relief']])
+            self._rp_bonus[sel] = k_rate_bonus
+            self._rp_leverage[sel] = RP_LEVERAGE_DISCOUNT.evaluate(sv_hld)
+            self._rp_relief[sel] = RP_DYNASTY_RELIEF.evaluate(sv_hld)
+        is_reliever = np.array(['RP' in position for position in cols['positions']], dtype=bool)
+        fallback = cols['fantrax_score'] * PITCHER_FANTRAX_FALLBACK.evaluate(cols['fantrax_rank'])
+        self._pitcher_fallback = np.where(is_reliever, fallback * 0.70, fallback)
+        # The 0-24 and 25-31 discount tiers are fixed; unknown ages and 32+ take the tunable discount
+        self._uses_discount = (ages <= 0) | (ages > 31)
+        self._fixed_discount = pitcher_age_discount_curve(0.0).evaluate(ages)
+        self._pitcher_bonus = np.maximum(0.15, np.minimum(1.0 + PITCHER_AGE_BONUS.evaluate(ages), 1.25))
+
+        # Consensus: player x source rank matrix and eligibility mask (top-100 prospects skip the pull)
+        ranks, mask = CONSENSUS_MATRIX.lookup(cols['names'])
+        self._source_ranks, self._source_mask = ranks, mask.astype(float)
+        prospect_rank = cols['prospect_rank']
+        self._source_mask[(prospect_rank > -np.inf) & (prospect_rank <= 100)] = 0.0
+
+    def values(self, weight_vectors: np.ndarray) -> np.ndarray:
+        """(n, K) player values for K parameter vectors (rows of weight_vectors)."""
+        W = np.atleast_2d(np.asarray(weight_vectors, dtype=float))
+        cols = self._cols
+        ey = cols['elite_young_boost'][:, None]
+
+        hit = self._hitter_scores @ W[:, self._slices['hitting']].T
+        hit = np.where(self._young[:, None], hit * self._young_boost[:, None], hit)
+        hit = np.where(cols['has_hitter_proj'][:, None], hit, self._hitter_fallback[:, None])
+        bonus = self._hitter_bonus[:, None] + self._scarcity @ W[:, self._slices['position_scarcity']].T
+        hit = hit * np.maximum(0.15, np.minimum(bonus, 1.25)) * ey
+
+        discount = np.where(self._uses_discount[:, None], W[:, self._discount][None, :], self._fixed_discount[:, None])
+        pitcher_factor = discount * self._pitcher_bonus[:, None]
+        unproven = cols['unproven'][:, None]
+        sp = self._sp_scores @ W[:, self._slices['pitching']].T
+        sp = sp * pitcher_factor * ey
+        sp = np.where(unproven, sp * 0.20, sp)
+        rp = self._rp_scores @ W[:, self._slices['relief']].T + self._rp_bonus[:, None]
+        rp = rp * self._rp_leverage[:, None] * pitcher_factor * ey * self._rp_relief[:, None]
+        rp = np.where(unproven, rp * 0.20, rp)
+        fallback = self._pitcher_fallback[:, None] * pitcher_factor * ey
+        pitch = np.where(self._is_rp[:, None], rp, np.where(self._is_sp[:, None], sp, fallback))
+
+        base = np.where(self._need_hitter[:, None], hit, pitch)
+        if self._two_way.any():
+            tw = self._two_way
+            primary = np.maximum(hit[tw], pitch[tw])
+            secondary = np.minimum(hit[tw], pitch[tw])
+            base[tw] = primary + (secondary * 0.40) + (primary * 0.10)
+
+        source_weights = W[:, self._slices['source_weights']].T
+        total_weight = self._source_mask @ source_weights
+        with np.errstate(invalid='ignore', divide='ignore'):
+            consensus = np.where(total_weight > 0,
+                                 ((self._source_ranks * self._source_mask) @ source_weights) / total_weight, np.nan)
+        final = DynastyValueCalculator.adjust_to_consensus(base, consensus)
+        final = final * cols['veteran_boost'][:, None]
+        return np.where(self._is_prospect[:, None], self._prospect_value[:, None], final)
+
+    def perturb(self, samples: int, sigma: float = 0.25, seed: int = 0,
+                normalize: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Random parameter vectors around the current weights: (vectors, standard-normal draws).
+
+        Weights scale by exp(sigma * z); scarcity bonuses shift by sigma * 0.05 * z.
+        normalize keeps each category group's weight sum fixed, so samples trade
+        categories off against each other instead of rescaling every value.
+        """
+        rng = np.random.default_rng(seed)
+        z = rng.standard_normal((samples, len(self.params)))
+        vectors = self.base_vector * np.exp(sigma * z)
+        scarcity = self._slices['position_scarcity']
+        vectors[:, scarcity] = self.base_vector[scarcity] + sigma * 0.05 * z[:, scarcity]
+        vectors[:, self._discount] = np.clip(vectors[:, self._discount], 0.05, 1.5)
+        if normalize:
+            for group in ('hitting', 'pitching', 'relief'):
+                part = self._slices[group]
+                vectors[:, part] *= self.base_vector[part].sum() / vectors[:, part].sum(axis=1, keepdims=True)
+        return vectors, z
+
+    def rank_correlations(self, values: np.ndarray, targets: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+        """Spearman correlation of value order with each target source's rank order, per column."""
+        result = {}
+        for target in targets:
+            ranks = CONSENSUS_SOURCES.get(target, {})
+            rows = [i for i, name in enumerate(self._cols['names']) if name in ranks]
+            if len(rows) < 3:
+                continue
+            target_order = np.argsort(np.argsort([ranks[self._cols['names'][i]] for i in rows], kind='stable'), kind='stable')
+            ours = np.argsort(np.argsort(-values[rows], axis=0, kind='stable'), axis=0, kind='stable')
+            a = ours - ours.mean(axis=0)
+            b = (target_order - target_order.mean())[:, None]
+            result[target] = (a * b).sum(axis=0) / np.sqrt((a * a).sum(axis=0) * (b * b).sum())
+        return result
+
+    def to_weights(self, vector: np.ndarray) -> dict:
+        """Parameter vector back to a set_value_weights() payload."""
+        weights = {}
+        for name, value in zip(self.params, vector):
+            group, _, key = name.partition('.')
+            if key:
+                weights.setdefault(group, {})[key] = round(float(value), 4)
+            else:
+                weights[group] = round(float(value), 4)
+        return weights
+
+    def analyze(self, samples: int = 2000, sigma: float = 0.25, seed: int = 0,
+                targets: Tuple[str, ...] = ('FHQ', 'HKB', 'CFR'), chunk: int = 256,
+                normalize: bool = True) -> dict:
+        """Score `samples` perturbed weight vectors and attribute value and rank-fit movement to each weight.
+
+        Effects are least-squares slopes on the standard-normal draws, i.e. the
+        change per one-sigma move of a single weight with the others varying too.
+        value_impact is the RMS over players of that slope in value points.
+        """
+        base_values = self.values(self.base_vector)[:, 0]
+        base_corr = {t: float(c[0]) for t, c in self.rank_correlations(base_values[:, None], targets).items()}
+        vectors, z = self.perturb(samples, sigma, seed, normalize)
+        zc = z - z.mean(axis=0)
+        z_var = (zc * zc).sum(axis=0)
+
+        value_slopes = np.zeros((self.n, len(self.params)))
+        value_sum = np.zeros(self.n)
+        movement = np.zeros(samples)
+        corr = {t: np.zeros(samples) for t in base_corr}
+        for start in range(0, samples, chunk):
+            block = self.values(vectors[start:start + chunk])
+            value_slopes += block @ zc[start:start + chunk]
+            value_sum += block.sum(axis=1)
+            movement[start:start + chunk] = np.abs(block - base_values[:, None]).mean(axis=0)
+            for target, c in self.rank_correlations(block, tuple(corr)).items():
+                corr[target][start:start + chunk] = c
+        value_slopes /= z_var
+
+        mean_corr = np.mean([corr[t] for t in corr], axis=0) if corr else np.zeros(samples)
+        impact = np.sqrt((value_slopes ** 2).mean(axis=0))
+        effects = []
+        for j, name in enumerate(self.params):
+            effects.append({
+                'param': name,
+                'base': round(float(self.base_vector[j]), 4),
+                'value_impact': round(float(impact[j]), 3),
+                'impact_share': round(float(impact[j] ** 2 / (impact ** 2).sum()), 4) if impact.any() else 0.0,
+                'movement_effect': round(float(zc[:, j] @ movement / z_var[j]), 4),
+                'corr_effect': {t: round(float(zc[:, j] @ corr[t] / z_var[j]), 5) for t in corr},
+            })
+        effects.sort(key=lambda e: -e['value_impact'])
+
+        best = int(np.argmax(mean_corr)) if samples else None
+        return {
+            'players': self.n,
+            'samples': samples,
+            'sigma': sigma,
+            'base_correlation': base_corr,
+            'mean_abs_value_change': round(float(movement.mean()), 3) if samples else 0.0,
+            'effects': effects,
+            'best_sample': None if best is None else {
+                'correlation': {t: round(float(corr[t][best]), 4) for t in corr},
+                'weights': self.to_weights(vectors[best]),
+            },
+        }
+
+
+# ============================================================================
+# MULTI-YEAR VALUE PROJECTION
+# ============================================================================
+# Age effects as position-specific year-over-year curves: the multiplier on a
+# player's value for the season after the one he plays at each age. The 1.00
+# plateau is the peak (hitters 26-31, starters 26-30); catchers and relievers
+# fade earlier. Value projections and the window analysis both read these.
+
+PROJECTION_YEARS = 5
+
+AGE_CURVE_GROUPS = ('hitter', 'catcher', 'sp', 'rp')
+AGE_CURVES = {
+    'hitter': step_table((23, 26, 32, 34, 36), (1.08, 1.04, 1.00, 0.93, 0.86, 0.78)),
+    'catcher': step_table((23, 26, 30, 32, 34), (1.07, 1.03, 1.00, 0.92, 0.85, 0.76)),
+    'sp': step_table((23, 26, 31, 33, 35), (1.06, 1.03, 1.00, 0.92, 0.86, 0.78)),
+    'rp': step_table((25, 30, 32, 34), (1.03, 1.00, 0.92, 0.85, 0.78)),
+}
+AGE_CURVE_MAX_AGE = 50
+
+_AGE_CURVE_TABLES = {}  # years -> (groups, ages, years + 1) cumulative multipliers
+
+
+def age_curve_table(years: int = PROJECTION_YEARS) -> np.ndarray:
+    """Cumulative age multipliers indexed [group, age, year]; year 0 is 1.0.
+
+    Age 0 (unknown) stays flat. Built once per horizon and reused.
+    """
+    table = _AGE_CURVE_TABLES.get(years)
+    if table is None:
+        ages = np.arange(AGE_CURVE_MAX_AGE + 1, dtype=float)
+        table = np.ones((len(AGE_CURVE_GROUPS), len(ages), years + 1))
+        for g, group in enumerate(AGE_CURVE_GROUPS):
+            for year in range(1, years + 1):
+                table[g, :, year] = table[g, :, year - 1] * AGE_CURVES[group].evaluate(ages + (year - 1))
+        table[:, 0, :] = 1.0
+        _AGE_CURVE_TABLES[years] = table
+    return table
+
+
+_AGE_CURVE_PEAKS = {}  # 'table' -> (phase, seasons_left), each [group, age]
+
+
+def age_curve_peaks() -> Tuple[np.ndarray, np.ndarray]:
+    """Where each age sits on its group's curve, indexed [group, age].
+
+    phase is +1 before the peak plateau (next season's multiplier > 1), 0 on it
+    and -1 past it; seasons_left counts the seasons after this one before the
+    curve turns down (0 in the last peak season and once declining). Age 0
+    (unknown) is phase 0 with 0 seasons left.
+    Built once from AGE_CURVES.
+    """
+    cached = _AGE_CURVE_PEAKS.get('table')
+    if cached is None:
+        ages = np.arange(AGE_CURVE_MAX_AGE + 1, dtype=float)
+        phase = np.zeros((len(AGE_CURVE_GROUPS), len(ages)), dtype=np.int8)
+        seasons_left = np.zeros((len(AGE_CURVE_GROUPS), len(ages)))
+        for g, group in enumerate(AGE_CURVE_GROUPS):
+            factors = AGE_CURVES[group].evaluate(ages)
+            phase[g] = np.sign(factors - 1.0)
+            first_decline = int(np.argmax(factors < 1.0))
+            seasons_left[g] = np.maximum(first_decline - 1 - ages, 0)
+        phase[:, 0] = 0
+        seasons_left[:, 0] = 0
+        cached = _AGE_CURVE_PEAKS['table'] = (phase, seasons_left)
+    return cached
+
+
+def age_curve_group(position: str) -> int:
+    """Index into AGE_CURVE_GROUPS for a position string (any SP eligibility counts as a starter)."""
+    mask = eligibility_mask(position or '')
+    if mask & ELIGIBILITY_BITS['SP']:
+        return AGE_CURVE_GROUPS.index('sp')
+    if mask & ELIGIBILITY_BITS['RP']:
+        return AGE_CURVE_GROUPS.index('rp')
+    if mask & ELIGIBILITY_BITS['C']:
+        return AGE_CURVE_GROUPS.index('catcher')
+    return AGE_CURVE_GROUPS.index('hitter')
+
+
+def project_values_by_year(players: List[Player], base_values, years: int = PROJECTION_YEARS) -> np.ndarray:
+    """(n, years + 1) projected value per season: column 0 is base_values, column k is k seasons out.
+
+    One gather from the cached age-curve table - no per-player age logic.
+    """
+    base_values = np.asarray(base_values, dtype=float)
+    groups = np.array([age_curve_group(p.position) for p in players], dtype=np.intp)
+    ages = np.array([p.age or 0 for p in players], dtype=float)
+    age_idx = np.clip(np.round(ages), 0, AGE_CURVE_MAX_AGE).astype(np.intp)
+    return base_values[:, None] * age_curve_table(years)[groups, age_idx]
+
+
+# ============================================================================
+# VALUE UNCERTAINTY
+# ============================================================================
+# Point values hide how much a player's value could move. Prospects and young or
+# unproven pitchers are far riskier than established hitters; the hard-coded
+# discounts price that into the mean, the sampler below prices it into a spread.
+
+# Lognormal sigma of projection error by player class
+VALUE_NOISE = {
+    'hitter': 0.15,
+    'sp': 0.22,
+    'rp': 0.30,
+    'young_pitcher': 0.28,    # pitchers 25 and under
+    'unproven': 0.40,         # UNPROVEN_PITCHERS and the unproven-veteran heuristic
+    'prospect_rank': 0.35,    # ranked prospects: noise on the rank itself
+}
+CONSENSUS_NOISE_DEFAULT = 0.25   # single-source consensus ranks
+CONSENSUS_NOISE_FLOOR = 0.08
+VALUE_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+class ValueUncertainty:
+    """Monte Carlo value distribution for a set of players, sampled in one batch.
+
+    Each draw scales every player's point value by lognormal projection noise
+    (sigma by class from VALUE_NOISE) and, for players whose value is pulled
+    toward consensus, shifts the consensus target by lognormal rank noise
+    (sigma from how much the sources disagree) at that player's correction
+    strength; those rows are then recentered on their point value, since the
+    sum of two skewed noise terms drifts off it. Ranked prospects move by the
+    prospect-curve difference between a noisy rank and their own rank. Medians
+    stay at the point values (up to sampling noise, and except for prospects
+    sitting right at a cliff of the prospect curve). Draws are independent
+    across players, so any roster or trade package is valued by summing rows of
+    `samples`.
+    """
+
+    def __init__(self, players: List[Player], actual_stats: Dict[str, dict] = None,
+                 samples: int = 500, seed: int = 0):
+        self.players = players
+        self.index = {p.name: i for i, p in enumerate(players)}
+        self.point_values = DynastyValueCalculator.calculate_values_batch(players, actual_stats)
+        n = len(players)
+        if n == 0:
+            self.samples = np.zeros((0, samples))
+            self._percentiles = np.zeros((0, len(VALUE_PERCENTILES)))
+            return
+        cols, base = DynastyValueCalculator._base_values_batch(players, actual_stats)
+        rng = np.random.default_rng(seed)
+
+        ages = cols['age']
+        # A hitter projection wins (two-way players and pitcher name collisions keep hitter noise)
+        pitcher = ~cols['has_hitter_proj'] & (cols['has_sp_proj'] | cols['has_rp_proj'] | cols['is_pitcher'])
+        sigma = np.full(n, VALUE_NOISE['hitter'])
+        sigma[pitcher] = VALUE_NOISE['sp']
+        sigma[pitcher & cols['has_rp_proj']] = VALUE_NOISE['rp']
+        sigma[pitcher & (ages > 0) & (ages <= 25)] = VALUE_NOISE['young_pitcher']
+        sigma[pitcher & cols['unproven']] = VALUE_NOISE['unproven']
+        drawn = self.point_values[:, None] * np.exp(sigma[:, None] * rng.standard_normal((n, samples)))
+
+        # Consensus noise moves the consensus target value; it only matters at the
+        # correction strength the player's point estimate actually gets. Sigma
+        # scales with source disagreement (std of log ranks across sources).
+        consensus_rank = cols['consensus_rank']
+        eligible = ~np.isnan(consensus_rank)
+        rank = np.where(eligible, consensus_rank, 0.0)
+        strength = np.where(eligible, CONSENSUS_CORRECTION.evaluate(
+            np.abs(CONSENSUS_IMPLIED_RANK.evaluate(base) - rank)), 0.0)
+        pulled = np.flatnonzero(strength > 0)
+        if len(pulled):
+            ranks, mask = CONSENSUS_MATRIX.lookup([cols['names'][i] for i in pulled])
+            counts = mask.sum(axis=1)
+            log_ranks = np.log(np.where(mask, np.maximum(ranks, 1.0), 1.0))
+            mean_log = (log_ranks * mask).sum(axis=1) / np.maximum(counts, 1)
+            spread = np.sqrt(((log_ranks - mean_log[:, None]) ** 2 * mask).sum(axis=1) / np.maximum(counts - 1, 1))
+            consensus_sigma = np.where(counts > 1, np.maximum(spread, CONSENSUS_NOISE_FLOOR), CONSENSUS_NOISE_DEFAULT)
+            noisy_rank = rank[pulled, None] * np.exp(consensus_sigma[:, None] * rng.standard_normal((len(pulled), samples)))
+            target_shift = CONSENSUS_TARGET_VALUE.evaluate(noisy_rank) - CONSENSUS_TARGET_VALUE.evaluate(rank[pulled])[:, None]
+            drawn[pulled] += (strength[pulled] * cols['veteran_boost'][pulled])[:, None] * target_shift
+            drawn[pulled] = np.maximum(
+                drawn[pulled] + (self.point_values[pulled] - np.median(drawn[pulled], axis=1))[:, None], 0.0)
+
+        is_prospect = cols['prospect_rank'] > -np.inf
+        if is_prospect.any():
+            rank = cols['prospect_rank'][is_prospect]
+            prospect_ranks = rank[:, None] * np.exp(
+                VALUE_NOISE['prospect_rank'] * rng.standard_normal((int(is_prospect.sum()), samples)))
+            rank_shift = (PROSPECT_VALUE_CURVE.evaluate(np.maximum(prospect_ranks, 1.0)) -
+                          PROSPECT_VALUE_CURVE.evaluate(rank)[:, None])
+            drawn[is_prospect] = self.point_values[is_prospect][:, None] + rank_shift
+        self.samples = drawn
+        self._percentiles = np.percentile(drawn, VALUE_PERCENTILES, axis=1).T
+
+    def percentiles(self, name: str) -> Optional[Dict[str, float]]:
+        """{'p10': .., 'p50': .., ...} for one player, or None if not sampled."""
+        row = self.index.get(name)
+        if row is None:
+            return None
+        return {f"p{q}": round(float(v), 1) for q, v in zip(VALUE_PERCENTILES, self._percentiles[row])}
+
+    def package_samples(self, names: List[str], fixed: float = 0.0) -> np.ndarray:
+        """Per-draw total value of a package; unsampled names count at their point value via `fixed`."""
+        rows = [self.index[name] for name in names if name in self.index]
+        return self.samples[rows].sum(axis=0) + fixed
+
+    def win_probability(self, receives_a: np.ndarray, receives_b: np.ndarray) -> float:
+        """Share of draws in which side A receives more value than side B (ties split)."""
+        if receives_a.size == 0:
+            return 0.5
+        return float(np.mean(receives_a > receives_b) + 0.5 * np.mean(receives_a == receives_b))
+
+
+# ============================================================================
+# H2H SEASON SIMULATOR
+# ============================================================================
+# Head-to-head categories: each week every team plays one opponent in all 14
+# categories; the season standings are total category wins. A simulated season
+# draws each team's true talent around its projection, then every weekly
+# category result, then a reseeded single-week playoff bracket. All seasons in
+# a chunk are one set of array ops.
+
+H2H_CATEGORIES = ('HR', 'SB', 'RBI', 'R', 'SO', 'AVG', 'OPS', 'K', 'ERA', 'WHIP', 'QS', 'SV+HLD', 'L', 'K/BB')
+H2H_LOWER_IS_BETTER = ('SO', 'ERA', 'WHIP', 'L')
+H2H_RATE_WEEKLY_SD = {'AVG': 0.012, 'OPS': 0.030, 'ERA': 0.85, 'WHIP': 0.11, 'K/BB': 0.55}
+H2H_COUNT_DISPERSION = 1.6      # weekly variance / mean for counting categories
+H2H_SEASON_TALENT_SD = 0.07     # relative error of a team's season-long projection
+MLB_SEASON_WEEKS = 26           # projection totals -> weekly means
+H2H_REGULAR_SEASON_WEEKS = 22
+H2H_PLAYOFF_TEAMS = 6
+
+# Standard normal CDF on a 1/256 grid over [-6, 6], as uint16 thresholds: a
+# weekly category result is one uint16 draw compared against Phi(gap / sd)
+_PHI_STEPS = 256
+_PHI_HALF_RANGE = 6 * _PHI_STEPS
+_PHI_U16 = np.array([round(0.5 * math.erfc(-(i - _PHI_HALF_RANGE) / _PHI_STEPS / math.sqrt(2)) * 65535)
+                     for i in range(2 * _PHI_HALF_RANGE + 1)], dtype=np.uint16)
+
+
+def round_robin_schedule(n_teams: int, weeks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(home, away) team indices, each (weeks, pairs), by the circle method repeated as needed.
+
+    With an odd team count one team sits out each week.
+    """
+    slots = list(range(n_teams)) + ([-1] if n_teams % 2 else [])
+    m = len(slots)
+    rounds = []
+    for _ in range(m - 1):
+        rounds.append([(slots[i], slots[m - 1 - i]) for i in range(m // 2)
+                       if slots[i] >= 0 and slots[m - 1 - i] >= 0])
+        slots = [slots[0], slots[-1]] + slots[1:-1]
+    week_pairs = [rounds[w % len(rounds)] for w in range(weeks)]
+    home = np.array([[a for a, _ in pairs] for pairs in week_pairs], dtype=np.intp)
+    away = np.array([[b for _, b in pairs] for pairs in week_pairs], dtype=np.intp)
+    return home, away
+
+
+class SeasonSimulator:
+    """Monte Carlo H2H categories seasons from team projection totals.
+
+    team_categories maps team name -> category totals as produced for the
+    category rankings (season counting totals, rate stats as rates).
+    """
+
+    def __init__(self, team_categories: Dict[str, dict], weeks: int = H2H_REGULAR_SEASON_WEEKS,
+                 playoff_teams: int = H2H_PLAYOFF_TEAMS):
+        self.team_names = list(team_categories)
+        self.team_index = {name: i for i, name in enumerate(self.team_names)}
+        n = len(self.team_names)
+        self.playoff_teams = max(2, min(playoff_teams, n))
+        self.home, self.away = round_robin_schedule(n, weeks)
+        self._home_flat, self._away_flat = self.home.ravel(), self.away.ravel()
+        self.direction = np.array([-1.0 if cat in H2H_LOWER_IS_BETTER else 1.0 for cat in H2H_CATEGORIES])
+        self._is_rate = np.array([cat in H2H_RATE_WEEKLY_SD for cat in H2H_CATEGORIES])
+        self._rate_sd = np.array([H2H_RATE_WEEKLY_SD.get(cat, 0.0) for cat in H2H_CATEGORIES])
+        self.weekly_mean, self.weekly_sd = self._weekly_params([team_categories[t] for t in self.team_names])
+        self._slot_scale = self._scale_for_slots(self.weekly_sd, np.arange(self.home.size))
+
+        # Regular-season incidence: category wins of every (week, pair) slot -> team totals via one matmul
+        slots = self.home.size
+        self._home_incidence = np.zeros((slots, n))
+        self._home_incidence[np.arange(slots), self._home_flat] = 1.0
+        self._away_incidence = np.zeros((slots, n))
+        self._away_incidence[np.arange(slots), self._away_flat] = 1.0
+
+        # Reseeded bracket: top seeds get byes up to the next power of two, then best vs worst
+        bracket = 1 << (self.playoff_teams - 1).bit_length()
+        self._byes = bracket - self.playoff_teams
+        self._round_games = []
+        alive = self.playoff_teams
+        byes = self._byes
+        while alive > 1:
+            games = (alive - byes) // 2
+            self._round_games.append(games)
+            alive = byes + games
+            byes = 0
+
+    def _weekly_params(self, categories: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """(weekly mean, weekly sd) rows for category-total dicts."""
+        totals = np.array([[float(c.get(cat, 0) or 0) for cat in H2H_CATEGORIES] for c in categories])
+        mean = np.where(self._is_rate, totals, totals / MLB_SEASON_WEEKS)
+        sd = np.where(self._is_rate, self._rate_sd, np.sqrt(np.maximum(mean, 0.0) * H2H_COUNT_DISPERSION))
+        return mean, sd
+
+    def _scale_for_slots(self, weekly_sd: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        """Talent gap -> Phi table index scale for the given flat (week, pair) slots."""
+        slot_sd = np.sqrt(weekly_sd[self._home_flat[slots]] ** 2 + weekly_sd[self._away_flat[slots]] ** 2)
+        return (self.direction * _PHI_STEPS / np.maximum(slot_sd, 1e-9)).astype(np.float32)
+
+    def _draw(self, seasons: int, rng) -> dict:
+        """Every random number one chunk of seasons needs, so variants can replay them.
+
+        Talent and weekly draws are team- / slot-major so a variant's changed
+        teams and schedule slots are contiguous blocks.
+        """
+        n, cats = len(self.team_names), len(H2H_CATEGORIES)
+        return {
+            'talent': rng.standard_normal((n, seasons, cats), dtype=np.float32),
+            'weekly': rng.integers(0, 65535, size=(self.home.size, seasons, cats), dtype=np.uint16, endpoint=True),
+            'tiebreak': rng.random((seasons, n)) * 0.5,
+            'playoffs': [rng.standard_normal((seasons, games, cats), dtype=np.float32) for games in self._round_games],
+        }
+
+    @staticmethod
+    def _talent(weekly_mean: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """(teams, s, cats) season talent: weekly means scaled by a per-season draw."""
+        return (weekly_mean[:, None, :] * (1.0 + H2H_SEASON_TALENT_SD * z)).astype(np.float32)
+
+    def _home_wins(self, talent: np.ndarray, draws: dict, scale: np.ndarray, slots=None) -> np.ndarray:
+        """(s, slots) categories won by the home side: P(win) = Phi(signed talent gap / weekly sd)."""
+        home, away, weekly = self._home_flat, self._away_flat, draws['weekly']
+        if slots is not None:
+            home, away, weekly = home[slots], away[slots], weekly[slots]
+        z = talent[home] - talent[away]
+        z *= scale[:, None, :]
+        z += _PHI_HALF_RANGE
+        np.clip(z, 0, 2 * _PHI_HALF_RANGE, out=z)
+        return (weekly < _PHI_U16.take(z.astype(np.int32))).sum(axis=-1).T.astype(float)
+
+    def _postseason(self, talent: np.ndarray, weekly_sd: np.ndarray, cat_wins: np.ndarray,
+                    draws: dict) -> Tuple[np.ndarray, np.ndarray]:
+        """(made playoffs (s, teams), champion (s,)) from regular-season category wins."""
+        seasons, n = cat_wins.shape
+        order = np.argsort(-(cat_wins + draws['tiebreak']), axis=1)
+        seeds = order[:, :self.playoff_teams]
+        made_playoffs = np.zeros((seasons, n), dtype=bool)
+        np.put_along_axis(made_playoffs, seeds, True, axis=1)
+
+        rows = np.arange(seasons)[:, None]
+        alive = np.tile(np.arange(self.playoff_teams), (seasons, 1))
+        byes = self._byes
+        for noise in draws['playoffs']:
+            playing = alive[:, byes:]
+            half = playing.shape[1] // 2
+            high, low = playing[:, :half], playing[:, ::-1][:, :half]
+            a, b = seeds[rows, high], seeds[rows, low]
+            diff = talent[a, rows] - talent[b, rows]
+            sd = np.sqrt(weekly_sd[a] ** 2 + weekly_sd[b] ** 2)
+            won = ((diff + sd * noise) * self.direction > 0).sum(axis=-1)
+            high_advances = won * 2 >= len(H2H_CATEGORIES)  # split categories -> higher seed
+            alive = np.sort(np.concatenate([alive[:, :byes], np.where(high_advances, high, low)], axis=1), axis=1)
+            byes = 0
+        return made_playoffs, seeds[np.arange(seasons), alive[:, 0]]
+
+    def _simulate_chunk(self, draws: dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        cats = len(H2H_CATEGORIES)
+        talent = self._talent(self.weekly_mean, draws['talent'])
+        home_wins = self._home_wins(talent, draws, self._slot_scale)
+        cat_wins = home_wins @ self._home_incidence + (cats - home_wins) @ self._away_incidence
+        made_playoffs, champion = self._postseason(talent, self.weekly_sd, cat_wins, draws)
+        return talent, home_wins, cat_wins, made_playoffs, champion
+
+    @staticmethod
+    def _wilson(successes: np.ndarray, trials: int) -> Tuple[list, list]:
+        """Wilson score 95% interval, in percent."""
+        p = successes / trials
+        z = 1.96
+        center = (p + z * z / (2 * trials)) / (1 + z * z / trials)
+        half = z * np.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / (1 + z * z / trials)
+        return (np.maximum(center - half, 0.0) * 100).tolist(), (np.minimum(center + half, 1.0) * 100).tolist()
+
+    def run(self, seasons: int = 10000, seed: int = 0, chunk: int = 2500) -> dict:
+        """Simulate `seasons` seasons; per-team title and playoff odds with 95% intervals."""
+        rng = np.random.default_rng(seed)
+        n = len(self.team_names)
+        titles = np.zeros(n)
+        playoffs = np.zeros(n)
+        cat_wins = np.zeros(n)
+        start = time.perf_counter()
+        for begin in range(0, seasons, chunk):
+            _, _, wins, made, champion = self._simulate_chunk(self._draw(min(chunk, seasons - begin), rng))
+            titles += np.bincount(champion, minlength=n)
+            playoffs += made.sum(axis=0)
+            cat_wins += wins.sum(axis=0)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        title_low, title_high = self._wilson(titles, seasons)
+        playoff_low, playoff_high = self._wilson(playoffs, seasons)
+        teams = {}
+        for i, name in enumerate(self.team_names):
+            teams[name] = {
+                'title_odds': round(float(titles[i]) / seasons * 100, 1),
+                'title_ci': [round(title_low[i], 1), round(title_high[i], 1)],
+                'playoff_odds': round(float(playoffs[i]) / seasons * 100, 1),
+                'playoff_ci': [round(playoff_low[i], 1), round(playoff_high[i], 1)],
+                'avg_category_wins': round(float(cat_wins[i]) / seasons, 1),
+            }
+        return {
+            'seasons': seasons,
+            'weeks': int(self.home.shape[0]),
+            'playoff_teams': self.playoff_teams,
+            'elapsed_ms': round(elapsed_ms, 1),
+            'teams': teams,
+        }
+
+    def compare(self, variants: List[Dict[str, dict]], seasons: int = 4000, seed: int = 0,
+                chunk: int = 2000) -> dict:
+        """Title/playoff odds deltas for many hypothetical leagues, with common random numbers.
+
+        Each variant maps the teams it changes (e.g. both sides of a trade) to
+        their new category totals. Every variant replays the baseline's random
+        draws, reuses the baseline results of all schedule slots between
+        unchanged teams, and only re-plays the changed teams' weeks and the
+        playoffs. Deltas are paired per season, so their intervals are far
+        tighter than the difference of two independent runs.
+        """
+        rng = np.random.default_rng(seed)
+        n = len(self.team_names)
+        prepared = []
+        for variant in variants:
+            changed = np.array([self.team_index[t] for t in variant], dtype=np.intp)
+            mean, sd = self.weekly_mean.copy(), self.weekly_sd.copy()
+            if len(changed):
+                mean[changed], sd[changed] = self._weekly_params(list(variant.values()))
+            slots = np.flatnonzero(np.isin(self._home_flat, changed) | np.isin(self._away_flat, changed))
+            prepared.append((changed, mean, sd, slots, self._scale_for_slots(sd, slots),
+                             self._home_incidence[slots] - self._away_incidence[slots]))
+
+        base_titles = np.zeros(n)
+        base_playoffs = np.zeros(n)
+        titles = np.zeros((len(variants), n))
+        playoffs = np.zeros((len(variants), n))
+        title_sq = np.zeros((len(variants), n))  # sum of squared paired title differences
+        start = time.perf_counter()
+        for begin in range(0, seasons, chunk):
+            draws = self._draw(min(chunk, seasons - begin), rng)
+            talent, home_wins, cat_wins, made, champion = self._simulate_chunk(draws)
+            base_titles += np.bincount(champion, minlength=n)
+            base_playoffs += made.sum(axis=0)
+            for v, (changed, mean, sd, slots, scale, incidence) in enumerate(prepared):
+                v_talent = talent.copy()
+                v_talent[changed] = self._talent(mean[changed], draws['talent'][changed])
+                v_wins = cat_wins
+                if len(slots):
+                    delta = self._home_wins(v_talent, draws, scale, slots) - home_wins[:, slots]
+                    v_wins = cat_wins + delta @ incidence
+                v_made, v_champion = self._postseason(v_talent, sd, v_wins, draws)
+                titles[v] += np.bincount(v_champion, minlength=n)
+                playoffs[v] += v_made.sum(axis=0)
+                moved = v_champion != champion
+                title_sq[v] += np.bincount(v_champion[moved], minlength=n) + np.bincount(champion[moved], minlength=n)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        base = base_titles / seasons
+        results = []
+        for v in range(len(variants)):
+            delta = titles[v] / seasons - base
+            se = np.sqrt(np.maximum(title_sq[v] / seasons - delta ** 2, 0.0) / seasons)
+            results.append({
+                name: {
+                    'title_odds': round(float(titles[v][i]) / seasons * 100, 1),
+                    'title_delta': round(float(delta[i]) * 100, 2),
+                    'title_delta_ci': [round(float(delta[i] - 1.96 * se[i]) * 100, 2),
+                                       round(float(delta[i] + 1.96 * se[i]) * 100, 2)],
+                    'playoff_delta': round(float(playoffs[v][i] - base_playoffs[i]) / seasons * 100, 2),
+                }
+                for i, name in enumerate(self.team_names)
+            })
+        return {
+            'seasons': seasons,
+            'elapsed_ms': round(elapsed_ms, 1),
+            'baseline': {name: round(float(base[i]) * 100, 1) for i, name in enumerate(self.team_names)},
+            'variants': results,
+        }
+
+
+# ============================================================================
+# STARTING LINEUP OPTIMIZER
+# ============================================================================
+
+# League starting slots: (slot, count); each slot accepts POSITION_FILTER_MASKS[slot]
+LINEUP_SLOTS = (
+    ('C', 1), ('1B', 1), ('2B', 1), ('SS', 1), ('3B', 1), ('MI', 1), ('CI', 1), ('INF', 1),
+    ('OF', 5), ('UTIL', 3), ('SP', 6), ('RP', 5), ('P', 1),
+)
+HITTER_SLOTS = frozenset(slot for slot, _ in LINEUP_SLOTS if POSITION_FILTER_MASKS[slot] & HITTER_MASK)
+
+
+class LineupScorer:
+    """Single-number projected category value used to rank players for lineup slots.
+
+    Each category is a player's marginal contribution to the team total:
+    counting stats as-is (negated for SO and L), rate stats as volume times
+    the edge over the pool's rate (AVG/OPS per AB, ERA/WHIP per IP, K/BB as
+    K - rate * BB). Contributions are scaled by their spread across the pool's
+    hitters or pitchers and summed.
+    """
+
+    def __init__(self, pool_names: List[str]):
+        hit = self._hitting(pool_names)
+        pit = self._pitching(pool_names)
+        hitters, pitchers = hit[:, 0] > 0, pit[:, 0] > 0
+        ab, ip = hit[hitters, 0].sum(), pit[pitchers, 0].sum()
+        self.baseline = {
+            'AVG': float(hit[hitters, 6].sum() / ab) if ab else 0.250,
+            'OPS': float(hit[hitters, 7].sum() / ab) if ab else 0.700,
+            'ERA': float(pit[pitchers, 5].sum() / ip) if ip else 4.00,
+            'WHIP': float(pit[pitchers, 6].sum() / ip) if ip else 1.25,
+            'K/BB': float(pit[pitchers, 1].sum() / max(pit[pitchers, 7].sum(), 1.0)),
+        }
+        self._hit_scale = self._spread(self._hit_contributions(hit[hitters]))
+        self._pit_scale = self._spread(self._pit_contributions(pit[pitchers]))
+
+    @staticmethod
+    def _spread(contributions: np.ndarray) -> np.ndarray:
+        if not len(contributions):
+            return np.ones(contributions.shape[1])
+        sd = contributions.std(axis=0)
+        return np.where(sd > 0, sd, 1.0)
+
+    @staticmethod
+    def _hitting(names: List[str]) -> np.ndarray:
+        """(n, 8): AB, HR, SB, RBI, R, SO, AB*AVG, AB*OPS."""
+        rows = np.zeros((len(names), 8))
+        for i, name in enumerate(names):
+            proj = HITTER_PROJECTIONS.get(name)
+            if proj and proj.get('AB', 0):
+                ab = proj['AB']
+                rows[i] = (ab, proj.get('HR', 0), proj.get('SB', 0), proj.get('RBI', 0), proj.get('R', 0),
+                           proj.get('SO', 0), ab * proj.get('AVG', 0), ab * proj.get('OPS', 0))
+        return rows
+
+    @staticmethod
+    def _pitching(names: List[str]) -> np.ndarray:
+        """(n, 8): IP, K, QS, SV+HLD, L, IP*ERA, IP*WHIP, BB."""
+        rows = np.zeros((len(names), 8))
+        for i, name in enumerate(names):
+            proj = PITCHER_PROJECTIONS.get(name) or RELIEVER_PROJECTIONS.get(name)
+            if proj and proj.get('IP', 0):
+                ip = proj['IP']
+                rows[i] = (ip, proj.get('K', 0), proj.get('QS', 0), proj.get('SV', 0) + proj.get('HD', 0),
+                           proj.get('L', 0), ip * proj.get('ERA', 0), ip * proj.get('WHIP', 0), proj.get('BB', 0))
+        return rows
+
+    def _hit_contributions(self, hit: np.ndarray) -> np.ndarray:
+        base = self.baseline
+        ab = hit[:, 0]
+        return np.column_stack([hit[:, 1], hit[:, 2], hit[:, 3], hit[:, 4], -hit[:, 5],
+                                hit[:, 6] - ab * base['AVG'], hit[:, 7] - ab * base['OPS']])
+
+    def _pit_contributions(self, pit: np.ndarray) -> np.ndarray:
+        base = self.baseline
+        ip = pit[:, 0]
+        return np.column_stack([pit[:, 1], pit[:, 2], pit[:, 3], -pit[:, 4],
+                                ip * base['ERA'] - pit[:, 5], ip * base['WHIP'] - pit[:, 6],
+                                pit[:, 1] - base['K/BB'] * pit[:, 7]])
+
+    def scores(self, names: List[str]) -> np.ndarray:
+        """Hitting and pitching scores per name (-inf where there is no projection)."""
+        hit = self._hitting(names)
+        pit = self._pitching(names)
+        hitting = np.where(hit[:, 0] > 0, (self._hit_contributions(hit) / self._hit_scale).sum(axis=1), -np.inf)
+        pitching = np.where(pit[:, 0] > 0, (self._pit_contributions(pit) / self._pit_scale).sum(axis=1), -np.inf)
+        return np.column_stack([hitting, pitching])
+
+    def player_weights(self, players: List[Player]) -> Tuple[List[int], List[float]]:
+        """Eligibility masks and lineup weights (best score among the roles the positions allow)."""
+        masks = [p.eligibility for p in players]
+        scores = self.scores([p.name for p in players])
+        weights = [
+            max(hitting if mask & HITTER_MASK else -np.inf, pitching if mask & PITCHER_MASK else -np.inf)
+            for mask, (hitting, pitching) in zip(masks, scores.tolist())
+        ]
+        return masks, weights
+
+
+class LineupOptimizer:
+    """Highest-scoring legal starting lineup for a set of players.
+
+    Players are considered best-first and kept whenever an augmenting path
+    over the slot groups can seat them. Seatable player sets form a
+    transversal matroid, so this greedy order gives the maximum-weight
+    lineup; with ~13 slot groups it runs in well under a millisecond.
+    """
+
+    def __init__(self, slots=LINEUP_SLOTS):
+        self.slot_names = [slot for slot, _ in slots]
+        self.accepts = [POSITION_FILTER_MASKS[slot] for slot, _ in slots]
+        self.capacity = [count for _, count in slots]
+        self.total_slots = sum(self.capacity)
+        self._groups_for_mask: Dict[int, Tuple[int, ...]] = {}
+
+    def groups_for(self, mask: int) -> Tuple[int, ...]:
+        groups = self._groups_for_mask.get(mask)
+        if groups is None:
+            groups = tuple(g for g, accepts in enumerate(self.accepts) if mask & accepts)
+            self._groups_for_mask[mask] = groups
+        return groups
+
+    def assign(self, masks: List[int], weights: List[float]) -> List[Optional[str]]:
+        """Slot name per player (None = bench) maximizing the starters' total weight.
+
+        Players with weight -inf never start; ties keep input order.
+        """
+        groups = [self.groups_for(m) for m in masks]
+        seated: List[List[int]] = [[] for _ in self.capacity]
+        where = [-1] * len(masks)
+        capacity = self.capacity
+
+        def seat(i: int, visited: List[bool]) -> bool:
+            for g in groups[i]:
+                if visited[g]:
+                    continue
+                visited[g] = True
+                members = seated[g]
+                if len(members) < capacity[g]:
+                    members.append(i)
+                    where[i] = g
+                    return True
+                for k, j in enumerate(members):
+                    if seat(j, visited):
+                        members[k] = i
+                        where[i] = g
+                        return True
+            return False
+
+        filled = 0
+        failed: List[int] = []  # once a mask can't be seated, neither can any subset of it
+        for i in sorted(range(len(masks)), key=lambda i: -weights[i]):
+            if filled == self.total_slots or weights[i] == -np.inf:
+                break
+            mask = masks[i]
+            if not groups[i] or any(mask | f == f for f in failed):
+                continue
+            if seat(i, [False] * len(capacity)):
+                filled += 1
+            else:
+                failed.append(mask)
+        return [self.slot_names[g] if g >= 0 else None for g in where]
+
+    def starting_lineup(self, players: List[Player], masks: List[int],
+                        weights: List[float]) -> List[Tuple[Player, str]]:
+        """[(player, slot)] for the starters, in LINEUP_SLOTS order."""
+        order = {slot: i for i, slot in enumerate(self.slot_names)}
+        lineup = [(p, slot) for p, slot in zip(players, self.assign(masks, weights)) if slot is not None]
+        lineup.sort(key=lambda ps: order[ps[1]])
+        return lineup
+
+
+# ============================================================================
+# TRADE MARKET MATRIX
+# ============================================================================
+# Every 1-for-1 search asks the same question of pairs of rostered players:
+# how far apart are their values, and does the swap help the owner where it is
+# weak? The market answers it for the whole league at once, so a search is a
+# row, column or block of cached matrices instead of a nested Python loop.
+
+# Need categories that single players carry as counting projections
+MARKET_CATEGORIES = ('HR', 'SB', 'RBI', 'R', 'K', 'SV+HLD')
+
+
+class TradeMarket:
+    """Pairwise 1-for-1 trade matrices over every rostered player.
+
+    Rows and columns are players, grouped by team in roster order. diff[i, j]
+    is value[j] - value[i], what the owner of i gains by sending i for j;
+    cross[i, j] marks pairs on different teams. fit[i, j] is the category fit
+    of that swap for i's owner: each player's MARKET_CATEGORIES projections are
+    put on the team need-score scale, and the change (j minus i) is weighted by
+    how far below zero the owner's need score sits in each category.
+    """
+
+    def __init__(self, rosters: Dict[str, List[Tuple[Player, float]]],
+                 need_scores: Dict[str, Dict[str, float]], need_scale: Dict[str, float]):
+        """rosters: team -> (player, value) pairs; need_scores: team -> category need
+        scores (negative = need); need_scale: need-score points per unit of each stat."""
+        self.team_names = list(rosters)
+        self.team_ids = {name: t for t, name in enumerate(self.team_names)}
+        self.players = [p for roster in rosters.values() for p, _ in roster]
+        self.team = np.array([t for t, roster in enumerate(rosters.values()) for _ in roster], dtype=np.int16)
+        self.values = np.array([v for roster in rosters.values() for _, v in roster], dtype=np.float64)
+        scale = np.array([need_scale[cat] for cat in MARKET_CATEGORIES])
+        needs = np.array([[need_scores.get(name, {}).get(cat, 0) for cat in MARKET_CATEGORIES]
+                          for name in self.team_names], dtype=np.float64).reshape(-1, len(MARKET_CATEGORIES))
+        self.diff = self.values[None, :] - self.values[:, None]
+        self.cross = self.team[:, None] != self.team[None, :]
+        self.projections = self.category_projections([p.name for p in self.players]) * scale
+        weights = np.clip(-needs, 0.0, None)[self.team]
+        self.fit = weights @ self.projections.T - (weights * self.projections).sum(axis=1)[:, None]
+
+        # Each team's rows in roster order and best-first (stable, so equal values keep roster order)
+        self.team_rows = {}
+        self.by_value = {}
+        for t, name in enumerate(self.team_names):
+            rows = np.flatnonzero(self.team == t)
+            self.team_rows[name] = rows
+            self.by_value[name] = rows[np.argsort(-self.values[rows], kind='stable')]
+
+    @staticmethod
+    def category_projections(names: List[str]) -> np.ndarray:
+        """(n, len(MARKET_CATEGORIES)) projected counting stats per name."""
+        rows = np.zeros((len(names), len(MARKET_CATEGORIES)))
+        for i, name in enumerate(names):
+            hit = HITTER_PROJECTIONS.get(name, {})
+            sp = PITCHER_PROJECTIONS.get(name, {})
+            rp = RELIEVER_PROJECTIONS.get(name, {})
+            rows[i] = (hit.get('HR', 0), hit.get('SB', 0), hit.get('RBI', 0), hit.get('R', 0),
+                       sp.get('K', 0) or rp.get('K', 0), rp.get('SV', 0) + rp.get('HD', 0))
+        return rows
+
+    def row(self, team_name: str, player_name: str) -> Optional[int]:
+        """Row of a player on a team's roster, or None."""
+        for row in self.team_rows.get(team_name, ()):
+            if self.players[row].name == player_name:
+                return int(row)
+        return None
+
+    def ranked(self, team_name: str, min_value: float = -np.inf, limit: Optional[int] = None) -> np.ndarray:
+        """A team's rows best-first, at or above min_value, optionally the top `limit`."""
+        rows = self.by_value.get(team_name, np.zeros(0, dtype=np.intp))
+        rows = rows[self.values[rows] >= min_value]
+        return rows if limit is None else rows[:limit]
+
+    def within(self, rows: np.ndarray, cols: np.ndarray, tolerance: float) -> List[Tuple[int, int]]:
+        """(row, col) pairs, row-major, whose values differ by less than tolerance."""
+        r, c = np.nonzero(np.abs(self.diff[np.ix_(rows, cols)]) < tolerance)
+        return list(zip(rows[r].tolist(), cols[c].tolist()))
+
+    def near_value(self, value: float, tolerance: float, exclude_team: Optional[str] = None) -> np.ndarray:
+        """Rows valued within tolerance of `value`, in league order, optionally off one team."""
+        mask = np.abs(self.values - value) <= tolerance
+        if exclude_team in self.team_ids:
+            mask &= self.team != self.team_ids[exclude_team]
+        return np.flatnonzero(mask)
+
+    def fair_pairs(self, tolerance: float, min_value: float = 0.0) -> np.ndarray:
+        """Boolean (n, n) mask of cross-team pairs within tolerance, both sides at least min_value."""
+        eligible = self.values >= min_value
+        return self.cross & (np.abs(self.diff) <= tolerance) & eligible[:, None] & eligible[None, :]
+
+    def heatmap(self, tolerance: float, min_value: float = 0.0) -> Dict[str, np.ndarray]:
+        """Team x team fair 1-for-1 counts and the mean two-way category fit of those pairs."""
+        n_teams = len(self.team_names)
+        onehot = np.zeros((len(self.team), n_teams))
+        onehot[np.arange(len(self.team)), self.team] = 1.0
+        fair = self.fair_pairs(tolerance, min_value).astype(np.float64)
+        counts = onehot.T @ fair @ onehot
+        mutual = onehot.T @ (fair * (self.fit + self.fit.T)) @ onehot
+        return {
+            'pairs': counts,
+            'mutual_fit': np.divide(mutual, counts, out=np.zeros_like(mutual), where=counts > 0),
+        }
+
+
+# ============================================================================
+# PACKAGE INDEX
+# ============================================================================
+# Multi-player searches ask "which packages from this roster are worth X give
+# or take a tolerance?". Sorting every package total once turns that question
+# into a bisect range instead of nested loops over a truncated player list.
+
+class PackageIndex:
+    """Every 2-player (and, on first use, 3-player) package from a valued player list.
+
+    Packages are stored as member positions into `players` (ascending, so with
+    a best-first list the first member is the package's best player) and kept
+    sorted by total value. Build one per roster and rebuild it when the roster
+    or its values change.
+    """
+
+    def __init__(self, players: List[Player], values: List[float]):
+        self.players = list(players)
+        self.values = np.asarray(values, dtype=np.float64)
+        self._packages = {}
+
+    def _sorted(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        entry = self._packages.get(size)
+        if entry is None:
+            members = np.array(list(combinations(range(len(self.players)), size)),
+                               dtype=np.intp).reshape(-1, size)
+            # Added member by member so totals match summing the values in order
+            totals = np.zeros(len(members))
+            for column in members.T:
+                totals = totals + self.values[column]
+            order = np.argsort(totals, kind='stable')
+            entry = self._packages[size] = (totals[order], members[order])
+        return entry
+
+    def between(self, size: int, low: float, high: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(totals, members) of packages with low <= total <= high, ascending by total."""
+        totals, members = self._sorted(size)
+        start = np.searchsorted(totals, low, side='left')
+        stop = np.searchsorted(totals, high, side='right')
+        return totals[start:stop], members[start:stop]
+
+    def closest(self, size: int, target: float, low: float, high: float, limit: int,
+                keep=None) -> List[Tuple[Tuple[int, ...], float]]:
+        """Up to `limit` packages valued in [low, high], nearest `target` first.
+
+        keep(totals, members) may return a boolean mask of further conditions.
+        Returns (member positions, total) pairs.
+        """
+        totals, members = self.between(size, low, high)
+        if keep is not None and len(totals):
+            mask = keep(totals, members)
+            totals, members = totals[mask], members[mask]
+        order = np.argsort(np.abs(totals - target), kind='stable')[:limit]
+        return [(tuple(members[i].tolist()), totals.item(i)) for i in order.tolist()]
+
+
+# ============================================================================
+# CANONICAL TRADE KEYS
+# ============================================================================
+# Suggestion generators reach the same trade by different routes: players
+# listed in another order, or the two teams swapped. A canonical key names the
+# trade itself, so each one is scored once and listed once.
+
+def trade_key(team_a: str, assets_a, team_b: str, assets_b) -> Tuple:
+    """Order-independent identity of a trade between two teams.
+
+    Assets are players (keyed by name) or pick/asset ID strings. Each side is
+    (team, sorted asset IDs) and the two sides are sorted, so player order and
+    team order don't matter.
+    """
+    side_a = (team_a, tuple(sorted(getattr(a, 'name', a) for a in assets_a)))
+    side_b = (team_b, tuple(sorted(getattr(a, 'name', a) for a in assets_b)))
+    return (side_a, side_b) if side_a <= side_b else (side_b, side_a)
+
+
+def proposal_trade_key(proposal: 'TradeProposal') -> Tuple:
+    """trade_key of a TradeProposal, picks included."""
+    return trade_key(proposal.team_a, list(proposal.players_from_a) + list(proposal.picks_from_a),
+                     proposal.team_b, list(proposal.players_from_b) + list(proposal.picks_from_b))
+
+
+class EvaluatedTrades:
+    """Shared cache of trade evaluations keyed on trade_key.
+
+    Scores are usually one team's view of the trade, so each entry is stored
+    per (key, perspective); `perspective` is any hashable, typically the
+    scoring team. Share one instance between generators working on the same
+    league snapshot and clear() it when rosters or values change. With
+    max_entries set, the oldest entry is evicted to make room for a new one.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get_or_evaluate(self, key: Tuple, perspective, evaluate):
+        """Cached result for (key, perspective), calling evaluate() on a miss."""
+        entry_key = (key, perspective)
+        if entry_key in self._results:
+            self.hits += 1
+            return self._results[entry_key]
+        self.misses += 1
+        result = evaluate()
+        if self.max_entries is not None:
+            while len(self._results) >= self.max_entries:
+                self._results.pop(next(iter(self._results)))
+        self._results[entry_key] = result
+        return result
+
+    def clear(self):
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
 
 
 # ============================================================================
@@ -8127,7 +9812,14 @@ class LeagueAnalyzer:
     def __init__(self, teams: Dict[str, Team]):
         self.teams = teams
         self.league_averages = {}
+        self._lineup_scorer = LineupScorer([p.name for t in teams.values() for p in t.players])
+        self._lineup_optimizer = LineupOptimizer()
         self._calculate_league_averages()
+
+    def _starting_lineup(self, team: Team) -> List[Tuple[Player, str]]:
+        """The team's optimal starting lineup (category totals ignore bench, minors and IR)."""
+        masks, weights = self._lineup_scorer.player_weights(team.players)
+        return self._lineup_optimizer.starting_lineup(team.players, masks, weights)
     
     def _calculate_league_averages(self):
         """Calculate league-wide category averages."""
@@ -8153,13 +9845,13 @@ class LeagueAnalyzer:
         }
     
     def _sum_team_hitting(self, team: Team) -> Dict[str, float]:
-        """Sum projected hitting stats for a team's active roster."""
+        """Sum projected hitting stats for a team's starting lineup."""
         # League categories: AVG, SLG, SO, HR, RBI, OPS
         totals = {'hr': 0, 'rbi': 0, 'so': 0, 'avg': 0, 'slg': 0, 'ops': 0}
         count = 0
 
-        for player in team.players:
-            if player.roster_status == 'Active' and player.is_hitter():
+        for player, slot in self._starting_lineup(team):
+            if slot in HITTER_SLOTS:
                 proj = HITTER_PROJECTIONS.get(player.name)
                 if proj:
                     totals['hr'] += proj.get('HR', 0)
@@ -8178,14 +9870,14 @@ class LeagueAnalyzer:
         return totals
     
     def _sum_team_pitching(self, team: Team) -> Dict[str, float]:
-        """Sum projected pitching stats for a team's active roster."""
+        """Sum projected pitching stats for a team's starting lineup."""
         # League categories: K, ERA, WHIP, K/BB, L, SV+HLD, QS
         totals = {'k': 0, 'qs': 0, 'l': 0, 'era': 0, 'whip': 0, 'k_bb': 0, 'sv_hld': 0}
         sp_count = 0
         rp_count = 0
 
-        for player in team.players:
-            if player.roster_status == 'Active' and player.is_pitcher():
+        for player, slot in self._starting_lineup(team):
+            if slot not in HITTER_SLOTS:
                 # Check starters first
                 proj = PITCHER_PROJECTIONS.get(player.name)
                 if proj:
@@ -8263,11 +9955,14 @@ class LeagueAnalyzer:
     def _analyze_position_depth(self, team: Team) -> Dict[str, List[Player]]:
         """Analyze positional depth for a team."""
         positions = defaultdict(list)
-        
+
         for player in team.players:
-            if player.roster_status in ['Active', 'Reserve']:
-                for pos in player.position.split(','):
-                    pos = pos.strip()
+            if player.roster_status not in ['Active', 'Reserve']:
+                continue
+            mask = player.eligibility
+            for pos, bit in ELIGIBILITY_BITS.items():
+                # UTIL lists only DH-only players; every hitter is UTIL-eligible
+                if mask & bit and (pos != 'UTIL' or not mask & (FIELD_MASK | PITCHER_MASK)):
                     positions[pos].append(player)
         
         # Sort by value
@@ -8288,12 +9983,30 @@ class LeagueAnalyzer:
 class TradeAnalyzer:
     """Analyzes trades with projections and fit scoring."""
     
-    def __init__(self, league_analyzer: LeagueAnalyzer):
+    def __init__(self, league_analyzer: LeagueAnalyzer, evaluated: Optional[EvaluatedTrades] = None):
         self.league = league_analyzer
         self.calculator = DynastyValueCalculator()
+        self.evaluated = evaluated
     
     def analyze_trade(self, proposal: TradeProposal) -> TradeProposal:
-        """Perform full trade analysis."""
+        """Perform full trade analysis.
+
+        With a shared `evaluated` cache, a trade already analyzed from team_a's
+        side (in any player order) is not re-scored; its results are copied
+        onto this proposal. Without one every call is analyzed afresh.
+        """
+        if self.evaluated is None:
+            return self._analyze(proposal)
+        analyzed = self.evaluated.get_or_evaluate(
+            proposal_trade_key(proposal), proposal.team_a, lambda: self._analyze(proposal)
+        )
+        if analyzed is not proposal:
+            for name in ANALYSIS_FIELDS:
+                value = getattr(analyzed, name)
+                setattr(proposal, name, dict(value) if isinstance(value, dict) else value)
+        return proposal
+
+    def _analyze(self, proposal: TradeProposal) -> TradeProposal:
         # Calculate raw values
         proposal.value_a_receives = self._calculate_package_value(
             proposal.players_from_b, proposal.picks_from_b
@@ -8479,11 +10192,11 @@ class TradeAnalyzer:
 class TradeSuggestionEngine:
     """Generates automated trade suggestions based on team needs."""
     
-    def __init__(self, teams: Dict[str, Team], my_team: str):
+    def __init__(self, teams: Dict[str, Team], my_team: str, evaluated: Optional[EvaluatedTrades] = None):
         self.teams = teams
         self.my_team = my_team
         self.league = LeagueAnalyzer(teams)
-        self.analyzer = TradeAnalyzer(self.league)
+        self.analyzer = TradeAnalyzer(self.league, evaluated)
         self.calculator = DynastyValueCalculator()
     
     def find_trade_partners(self) -> List[Dict]:
@@ -8556,6 +10269,7 @@ class TradeSuggestionEngine:
             return []
         
         suggestions = []
+        seen = set()
         
         # Find players that address each team's needs
         my_trade_chips = self._identify_trade_chips(my_team_data)
@@ -8571,6 +10285,10 @@ class TradeSuggestionEngine:
                     players_from_a=[my_chip],
                     players_from_b=[their_target],
                 )
+                key = proposal_trade_key(proposal)
+                if key in seen:
+                    continue
+                seen.add(key)
                 
                 analyzed = self.analyzer.analyze_trade(proposal)
                 
@@ -8653,6 +10371,330 @@ class TradeSuggestionEngine:
         return [t[0] for t in targets]
 
 
+# ============================================================================
+# LEADERBOARDS
+# ============================================================================
+
+def get_leaderboard_groups(player: Player) -> List[str]:
+    """Leaderboard groups a player belongs to (besides 'all')."""
+    mask = player.eligibility
+    groups = ['pitchers'] if mask & PITCHER_MASK else ['hitters']
+    if mask & ELIGIBILITY_BITS['SP']:
+        groups.append('SP')
+    if mask & ELIGIBILITY_BITS['RP']:
+        groups.append('RP')
+    if player.is_prospect:
+        groups.append('prospects')
+    return groups
+
+
+@dataclass
+class LeaderboardEntry:
+    """One player's slot in a leaderboard."""
+    player: Player
+    team_name: str
+    value: float
+    seq: int  # insertion order, breaks value ties the same way a stable sort would
+
+    @property
+    def sort_key(self) -> Tuple[float, int]:
+        # Values are shown to one decimal; ties at that precision keep roster order
+        return (-round(self.value, 1), self.seq)
+
+
+class Leaderboard:
+    """Value-ordered player index kept sorted under inserts and removals.
+
+    Entries live in a list ordered by (-value, seq), so top-K is a slice and a
+    single value change is a bisect remove + insert instead of a full re-sort.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[float, int]] = []
+        self._entries: List[LeaderboardEntry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def insert(self, entry: LeaderboardEntry):
+        key = entry.sort_key
+        idx = bisect.bisect_left(self._keys, key)
+        self._keys.insert(idx, key)
+        self._entries.insert(idx, entry)
+
+    def remove(self, entry: LeaderboardEntry):
+        idx = bisect.bisect_left(self._keys, entry.sort_key)
+        if idx < len(self._entries) and self._entries[idx] is entry:
+            del self._keys[idx]
+            del self._entries[idx]
+
+    def top(self, k: int, predicate=None) -> List[LeaderboardEntry]:
+        """Best k entries, optionally only those passing predicate(entry)."""
+        if predicate is None:
+            return self._entries[:k]
+        result = []
+        for entry in self._entries:
+            if predicate(entry):
+                result.append(entry)
+                if len(result) >= k:
+                    break
+        return result
+
+
+class LeagueLeaderboards:
+    """Per-group leaderboards (all, hitters, pitchers, SP, RP, prospects) for a league.
+
+    Built once from the rosters, then maintained incrementally via update_value
+    and move_player when values or rosters change.
+    """
+
+    GROUPS = ('all', 'hitters', 'pitchers', 'SP', 'RP', 'prospects')
+
+    def __init__(self, value_fn=None):
+        self.value_fn = value_fn or DynastyValueCalculator.calculate_player_value
+        self.boards: Dict[str, Leaderboard] = {group: Leaderboard() for group in self.GROUPS}
+        self._entries: Dict[int, LeaderboardEntry] = {}  # id(player) -> entry
+        self._groups: Dict[int, List[str]] = {}
+        self._seq = 0
+
+    @classmethod
+    def build(cls, teams: Dict[str, Team], value_fn=None, values: List[float] = None) -> 'LeagueLeaderboards':
+        """Index every rostered player; `values` may carry precomputed values in roster order."""
+        boards = cls(value_fn)
+        values = iter(values) if values is not None else None
+        for team_name, team in teams.items():
+            for player in team.players:
+                boards.add_player(player, team_name, next(values) if values is not None else None)
+        return boards
+
+    def __contains__(self, player: Player) -> bool:
+        return id(player) in self._entries
+
+    def add_player(self, player: Player, team_name: str, value: float = None):
+        """Add a rostered player (no-op if already indexed)."""
+        if id(player) in self._entries:
+            return
+        if value is None:
+            value = self.value_fn(player)
+        entry = LeaderboardEntry(player, team_name, value, self._seq)
+        self._seq += 1
+        groups = ['all'] + get_leaderboard_groups(player)
+        self._entries[id(player)] = entry
+        self._groups[id(player)] = groups
+        for group in groups:
+            self.boards[group].insert(entry)
+
+    def update_value(self, player: Player, value: float = None):
+        """Re-place a player after their value changed (keeps their tie-break order)."""
+        entry = self._entries.get(id(player))
+        if entry is None:
+            return
+        if value is None:
+            value = self.value_fn(player)
+        if value == entry.value:
+            return
+        groups = self._groups[id(player)]
+        for group in groups:
+            self.boards[group].remove(entry)
+        entry.value = value
+        for group in groups:
+            self.boards[group].insert(entry)
+
+    def move_player(self, player: Player, new_team_name: str):
+        """Record a roster move; ordering is unaffected."""
+        entry = self._entries.get(id(player))
+        if entry is not None:
+            entry.team_name = new_team_name
+
+    def top(self, group: str = 'all', k: int = 50, position: str = None,
+            min_age: int = None, max_age: int = None, team: str = None) -> List[LeaderboardEntry]:
+        """Top k entries of a group, optionally filtered by position, age range and team."""
+        board = self.boards[group]
+        if not (position or min_age or max_age or team):
+            return board.top(k)
+
+        wanted = position_filter_mask(position) if position else 0
+        if position and not wanted:
+            return []
+
+        def matches(entry: LeaderboardEntry) -> bool:
+            p = entry.player
+            if team and entry.team_name != team:
+                return False
+            if min_age and p.age < min_age:
+                return False
+            if max_age and (p.age <= 0 or p.age > max_age):
+                return False
+            if wanted and not p.eligibility & wanted:
+                return False
+            return True
+
+        return board.top(k, matches)
+
+
+# ============================================================================
+# DERIVED METRICS GRAPH
+# ============================================================================
+
+class _GraphNode:
+    """One memoized computation in a DependencyGraph."""
+    __slots__ = ('key', 'value', 'state', 'deps', 'dependents', 'computed_at', 'changed_at')
+
+    def __init__(self, key):
+        self.key = key
+        self.value = None
+        self.state = 'dirty'  # 'clean' | 'check' (an upstream node may have changed) | 'dirty'
+        self.deps: List[tuple] = []
+        self.dependents: set = set()
+        self.computed_at = -1
+        self.changed_at = -1
+
+
+class DependencyGraph:
+    """Lazily recomputed graph of derived values with dirty propagation.
+
+    Nodes are keyed (family, *args) and computed by the function registered for
+    their family. Any graph.get() made while a node computes is recorded as one
+    of its dependencies, so the edges follow the code rather than a hand-kept
+    list. invalidate() marks a node dirty and its downstream nodes as needing a
+    check; on the next get() a checked node recomputes only if one of its
+    dependencies actually produced a different value. Every recompute is
+    appended to a bounded trace with its duration (which includes any
+    dependencies it recomputed along the way).
+    """
+
+    def __init__(self, trace_size: int = 500):
+        self._families: Dict[str, callable] = {}
+        self._nodes: Dict[tuple, _GraphNode] = {}
+        self._stack: List[_GraphNode] = []
+        self._clock = 0
+        self._seq = 0
+        self.trace_log = deque(maxlen=trace_size)
+
+    def register(self, family: str, compute):
+        """Register compute(*args) as the function behind every (family, *args) node."""
+        self._families[family] = compute
+
+    def node(self, family: str):
+        """Decorator form of register()."""
+        def decorator(compute):
+            self.register(family, compute)
+            return compute
+        return decorator
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, key: tuple):
+        """Current value of a node, recomputing it (and stale dependencies) if needed."""
+        node = self._nodes.get(key)
+        if node is None:
+            if key[0] not in self._families:
+                raise KeyError(f"No graph family registered for {key[0]!r}")
+            node = self._nodes[key] = _GraphNode(key)
+        if self._stack:
+            parent = self._stack[-1]
+            if parent.key not in node.dependents:
+                node.dependents.add(parent.key)
+                parent.deps.append(key)
+        self._refresh(node)
+        return node.value
+
+    def _refresh(self, node: _GraphNode):
+        if node.state == 'clean':
+            return
+        if node.state == 'check':
+            for dep_key in list(node.deps):
+                dep = self._nodes.get(dep_key)
+                if dep is None:
+                    node.state = 'dirty'
+                    break
+                self._refresh(dep)
+                if dep.changed_at > node.computed_at:
+                    node.state = 'dirty'
+                    break
+            if node.state == 'check':
+                node.state = 'clean'
+                return
+        self._recompute(node)
+
+    def _recompute(self, node: _GraphNode):
+        for dep_key in node.deps:
+            dep = self._nodes.get(dep_key)
+            if dep is not None:
+                dep.dependents.discard(node.key)
+        node.deps = []
+        self._stack.append(node)
+        start = time.perf_counter()
+        try:
+            value = self._families[node.key[0]](*node.key[1:])
+        finally:
+            self._stack.pop()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._clock += 1
+        changed = node.changed_at < 0 or value != node.value
+        if changed:
+            node.changed_at = self._clock
+        node.value = value
+        node.computed_at = self._clock
+        node.state = 'clean'
+        self._seq += 1
+        self.trace_log.append({
+            'seq': self._seq,
+            'node': self.describe(node.key),
+            'ms': round(elapsed_ms, 3),
+            'changed': changed,
+            'depth': len(self._stack),
+        })
+
+    def invalidate(self, key: tuple):
+        """Mark a node dirty and everything downstream of it as needing a check."""
+        node = self._nodes.get(key)
+        if node is None:
+            return
+        node.state = 'dirty'
+        pending = list(node.dependents)
+        while pending:
+            dependent = self._nodes.get(pending.pop())
+            if dependent is not None and dependent.state == 'clean':
+                dependent.state = 'check'
+                pending.extend(dependent.dependents)
+
+    def invalidate_family(self, family: str):
+        """Invalidate every node of one family."""
+        for key in [k for k in self._nodes if k[0] == family]:
+            self.invalidate(key)
+
+    def reset(self):
+        """Drop every node (full reload); the trace is kept."""
+        self._nodes.clear()
+
+    def trace(self, since: int = 0) -> List[dict]:
+        """Recompute records with seq > since, oldest first."""
+        return [entry for entry in self.trace_log if entry['seq'] > since]
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def stats(self) -> Dict[str, int]:
+        """Node counts by state."""
+        counts = {'nodes': len(self._nodes), 'clean': 0, 'check': 0, 'dirty': 0}
+        for node in self._nodes.values():
+            counts[node.state] += 1
+        return counts
+
+    @staticmethod
+    def describe(key: tuple) -> str:
+        return key[0] if len(key) == 1 else f"{key[0]}[{', '.join(str(a) for a in key[1:])}]"
+
+
 # ============================================================================
 # DATA LOADER
 # ============================================================================
@@ -8805,10 +10847,10 @@ def print_trade_analysis(proposal: TradeProposal):
 class InteractiveTradeAnalyzer:
     """Interactive mode for user-specified trade analysis."""
     
-    def __init__(self, teams: Dict[str, Team]):
+    def __init__(self, teams: Dict[str, Team], evaluated: Optional[EvaluatedTrades] = None):
         self.teams = teams
         self.league = LeagueAnalyzer(teams)
-        self.analyzer = TradeAnalyzer(self.league)
+        self.analyzer = TradeAnalyzer(self.league, evaluated)
         self.calculator = DynastyValueCalculator()
     
     def find_player(self, name: str) -> Optional[Tuple[Player, str]]:
@@ -8933,9 +10975,15 @@ class InteractiveTradeAnalyzer:
         self, 
         my_team: str, 
         target_team: str,
-        trade_format: str = "2-for-1"
+        trade_format: str = "2-for-1",
+        matches_per_target: int = 10
     ) -> List[TradeProposal]:
-        """Generate multi-player trade suggestions."""
+        """Generate multi-player trade suggestions.
+
+        My side's packages come from a PackageIndex over the whole eligible
+        roster; each target (player or pair) analyzes the `matches_per_target`
+        packages nearest its value.
+        """
         my_team_data = self.league.analyze_team(my_team)
         target_team_data = self.league.analyze_team(target_team)
         
@@ -8943,6 +10991,7 @@ class InteractiveTradeAnalyzer:
             return []
         
         suggestions = []
+        seen = set()
         my_players = sorted(
             [p for p in my_team_data.players if p.roster_status in ['Active', 'Reserve']],
             key=lambda p: self.calculator.calculate_player_value(p),
@@ -8954,6 +11003,8 @@ class InteractiveTradeAnalyzer:
             reverse=True
         )
         
+        packages = PackageIndex(my_players, [self.calculator.calculate_player_value(p) for p in my_players])
+        
         if trade_format == "2-for-1":
             # Find 2-for-1 opportunities (get one premium player)
             for target in target_players[:20]:
@@ -8962,26 +11013,24 @@ class InteractiveTradeAnalyzer:
                 if target_value < 40:  # Lower threshold
                     continue
                 
-                # Find pairs that match the value
-                for i, my_p1 in enumerate(my_players[:25]):
-                    v1 = self.calculator.calculate_player_value(my_p1)
-                    for my_p2 in my_players[i+1:30]:
-                        v2 = self.calculator.calculate_player_value(my_p2)
-                        combined = v1 + v2
-                        
-                        # More lenient value matching for consolidation trades
-                        if 0.6 * target_value <= combined <= 1.6 * target_value:
-                            proposal = TradeProposal(
-                                team_a=my_team,
-                                team_b=target_team,
-                                players_from_a=[my_p1, my_p2],
-                                players_from_b=[target]
-                            )
-                            analyzed = self.analyzer.analyze_trade(proposal)
-                            
-                            # Accept trades within 35 points
-                            if abs(analyzed.value_a_receives - analyzed.value_b_receives) < 35:
-                                suggestions.append(analyzed)
+                # Pairs that match the value (lenient range for consolidation trades)
+                for members, _ in packages.closest(2, target_value, 0.6 * target_value, 1.6 * target_value,
+                                                   matches_per_target):
+                    proposal = TradeProposal(
+                        team_a=my_team,
+                        team_b=target_team,
+                        players_from_a=[my_players[i] for i in members],
+                        players_from_b=[target]
+                    )
+                    key = proposal_trade_key(proposal)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    analyzed = self.analyzer.analyze_trade(proposal)
+                    
+                    # Accept trades within 35 points
+                    if abs(analyzed.value_a_receives - analyzed.value_b_receives) < 35:
+                        suggestions.append(analyzed)
         
         elif trade_format == "3-for-2":
             # Find 3-for-2 opportunities
@@ -8995,29 +11044,22 @@ class InteractiveTradeAnalyzer:
                     if target_value < 80:
                         continue
                     
-                    for i, my_p1 in enumerate(my_players[:15]):
-                        for j, my_p2 in enumerate(my_players[i+1:20]):
-                            for my_p3 in my_players[j+1:25]:
-                                combined = (
-                                    self.calculator.calculate_player_value(my_p1) +
-                                    self.calculator.calculate_player_value(my_p2) +
-                                    self.calculator.calculate_player_value(my_p3)
-                                )
-                                
-                                if 0.85 * target_value <= combined <= 1.25 * target_value:
-                                    proposal = TradeProposal(
-                                        team_a=my_team,
-                                        team_b=target_team,
-                                        players_from_a=[my_p1, my_p2, my_p3],
-                                        players_from_b=[target1, target2]
-                                    )
-                                    analyzed = self.analyzer.analyze_trade(proposal)
-                                    
-                                    if abs(analyzed.value_a_receives - analyzed.value_b_receives) < 30:
-                                        suggestions.append(analyzed)
-                                        
-                                if len(suggestions) >= 50:
-                                    break
+                    for members, _ in packages.closest(3, target_value, 0.85 * target_value, 1.25 * target_value,
+                                                       matches_per_target):
+                        proposal = TradeProposal(
+                            team_a=my_team,
+                            team_b=target_team,
+                            players_from_a=[my_players[i] for i in members],
+                            players_from_b=[target1, target2]
+                        )
+                        key = proposal_trade_key(proposal)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        analyzed = self.analyzer.analyze_trade(proposal)
+                        
+                        if abs(analyzed.value_a_receives - analyzed.value_b_receives) < 30:
+                            suggestions.append(analyzed)
         
         # Sort by combined fit score and value balance
         suggestions.sort(
@@ -9249,6 +11291,7 @@ def main():
     print("  0. Quit")
     
     my_team = "PAW"
+    leaderboards = LeagueLeaderboards.build(teams)
     
     while True:
         try:
@@ -9267,9 +11310,9 @@ def main():
             else:
                 print(f"❌ Team '{my_team}' not found")
         elif choice == "4":
-            print_hitter_rankings(teams)
+            print_hitter_rankings(teams, leaderboards)
         elif choice == "5":
-            print_sp_rankings(teams)
+            print_sp_rankings(teams, leaderboards)
         elif choice == "6":
             print_reliever_rankings(teams)
         elif choice == "7":
@@ -9311,7 +11354,8 @@ def run_full_analysis(teams: Dict[str, Team], my_team: str):
         print_reliever_rankings(teams)
         
         # Find trade partners
-        engine = TradeSuggestionEngine(teams, my_team)
+        evaluated = EvaluatedTrades()
+        engine = TradeSuggestionEngine(teams, my_team, evaluated)
         partners = engine.find_trade_partners()
         
         print(f"\n{'='*70}")
@@ -9341,7 +11385,7 @@ def run_full_analysis(teams: Dict[str, Team], my_team: str):
             print(f"💡 2-FOR-1 TRADE SUGGESTIONS WITH {top_partner} (V2 Feature):")
             print('='*70)
             
-            interactive = InteractiveTradeAnalyzer(teams)
+            interactive = InteractiveTradeAnalyzer(teams, evaluated)
             multi_suggestions = interactive.generate_multi_player_suggestions(my_team, top_partner, "2-for-1")
             
             for i, suggestion in enumerate(multi_suggestions[:3], 1):
@@ -9483,60 +11527,47 @@ def print_team_asset_summary(teams: Dict[str, Team]):
             print(f"\n  {team_name}: No ranked prospects")
 
 
-def print_hitter_rankings(teams: Dict[str, Team]):
+def print_hitter_rankings(teams: Dict[str, Team], leaderboards: LeagueLeaderboards = None):
     """Print top hitters by dynasty value."""
     print(f"\n{'='*70}")
     print("🏆 TOP HITTERS BY DYNASTY VALUE:")
     print('='*70)
     
-    hitter_values = []
-    for team_name, team in teams.items():
-        for player in team.players:
-            if player.is_hitter() and player.name in HITTER_PROJECTIONS:
-                proj = HITTER_PROJECTIONS[player.name]
-                value = DynastyValueCalculator.calculate_player_value(player)
-                hitter_values.append((
-                    player.name, team_name, player.position, player.age,
-                    proj.get('HR', 0), proj.get('SB', 0), proj.get('AVG', 0), proj.get('OPS', 0),
-                    value
-                ))
-    
-    hitter_values.sort(key=lambda x: x[8], reverse=True)
+    if leaderboards is None:
+        leaderboards = LeagueLeaderboards.build(teams)
+    top_hitters = leaderboards.boards['all'].top(
+        25, lambda e: e.player.is_hitter() and e.player.name in HITTER_PROJECTIONS
+    )
     
     print(f"  {'Name':<22} {'Team':<6} {'Pos':<8} {'Age':>3} {'HR':>4} {'SB':>4} {'AVG':>6} {'OPS':>6} {'Value':>6}")
     print(f"  {'-'*22} {'-'*6} {'-'*8} {'-'*3} {'-'*4} {'-'*4} {'-'*6} {'-'*6} {'-'*6}")
     
-    for name, team, pos, age, hr, sb, avg, ops, value in hitter_values[:25]:
-        pos_short = pos[:8] if len(pos) > 8 else pos
-        print(f"  {name:<22} {team:<6} {pos_short:<8} {age:>3} {hr:>4} {sb:>4} {avg:>6.3f} {ops:>6.3f} {value:>6.1f}")
+    for entry in top_hitters:
+        player = entry.player
+        proj = HITTER_PROJECTIONS[player.name]
+        hr, sb, avg, ops = proj.get('HR', 0), proj.get('SB', 0), proj.get('AVG', 0), proj.get('OPS', 0)
+        pos_short = player.position[:8]
+        print(f"  {player.name:<22} {entry.team_name:<6} {pos_short:<8} {player.age:>3} {hr:>4} {sb:>4} {avg:>6.3f} {ops:>6.3f} {entry.value:>6.1f}")
 
 
-def print_sp_rankings(teams: Dict[str, Team]):
+def print_sp_rankings(teams: Dict[str, Team], leaderboards: LeagueLeaderboards = None):
     """Print top starting pitchers by dynasty value."""
     print(f"\n{'='*70}")
     print("⚾ TOP STARTING PITCHERS BY DYNASTY VALUE:")
     print('='*70)
     
-    sp_values = []
-    for team_name, team in teams.items():
-        for player in team.players:
-            if player.name in PITCHER_PROJECTIONS:
-                proj = PITCHER_PROJECTIONS[player.name]
-                value = DynastyValueCalculator.calculate_pitcher_value(player)
-                sp_values.append((
-                    player.name, team_name, player.age,
-                    proj.get('K', 0), proj.get('QS', 0), proj.get('ERA', 0), 
-                    proj.get('WHIP', 0), proj.get('IP', 0),
-                    value
-                ))
-    
-    sp_values.sort(key=lambda x: x[8], reverse=True)
+    if leaderboards is None:
+        leaderboards = LeagueLeaderboards.build(teams)
+    top_sp = leaderboards.boards['pitchers'].top(25, lambda e: e.player.name in PITCHER_PROJECTIONS)
     
     print(f"  {'Name':<22} {'Team':<6} {'Age':>3} {'K':>5} {'QS':>4} {'ERA':>5} {'WHIP':>5} {'IP':>6} {'Value':>6}")
     print(f"  {'-'*22} {'-'*6} {'-'*3} {'-'*5} {'-'*4} {'-'*5} {'-'*5} {'-'*6} {'-'*6}")
     
-    for name, team, age, k, qs, era, whip, ip, value in sp_values[:25]:
-        print(f"  {name:<22} {team:<6} {age:>3} {k:>5} {qs:>4} {era:>5.2f} {whip:>5.2f} {ip:>6.1f} {value:>6.1f}")
+    for entry in top_sp:
+        player = entry.player
+        proj = PITCHER_PROJECTIONS[player.name]
+        k, qs, era, whip, ip = proj.get('K', 0), proj.get('QS', 0), proj.get('ERA', 0), proj.get('WHIP', 0), proj.get('IP', 0)
+        print(f"  {player.name:<22} {entry.team_name:<6} {player.age:>3} {k:>5} {qs:>4} {era:>5.2f} {whip:>5.2f} {ip:>6.1f} {entry.value:>6.1f}")
 
 
 if __name__ == "__main__":
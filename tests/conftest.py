@@ -0,0 +1,17 @@
+import contextlib
+import io
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    """The Flask app module with league data, projections and free agents loaded."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app
+    return app
+
+
+@pytest.fixture()
+def client(app_module):
+    return app_module.app.test_client()
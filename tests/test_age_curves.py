@@ -0,0 +1,34 @@
+"""Age curve table: value projections and the window analysis read the same curves."""
+import numpy as np
+
+from dynasty_trade_analyzer_v2 import (AGE_CURVE_GROUPS, PROJECTION_YEARS, Player, age_curve_peaks,
+                                       age_curve_table, project_values_by_year)
+
+
+def test_peak_plateaus():
+    phases, seasons_left = age_curve_peaks()
+    hitter, sp = AGE_CURVE_GROUPS.index('hitter'), AGE_CURVE_GROUPS.index('sp')
+    assert [a for a in range(1, 45) if phases[hitter, a] == 0] == list(range(26, 32))
+    assert [a for a in range(1, 45) if phases[sp, a] == 0] == list(range(26, 31))
+    assert seasons_left[hitter, 20] == 11 and seasons_left[hitter, 31] == 0 and seasons_left[hitter, 35] == 0
+
+
+def test_seasons_left_matches_projected_values():
+    """Seasons left count the peak seasons after this one; value first drops the season after the last."""
+    phases, seasons_left = age_curve_peaks()
+    table = age_curve_table(PROJECTION_YEARS)
+    for g in range(len(AGE_CURVE_GROUPS)):
+        for age in range(1, 45):
+            if phases[g, age] < 0:
+                continue
+            row = table[g, age]
+            drops = [k for k in range(1, PROJECTION_YEARS + 1) if row[k] < row[k - 1]]
+            if seasons_left[g, age] + 2 <= PROJECTION_YEARS:
+                assert drops[0] == seasons_left[g, age] + 2
+            else:
+                assert not drops
+
+
+def test_project_values_by_year_unknown_age_stays_flat():
+    rows = project_values_by_year([Player(name='x', position='OF', age=0)], [10.0])
+    assert np.array_equal(rows[0], np.full(PROJECTION_YEARS + 1, 10.0))
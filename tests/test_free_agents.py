@@ -0,0 +1,43 @@
+"""The vectorized FA recommender must agree with the scalar reference scorer."""
+import pytest
+
+WINDOWS = ['rebuilding', 'rising', 'win-now', 'contender', 'dynasty', 'balanced']
+
+
+def team_contexts(app_module):
+    """Every team's own context, plus each team under every window with a youth/production/value GM."""
+    philosophies = (app_module.YOUTH_PHILOSOPHIES + app_module.PRODUCTION_PHILOSOPHIES +
+                    app_module.VALUE_PHILOSOPHIES + ['balanced'])
+    contexts = []
+    for t, team_name in enumerate(sorted(app_module.teams)):
+        ctx = app_module.build_fa_team_context(team_name)
+        contexts.append(ctx)
+        for w, window in enumerate(WINDOWS):
+            contexts.append({**ctx, 'team_window': window,
+                             'philosophy': philosophies[(t + w) % len(philosophies)],
+                             'gm_preferred_cats': ['HR', 'K', 'SV+HLD'][(t + w) % 3:]})
+    return contexts
+
+
+def test_table_scorer_matches_scalar(app_module):
+    f = app_module.get_fa_features()
+    assert f['n'] == len(app_module.FREE_AGENTS) > 0
+    mismatches = []
+    for ctx in team_contexts(app_module):
+        scores, keep = app_module.score_fa_table_for_team(ctx)
+        for i, fa in enumerate(app_module.FREE_AGENTS):
+            entry = app_module.score_fa_for_team(fa, f['projections'][i], f['tags'][i], ctx)
+            table = round(scores[i], 1) if keep[i] else None
+            scalar = entry['fit_score'] if entry is not None else None
+            if table != scalar:
+                mismatches.append((ctx['team_name'], ctx['team_window'], fa['name'], table, scalar))
+    assert not mismatches, mismatches[:10]
+
+
+def test_feature_table_is_built_per_fa_load(app_module):
+    f = app_module.get_fa_features()
+    projections = f['projections']
+    app_module.bump_data_version("test: unrelated change")
+    f = app_module.get_fa_features()
+    assert f['projections'] is projections
+    assert f['load'] == app_module._fa_load_count
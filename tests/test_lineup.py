@@ -0,0 +1,65 @@
+"""LineupOptimizer.assign against exhaustive search on small rosters."""
+import random
+
+import numpy as np
+import pytest
+
+from dynasty_trade_analyzer_v2 import ELIGIBILITY_BITS, POSITION_FILTER_MASKS, LineupOptimizer
+
+SMALL_SLOTS = (('C', 1), ('SS', 1), ('MI', 1), ('OF', 2), ('UTIL', 1), ('SP', 1), ('P', 1))
+POSITIONS = [('C',), ('SS',), ('2B',), ('2B', 'SS'), ('1B',), ('OF',), ('C', 'OF'), ('UTIL',),
+             ('SP',), ('RP',), ('SP', 'RP'), ('OF', 'SP'), ()]
+
+
+def mask_of(positions):
+    mask = 0
+    for pos in positions:
+        mask |= ELIGIBILITY_BITS[pos]
+    if mask & ~(ELIGIBILITY_BITS['SP'] | ELIGIBILITY_BITS['RP']):
+        mask |= ELIGIBILITY_BITS['UTIL']  # every hitter is UTIL-eligible
+    return mask
+
+
+def best_total(masks, weights, slots):
+    """Maximum starter weight over every legal assignment (players may sit)."""
+    accepts = [POSITION_FILTER_MASKS[slot] for slot, _ in slots]
+    best = 0.0
+
+    def search(i, capacity, total):
+        nonlocal best
+        if i == len(masks):
+            best = max(best, total)
+            return
+        search(i + 1, capacity, total)
+        if weights[i] == -np.inf:
+            return
+        for g, accept in enumerate(accepts):
+            if capacity[g] and masks[i] & accept:
+                capacity[g] -= 1
+                search(i + 1, capacity, total + weights[i])
+                capacity[g] += 1
+
+    search(0, [count for _, count in slots], 0.0)
+    return best
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_assign_matches_brute_force(seed):
+    rng = random.Random(seed)
+    n = rng.randint(3, 10)
+    masks = [mask_of(rng.choice(POSITIONS)) for _ in range(n)]
+    weights = [-np.inf if rng.random() < 0.1 else float(rng.randint(0, 20)) for _ in range(n)]
+    optimizer = LineupOptimizer(SMALL_SLOTS)
+
+    assigned = optimizer.assign(masks, weights)
+
+    capacity = dict(SMALL_SLOTS)
+    for mask, weight, slot in zip(masks, weights, assigned):
+        if slot is None:
+            continue
+        assert weight != -np.inf
+        assert mask & POSITION_FILTER_MASKS[slot]
+        capacity[slot] -= 1
+        assert capacity[slot] >= 0
+    total = sum(w for w, slot in zip(weights, assigned) if slot is not None)
+    assert total == best_total(masks, weights, SMALL_SLOTS)
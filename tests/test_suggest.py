@@ -0,0 +1,59 @@
+"""/suggest pagination: cursors walk the same ranked list the first page came from."""
+from urllib.parse import quote
+
+import pytest
+
+
+@pytest.fixture()
+def suggest_team(app_module, client):
+    """A team whose suggestion list is long enough to paginate."""
+    for team_name in sorted(app_module.teams):
+        data = client.get(f'/suggest?my_team={quote(team_name)}&limit=1').get_json()
+        if data.get('total_found', 0) >= 6:
+            return team_name
+    pytest.skip("no team has enough trade suggestions to paginate")
+
+
+def test_cursor_pages_concatenate_to_the_full_list(client, suggest_team):
+    query = f'/suggest?my_team={quote(suggest_team)}'
+    full = client.get(f'{query}&limit=200').get_json()
+
+    pages = []
+    data = client.get(f'{query}&limit=4').get_json()
+    while True:
+        pages.extend(data['suggestions'])
+        if not data['next_cursor']:
+            break
+        data = client.get(f"{query}&limit=4&cursor={quote(data['next_cursor'])}").get_json()
+        assert data['limit'] == 4
+    assert pages == full['suggestions'][:len(pages)]
+    assert len(pages) == full['total_found']
+
+
+def test_cursor_matches_offset(client, suggest_team):
+    query = f'/suggest?my_team={quote(suggest_team)}'
+    first = client.get(f'{query}&limit=3').get_json()
+    by_cursor = client.get(f"{query}&limit=3&cursor={quote(first['next_cursor'])}").get_json()
+    by_offset = client.get(f'{query}&limit=3&offset=3').get_json()
+    assert by_cursor['offset'] == 3
+    assert by_cursor['suggestions'] == by_offset['suggestions']
+
+
+def test_cursor_rejected_for_another_query(client, suggest_team):
+    first = client.get(f'/suggest?my_team={quote(suggest_team)}&limit=3').get_json()
+    resp = client.get(f"/suggest?my_team={quote(suggest_team)}&trade_type=2-for-1&limit=3"
+                      f"&cursor={quote(first['next_cursor'])}")
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize('params', ['cursor=garbage', 'cursor=abc.def', 'offset=x', 'limit=1.5'])
+def test_malformed_page_params_are_rejected(client, suggest_team, params):
+    resp = client.get(f'/suggest?my_team={quote(suggest_team)}&{params}')
+    assert resp.status_code == 400
+
+
+def test_limit_is_clamped(app_module, client, suggest_team):
+    data = client.get(f'/suggest?my_team={quote(suggest_team)}&limit=0&offset=-5').get_json()
+    assert (data['limit'], data['offset']) == (1, 0)
+    data = client.get(f'/suggest?my_team={quote(suggest_team)}&limit=100000').get_json()
+    assert data['limit'] == app_module.SUGGEST_MAX_LIMIT
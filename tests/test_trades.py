@@ -0,0 +1,50 @@
+"""Canonical trade keys and the shared EvaluatedTrades cache."""
+from dynasty_trade_analyzer_v2 import (EvaluatedTrades, LeagueAnalyzer, TradeAnalyzer, TradeProposal,
+                                       trade_key)
+
+
+def test_trade_key_ignores_player_and_team_order():
+    assert trade_key('A', ['x', 'y'], 'B', ['z']) == trade_key('B', ['z'], 'A', ['y', 'x'])
+    assert trade_key('A', ['x'], 'B', ['z']) != trade_key('A', ['z'], 'B', ['x'])
+
+
+def test_evaluated_trades_evicts_oldest_past_max_entries():
+    cache = EvaluatedTrades(max_entries=2)
+    for i in range(3):
+        cache.get_or_evaluate(('k', i), None, lambda i=i: i)
+    assert len(cache) == 2
+    assert cache.get_or_evaluate(('k', 0), None, lambda: 'recomputed') == 'recomputed'
+    assert cache.get_or_evaluate(('k', 2), None, lambda: 'recomputed') == 2
+
+
+def sample_proposal(app_module):
+    team_a, team_b = sorted(app_module.teams)[:2]
+    players_a = app_module.teams[team_a].players[:2]
+    players_b = app_module.teams[team_b].players[:1]
+    return TradeProposal(team_a=team_a, team_b=team_b, players_from_a=players_a, players_from_b=players_b)
+
+
+def test_trade_analyzer_caches_only_with_shared_instance(app_module):
+    league = LeagueAnalyzer(dict(app_module.teams))
+    assert TradeAnalyzer(league).evaluated is None
+
+    shared = EvaluatedTrades()
+    first = TradeAnalyzer(league, shared).analyze_trade(sample_proposal(app_module))
+    reordered = sample_proposal(app_module)
+    reordered.players_from_a = list(reversed(reordered.players_from_a))
+    second = TradeAnalyzer(league, shared).analyze_trade(reordered)
+    assert (shared.misses, shared.hits) == (1, 1)
+    assert second.value_a_receives == first.value_a_receives
+    assert second.verdict == first.verdict
+
+
+def test_pick_parsing_is_bounded_and_stable():
+    from dynasty_trade_analyzer_v2 import PICK_KEY_CACHE_SIZE, DynastyValueCalculator, parse_pick_key
+
+    assert parse_pick_key('1.03') == (None, 1, 3)
+    assert parse_pick_key('2026 2nd Round Pick 3 (#15)') == (2026, 2, 3)
+    assert parse_pick_key('2027 1st Round Pick') == (2027, 1, None)
+    assert parse_pick_key('not a pick') is None
+    for i in range(PICK_KEY_CACHE_SIZE + 50):
+        DynastyValueCalculator.calculate_pick_value(f'2027 1st Round Pick {i}')
+    assert parse_pick_key.cache_info().currsize <= PICK_KEY_CACHE_SIZE
@@ -0,0 +1,67 @@
+"""Scalar and vectorized valuation must agree exactly (both read the curve tables)."""
+import random
+
+import pytest
+
+import dynasty_trade_analyzer_v2 as core
+from dynasty_trade_analyzer_v2 import DynastyValueCalculator, Player
+
+POSITIONS = ['C', '1B', 'SS', 'OF', 'SP', 'RP', 'SP,RP', 'UT']
+
+
+def synthetic_players(rng):
+    """Every projected / ranked name at an unknown, a random and a young age, plus unprojected players."""
+    names = (set(core.HITTER_PROJECTIONS) | set(core.PITCHER_PROJECTIONS) | set(core.RELIEVER_PROJECTIONS) |
+             set(core.CONSENSUS_RANKINGS) | set(core.PROSPECT_RANKINGS))
+    players = []
+    for name in sorted(names):
+        for age in (0, rng.randint(18, 40), rng.randint(18, 25)):
+            players.append(Player(name=name, position=rng.choice(POSITIONS), age=age,
+                                  fantrax_score=rng.choice([3, 40, 100]),
+                                  fantrax_rank=rng.choice([50, 150, 350, 450, 1500])))
+    for i in range(200):
+        players.append(Player(name=f'Unprojected {i}', position=rng.choice(POSITIONS), age=rng.randint(0, 40),
+                              fantrax_score=rng.uniform(0, 120), fantrax_rank=rng.randint(1, 2000)))
+    return players
+
+
+def synthetic_actual_stats(rng):
+    """In-season lines for half the projected hitters, spanning every blend tier (including < 20 G)."""
+    actual = {}
+    for name in sorted(core.HITTER_PROJECTIONS):
+        if rng.random() < 0.5:
+            actual[name] = core.parse_actual_stats({
+                'type': 'hitter', 'G': rng.randint(0, 162), 'HR': rng.randint(0, 45), 'SB': rng.randint(0, 45),
+                'R': rng.randint(0, 110), 'RBI': rng.randint(0, 120),
+                'AVG': f'.{rng.randint(180, 350)}', 'OPS': f'.{rng.randint(550, 999)}'})
+    return actual
+
+
+@pytest.mark.parametrize('with_actual', [False, True])
+def test_batch_matches_scalar(app_module, with_actual):
+    rng = random.Random(31)
+    players = synthetic_players(rng)
+    players.extend(p for team in app_module.teams.values() for p in team.players)
+    actual = synthetic_actual_stats(rng) if with_actual else {}
+    if with_actual:
+        blended = [p for p in players if p.name in actual and 0 < p.age <= 25 and actual[p.name]['G'] >= 20]
+        assert blended, "no young hitter exercises the actual-stats blend"
+
+    scalar = [DynastyValueCalculator.calculate_player_value(p, actual.get(p.name)) for p in players]
+    batch = DynastyValueCalculator.calculate_values_batch(players, actual).tolist()
+    mismatches = [(p.name, p.age, s, b) for p, s, b in zip(players, scalar, batch) if s != b]
+    assert not mismatches, mismatches[:10]
+
+
+@pytest.mark.parametrize('curve', [
+    *core.HITTER_CATEGORY_CURVES.values(), core.SP_HITS_PER_9, core.RP_SV_HLD_CURVE, core.RP_K_CURVE,
+    core.RP_ERA_CURVE, core.RP_WHIP_CURVE, core.RP_K_RATE_BONUS, core.HITTER_AGE_BONUS, core.PITCHER_AGE_BONUS,
+    core.PITCHER_AGE_DISCOUNT, core.PROSPECT_VALUE_CURVE, core.CONSENSUS_IMPLIED_RANK, core.CONSENSUS_TARGET_VALUE,
+    core.CONSENSUS_CORRECTION,
+])
+def test_curve_at_matches_evaluate(curve):
+    # Every break, a hair either side of it, and points well outside the table
+    xs = [-50.0, 0.0, 500.0]
+    for b in curve.breaks:
+        xs.extend([b - 1e-9, b, b + 1e-9])
+    assert [curve.at(x) for x in xs] == curve.evaluate(xs).tolist()
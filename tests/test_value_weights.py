@@ -0,0 +1,75 @@
+"""set_value_weights validation and revalue_with_weights rollback."""
+import pytest
+
+import dynasty_trade_analyzer_v2 as core
+from dynasty_trade_analyzer_v2 import get_value_weights, reset_value_weights, set_value_weights
+
+
+@pytest.fixture(autouse=True)
+def restore_weights(app_module):
+    yield
+    reset_value_weights()
+    app_module.bump_data_version("test: value weights reset")
+
+
+@pytest.mark.parametrize('updates', [
+    ['hitting'],
+    {'batting': {'hr': 0.2}},
+    {'hitting': {'xbh': 0.2}},
+    {'hitting': {'hr': 1.5}},
+    {'hitting': {'hr': True}},
+    {'hitting': {'hr': float('nan')}},
+    {'hitting': 0.2},
+    {'dynasty_pitcher_discount': 2.0},
+    {'source_weights': {'not_a_source': 0.5}},
+    {'position_scarcity': {'C': 0.9}},
+])
+def test_invalid_updates_raise_and_change_nothing(updates):
+    before = get_value_weights()
+    with pytest.raises(ValueError):
+        set_value_weights(updates)
+    assert get_value_weights() == before
+
+
+def test_invalid_section_leaves_valid_sections_untouched():
+    before = get_value_weights()
+    with pytest.raises(ValueError):
+        set_value_weights({'hitting': {'hr': 0.3}, 'pitching': {'k': -1}})
+    assert get_value_weights() == before
+
+
+def test_replace_requires_every_category():
+    before = get_value_weights()
+    partial = dict(before['hitting'])
+    partial.pop('hr')
+    with pytest.raises(ValueError, match='hr'):
+        set_value_weights({'hitting': partial}, replace=True)
+    assert get_value_weights() == before
+
+
+def test_partial_update_returns_previous_and_reset_restores():
+    previous = set_value_weights({'hitting': {'hr': 0.3}, 'dynasty_pitcher_discount': 0.7})
+    assert previous == core.DEFAULT_VALUE_WEIGHTS
+    current = get_value_weights()
+    assert current['hitting']['hr'] == 0.3 and current['dynasty_pitcher_discount'] == 0.7
+    assert core.PITCHER_AGE_DISCOUNT.at(35) == 0.7
+    reset_value_weights()
+    assert get_value_weights() == core.DEFAULT_VALUE_WEIGHTS
+
+
+def test_revalue_rolls_back_when_valuation_fails(app_module, monkeypatch):
+    before = get_value_weights()
+    value_all = app_module.calc_player_values_batch
+    calls = []
+
+    def fail_after_weights_change(players):
+        calls.append(get_value_weights())
+        if len(calls) > 1:  # the first call values the league before the change
+            raise RuntimeError("valuation failed")
+        return value_all(players)
+
+    monkeypatch.setattr(app_module, 'calc_player_values_batch', fail_after_weights_change)
+    with pytest.raises(RuntimeError):
+        app_module.revalue_with_weights({'hitting': {'hr': 0.3}})
+    assert calls[1]['hitting']['hr'] == 0.3
+    assert get_value_weights() == before
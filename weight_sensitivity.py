@@ -0,0 +1,69 @@
+"""
+Weight sensitivity: which value weights move player valuations the most?
+
+Values every rostered player under thousands of randomly perturbed weight
+vectors (category weights, position scarcity, the dynasty pitcher discount and
+the consensus source weights) in vectorized blocks, then reports each weight's
+impact on player values and on rank agreement with FHQ / HKB / CFR. The best
+sample's weights can be POSTed to /value-weights as-is.
+
+For tuning the weights this takes the place of hand-edited runs like
+check_weighting.py or formula_fix.py; calibration_comparison.py still covers
+the wider source set (Steamer, ZiPS, STS, Prospects Live) for one fixed
+configuration.
+
+Usage: python weight_sensitivity.py [samples] [sigma] [seed]
+"""
+import contextlib
+import io
+import json
+import sys
+import time
+
+import numpy as np
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+from dynasty_trade_analyzer_v2 import DynastyValueCalculator, WeightSensitivity
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    sigma = float(sys.argv[2]) if len(sys.argv) > 2 else 0.25
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    players = [p for team in app.teams.values() for p in team.players]
+    actual = app.player_actual_stats
+
+    start = time.perf_counter()
+    model = WeightSensitivity(players, actual)
+    setup = time.perf_counter() - start
+
+    reference = DynastyValueCalculator.calculate_values_batch(players, actual)
+    drift = np.abs(model.values(model.base_vector)[:, 0] - reference).max()
+    print(f"{len(players)} players, {len(model.params)} weights (setup {setup * 1000:.1f} ms)")
+    print(f"model vs calculate_values_batch: max |diff| = {drift:.2e}")
+
+    start = time.perf_counter()
+    report = model.analyze(samples=samples, sigma=sigma, seed=seed)
+    elapsed = time.perf_counter() - start
+    print(f"{samples} samples at sigma={sigma}: {elapsed:.2f}s ({elapsed / max(samples, 1) * 1e3:.2f} ms/sample)")
+    print(f"mean |value change| per player: {report['mean_abs_value_change']}")
+    print("base rank correlation: " + ", ".join(f"{t} {c:.4f}" for t, c in report['base_correlation'].items()))
+    print()
+
+    targets = list(report['base_correlation'])
+    print(f"{'weight':<32}{'base':>8}{'impact':>9}{'share':>8}" + "".join(f"{'d' + t:>9}" for t in targets))
+    for effect in report['effects']:
+        print(f"{effect['param']:<32}{effect['base']:>8.3f}{effect['value_impact']:>9.3f}{effect['impact_share']:>8.1%}"
+              + "".join(f"{effect['corr_effect'][t]:>+9.4f}" for t in targets))
+
+    best = report['best_sample']
+    if best:
+        print()
+        print("best sample: " + ", ".join(f"{t} {c:.4f}" for t, c in best['correlation'].items()))
+        print(json.dumps(best['weights'], indent=2))
+
+
+if __name__ == '__main__':
+    main()